@@ -0,0 +1,139 @@
+"""
+SQLite 동시성 벤치마크 - 기본 엔진 vs 성능 프로필(WAL + PRAGMA) 엔진
+API 읽기(피드 조회) 스레드와 스케줄러 쓰기(뉴스 저장) 스레드를 동시에 돌려 처리량/잠금 오류 비교
+
+실행: python benchmarks/bench_db_concurrency.py [--readers 8] [--writers 2] [--seconds 5] [--rows 20000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import Base, News
+from src.db.profiles import engine_options, install_sqlite_pragmas
+
+
+def build_engine(path: str, tuned: bool):
+    """tuned=False: 기존 database.py와 같은 기본 엔진 / tuned=True: profiles.py 적용"""
+    url = f"sqlite:///{path}"
+    if not tuned:
+        return create_engine(url, connect_args={"check_same_thread": False})
+    return install_sqlite_pragmas(create_engine(url, **engine_options(url)))
+
+
+def seed(engine, rows: int):
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    now = datetime.now()
+    db.add_all([
+        News(title=f"seed news {i}", url=f"https://seed/{i}", source="bench", market="kr",
+             created_at=now - timedelta(seconds=i), importance_score=(i % 10) / 10)
+        for i in range(rows)
+    ])
+    db.commit()
+    db.close()
+
+
+def run_mixed(engine, readers: int, writers: int, seconds: float):
+    """
+    읽기/쓰기 스레드를 seconds 동안 실행
+
+    Returns:
+        {'reads', 'writes', 'errors', 'read_p95_ms', 'write_p95_ms'}
+    """
+    Session = sessionmaker(bind=engine, autoflush=False)
+    stop = threading.Event()
+    lock = threading.Lock()
+    result = {'reads': 0, 'writes': 0, 'errors': 0}
+    latencies = {'read': [], 'write': []}
+
+    def reader():
+        while not stop.is_set():
+            db = Session()
+            started = time.perf_counter()
+            try:
+                db.scalar(select(func.count()).select_from(News).where(News.market == 'kr'))
+                db.scalars(select(News).order_by(News.created_at.desc()).limit(20)).all()
+                kind = 'reads'
+            except OperationalError:
+                kind = 'errors'
+            finally:
+                db.close()
+            with lock:
+                result[kind] += 1
+                latencies['read'].append(time.perf_counter() - started)
+
+    def writer(worker_id: int):
+        seq = 0
+        while not stop.is_set():
+            db = Session()
+            started = time.perf_counter()
+            try:
+                for _ in range(5):  # 수집기 한 배치
+                    seq += 1
+                    db.add(News(title=f"bench {worker_id}-{seq}", url=f"https://bench/{worker_id}/{seq}",
+                                source="bench", market="kr"))
+                db.commit()
+                kind = 'writes'
+            except OperationalError:
+                db.rollback()
+                kind = 'errors'
+            finally:
+                db.close()
+            with lock:
+                result[kind] += 1
+                latencies['write'].append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    def p95(values):
+        if not values:
+            return None
+        values = sorted(values)
+        return round(values[max(0, int(len(values) * 0.95) - 1)] * 1000, 1)
+
+    result['read_p95_ms'] = p95(latencies['read'])
+    result['write_p95_ms'] = p95(latencies['write'])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--rows', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"readers={args.readers} writers={args.writers} seconds={args.seconds} seed_rows={args.rows}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, tuned in (('default', False), ('tuned', True)):
+            path = os.path.join(tmp, f"{label}.db")
+            engine = build_engine(path, tuned)
+            seed(engine, args.rows)
+            result = run_mixed(engine, args.readers, args.writers, args.seconds)
+            engine.dispose()
+            print(f"{label:>8}: reads/s={result['reads'] / args.seconds:8.1f}  "
+                  f"writes/s={result['writes'] / args.seconds:7.1f}  errors={result['errors']:4d}  "
+                  f"read_p95={result['read_p95_ms']}ms  write_p95={result['write_p95_ms']}ms")
+
+
+if __name__ == '__main__':
+    main()
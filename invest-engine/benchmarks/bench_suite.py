@@ -0,0 +1,312 @@
+"""
+엔진 핫패스 벤치마크 스위트
+합성 데이터(benchmarks/synthetic.py)를 임시 SQLite DB 에 적재한 뒤 아래 구간을 반복 측정하고 JSON 으로 저장
+
+- filter.classify_filing: 합성 공시 전체를 FilingFilter.classify_filing 으로 분류
+- parse.*: 수집기 파싱 함수 (benchmarks/fixtures/ 의 HTML/RSS - 실제 페이지 구조를 흉내 내 손으로 만든 합성 응답)
+- api.*: /api/feed, /api/filings, /api/sns/feed, /api/notes/?search= (응답 캐시 끄고 DB 경로 측정)
+- collect.*: 수집기 collect_and_store_* 를 benchmarks/cassettes/ (합성 cassette) 재생으로 실행 (수집 -> 파싱 -> 저장, 네트워크 없음)
+
+결과: benchmarks/results/<시각>-<커밋>.json  (--compare 로 이전 결과와 p50 비교)
+
+실행: python benchmarks/bench_suite.py [--scale 1] [--seed 42] [--repeat 30] [--only collect] [--compare results/old.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCH_DIR, 'fixtures')
+RESULT_DIR = os.path.join(BENCH_DIR, 'results')
+CASSETTE_DIR = os.path.join(BENCH_DIR, 'cassettes')
+
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, int(round(len(values) * pct / 100)) - 1))]
+
+
+def summarize(durations: List[float], ops: int = 1) -> Dict:
+    """반복 측정값(초) -> ms 통계 (ops: 한 번 측정에 처리한 건수)"""
+    return {
+        'runs': len(durations),
+        'ops_per_run': ops,
+        'p50_ms': round(_percentile(durations, 50) * 1000, 3),
+        'p95_ms': round(_percentile(durations, 95) * 1000, 3),
+        'mean_ms': round(statistics.mean(durations) * 1000, 3),
+        'min_ms': round(min(durations) * 1000, 3),
+        'ops_per_sec': round(ops / statistics.median(durations), 1) if statistics.median(durations) else None,
+    }
+
+
+def measure(func: Callable, repeat: int, warmup: int = 2) -> List[float]:
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+def _fixture(name: str, binary: bool = False):
+    with open(os.path.join(FIXTURE_DIR, name), 'rb' if binary else 'r', **({} if binary else {'encoding': 'utf-8'})) as f:
+        return f.read()
+
+
+def bench_filter(db_url: str, repeat: int) -> Dict[str, Dict]:
+    from sqlalchemy import create_engine, text
+    from src.analyzers.filing_filter import FilingFilter
+
+    engine = create_engine(db_url)
+    with engine.connect() as conn:
+        filings = [dict(row._mapping) for row in conn.execute(text("SELECT corp_name, report_nm FROM dart_filings"))]
+    engine.dispose()
+
+    filing_filter = FilingFilter()
+
+    def classify_all():
+        for filing in filings:
+            filing_filter.classify_filing(filing)
+
+    return {'filter.classify_filing': summarize(measure(classify_all, repeat), len(filings))}
+
+
+def bench_parsers(repeat: int) -> Dict[str, Dict]:
+    from src.collectors.crypto_news import CryptoNewsCollector
+    from src.collectors.naver_news import NaverNewsCollector
+    from src.collectors.us_news import USNewsCollector
+
+    naver, us, crypto = NaverNewsCollector(), USNewsCollector(), CryptoNewsCollector()
+    cases = {
+        'parse.naver_main_news': (naver.parse_main_news, (_fixture('naver_main_news.html'),)),
+        'parse.naver_stock_news': (naver.parse_stock_news, (_fixture('naver_stock_news.html'), '005930', 20)),
+        'parse.yahoo_market_rss': (us.parse_yahoo_market_rss, (_fixture('yahoo_market_news.xml', binary=True), 50)),
+        'parse.yahoo_stock_rss': (us.parse_yahoo_stock_rss, (_fixture('yahoo_stock_news_NVDA.xml', binary=True), 'NVDA', 20)),
+        'parse.google_finance': (us.parse_google_finance, (_fixture('google_finance_quote.html'), 20)),
+        'parse.coindesk_rss': (crypto.parse_coindesk_rss, (_fixture('coindesk_rss.xml'),)),
+        'parse.cointelegraph_rss': (crypto.parse_cointelegraph_rss, (_fixture('cointelegraph_rss.xml'),)),
+    }
+
+    results = {}
+    for name, (func, args) in cases.items():
+        items = len(func(*args))
+        if not items:
+            raise RuntimeError(f"{name}: fixture parsed to 0 items - selector or fixture out of date")
+        results[name] = summarize(measure(lambda: func(*args), repeat), items)
+    return results
+
+
+API_CASES = {
+    'api.feed': "/api/feed?page=1&limit=20",
+    'api.feed_page5': "/api/feed?page=5&limit=20",
+    'api.feed_search': "/api/feed?search=%EC%82%BC%EC%84%B1&limit=20",  # 삼성
+    'api.filings': "/api/filings?page=1&limit=20",
+    'api.filings_grade_b': "/api/filings?grade=B&page=1&limit=20",
+    'api.sns_feed': "/api/sns/feed?page=1&limit=20",
+    'api.notes_search': "/api/notes/?search=%EC%98%81%EC%97%85%EC%9D%B4%EC%9D%B5",  # 영업이익
+}
+
+
+def quiet_logs():
+    """측정 대상에 로그 출력 비용이 섞이지 않도록 경고 이상만 stderr 로 출력"""
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+
+def bench_api(repeat: int) -> Dict[str, Dict]:
+    from fastapi.testclient import TestClient
+    from main import app
+
+    quiet_logs()  # main.py 가 import 시 등록한 로그 파일 핸들러 제거
+
+    # lifespan(스케줄러 시작) 없이 라우트만 호출
+    client = TestClient(app)
+    results = {}
+    for name, url in API_CASES.items():
+        response = client.get(url)
+        if response.status_code != 200:
+            raise RuntimeError(f"{name}: GET {url} -> {response.status_code} {response.text[:200]}")
+
+        def call(url=url):
+            client.get(url)
+        results[name] = summarize(measure(call, repeat))
+    return results
+
+
+def bench_collectors(repeat: int) -> Dict[str, Dict]:
+    import asyncio
+    from sqlalchemy import delete, func, select
+    from src.collectors.crypto_news import CryptoNewsCollector
+    from src.collectors.dart import DartCollector
+    from src.collectors.http_replay import use_cassette
+    from src.collectors.naver_news import NaverNewsCollector
+    from src.collectors.us_news import USNewsCollector
+    from src.db.database import dispose_async_engine, get_async_db_session
+    from src.db.models import DartFiling, News
+
+    async def collect_dart(collector):
+        collector.api_key = 'replay'  # 키가 없으면 요청하지 않음 (cassette 에는 REDACTED 로 기록됨)
+        return await collector.collect_and_store_filings(days_back=1)
+
+    cases = {
+        'collect.dart': ('dart', DartCollector, DartFiling, collect_dart),
+        'collect.naver_news': ('naver_news', NaverNewsCollector, News,
+                               lambda collector: collector.collect_and_store_news(collect_stock_news=True)),
+        'collect.us_news': ('us_news', USNewsCollector, News, lambda collector: collector.collect_and_store_news()),
+        'collect.crypto_news': ('crypto_news', CryptoNewsCollector, News,
+                                lambda collector: collector.collect_and_store_news()),
+    }
+
+    async def run_all():
+        # TestClient 가 쓰던 이벤트 루프의 커넥션을 버리고 이 루프에서 새로 연결
+        await dispose_async_engine()
+        results = {}
+        for name, (cassette, collector_class, model, collect) in cases.items():
+            async with get_async_db_session() as db:
+                marker = await db.scalar(select(func.max(model.id))) or 0
+
+            async def run_once():
+                # 매 회 새로 저장되도록 이전 회차에 저장한 행 삭제 (합성 데이터는 유지)
+                async with get_async_db_session() as db:
+                    await db.execute(delete(model).where(model.id > marker))
+                    await db.commit()
+                started = time.perf_counter()
+                with use_cassette(cassette, 'replay', directory=CASSETTE_DIR):
+                    async with collector_class() as collector:
+                        stored = await collect(collector)
+                return time.perf_counter() - started, stored
+
+            stored_counts = set()
+            for _ in range(2):
+                stored_counts.add((await run_once())[1])
+            durations = []
+            for _ in range(repeat):
+                elapsed, stored = await run_once()
+                durations.append(elapsed)
+                stored_counts.add(stored)
+            if stored_counts == {0}:
+                raise RuntimeError(f"{name}: nothing stored from cassette '{cassette}'")
+            results[name] = summarize(durations, max(stored_counts))
+        await dispose_async_engine()
+        return results
+
+    return asyncio.run(run_all())
+
+
+def git_info() -> Dict:
+    def run(*args) -> Optional[str]:
+        try:
+            return subprocess.run(['git', *args], cwd=BENCH_DIR, capture_output=True, text=True,
+                                  timeout=10).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+    return {
+        'commit': run('rev-parse', '--short', 'HEAD'),
+        'branch': run('rev-parse', '--abbrev-ref', 'HEAD'),
+        'dirty': bool(run('status', '--porcelain', '--untracked-files=no')),
+    }
+
+
+def compare(current: Dict, baseline_path: str):
+    """이전 결과와 p50 비교 출력 (+ 는 느려짐)"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"\ncompare with {os.path.basename(baseline_path)} (commit {baseline['git'].get('commit')})")
+    for name, result in current['results'].items():
+        old = baseline['results'].get(name)
+        if not old:
+            print(f"  {name:<28} {result['p50_ms']:>10.3f}ms  (new)")
+            continue
+        change = (result['p50_ms'] - old['p50_ms']) / old['p50_ms'] * 100 if old['p50_ms'] else 0.0
+        print(f"  {name:<28} {old['p50_ms']:>10.3f}ms -> {result['p50_ms']:>10.3f}ms  {change:+6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="합성 데이터 배율")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=30, help="구간별 측정 횟수")
+    parser.add_argument('--only', choices=['filter', 'parse', 'api', 'collect'], action='append',
+                        help="일부 그룹만 실행 (여러 번 지정 가능)")
+    parser.add_argument('--output', help="결과 JSON 경로 (기본: benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+    groups = args.only or ['filter', 'parse', 'api', 'collect']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        db_url = f"sqlite:///{db_path}"
+        # settings 는 import 시점에 환경변수를 읽으므로 src 를 import 하기 전에 설정
+        os.environ.update({
+            'DATABASE_URL': db_url,
+            'RESPONSE_CACHE_ENABLED': 'False',
+            'TRACING_ENABLED': 'False',
+            'LOG_FILE': os.path.join(tmp, 'bench.log'),
+            'ARCHIVE_DIR': os.path.join(tmp, 'archive'),
+        })
+
+        from synthetic import generate
+
+        dataset = generate(db_url, args.scale, args.seed)
+        print(f"dataset (scale={args.scale}, seed={args.seed}): {dataset}")
+
+        quiet_logs()
+
+        results = {}
+        if 'filter' in groups:
+            results.update(bench_filter(db_url, args.repeat))
+        if 'parse' in groups:
+            results.update(bench_parsers(args.repeat))
+        if 'api' in groups:
+            results.update(bench_api(args.repeat))
+        if 'collect' in groups:
+            results.update(bench_collectors(args.repeat))
+
+        from src.db.database import engine
+        engine.dispose()
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git': git_info(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'params': {'scale': args.scale, 'seed': args.seed, 'repeat': args.repeat, 'groups': groups},
+        'dataset': dataset,
+        'results': results,
+    }
+
+    print(f"\n{'benchmark':<28} {'p50':>10} {'p95':>10} {'mean':>10} {'ops/s':>12}")
+    for name, result in results.items():
+        print(f"{name:<28} {result['p50_ms']:>8.3f}ms {result['p95_ms']:>8.3f}ms "
+              f"{result['mean_ms']:>8.3f}ms {result['ops_per_sec'] or 0:>12.1f}")
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULT_DIR, exist_ok=True)
+        output = os.path.join(RESULT_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{report['git']['commit'] or 'nogit'}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nsaved: {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,387 @@
+"""
+로컬 부하 테스트 - 피드/노트/SNS 혼합 워크로드를 단계별 동시 사용자 수로 실행
+한 인스턴스(main.py)가 몇 명의 동시 사용자를 감당하는지 라우트별 p50/p95/p99 / 오류율로 확인
+
+기본: 임시 SQLite DB 에 합성 데이터(benchmarks/synthetic.py)를 적재하고 uvicorn 으로 앱을 띄운 뒤 측정
+--url 을 주면 이미 떠 있는 인스턴스에 요청 (노트 생성/삭제, 좋아요, 댓글, 팔로우를 실제로 기록하므로 테스트용 DB 에서만)
+
+가상 사용자 하나는 쉬지 않고(--think-ms 로 대기 추가) 아래 비율로 요청:
+  피드 조회 (/api/feed, /api/sns/feed, /api/filings, /api/notes) / 노트 CRUD / 좋아요 / 댓글 / 팔로우-언팔로우
+
+결과: benchmarks/results/load-<시각>-<커밋>.json
+  단계별 처리량, 라우트별 p50/p95/p99/max, 오류(5xx/연결 실패)와 4xx 수, 그리고
+  p95 <= --slo-ms 이고 오류율 <= --max-error-rate 를 만족한 최대 동시 사용자 수(capacity)
+
+실행: python benchmarks/load_test.py [--steps 1,5,10,25,50] [--step-seconds 20] [--scale 1] [--url http://127.0.0.1:8000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ENGINE_DIR = os.path.join(BENCH_DIR, '..')
+
+from bench_suite import RESULT_DIR, _percentile, git_info
+
+SEARCH_TERMS = ["삼성", "영업이익", "반도체", "실적", "배당"]
+COMMENTS = ["좋은 정보 감사합니다", "저도 보유중입니다", "근거가 궁금하네요", "동의합니다"]
+
+# (동작, 가중치)
+WORKLOAD = [
+    ('feed', 25),
+    ('feed_page', 5),
+    ('feed_search', 4),
+    ('sns_feed', 18),
+    ('filings', 5),
+    ('notes_list', 8),
+    ('notes_search', 4),
+    ('note_create', 5),
+    ('note_read', 4),
+    ('note_update', 3),
+    ('note_delete', 3),
+    ('like', 8),
+    ('comment', 4),
+    ('comments_read', 3),
+    ('follow', 2),
+]
+
+
+class Recorder:
+    """라우트별 지연/오류 기록 (단계마다 새로 생성)"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.client_errors: Dict[str, int] = defaultdict(int)
+        self.error_samples: Dict[str, str] = {}
+
+    def add(self, route: str, elapsed: float, status: Optional[int], detail: str = ''):
+        self.latencies[route].append(elapsed)
+        if status is None or status >= 500:
+            self.errors[route] += 1
+            self.error_samples.setdefault(route, detail[:200])
+        elif status >= 400:
+            self.client_errors[route] += 1
+
+    def summary(self, seconds: float) -> Dict:
+        routes = {}
+        for route, values in sorted(self.latencies.items()):
+            routes[route] = {
+                'count': len(values),
+                'errors': self.errors[route],
+                'client_errors': self.client_errors[route],
+                'p50_ms': round(_percentile(values, 50) * 1000, 1),
+                'p95_ms': round(_percentile(values, 95) * 1000, 1),
+                'p99_ms': round(_percentile(values, 99) * 1000, 1),
+                'max_ms': round(max(values) * 1000, 1),
+            }
+            if route in self.error_samples:
+                routes[route]['error_sample'] = self.error_samples[route]
+        values = [value for route_values in self.latencies.values() for value in route_values]
+        total = len(values)
+        errors = sum(self.errors.values())
+        return {
+            'requests': total,
+            'rps': round(total / seconds, 1) if seconds else 0,
+            'errors': errors,
+            'error_rate': round(errors / total, 4) if total else 0,
+            'client_errors': sum(self.client_errors.values()),
+            'p50_ms': round(_percentile(values, 50) * 1000, 1) if values else None,
+            'p95_ms': round(_percentile(values, 95) * 1000, 1) if values else None,
+            'p99_ms': round(_percentile(values, 99) * 1000, 1) if values else None,
+            'routes': routes,
+        }
+
+
+class VirtualUser:
+    """혼합 워크로드를 반복하는 가상 사용자"""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, rng: random.Random,
+                 post_ids: List[int], user_ids: List[str], think: float):
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.post_ids = post_ids
+        self.user_ids = user_ids
+        self.think = think
+        self.note_ids: List[int] = []
+        self.following: List[str] = []
+        self.actions = [name for name, _ in WORKLOAD]
+        self.weights = [weight for _, weight in WORKLOAD]
+
+    async def request(self, route: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.add(route, time.perf_counter() - started, None, f"{type(e).__name__}: {e}")
+            return None
+        self.recorder.add(route, time.perf_counter() - started, response.status_code, response.text)
+        return response
+
+    async def run(self, deadline: float):
+        while time.perf_counter() < deadline:
+            action = self.rng.choices(self.actions, weights=self.weights)[0]
+            await getattr(self, f"do_{action}")()
+            if self.think:
+                await asyncio.sleep(self.rng.uniform(0.5, 1.5) * self.think)
+
+    # -- 피드 조회 --
+    async def do_feed(self):
+        await self.request("GET /api/feed", "GET", "/api/feed", params={'page': 1, 'limit': 20})
+
+    async def do_feed_page(self):
+        await self.request("GET /api/feed?page=N", "GET", "/api/feed",
+                           params={'page': self.rng.randint(2, 10), 'limit': 20})
+
+    async def do_feed_search(self):
+        await self.request("GET /api/feed?search=", "GET", "/api/feed",
+                           params={'search': self.rng.choice(SEARCH_TERMS), 'limit': 20})
+
+    async def do_sns_feed(self):
+        await self.request("GET /api/sns/feed", "GET", "/api/sns/feed",
+                           params={'page': self.rng.choice([1, 1, 1, 2]), 'limit': 20})
+
+    async def do_filings(self):
+        await self.request("GET /api/filings", "GET", "/api/filings",
+                           params={'grade': self.rng.choice(['', 'A', 'B']), 'page': 1, 'limit': 20})
+
+    async def do_notes_list(self):
+        await self.request("GET /api/notes/", "GET", "/api/notes/", params={'page': 1, 'limit': 20})
+
+    async def do_notes_search(self):
+        await self.request("GET /api/notes/?search=", "GET", "/api/notes/",
+                           params={'search': self.rng.choice(SEARCH_TERMS)})
+
+    # -- 노트 CRUD (자기가 만든 노트만 수정/삭제) --
+    async def do_note_create(self):
+        response = await self.request("POST /api/notes/", "POST", "/api/notes/", json={
+            'note_type': 'memo',
+            'title': f"부하 테스트 메모 {self.rng.randrange(10 ** 6)}",
+            'content': ' '.join(self.rng.choices(SEARCH_TERMS, k=12)),
+            'folder': '기본',
+            'tags': ['부하테스트'],
+        })
+        if response is not None and response.status_code == 200:
+            note_id = response.json().get('note_id')
+            if note_id:
+                self.note_ids.append(note_id)
+
+    async def do_note_read(self):
+        if not self.note_ids:
+            return await self.do_note_create()
+        await self.request("GET /api/notes/{id}", "GET", f"/api/notes/{self.rng.choice(self.note_ids)}")
+
+    async def do_note_update(self):
+        if not self.note_ids:
+            return await self.do_note_create()
+        await self.request("PUT /api/notes/{id}", "PUT", f"/api/notes/{self.rng.choice(self.note_ids)}",
+                           json={'content': ' '.join(self.rng.choices(SEARCH_TERMS, k=15)), 'importance': 1})
+
+    async def do_note_delete(self):
+        if not self.note_ids:
+            return await self.do_note_create()
+        note_id = self.note_ids.pop(self.rng.randrange(len(self.note_ids)))
+        await self.request("DELETE /api/notes/{id}", "DELETE", f"/api/notes/{note_id}")
+
+    # -- SNS --
+    async def do_like(self):
+        await self.request("POST /api/sns/posts/{id}/like", "POST",
+                           f"/api/sns/posts/{self.rng.choice(self.post_ids)}/like")
+
+    async def do_comment(self):
+        await self.request("POST /api/sns/posts/{id}/comments", "POST",
+                           f"/api/sns/posts/{self.rng.choice(self.post_ids)}/comments",
+                           json={'content': self.rng.choice(COMMENTS)})
+
+    async def do_comments_read(self):
+        await self.request("GET /api/sns/posts/{id}/comments", "GET",
+                           f"/api/sns/posts/{self.rng.choice(self.post_ids)}/comments")
+
+    async def do_follow(self):
+        # 가상 사용자마다 다른 대상 -> 같은 관계를 동시에 만들다 생기는 400 은 최소화
+        if self.following:
+            target = self.following.pop()
+            await self.request("DELETE /api/sns/follow/{id}", "DELETE", f"/api/sns/follow/{target}")
+            return
+        target = self.rng.choice(self.user_ids)
+        response = await self.request("POST /api/sns/follow", "POST", "/api/sns/follow",
+                                      json={'following_id': target})
+        if response is not None and response.status_code == 200:
+            self.following.append(target)
+
+
+async def discover(base_url: str) -> List[int]:
+    """좋아요/댓글 대상 포스트 id (피드에서 수집)"""
+    post_ids = []
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+        for page in range(1, 6):
+            response = await client.get("/api/sns/feed", params={'page': page, 'limit': 50})
+            response.raise_for_status()
+            posts = response.json().get('posts', [])
+            post_ids.extend(post['id'] for post in posts)
+            if len(posts) < 50:
+                break
+    return post_ids
+
+
+async def run_step(base_url: str, users: int, seconds: float, seed: int, think: float,
+                   post_ids: List[int], user_ids: List[str]) -> Dict:
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        started = time.perf_counter()
+        deadline = started + seconds
+        await asyncio.gather(*[
+            VirtualUser(client, recorder, random.Random(seed * 1000 + index), post_ids, user_ids, think).run(deadline)
+            for index in range(users)
+        ])
+        elapsed = time.perf_counter() - started
+    return {'users': users, 'seconds': round(elapsed, 1), **recorder.summary(elapsed)}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_local_app(tmp: str, scale: float, seed: int, workers: int, response_cache: bool = True):
+    """합성 데이터 DB + uvicorn 서버 시작 -> (프로세스, base_url, 데이터셋)"""
+    db_path = os.path.join(tmp, 'load.db')
+    env = {
+        **os.environ,
+        'DATABASE_URL': f"sqlite:///{db_path}",
+        'SCHEDULER_ENABLED': 'False',
+        'TRACING_ENABLED': 'False',
+        'LOG_LEVEL': 'WARNING',
+        'LOG_FILE': os.path.join(tmp, 'load.log'),
+        'ARCHIVE_DIR': os.path.join(tmp, 'archive'),
+        'RESPONSE_CACHE_ENABLED': str(response_cache),
+    }
+    os.environ.update({key: env[key] for key in ('DATABASE_URL', 'TRACING_ENABLED', 'LOG_FILE')})
+    sys.path.insert(0, ENGINE_DIR)
+    from synthetic import generate
+    dataset = generate(env['DATABASE_URL'], scale, seed)
+
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(port),
+         '--workers', str(workers), '--log-level', 'warning', '--no-access-log'],
+        cwd=ENGINE_DIR, env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(150):
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/", timeout=1.0).status_code == 200:
+                return process, base_url, dataset
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not start within 30s")
+
+
+def print_step(result: Dict):
+    print(f"\n== {result['users']} users: {result['requests']} req in {result['seconds']}s "
+          f"({result['rps']} req/s)  p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms  "
+          f"errors={result['errors']} 4xx={result['client_errors']}")
+    print(f"   {'route':<36} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>5} {'4xx':>5}")
+    for route, stats in result['routes'].items():
+        print(f"   {route:<36} {stats['count']:>6} {stats['p50_ms']:>8} {stats['p95_ms']:>8} "
+              f"{stats['p99_ms']:>8} {stats['errors']:>5} {stats['client_errors']:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help="이미 실행 중인 인스턴스 (없으면 임시 DB 로 로컬 실행)")
+    parser.add_argument('--steps', default='1,5,10,25,50', help="동시 사용자 단계 (쉼표 구분)")
+    parser.add_argument('--step-seconds', type=float, default=20.0)
+    parser.add_argument('--think-ms', type=float, default=0.0, help="요청 사이 평균 대기 (0 = 쉬지 않음)")
+    parser.add_argument('--scale', type=float, default=1.0, help="로컬 실행 시 합성 데이터 배율")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=1, help="로컬 실행 시 uvicorn 워커 수")
+    parser.add_argument('--no-response-cache', action='store_true', help="로컬 실행 시 응답 캐시 끄기 (DB 경로만 측정)")
+    parser.add_argument('--slo-ms', type=float, default=500.0, help="capacity 판정 p95 기준")
+    parser.add_argument('--max-error-rate', type=float, default=0.01, help="capacity 판정 오류율 기준")
+    parser.add_argument('--stop-on-breach', action='store_true', help="기준을 넘으면 다음 단계 생략")
+    parser.add_argument('--output', help="결과 JSON 경로 (기본: benchmarks/results/load-<시각>-<커밋>.json)")
+    args = parser.parse_args()
+    steps = [int(step) for step in args.steps.split(',') if step.strip()]
+
+    process = None
+    dataset = None
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            if args.url:
+                base_url = args.url.rstrip('/')
+            else:
+                process, base_url, dataset = start_local_app(tmp, args.scale, args.seed, args.workers,
+                                                             not args.no_response_cache)
+                print(f"local app {base_url} (scale={args.scale}, seed={args.seed}): {dataset}")
+
+            post_ids = asyncio.run(discover(base_url))
+            if not post_ids:
+                parser.error("no public SNS posts to like/comment - seed the target DB first")
+            user_ids = [f"user_{index:04d}" for index in range(1, 100)]
+
+            results = []
+            capacity = 0
+            for users in steps:
+                result = asyncio.run(run_step(base_url, users, args.step_seconds, args.seed, args.think_ms / 1000,
+                                              post_ids, user_ids))
+                result['within_slo'] = (result['p95_ms'] is not None and result['p95_ms'] <= args.slo_ms
+                                        and result['error_rate'] <= args.max_error_rate)
+                results.append(result)
+                print_step(result)
+                if result['within_slo']:
+                    capacity = max(capacity, users)
+                elif args.stop_on_breach:
+                    print(f"\nSLO breached at {users} users - stopping")
+                    break
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=30)
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git': git_info(),
+        'target': args.url or 'local',
+        'params': {
+            'steps': steps, 'step_seconds': args.step_seconds, 'think_ms': args.think_ms,
+            'scale': args.scale, 'seed': args.seed, 'workers': args.workers,
+            'response_cache': not args.no_response_cache,
+            'slo_ms': args.slo_ms, 'max_error_rate': args.max_error_rate,
+        },
+        'workload': dict(WORKLOAD),
+        'dataset': dataset,
+        'capacity_users': capacity,
+        'steps': results,
+    }
+    output = args.output
+    if not output:
+        os.makedirs(RESULT_DIR, exist_ok=True)
+        output = os.path.join(RESULT_DIR, f"load-{datetime.now():%Y%m%d-%H%M%S}-{report['git']['commit'] or 'nogit'}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\ncapacity: {capacity} users (p95 <= {args.slo_ms}ms, error rate <= {args.max_error_rate})")
+    print(f"saved: {output}")
+
+
+if __name__ == '__main__':
+    main()
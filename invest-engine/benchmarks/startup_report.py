@@ -0,0 +1,205 @@
+"""
+시작 시간 리포트 - main.py import 시간과 (선택) uvicorn 이 /health 에 응답하기까지 걸린 시간
+컨테이너 오토스케일링용 cold start 목표(--target-ms)를 넘으면 종료 코드 1 (CI 에서 회귀 확인)
+
+import: python -X importtime -c "import main" 을 --runs 번 실행해 중앙값
+  무거운 모듈(top-level 패키지별 self 시간 합계)과 src.* 모듈(누적 시간) 상위 --top 개 출력
+  openai/telegram/bs4/feedparser/pyarrow/numpy 처럼 첫 사용 때 로드해야 하는 모듈이 import 되면 경고
+--serve: 임시 SQLite DB 로 uvicorn 을 두 번 시작
+  cold = 빈 DB (테이블 생성), fast = 같은 DB + FAST_START=True (스키마가 그대로면 테이블 확인 생략)
+
+결과: benchmarks/results/startup-<시각>-<커밋>.json
+
+실행: python benchmarks/startup_report.py [--runs 5] [--serve] [--target-ms 1500]
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ENGINE_DIR = os.path.join(BENCH_DIR, '..')
+
+from bench_suite import RESULT_DIR, git_info
+
+# API 시작 시 import 되면 안 되는 모듈 (작업/요청에서 처음 쓸 때 로드)
+LAZY_MODULES = ['openai', 'telegram', 'bs4', 'feedparser', 'pyarrow', 'numpy', 'alembic']
+
+
+def _env(tmp: str, **extra) -> Dict[str, str]:
+    return {
+        **os.environ,
+        'DATABASE_URL': f"sqlite:///{os.path.join(tmp, 'startup.db')}",
+        'SCHEDULER_ENABLED': 'False',
+        'TRACING_ENABLED': 'False',
+        'LOG_LEVEL': 'WARNING',
+        'LOG_FILE': os.path.join(tmp, 'startup.log'),
+        **extra,
+    }
+
+
+def parse_importtime(output: str) -> List[Dict]:
+    """-X importtime 출력 -> [{'module', 'self_us', 'cumulative_us', 'depth'}]"""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            rows.append({
+                'module': name.strip(),
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth': (len(name) - len(name.lstrip()) - 1) // 2,
+            })
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_import(env: Dict[str, str]) -> Dict:
+    """새 인터프리터에서 import main 한 번"""
+    probe = "import main, sys; print(','.join(m for m in %r if m in sys.modules))" % (LAZY_MODULES,)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', probe],
+        cwd=ENGINE_DIR, env=env, capture_output=True, text=True, timeout=120,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import main failed:\n{result.stderr[-2000:]}")
+    rows = parse_importtime(result.stderr)
+    main_row = next((row for row in rows if row['module'] == 'main'), None)
+    loaded = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ''
+    return {
+        'total_ms': round(main_row['cumulative_us'] / 1000, 1) if main_row else None,
+        'rows': rows,
+        'eager_heavy_modules': [m for m in loaded.split(',') if m],
+    }
+
+
+def summarize_imports(rows: List[Dict], top: int) -> Dict:
+    by_package = defaultdict(int)
+    for row in rows:
+        by_package[row['module'].split('.')[0]] += row['self_us']
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+    src_modules = sorted((row for row in rows if row['module'].startswith('src.')),
+                         key=lambda row: row['cumulative_us'], reverse=True)[:top]
+    return {
+        'packages': [{'package': name, 'self_ms': round(us / 1000, 1)} for name, us in packages],
+        'src_modules': [{'module': row['module'], 'cumulative_ms': round(row['cumulative_us'] / 1000, 1)}
+                        for row in src_modules],
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def measure_ready(env: Dict[str, str], timeout: float = 60.0) -> float:
+    """uvicorn 프로세스 시작 -> /health 200 까지 걸린 시간 (ms)"""
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(port),
+         '--log-level', 'warning', '--no-access-log'],
+        cwd=ENGINE_DIR, env=env,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0).status_code == 200:
+                    return round((time.perf_counter() - started) * 1000, 1)
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.02)
+        raise RuntimeError(f"uvicorn did not become healthy within {timeout:.0f}s")
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help="import 측정 횟수 (중앙값 사용)")
+    parser.add_argument('--top', type=int, default=15, help="출력할 상위 모듈 수")
+    parser.add_argument('--serve', action='store_true', help="uvicorn 시작 -> /health 응답 시간도 측정")
+    parser.add_argument('--target-ms', type=float,
+                        help="cold start 목표 (--serve 면 FAST_START 시작 시간, 아니면 import 시간)")
+    parser.add_argument('--output', help="결과 JSON 경로 (기본: benchmarks/results/startup-<시각>-<커밋>.json)")
+    args = parser.parse_args()
+
+    ready: Optional[Dict] = None
+    with tempfile.TemporaryDirectory() as tmp:
+        env = _env(tmp)
+        runs = [measure_import(env) for _ in range(max(args.runs, 1))]
+        if args.serve:
+            ready = {
+                'cold_ms': measure_ready(env),
+                'fast_ms': measure_ready(_env(tmp, FAST_START='True')),
+            }
+
+    totals = [run['total_ms'] for run in runs if run['total_ms'] is not None]
+    import_ms = round(statistics.median(totals), 1) if totals else None
+    median_run = min(runs, key=lambda run: abs((run['total_ms'] or 0) - (import_ms or 0)))
+    summary = summarize_imports(median_run['rows'], args.top)
+    eager = sorted({m for run in runs for m in run['eager_heavy_modules']})
+
+    print(f"import main: median {import_ms}ms over {len(totals)} runs "
+          f"(min {min(totals) if totals else None}, max {max(totals) if totals else None})")
+    print(f"\n   {'package':<28} {'self ms':>8}")
+    for item in summary['packages']:
+        print(f"   {item['package']:<28} {item['self_ms']:>8}")
+    print(f"\n   {'src module':<40} {'cum ms':>8}")
+    for item in summary['src_modules']:
+        print(f"   {item['module']:<40} {item['cumulative_ms']:>8}")
+    if eager:
+        print(f"\nWARNING: imported at startup (should load on first use): {', '.join(eager)}")
+    if ready:
+        print(f"\ntime to /health: cold {ready['cold_ms']}ms (new DB), fast {ready['fast_ms']}ms (FAST_START)")
+
+    cold_start_ms = ready['fast_ms'] if ready else import_ms
+    within_target = None
+    if args.target_ms is not None and cold_start_ms is not None:
+        within_target = cold_start_ms <= args.target_ms
+        print(f"\ncold start {cold_start_ms}ms {'<=' if within_target else '>'} target {args.target_ms}ms")
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git': git_info(),
+        'python': sys.version.split()[0],
+        'params': {'runs': args.runs, 'serve': args.serve, 'target_ms': args.target_ms},
+        'import_ms': {'median': import_ms, 'runs': totals},
+        'packages': summary['packages'],
+        'src_modules': summary['src_modules'],
+        'eager_heavy_modules': eager,
+        'ready_ms': ready,
+        'cold_start_ms': cold_start_ms,
+        'within_target': within_target,
+    }
+    output = args.output
+    if not output:
+        os.makedirs(RESULT_DIR, exist_ok=True)
+        output = os.path.join(RESULT_DIR, f"startup-{datetime.now():%Y%m%d-%H%M%S}-{report['git']['commit'] or 'nogit'}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"saved: {output}")
+
+    if within_target is False:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+"""
+벤치마크용 합성 데이터 생성기
+같은 seed/scale 이면 항상 같은 데이터 (시각은 anchor 기준 상대값, 기본 anchor = 오늘 0시)
+
+scale=1 기준 행 수:
+  stocks 200 / dart_filings 5,000 / news 10,000 / notes 2,000 / sns_posts 3,000
+  sns_comments 6,000 / user_profiles 100 / user_follows ~1,000
+
+실행 (단독): python benchmarks/synthetic.py --db /tmp/bench.db [--scale 1] [--seed 42]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sqlalchemy import create_engine, insert
+
+from src.analyzers.filing_filter import FilingFilter
+from src.db.models import (
+    Base, DartFiling, News, Note, SNSComment, SNSPost, Stock, UserFollow, UserProfile
+)
+
+# 노트/SNS API 의 get_current_user_id() 와 같은 값 - 피드/검색 벤치가 이 사용자 기준으로 조회
+CURRENT_USER_ID = "user_me"
+
+BASE_ROWS = {
+    'stocks': 200,
+    'dart_filings': 5000,
+    'news': 10000,
+    'notes': 2000,
+    'sns_posts': 3000,
+    'users': 100,
+}
+
+# 실제 공시 비율에 가깝게: 정기공시(A) 소수, 중요 비정기(B) 일부, 나머지 기타(C)
+REPORT_NAMES = [
+    ("분기보고서 ({year}.09)", 2),
+    ("반기보고서 ({year}.06)", 1),
+    ("사업보고서 ({year}.12)", 1),
+    ("주요사항보고서(자기주식취득결정)", 3),
+    ("주요사항보고서(유상증자결정)", 2),
+    ("전환사채권발행결정", 2),
+    ("최대주주변경", 1),
+    ("타법인주식및출자증권취득결정", 2),
+    ("임원ㆍ주요주주특정증권등소유상황보고서", 12),
+    ("주식등의대량보유상황보고서", 8),
+    ("기업설명회(IR)개최(안내공시)", 4),
+    ("단일판매ㆍ공급계약체결", 4),
+    ("기타시장안내", 3),
+    ("[기재정정]투자설명서", 2),
+    ("증권발행실적보고서", 3),
+]
+
+SECTORS = ["반도체", "2차전지", "바이오", "자동차", "인터넷", "게임", "금융", "화학", "철강", "조선", "건설", "유통"]
+NAME_PARTS = ["삼성", "한국", "대한", "신한", "현대", "에스", "케이", "엘지", "미래", "동양", "세아", "한화", "코리아", "글로벌"]
+NAME_SUFFIXES = ["전자", "바이오", "테크", "화학", "중공업", "제약", "소프트", "에너지", "홀딩스", "반도체", "머티리얼즈", "시스템"]
+NEWS_SOURCES = {
+    'kr': ["네이버금융", "한국경제", "매일경제", "연합뉴스"],
+    'us': ["Yahoo Finance", "Google Finance", "Reuters"],
+    'crypto': ["CoinDesk", "Cointelegraph"],
+}
+US_TICKERS = ["AAPL", "NVDA", "MSFT", "TSLA", "AMZN", "GOOGL", "META", "AMD", "NFLX", "AVGO"]
+TOPICS = ["실적", "수주", "목표주가", "외국인 순매수", "신제품", "배당", "공매도", "자사주", "인수합병", "증설"]
+US_TOPICS = ["earnings beat", "guidance", "AI demand", "buyback", "price target", "antitrust probe", "chip exports"]
+CRYPTO_TOPICS = ["ETF inflows", "halving", "stablecoin bill", "exchange hack", "on-chain volume"]
+TAGS = ["관심", "매수검토", "실적", "장기", "단타", "리포트", "공시", "뉴스"]
+FOLDERS = ["기본", "반도체", "2차전지", "미국주식", "리포트"]
+MEMO_WORDS = ["영업이익", "컨센서스", "밸류에이션", "PER", "PBR", "수급", "차트", "지지선", "저항선", "분할매수",
+              "배당수익률", "성장성", "리스크", "환율", "금리", "재고", "마진", "점유율"]
+
+
+def _weighted(rng: random.Random, choices):
+    return rng.choices([item for item, _ in choices], weights=[weight for _, weight in choices])[0]
+
+
+def _insert(conn, model, rows, batch_size: int = 2000):
+    for start in range(0, len(rows), batch_size):
+        conn.execute(insert(model), rows[start:start + batch_size])
+
+
+def generate(db_url: str, scale: float = 1.0, seed: int = 42, anchor: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    db_url 의 DB 에 테이블을 만들고 합성 데이터 적재
+
+    Args:
+        db_url: SQLAlchemy 동기 URL (빈 DB 권장)
+        scale: 행 수 배율 (BASE_ROWS * scale)
+        seed: 난수 seed
+        anchor: 시각 기준점 (기본: 오늘 0시) - 모든 created_at 은 anchor 이전 90일 안
+
+    Returns:
+        테이블별 적재 행 수
+    """
+    rng = random.Random(seed)
+    anchor = anchor or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    counts = {key: max(1, int(value * scale)) for key, value in BASE_ROWS.items()}
+    span_seconds = 90 * 24 * 3600
+
+    def past(max_seconds: int = span_seconds) -> datetime:
+        return anchor - timedelta(seconds=rng.randrange(max_seconds))
+
+    # 종목
+    stocks = []
+    for i in range(counts['stocks']):
+        name = f"{rng.choice(NAME_PARTS)}{rng.choice(NAME_SUFFIXES)}{'' if i < 150 else i}"
+        stocks.append({
+            'stock_code': f"{100000 + i * 37:06d}",
+            'corp_code': f"{126000 + i:08d}",
+            'corp_name': name,
+            'market': 'KOSPI' if rng.random() < 0.45 else 'KOSDAQ',
+            'sector': rng.choice(SECTORS),
+            'market_cap': round(rng.lognormvariate(27, 1.5)),
+            'is_active': True,
+            'created_at': anchor - timedelta(days=365),
+            'updated_at': anchor - timedelta(days=365),
+        })
+
+    # 공시 (rcept_dt 는 created_at 과 같은 날)
+    filings = []
+    for i in range(counts['dart_filings']):
+        stock = rng.choice(stocks)
+        created = past()
+        filings.append({
+            'rcept_no': f"{created:%Y%m%d}{800000 + i:06d}",
+            'stock_code': stock['stock_code'],
+            'corp_code': stock['corp_code'],
+            'corp_name': stock['corp_name'],
+            'corp_cls': 'Y' if stock['market'] == 'KOSPI' else 'K',
+            'report_nm': _weighted(rng, REPORT_NAMES).format(year=created.year - 1),
+            'rcept_dt': f"{created:%Y%m%d}",
+            'flr_nm': stock['corp_name'],
+            'rm': rng.choice(["", "유", "코", "정"]),
+            'is_alerted': rng.random() < 0.3,
+            'created_at': created,
+        })
+    # 등급은 실제 수집 경로처럼 FilingFilter 결과를 저장 (피드 grade 필터가 의미 있도록)
+    filing_filter = FilingFilter()
+    for filing in filings:
+        filing['grade'] = filing_filter.match_keyword(filing['report_nm'])[0].value
+
+    # 뉴스 (kr 60% / us 30% / crypto 10%)
+    news = []
+    for i in range(counts['news']):
+        market = _weighted(rng, [('kr', 6), ('us', 3), ('crypto', 1)])
+        created = past()
+        if market == 'kr':
+            stock = rng.choice(stocks)
+            title = f"{stock['corp_name']}, {rng.choice(TOPICS)} 기대감에 {rng.choice(['강세', '약세', '보합'])}"
+            codes = [stock['stock_code']]
+        elif market == 'us':
+            ticker = rng.choice(US_TICKERS)
+            title = f"{ticker} shares move on {rng.choice(US_TOPICS)}"
+            codes = [ticker]
+        else:
+            title = f"Bitcoin {rng.choice(['rallies', 'slides', 'steadies'])} as {rng.choice(CRYPTO_TOPICS)} in focus"
+            codes = ["BTC"]
+        news.append({
+            'title': title,
+            'content': f"{title}. " * rng.randint(2, 6),
+            'url': f"https://bench.news/{market}/{i}",
+            'source': rng.choice(NEWS_SOURCES[market]),
+            'market': market,
+            'published_at': created - timedelta(minutes=rng.randint(1, 30)),
+            'stock_codes': codes,
+            'importance_score': round(rng.random(), 2),
+            'created_at': created,
+        })
+
+    # 사용자: CURRENT_USER_ID + user_0001..
+    users = [CURRENT_USER_ID] + [f"user_{i:04d}" for i in range(1, counts['users'])]
+    profiles = [{
+        'user_id': user_id,
+        'username': "나" if user_id == CURRENT_USER_ID else f"투자자{user_id[-4:]}",
+        'avatar_text': "나" if user_id == CURRENT_USER_ID else "투",
+        'posts_count': 0, 'notes_count': 0, 'followers_count': 0, 'following_count': 0,
+        'is_public': True, 'email_notifications': True, 'push_notifications': True,
+        'created_at': anchor - timedelta(days=180), 'updated_at': anchor - timedelta(days=180),
+    } for user_id in users]
+
+    # 팔로우: 현재 사용자는 30명, 나머지는 4~25명 (긴 꼬리)
+    follows = set()
+    for user_id in users:
+        fanout = min(30, len(users) - 1) if user_id == CURRENT_USER_ID else min(int(rng.paretovariate(1.2) * 4), 25)
+        for target in rng.sample(users, min(fanout, len(users))):
+            if target != user_id:
+                follows.add((user_id, target))
+    follow_rows = [{'follower_id': follower, 'following_id': following, 'created_at': past()}
+                   for follower, following in sorted(follows)]
+
+    # 노트: 절반은 현재 사용자 (노트 검색 벤치 대상)
+    notes = []
+    for i in range(counts['notes']):
+        stock = rng.choice(stocks)
+        note_type = _weighted(rng, [('memo', 5), ('scrap', 3), ('news', 1), ('filing', 1)])
+        created = past()
+        words = ' '.join(rng.choices(MEMO_WORDS, k=rng.randint(8, 40)))
+        notes.append({
+            'user_id': CURRENT_USER_ID if i % 2 == 0 else rng.choice(users),
+            'note_type': note_type,
+            'title': f"{stock['corp_name']} {rng.choice(TOPICS)} 메모",
+            'content': f"{stock['corp_name']} {words}",
+            'url': f"https://bench.news/kr/{rng.randrange(counts['news'])}" if note_type != 'memo' else None,
+            'source_title': f"{stock['corp_name']} 관련 기사" if note_type != 'memo' else None,
+            'stock_code': stock['stock_code'],
+            'stock_name': stock['corp_name'],
+            'folder': rng.choice(FOLDERS),
+            'tags': rng.sample(TAGS, rng.randint(0, 3)),
+            'is_bookmarked': rng.random() < 0.1,
+            'is_public': rng.random() < 0.2,
+            'importance': 1 if rng.random() < 0.1 else 0,
+            'created_at': created,
+            'updated_at': created,
+        })
+
+    engine = create_engine(db_url)
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        _insert(conn, Stock, stocks)
+        _insert(conn, DartFiling, filings)
+        _insert(conn, News, news)
+        _insert(conn, UserProfile, profiles)
+        _insert(conn, UserFollow, follow_rows)
+        _insert(conn, Note, notes)
+
+    # SNS 포스트 (노트 id 가 필요해서 노트 적재 후 생성, 10% 는 스크랩 공유)
+    posts = []
+    for i in range(counts['sns_posts']):
+        user_id = rng.choice(users)
+        stock = rng.choice(stocks)
+        is_scrap = rng.random() < 0.1
+        created = past()
+        posts.append({
+            'user_id': user_id,
+            'author_name': f"투자자{user_id[-4:]}",
+            'content': f"{stock['corp_name']} {' '.join(rng.choices(MEMO_WORDS, k=rng.randint(5, 25)))}",
+            'is_scrap_share': is_scrap,
+            'note_id': rng.randint(1, len(notes)) if is_scrap else None,
+            'stock_tags': [stock['corp_name']],
+            'likes_count': int(rng.paretovariate(1.2)) - 1,
+            'comments_count': 0,
+            'shares_count': 0,
+            'is_public': rng.random() < 0.95,
+            'is_pinned': False,
+            'created_at': created,
+            'updated_at': created,
+        })
+    comments = []
+    for _ in range(len(posts) * 2):
+        post_id = rng.randint(1, len(posts))
+        posts[post_id - 1]['comments_count'] += 1
+        user_id = rng.choice(users)
+        comments.append({
+            'post_id': post_id,
+            'user_id': user_id,
+            'author_name': f"투자자{user_id[-4:]}",
+            'content': rng.choice(["좋은 정보 감사합니다", "저도 보유중입니다", "근거가 궁금하네요", "동의합니다"]),
+            'created_at': posts[post_id - 1]['created_at'] + timedelta(minutes=rng.randint(1, 600)),
+        })
+    with engine.begin() as conn:
+        _insert(conn, SNSPost, posts)
+        _insert(conn, SNSComment, comments)
+    engine.dispose()
+
+    result = {
+        'stocks': len(stocks),
+        'dart_filings': len(filings),
+        'news': len(news),
+        'user_profiles': len(profiles),
+        'user_follows': len(follow_rows),
+        'notes': len(notes),
+        'sns_posts': len(posts),
+        'sns_comments': len(comments),
+        'seconds': round(time.perf_counter() - started, 2),
+    }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', required=True, help="SQLite 파일 경로")
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        parser.error(f"{args.db} already exists - use a new file")
+    print(generate(f"sqlite:///{args.db}", args.scale, args.seed))
+
+
+if __name__ == '__main__':
+    main()
@@ -18,21 +18,22 @@ from datetime import datetime
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.config.settings import settings
-from src.db.database import create_tables, get_db
-from src.scheduler.job_scheduler import scheduler
-# from src.scheduler import auto_scheduler  # 새 자동 수집 스케줄러
+from src.db.database import create_tables, get_db, get_async_db, dispose_async_engine
+from src.scheduler.orchestrator import orchestrator
+from src.scheduler.leader import leader_elector
 from src.alerts.telegram_bot import telegram_bot, send_test_message
-from src.alerts.telegram_alert import telegram_alert, send_test_telegram_alert, process_all_high_priority_content
+from src.alerts.telegram_alert import telegram_alert, send_test_telegram_alert
 from src.alerts.briefing import briefing_generator
-from src.collectors.dart import DartCollector
-from src.collectors.naver_news import NaverNewsCollector
-from src.collectors.us_news import USNewsCollector
-from src.collectors.crypto_news import CryptoNewsCollector
-from src.services.translator import translate_news_batch
+from src.services.response_cache import cached_response, response_cache
+from src.monitoring.metrics import MetricsMiddleware, render_metrics
+from src.monitoring.tracing import tracer
+from src.monitoring.profiler import RequestProfilerMiddleware
 
 # Import API routers
 from src.api.notes import router as notes_router
 from src.api.sns import router as sns_router
+from src.api.influencers import router as influencers_router
+from src.api.admin import router as admin_router
 
 # Setup logging
 logger.add(
@@ -43,24 +44,49 @@ logger.add(
     format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}"
 )
 
+def warm_up_clients():
+    """외부 클라이언트 미리 생성 (텔레그램 Bot, OpenAI) - import 가 무거워 시작 후 백그라운드 스레드에서"""
+    try:
+        from src.services.translator import news_translator
+        
+        for client in (telegram_bot.bot, telegram_alert.bot, news_translator.openai_client):
+            if client is not None:
+                logger.debug(f"Warmed up {type(client).__name__}")
+    except Exception as e:
+        logger.warning(f"Client warm-up failed (retried on first use): {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
     logger.info("Starting Investment Engine")
     
-    # Create database tables
-    create_tables()
-    logger.info("Database tables created")
+    # Create database tables (FAST_START: 스키마가 그대로면 생략)
+    if create_tables():
+        logger.info("Database tables created")
+    else:
+        logger.info("Database schema unchanged, table check skipped (FAST_START)")
+    
+    # 외부 클라이언트는 요청 처리와 동시에 준비
+    warm_up = asyncio.create_task(asyncio.to_thread(warm_up_clients))
     
-    # Start scheduler
-    await scheduler.start()
+    # Start scheduler (API 전용 인스턴스 / 부하 테스트는 SCHEDULER_ENABLED=False)
+    # 리더 선출: uvicorn --workers N 이어도 임대를 가진 프로세스 하나만 정기 작업 실행
+    if settings.SCHEDULER_ENABLED and settings.LEADER_ELECTION_ENABLED:
+        await leader_elector.start(on_elected=orchestrator.start, on_demoted=orchestrator.demote)
+    elif settings.SCHEDULER_ENABLED:
+        await orchestrator.start()
+    else:
+        logger.info("Scheduler disabled (SCHEDULER_ENABLED=False)")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Investment Engine")
-    await scheduler.stop()
+    await warm_up
+    await orchestrator.stop()  # 리더(또는 단일 프로세스)만 실행 중 -> 종료 알림은 한 번
+    await leader_elector.stop()
+    await dispose_async_engine()
 
 # Create FastAPI app
 app = FastAPI(
@@ -79,9 +105,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Route latency / request count metrics (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# Per-request cProfile (X-Profile: 1 + X-Admin-Token)
+app.add_middleware(RequestProfilerMiddleware)
+
 # Include API routers
 app.include_router(notes_router)
 app.include_router(sns_router)
+app.include_router(influencers_router)
+app.include_router(admin_router)
 
 @app.get("/")
 async def root():
@@ -106,7 +140,12 @@ async def health_check():
         db_status = f"error: {str(e)}"
     
     # Check scheduler
-    scheduler_status = "running" if scheduler.is_running else "stopped"
+    if orchestrator.is_running:
+        scheduler_status = "running"
+    elif leader_elector.enabled:
+        scheduler_status = "standby"  # 다른 프로세스가 리더
+    else:
+        scheduler_status = "stopped"
     
     # Check Telegram bot
     bot_status = "configured" if telegram_bot.bot else "not_configured"
@@ -122,7 +161,8 @@ async def health_check():
 @app.get("/status")
 async def get_status():
     """Get detailed system status"""
-    jobs_status = scheduler.get_jobs_status()
+    jobs_status = orchestrator.get_jobs_status()
+    jobs_status['leader'] = await asyncio.to_thread(leader_elector.get_status)
     
     return {
         "scheduler": jobs_status,
@@ -139,6 +179,23 @@ async def get_status():
         }
     }
 
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus metrics (jobs, collectors, LLM calls, API routes)"""
+    from fastapi.responses import PlainTextResponse
+    
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/debug/traces")
+async def get_slowest_traces(limit: int = 20, name: Optional[str] = None):
+    """Slowest recent pipeline / collection runs with per-stage spans (name: 루트 span 이름 필터)"""
+    return {
+        "success": True,
+        "enabled": tracer.enabled,
+        "export_file": tracer.path,
+        "data": tracer.slowest(limit=min(max(limit, 1), 200), name=name)
+    }
+
 # Manual trigger endpoints
 @app.post("/trigger/morning-briefing")
 async def trigger_morning_briefing():
@@ -170,13 +227,14 @@ async def trigger_market_close_summary():
 async def trigger_dart_collection():
     """Manually trigger DART collection"""
     try:
-        async with DartCollector() as collector:
-            new_filings = await collector.collect_and_store_filings(days_back=1)
-            return {
-                "success": True,
-                "new_filings": new_filings,
-                "message": f"DART collection completed: {new_filings} new filings"
-            }
+        outcome = await orchestrator.run_now('dart_collection')
+        new_filings = outcome['result'] or 0
+        return {
+            "success": outcome['status'] in ('ok', 'queued'),
+            "status": outcome['status'],
+            "new_filings": new_filings,
+            "message": f"DART collection {outcome['status']}: {new_filings} new filings"
+        }
     except Exception as e:
         logger.error(f"Manual DART collection failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -211,12 +269,11 @@ async def trigger_telegram_alert_test():
 async def trigger_process_high_priority():
     """Process and send high priority news/filings alerts"""
     try:
-        result = await process_all_high_priority_content()
-        total_sent = result["news_alerts"] + result["filing_alerts"]
+        outcome = await orchestrator.run_now('high_priority_alerts')
+        total_sent = outcome['result'] or 0
         return {
-            "success": True,
-            "news_alerts_sent": result["news_alerts"],
-            "filing_alerts_sent": result["filing_alerts"],
+            "success": outcome['status'] in ('ok', 'queued'),
+            "status": outcome['status'],
             "total_sent": total_sent,
             "message": f"Processed high priority content: {total_sent} alerts sent"
         }
@@ -228,13 +285,14 @@ async def trigger_process_high_priority():
 async def trigger_news_collection():
     """Manually trigger Naver news collection"""
     try:
-        async with NaverNewsCollector() as collector:
-            new_news = await collector.collect_and_store_news(collect_stock_news=True)
-            return {
-                "success": True,
-                "new_news": new_news,
-                "message": f"News collection completed: {new_news} new articles"
-            }
+        outcome = await orchestrator.run_now('korean_news')
+        new_news = outcome['result'] or 0
+        return {
+            "success": outcome['status'] in ('ok', 'queued'),
+            "status": outcome['status'],
+            "new_news": new_news,
+            "message": f"News collection {outcome['status']}: {new_news} new articles"
+        }
     except Exception as e:
         logger.error(f"Manual news collection failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -243,17 +301,14 @@ async def trigger_news_collection():
 async def trigger_us_news_collection():
     """Manually trigger US news collection"""
     try:
-        async with USNewsCollector() as collector:
-            new_news = await collector.collect_and_store_news(
-                collect_stock_specific=True,
-                market_news_limit=20,
-                stock_limit_per_ticker=5
-            )
-            return {
-                "success": True,
-                "new_news": new_news,
-                "message": f"US news collection completed: {new_news} new articles"
-            }
+        outcome = await orchestrator.run_now('us_news')
+        new_news = outcome['result'] or 0
+        return {
+            "success": outcome['status'] in ('ok', 'queued'),
+            "status": outcome['status'],
+            "new_news": new_news,
+            "message": f"US news collection {outcome['status']}: {new_news} new articles"
+        }
     except Exception as e:
         logger.error(f"Manual US news collection failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -262,13 +317,14 @@ async def trigger_us_news_collection():
 async def trigger_crypto_news_collection():
     """Manually trigger crypto news collection"""
     try:
-        async with CryptoNewsCollector() as collector:
-            new_news = await collector.collect_and_store_news()
-            return {
-                "success": True,
-                "new_news": new_news,
-                "message": f"Crypto news collection completed: {new_news} new articles"
-            }
+        outcome = await orchestrator.run_now('crypto_news')
+        new_news = outcome['result'] or 0
+        return {
+            "success": outcome['status'] in ('ok', 'queued'),
+            "status": outcome['status'],
+            "new_news": new_news,
+            "message": f"Crypto news collection {outcome['status']}: {new_news} new articles"
+        }
     except Exception as e:
         logger.error(f"Manual crypto news collection failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -278,7 +334,8 @@ async def trigger_crypto_news_collection():
 async def get_scheduler_status():
     """스케줄러 상태 조회"""
     try:
-        status = auto_scheduler.get_scheduler_status()
+        status = orchestrator.get_jobs_status()
+        status['leader'] = await asyncio.to_thread(leader_elector.get_status)
         return {
             "success": True,
             "scheduler": status
@@ -291,8 +348,8 @@ async def get_scheduler_status():
 async def toggle_scheduler():
     """스케줄러 on/off 토글"""
     try:
-        new_state = auto_scheduler.toggle_scheduler()
-        status = auto_scheduler.get_scheduler_status()
+        new_state = orchestrator.toggle()
+        status = orchestrator.get_jobs_status()
         
         return {
             "success": True,
@@ -366,23 +423,24 @@ async def update_alert_settings(settings_data: dict):
 
 # Data endpoints
 @app.get("/api/filings")
+@cached_response("filings", sources=("filings",), ttl=settings.CACHE_TTL_FILINGS)
 async def get_filings(
     grade: str = None, 
     search: str = None, 
     page: int = 1, 
     limit: int = 20,
-    db=Depends(get_db)
+    db=Depends(get_async_db)
 ):
     """Get DART filings with filters for timeline feed"""
     try:
         from src.db.models import DartFiling
-        from sqlalchemy import and_, or_
+        from sqlalchemy import and_, or_, select, func
         
         # Calculate offset
         offset = (page - 1) * limit
         
         # Build query
-        query = db.query(DartFiling)
+        query = select(DartFiling)
         
         # Apply filters
         conditions = []
@@ -403,7 +461,10 @@ async def get_filings(
             )
         
         if conditions:
-            query = query.filter(and_(*conditions))
+            query = query.where(and_(*conditions))
+        
+        # Get total count for pagination
+        total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
         
         # Order by receipt date desc, then created_at desc
         query = query.order_by(
@@ -411,11 +472,8 @@ async def get_filings(
             DartFiling.created_at.desc()
         )
         
-        # Get total count for pagination
-        total_count = query.count()
-        
         # Apply pagination
-        filings = query.offset(offset).limit(limit).all()
+        filings = (await db.scalars(query.offset(offset).limit(limit))).all()
         
         def format_time(filing):
             """Format created_at to HH:MM"""
@@ -467,24 +525,119 @@ async def get_filings(
         logger.error(f"Failed to get filings: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/event-study")
+async def get_event_study(
+    event_type: str = None,
+    window: str = None,
+    db=Depends(get_db)
+):
+    """공시 유형별 이벤트 스터디 결과 (캐시 조회, window 예: "-1,5")"""
+    try:
+        from src.analyzers.event_study import event_study_engine
+        
+        window_range = None
+        if window:
+            try:
+                start, end = (int(x) for x in window.split(","))
+            except ValueError:
+                raise HTTPException(status_code=400, detail="window must be 'start,end' (e.g. -1,5)")
+            window_range = (start, end)
+        
+        results = event_study_engine.get_results(db, event_type, window_range)
+        return {
+            "success": True,
+            "data": [
+                {
+                    "event_type": r.event_type,
+                    "window": [r.window_start, r.window_end],
+                    "n_events": r.n_events,
+                    "caar": r.caar,
+                    "caar_t": r.caar_t,
+                    "positive_ratio": r.positive_ratio,
+                    "aar_path": r.aar_path,
+                    "last_event_date": r.last_event_date,
+                    "computed_at": r.computed_at.isoformat() if r.computed_at else None
+                }
+                for r in results
+            ]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get event study: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/trigger/event-study")
+async def trigger_event_study():
+    """Manually recompute event study cache"""
+    try:
+        from src.analyzers.event_study import event_study_engine
+        
+        count = await asyncio.to_thread(event_study_engine.refresh)
+        return {
+            "success": True,
+            "results": count,
+            "message": f"Event study refreshed: {count} results"
+        }
+    except Exception as e:
+        logger.error(f"Manual event study refresh failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Response cache hit ratios per endpoint"""
+    return {
+        "success": True,
+        "enabled": response_cache.enabled,
+        "data": response_cache.stats()
+    }
+
+@app.post("/api/cache/invalidate")
+async def invalidate_response_cache(source: Optional[str] = None):
+    """Manually clear cached responses (source: filings / news / alerts, 없으면 전체)"""
+    cleared = response_cache.invalidate(*([source] if source else []))
+    return {
+        "success": True,
+        "cleared": cleared
+    }
+
+@app.post("/trigger/archive")
+async def trigger_archive(dry_run: bool = False):
+    """Manually move old news / alert logs to the Parquet archive"""
+    try:
+        from src.services.archive import cold_archive
+        
+        result = await asyncio.to_thread(cold_archive.run, None, dry_run)
+        return {
+            "success": True,
+            "dry_run": dry_run,
+            "archived": result,
+            "message": f"Archive {'dry run' if dry_run else 'completed'}: {result}"
+        }
+    except Exception as e:
+        logger.error(f"Manual archive failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/news")
+@cached_response("news", sources=("news",), ttl=settings.CACHE_TTL_NEWS)
 async def get_news(
     search: str = None, 
     market: str = None,
     page: int = 1, 
     limit: int = 20,
-    db=Depends(get_db)
+    db=Depends(get_async_db)
 ):
-    """Get news with filters and pagination"""
+    """Get news with filters and pagination (깊은 페이지는 Parquet 아카이브에서 이어서 조회)"""
     try:
         from src.db.models import News
-        from sqlalchemy import and_, or_
+        from src.services.archive import cold_archive
+        from sqlalchemy import and_, or_, select, func
         
         # Calculate offset
         offset = (page - 1) * limit
         
         # Build query
-        query = db.query(News)
+        query = select(News)
         
         # Apply filters
         conditions = []
@@ -515,7 +668,10 @@ async def get_news(
                 logger.warning(f"Market filter error: {e}")
         
         if conditions:
-            query = query.filter(and_(*conditions))
+            query = query.where(and_(*conditions))
+        
+        # Get total count for pagination
+        total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
         
         # Order by published_at desc, then created_at desc
         query = query.order_by(
@@ -523,11 +679,20 @@ async def get_news(
             News.created_at.desc()
         )
         
-        # Get total count for pagination
-        total_count = query.count()
-        
         # Apply pagination
-        news_items = query.offset(offset).limit(limit).all()
+        news_items = list((await db.scalars(query.offset(offset).limit(limit))).all())
+        
+        # hot 테이블이 끝나면 아카이브로 이어서 (아카이브 행은 hot 행보다 항상 오래됨)
+        archive_market = market if hasattr(News, 'market') else None
+        archive_total = await asyncio.to_thread(
+            cold_archive.count_news, search, archive_market, True
+        )
+        if archive_total and len(news_items) < limit:
+            news_items += await asyncio.to_thread(
+                cold_archive.newest_news, max(0, offset - total_count), limit - len(news_items),
+                search, archive_market, 'published_at', True
+            )
+        total_count += archive_total
         
         def format_time(news_item):
             """Format published_at or created_at to HH:MM"""
@@ -582,41 +747,54 @@ async def get_news(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/feed")
+@cached_response("feed", sources=("filings", "news"), ttl=settings.CACHE_TTL_FEED)
 async def get_feed(
     content_type: str = "all",  # all, filings, news
     search: str = None,
     market: str = None,
     page: int = 1,
     limit: int = 20,
-    db=Depends(get_db)
+    db=Depends(get_async_db)
 ):
     """Get integrated feed of filings and news"""
     try:
         from src.db.models import DartFiling, News
-        from sqlalchemy import and_, or_, union_all, literal, func
+        from src.db.partitions import fetch_newest, estimated_count
+        from src.services.archive import cold_archive
+        from sqlalchemy import or_, select, func
         
         # Calculate offset
         offset = (page - 1) * limit
         
-        # Separate queries and combine manually
+        # 통합 피드는 각 테이블에서 offset + limit 건만 가져와 병합 (전체 로드 없이 페이지 구성)
+        fetch_limit = offset + limit if content_type == "all" else limit
+        fetch_offset = 0 if content_type == "all" else offset
+        
+        async def count_rows(query, table, filtered):
+            """필터 없는 전체 건수는 파티션 통계 추정치 사용 (PostgreSQL), 그 외 COUNT"""
+            estimate = None if filtered else await estimated_count(db, table)
+            if estimate is not None:
+                return estimate
+            return await db.scalar(select(func.count()).select_from(query.subquery()))
+        
         feed_items = []
+        total_count = 0
         
         if content_type == "filings" or content_type == "all":
             # Get filings
-            filing_query = db.query(DartFiling).order_by(DartFiling.created_at.desc())
+            filing_query = select(DartFiling)
             
             if search:
-                filing_query = filing_query.filter(
+                filing_query = filing_query.where(
                     or_(
                         DartFiling.corp_name.contains(search),
                         DartFiling.report_nm.contains(search)
                     )
                 )
             
-            if content_type == "filings":
-                filing_query = filing_query.offset(offset).limit(limit)
-                
-            filings = filing_query.all()
+            total_count += await count_rows(filing_query, "dart_filings", bool(search))
+            # 최근 구간부터 조회 -> created_at 범위 조건으로 최근 파티션만 스캔
+            filings = await fetch_newest(db, filing_query, DartFiling.created_at, fetch_limit, fetch_offset)
             
             # Convert filings to feed items
             for filing in filings:
@@ -637,20 +815,20 @@ async def get_feed(
         
         if content_type == "news" or content_type == "all":
             # Get news
-            news_query = db.query(News).order_by(News.created_at.desc())
+            news_query = select(News)
             
             if search:
-                news_query = news_query.filter(News.title.contains(search))
+                news_query = news_query.where(News.title.contains(search))
             
             # Market filter for news
             if market:
                 try:
                     if hasattr(News, 'market'):
-                        news_query = news_query.filter(News.market == market)
+                        news_query = news_query.where(News.market == market)
                     else:
                         # Fallback: filter by source for crypto
                         if market == 'crypto':
-                            news_query = news_query.filter(
+                            news_query = news_query.where(
                                 or_(
                                     News.source == 'coindesk',
                                     News.source == 'cointelegraph'
@@ -659,10 +837,17 @@ async def get_feed(
                 except Exception as e:
                     logger.warning(f"Market filter error in feed: {e}")
             
-            if content_type == "news":
-                news_query = news_query.offset(offset).limit(limit)
-                
-            news_items = news_query.all()
+            hot_news_total = await count_rows(news_query, "news", bool(search or market))
+            news_items = list(await fetch_newest(db, news_query, News.created_at, fetch_limit, fetch_offset))
+            
+            # 깊은 페이지: hot 테이블 뒤로 Parquet 아카이브 (아카이브 행은 hot 행보다 항상 오래됨)
+            archive_total = await asyncio.to_thread(cold_archive.count_news, search, market)
+            if archive_total and len(news_items) < fetch_limit:
+                news_items += await asyncio.to_thread(
+                    cold_archive.newest_news, max(0, fetch_offset - hot_news_total),
+                    fetch_limit - len(news_items), search, market
+                )
+            total_count += hot_news_total + archive_total
             
             # Convert news to feed items
             for news in news_items:
@@ -684,11 +869,8 @@ async def get_feed(
         # Sort by created_at desc if combining both
         if content_type == "all":
             feed_items.sort(key=lambda x: x['created_at'] if x['created_at'] else datetime.min, reverse=True)
-            total_count = len(feed_items)
             # Apply pagination
             feed_items = feed_items[offset:offset + limit]
-        else:
-            total_count = len(feed_items)
         
         def format_time(created_at):
             """Format created_at to HH:MM"""
@@ -761,14 +943,16 @@ async def get_feed(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/data/filings")
-async def get_recent_filings(limit: int = 10, db=Depends(get_db)):
+@cached_response("data_filings", sources=("filings",), ttl=settings.CACHE_TTL_FILINGS)
+async def get_recent_filings(limit: int = 10, db=Depends(get_async_db)):
     """Get recent DART filings (legacy endpoint)"""
     try:
         from src.db.models import DartFiling
+        from sqlalchemy import select
         
-        filings = db.query(DartFiling).order_by(
-            DartFiling.created_at.desc()
-        ).limit(limit).all()
+        filings = (await db.scalars(
+            select(DartFiling).order_by(DartFiling.created_at.desc()).limit(limit)
+        )).all()
         
         return {
             "filings": [
@@ -788,14 +972,16 @@ async def get_recent_filings(limit: int = 10, db=Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/data/alerts")
-async def get_recent_alerts(limit: int = 20, db=Depends(get_db)):
+@cached_response("data_alerts", sources=("alerts",), ttl=settings.CACHE_TTL_ALERTS)
+async def get_recent_alerts(limit: int = 20, db=Depends(get_async_db)):
     """Get recent alerts log"""
     try:
         from src.db.models import AlertsLog
+        from sqlalchemy import select
         
-        alerts = db.query(AlertsLog).order_by(
-            AlertsLog.sent_at.desc()
-        ).limit(limit).all()
+        alerts = (await db.scalars(
+            select(AlertsLog).order_by(AlertsLog.sent_at.desc()).limit(limit)
+        )).all()
         
         return {
             "alerts": [
@@ -829,6 +1015,8 @@ async def trigger_translate_news(
     try:
         logger.info(f"뉴스 번역 시작: market={market}, limit={limit}")
         
+        from src.services.translator import translate_news_batch
+        
         # 번역 실행
         translated_count = await translate_news_batch(market=market, limit=limit)
         
@@ -1191,118 +1379,6 @@ async def remove_badge_from_user(user_id: str, badge_name: str, db=Depends(get_d
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
-# Influencer API Endpoints  
-@app.get("/api/influencers")
-async def get_influencers():
-    """인플루언서 목록 조회"""
-    try:
-        # Mock data - 실제로는 DB에서 가져올 것
-        influencers = [
-            {
-                "id": 6,
-                "name": "박두환",
-                "channel": "YouTube",
-                "style": "단타/스윙",
-                "color": "#3b82f6",
-                "accuracy": 75.2,
-                "avg_return": 18.5,
-                "main_stock": "삼성전자",
-                "img": "https://randomuser.me/api/portraits/men/75.jpg",
-                "signal_count": 45,
-                "follower_count": 12500
-            },
-            {
-                "id": 11, 
-                "name": "이효석",
-                "channel": "YouTube",
-                "style": "장기투자",
-                "color": "#a855f7",
-                "accuracy": 82.1,
-                "avg_return": 24.3,
-                "main_stock": "엔비디아",
-                "img": "https://randomuser.me/api/portraits/men/32.jpg",
-                "signal_count": 38,
-                "follower_count": 8900
-            },
-            {
-                "id": 15,
-                "name": "세상학개론", 
-                "channel": "YouTube",
-                "style": "성장주",
-                "color": "#10b981",
-                "accuracy": 88.7,
-                "avg_return": 35.2,
-                "main_stock": "팔란티어",
-                "img": "https://randomuser.me/api/portraits/men/45.jpg",
-                "signal_count": 52,
-                "follower_count": 15600
-            },
-            {
-                "id": 18,
-                "name": "코린이아빠",
-                "channel": "YouTube", 
-                "style": "코인/주식",
-                "color": "#f59e0b",
-                "accuracy": 68.9,
-                "avg_return": 42.1,
-                "main_stock": "비트코인",
-                "img": "https://randomuser.me/api/portraits/men/67.jpg",
-                "signal_count": 73,
-                "follower_count": 23400
-            }
-        ]
-        
-        return {
-            "success": True,
-            "data": influencers
-        }
-    except Exception as e:
-        logger.error(f"Failed to get influencers: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.get("/api/signals/recent")
-async def get_recent_signals(limit: int = 10):
-    """최근 인플루언서 시그널 조회"""
-    try:
-        # Mock data - 실제로는 DB에서 가져올 것
-        recent_signals = [
-            {
-                "id": "s1",
-                "influencer_name": "박두환",
-                "stock": "삼성전자",
-                "signal": "buy",
-                "content": "3분기 실적 발표 후 조정받은 현재가는 매수 기회",
-                "date": "2026-02-21T02:30:00Z",
-                "accuracy": 85
-            },
-            {
-                "id": "s2",
-                "influencer_name": "이효석", 
-                "stock": "엔비디아",
-                "signal": "strong-buy",
-                "content": "AI 반도체 수요 급증으로 향후 2년간 고성장 예상",
-                "date": "2026-02-20T07:15:00Z", 
-                "accuracy": 92
-            },
-            {
-                "id": "s3",
-                "influencer_name": "세상학개론",
-                "stock": "팔란티어",
-                "signal": "hold",
-                "content": "정부 계약 증가로 실적 개선 중. 현재가에서 홀딩 유지",
-                "date": "2026-02-19T12:45:00Z",
-                "accuracy": 78
-            }
-        ]
-        
-        return {
-            "success": True,
-            "data": recent_signals[:limit]
-        }
-    except Exception as e:
-        logger.error(f"Failed to get recent signals: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
 # Signal Verification API endpoints
 @app.get("/smtr_data/corinpapa1106/_extracted_signals.json")
 async def get_extracted_signals():
@@ -0,0 +1,59 @@
+"""
+Alembic environment
+- URL: settings.DATABASE_URL
+- database.run_migrations()가 넘긴 연결이 있으면 그 연결에서 실행 (앱 시작 시 create_tables)
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from src.config.settings import settings
+from src.db.models import Base
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get('connection') is None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """SQL 스크립트 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == 'sqlite',
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get('connection')
+    if connection is not None:
+        _run(connection)
+        return
+
+    section = config.get_section(config.config_ini_section, {})
+    section['sqlalchemy.url'] = settings.DATABASE_URL
+    connectable = engine_from_config(section, prefix='sqlalchemy.', poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        _run(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
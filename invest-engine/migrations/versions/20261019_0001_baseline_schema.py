@@ -0,0 +1,450 @@
+"""baseline schema
+
+기존 create_tables()로 만든 DB와 새 DB를 같은 출발점으로 맞춤 (이미 있는 테이블은 건너뜀)
+테이블 정의는 마이그레이션 도입 시점의 스키마를 그대로 고정한 것 (src.db.models 를 import 하지 않음)
+  - influencer_signals 는 create_tables() 로 만든 기존 DB 와 같은 모양 (동기화용 컬럼은 0006)
+  - news/dart_filings 의 created_at 인덱스는 0002
+이후 스키마 변경은 모델을 고치고 새 마이그레이션으로 추가
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _metadata() -> sa.MetaData:
+    metadata = sa.MetaData()
+    sa.Table(
+        'stocks', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('stock_code', sa.String(10), nullable=False),
+        sa.Column('corp_code', sa.String(10)),
+        sa.Column('corp_name', sa.String(100), nullable=False),
+        sa.Column('market', sa.String(20)),
+        sa.Column('sector', sa.String(100)),
+        sa.Column('market_cap', sa.Float()),
+        sa.Column('is_active', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Index('ix_stocks_corp_code', 'corp_code', unique=True),
+        sa.Index('ix_stocks_id', 'id'),
+        sa.Index('ix_stocks_stock_code', 'stock_code', unique=True),
+    )
+    sa.Table(
+        'watchlist', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.String(50), nullable=False),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code'), nullable=False),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_watchlist_id', 'id'),
+        sa.Index('ix_watchlist_user_id', 'user_id'),
+    )
+    sa.Table(
+        'dart_filings', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('rcept_no', sa.String(50), nullable=False),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code')),
+        sa.Column('corp_code', sa.String(10)),
+        sa.Column('corp_name', sa.String(100), nullable=False),
+        sa.Column('corp_cls', sa.String(10)),
+        sa.Column('report_nm', sa.String(200), nullable=False),
+        sa.Column('rcept_dt', sa.String(10)),
+        sa.Column('flr_nm', sa.String(100)),
+        sa.Column('rm', sa.Text()),
+        sa.Column('grade', sa.String(1)),
+        sa.Column('category', sa.String(50)),
+        sa.Column('ai_summary', sa.Text()),
+        sa.Column('ai_analysis', sa.Text()),
+        sa.Column('is_alerted', sa.Boolean()),
+        sa.Column('revenue', sa.Float()),
+        sa.Column('operating_income', sa.Float()),
+        sa.Column('net_income', sa.Float()),
+        sa.Column('revenue_prev', sa.Float()),
+        sa.Column('operating_income_prev', sa.Float()),
+        sa.Column('net_income_prev', sa.Float()),
+        sa.Column('revenue_estimate', sa.Float()),
+        sa.Column('operating_income_estimate', sa.Float()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_dart_filings_corp_code', 'corp_code'),
+        sa.Index('ix_dart_filings_id', 'id'),
+        sa.Index('ix_dart_filings_rcept_dt', 'rcept_dt'),
+        sa.Index('ix_dart_filings_rcept_no', 'rcept_no', unique=True),
+        sa.Index('ix_dart_filings_stock_code', 'stock_code'),
+        sa.Index('ix_dart_stock_date', 'stock_code', 'rcept_dt'),
+    )
+    sa.Table(
+        'alerts_log', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('alert_type', sa.String(50), nullable=False),
+        sa.Column('stock_code', sa.String(10)),
+        sa.Column('title', sa.String(200), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('channel', sa.String(20), nullable=False),
+        sa.Column('recipient', sa.String(100), nullable=False),
+        sa.Column('sent_at', sa.DateTime()),
+        sa.Column('status', sa.String(20)),
+        sa.Index('ix_alerts_log_id', 'id'),
+        sa.Index('ix_alerts_log_stock_code', 'stock_code'),
+    )
+    sa.Table(
+        'news', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('title', sa.String(300), nullable=False),
+        sa.Column('content', sa.Text()),
+        sa.Column('url', sa.String(500)),
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('market', sa.String(10)),
+        sa.Column('published_at', sa.DateTime()),
+        sa.Column('stock_codes', sa.JSON()),
+        sa.Column('sentiment_score', sa.Float()),
+        sa.Column('importance_score', sa.Float()),
+        sa.Column('ai_summary', sa.Text()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_news_id', 'id'),
+        sa.Index('ix_news_market', 'market'),
+        sa.Index('ix_news_url', 'url', unique=True),
+    )
+    sa.Table(
+        'price_alerts', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code'), nullable=False),
+        sa.Column('alert_type', sa.String(20), nullable=False),
+        sa.Column('price_change_pct', sa.Float(), nullable=False),
+        sa.Column('prev_price', sa.Float(), nullable=False),
+        sa.Column('curr_price', sa.Float(), nullable=False),
+        sa.Column('volume', sa.Integer()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_price_alerts_id', 'id'),
+        sa.Index('ix_price_alerts_stock_code', 'stock_code'),
+    )
+    sa.Table(
+        'price_history', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code'), nullable=False),
+        sa.Column('date', sa.String(10), nullable=False),
+        sa.Column('open_price', sa.Float()),
+        sa.Column('high_price', sa.Float()),
+        sa.Column('low_price', sa.Float()),
+        sa.Column('close_price', sa.Float()),
+        sa.Column('volume', sa.Integer()),
+        sa.Column('change_pct', sa.Float()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_price_history_id', 'id'),
+        sa.Index('ix_price_history_stock_code', 'stock_code'),
+        sa.Index('ix_price_stock_date', 'stock_code', 'date', unique=True),
+    )
+    sa.Table(
+        'event_study_results', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('event_type', sa.String(50), nullable=False),
+        sa.Column('window_start', sa.Integer(), nullable=False),
+        sa.Column('window_end', sa.Integer(), nullable=False),
+        sa.Column('n_events', sa.Integer()),
+        sa.Column('caar', sa.Float()),
+        sa.Column('caar_t', sa.Float()),
+        sa.Column('positive_ratio', sa.Float()),
+        sa.Column('aar_path', sa.JSON()),
+        sa.Column('last_event_date', sa.String(10)),
+        sa.Column('computed_at', sa.DateTime()),
+        sa.Index('ix_event_study_key', 'event_type', 'window_start', 'window_end', unique=True),
+        sa.Index('ix_event_study_results_id', 'id'),
+    )
+    sa.Table(
+        'buzz_data', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code'), nullable=False),
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('mention_count', sa.Integer()),
+        sa.Column('sentiment_score', sa.Float()),
+        sa.Column('buzz_score', sa.Float()),
+        sa.Column('data_date', sa.String(10), nullable=False),
+        sa.Column('raw_data', sa.JSON()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_buzz_data_id', 'id'),
+        sa.Index('ix_buzz_data_stock_code', 'stock_code'),
+        sa.Index('ix_buzz_stock_date', 'stock_code', 'data_date'),
+    )
+    sa.Table(
+        'influencer_videos', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('channel_id', sa.String(50), nullable=False),
+        sa.Column('channel_name', sa.String(100), nullable=False),
+        sa.Column('video_id', sa.String(50), nullable=False),
+        sa.Column('title', sa.String(300), nullable=False),
+        sa.Column('description', sa.Text()),
+        sa.Column('published_at', sa.DateTime(), nullable=False),
+        sa.Column('view_count', sa.Integer()),
+        sa.Column('like_count', sa.Integer()),
+        sa.Column('comment_count', sa.Integer()),
+        sa.Column('transcript', sa.Text()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_influencer_videos_channel_id', 'channel_id'),
+        sa.Index('ix_influencer_videos_id', 'id'),
+        sa.Index('ix_influencer_videos_video_id', 'video_id', unique=True),
+    )
+    sa.Table(
+        'influencer_signals', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('video_id', sa.String(50), sa.ForeignKey('influencer_videos.video_id'), nullable=False),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code'), nullable=False),
+        sa.Column('channel_name', sa.String(100), nullable=False),
+        sa.Column('signal_type', sa.String(20)),
+        sa.Column('confidence', sa.Float()),
+        sa.Column('context', sa.Text()),
+        sa.Column('mentioned_at', sa.DateTime(), nullable=False),
+        sa.Column('price_at_signal', sa.Float()),
+        sa.Column('price_1d', sa.Float()),
+        sa.Column('price_3d', sa.Float()),
+        sa.Column('price_1w', sa.Float()),
+        sa.Column('price_1m', sa.Float()),
+        sa.Column('return_1d', sa.Float()),
+        sa.Column('return_3d', sa.Float()),
+        sa.Column('return_1w', sa.Float()),
+        sa.Column('return_1m', sa.Float()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_influencer_signals_id', 'id'),
+        sa.Index('ix_influencer_signals_stock_code', 'stock_code'),
+        sa.Index('ix_influencer_signals_video_id', 'video_id'),
+        sa.Index('ix_signal_stock_date', 'stock_code', 'mentioned_at'),
+    )
+    sa.Table(
+        'influencer_stats', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('channel_id', sa.String(50), nullable=False),
+        sa.Column('channel_name', sa.String(100)),
+        sa.Column('signal_count', sa.Integer()),
+        sa.Column('main_asset', sa.String(100)),
+        sa.Column('main_asset_count', sa.Integer()),
+        sa.Column('scored_1d', sa.Integer()),
+        sa.Column('hits_1d', sa.Integer()),
+        sa.Column('return_sum_1d', sa.Float()),
+        sa.Column('scored_3d', sa.Integer()),
+        sa.Column('hits_3d', sa.Integer()),
+        sa.Column('return_sum_3d', sa.Float()),
+        sa.Column('scored_1w', sa.Integer()),
+        sa.Column('hits_1w', sa.Integer()),
+        sa.Column('return_sum_1w', sa.Float()),
+        sa.Column('scored_1m', sa.Integer()),
+        sa.Column('hits_1m', sa.Integer()),
+        sa.Column('return_sum_1m', sa.Float()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Index('ix_influencer_stats_channel_id', 'channel_id', unique=True),
+        sa.Index('ix_influencer_stats_id', 'id'),
+    )
+    sa.Table(
+        'influencer_asset_stats', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('channel_id', sa.String(50), nullable=False),
+        sa.Column('asset', sa.String(100), nullable=False),
+        sa.Column('signal_count', sa.Integer()),
+        sa.Index('ix_influencer_asset', 'channel_id', 'asset', unique=True),
+        sa.Index('ix_influencer_asset_count', 'channel_id', 'signal_count'),
+        sa.Index('ix_influencer_asset_stats_id', 'id'),
+    )
+    sa.Table(
+        'influencer_sync_state', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('source_path', sa.String(300), nullable=False),
+        sa.Column('content_hash', sa.String(64), nullable=False),
+        sa.Column('file_size', sa.Integer()),
+        sa.Column('file_mtime', sa.Float()),
+        sa.Column('record_count', sa.Integer()),
+        sa.Column('synced_at', sa.DateTime()),
+        sa.Index('ix_influencer_sync_state_id', 'id'),
+        sa.Index('ix_influencer_sync_state_source_path', 'source_path', unique=True),
+    )
+    sa.Table(
+        'fund_flow', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code'), nullable=False),
+        sa.Column('date', sa.String(10), nullable=False),
+        sa.Column('foreign_net', sa.Float()),
+        sa.Column('institution_net', sa.Float()),
+        sa.Column('pension_net', sa.Float()),
+        sa.Column('trust_net', sa.Float()),
+        sa.Column('retail_net', sa.Float()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_fund_flow_id', 'id'),
+        sa.Index('ix_fund_flow_stock_code', 'stock_code'),
+        sa.Index('ix_fund_stock_date', 'stock_code', 'date', unique=True),
+    )
+    sa.Table(
+        'short_selling', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code'), nullable=False),
+        sa.Column('date', sa.String(10), nullable=False),
+        sa.Column('short_volume', sa.Integer()),
+        sa.Column('short_amount', sa.Float()),
+        sa.Column('short_ratio', sa.Float()),
+        sa.Column('balance_volume', sa.Integer()),
+        sa.Column('balance_amount', sa.Float()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_short_selling_id', 'id'),
+        sa.Index('ix_short_selling_stock_code', 'stock_code'),
+        sa.Index('ix_short_stock_date', 'stock_code', 'date', unique=True),
+    )
+    sa.Table(
+        'notes', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.String(50), nullable=False),
+        sa.Column('note_type', sa.String(20), nullable=False),
+        sa.Column('title', sa.String(200), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('url', sa.String(500)),
+        sa.Column('source_title', sa.String(300)),
+        sa.Column('source_description', sa.Text()),
+        sa.Column('stock_code', sa.String(10), sa.ForeignKey('stocks.stock_code')),
+        sa.Column('stock_name', sa.String(100)),
+        sa.Column('folder', sa.String(50)),
+        sa.Column('tags', sa.JSON()),
+        sa.Column('is_bookmarked', sa.Boolean()),
+        sa.Column('is_public', sa.Boolean()),
+        sa.Column('importance', sa.Integer()),
+        sa.Column('source_id', sa.String(50)),
+        sa.Column('source_type', sa.String(20)),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Index('ix_note_user_created', 'user_id', 'created_at'),
+        sa.Index('ix_note_user_type', 'user_id', 'note_type'),
+        sa.Index('ix_notes_id', 'id'),
+        sa.Index('ix_notes_stock_code', 'stock_code'),
+        sa.Index('ix_notes_user_id', 'user_id'),
+    )
+    sa.Table(
+        'note_folders', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.String(50), nullable=False),
+        sa.Column('folder_name', sa.String(50), nullable=False),
+        sa.Column('folder_type', sa.String(20), nullable=False),
+        sa.Column('color', sa.String(7)),
+        sa.Column('note_count', sa.Integer()),
+        sa.Column('is_default', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Index('ix_folder_user', 'user_id', 'folder_name', unique=True),
+        sa.Index('ix_note_folders_id', 'id'),
+        sa.Index('ix_note_folders_user_id', 'user_id'),
+    )
+    sa.Table(
+        'sns_posts', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.String(50), nullable=False),
+        sa.Column('author_name', sa.String(100), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('image_url', sa.String(500)),
+        sa.Column('is_scrap_share', sa.Boolean()),
+        sa.Column('note_id', sa.Integer(), sa.ForeignKey('notes.id')),
+        sa.Column('stock_tags', sa.JSON()),
+        sa.Column('likes_count', sa.Integer()),
+        sa.Column('comments_count', sa.Integer()),
+        sa.Column('shares_count', sa.Integer()),
+        sa.Column('is_public', sa.Boolean()),
+        sa.Column('is_pinned', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Index('ix_sns_posts_id', 'id'),
+        sa.Index('ix_sns_posts_user_id', 'user_id'),
+        sa.Index('ix_sns_public_created', 'is_public', 'created_at'),
+        sa.Index('ix_sns_user_created', 'user_id', 'created_at'),
+    )
+    sa.Table(
+        'sns_comments', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('post_id', sa.Integer(), sa.ForeignKey('sns_posts.id'), nullable=False),
+        sa.Column('user_id', sa.String(50), nullable=False),
+        sa.Column('author_name', sa.String(100), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_sns_comments_id', 'id'),
+    )
+    sa.Table(
+        'user_follows', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('follower_id', sa.String(50), nullable=False),
+        sa.Column('following_id', sa.String(50), nullable=False),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_follow_relation', 'follower_id', 'following_id', unique=True),
+        sa.Index('ix_user_follows_follower_id', 'follower_id'),
+        sa.Index('ix_user_follows_following_id', 'following_id'),
+        sa.Index('ix_user_follows_id', 'id'),
+    )
+    sa.Table(
+        'user_profiles', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.String(50), nullable=False),
+        sa.Column('username', sa.String(50), nullable=False),
+        sa.Column('bio', sa.Text()),
+        sa.Column('avatar_text', sa.String(2), nullable=False),
+        sa.Column('posts_count', sa.Integer()),
+        sa.Column('notes_count', sa.Integer()),
+        sa.Column('followers_count', sa.Integer()),
+        sa.Column('following_count', sa.Integer()),
+        sa.Column('is_public', sa.Boolean()),
+        sa.Column('email_notifications', sa.Boolean()),
+        sa.Column('push_notifications', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Index('ix_user_profile_username', 'username'),
+        sa.Index('ix_user_profiles_id', 'id'),
+        sa.Index('ix_user_profiles_user_id', 'user_id', unique=True),
+    )
+    sa.Table(
+        'users', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.String(50), nullable=False),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('email', sa.String(255)),
+        sa.Column('bio', sa.Text()),
+        sa.Column('investment_style', sa.String(50), nullable=False),
+        sa.Column('avatar', sa.String(255)),
+        sa.Column('is_public', sa.Boolean()),
+        sa.Column('is_verified', sa.Boolean()),
+        sa.Column('followers_count', sa.Integer()),
+        sa.Column('following_count', sa.Integer()),
+        sa.Column('posts_count', sa.Integer()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('updated_at', sa.DateTime()),
+        sa.Index('ix_users_id', 'id'),
+        sa.Index('ix_users_user_id', 'user_id', unique=True),
+    )
+    sa.Table(
+        'badges', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(50), nullable=False, unique=True),
+        sa.Column('description', sa.Text()),
+        sa.Column('icon', sa.String(100)),
+        sa.Column('category', sa.String(30)),
+        sa.Column('rarity', sa.String(20)),
+        sa.Column('is_active', sa.Boolean()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Index('ix_badges_id', 'id'),
+    )
+    sa.Table(
+        'user_badges', metadata,
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.String(50), sa.ForeignKey('users.user_id'), nullable=False),
+        sa.Column('badge_id', sa.Integer(), sa.ForeignKey('badges.id'), nullable=False),
+        sa.Column('earned_at', sa.DateTime()),
+        sa.Column('earned_reason', sa.String(200)),
+        sa.Column('is_displayed', sa.Boolean()),
+        sa.Index('ix_user_badge_unique', 'user_id', 'badge_id', unique=True),
+        sa.Index('ix_user_badges_badge_id', 'badge_id'),
+        sa.Index('ix_user_badges_id', 'id'),
+        sa.Index('ix_user_badges_user_id', 'user_id'),
+    )
+    return metadata
+
+
+def upgrade() -> None:
+    _metadata().create_all(bind=op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    _metadata().drop_all(bind=op.get_bind())
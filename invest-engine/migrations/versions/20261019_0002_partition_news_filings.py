@@ -0,0 +1,165 @@
+"""partition news and dart_filings by month
+
+PostgreSQL: news / dart_filings 를 created_at 기준 월별 RANGE 파티션 테이블로 전환
+  - 기존 행은 새 파티션 테이블로 복사 (기존 데이터 기간 + 앞으로 PARTITION_MONTHS_AHEAD개월 파티션 생성)
+  - 범위 밖 행(created_at 이상치)은 DEFAULT 파티션으로
+  - 파티션 테이블의 PK/UNIQUE 는 파티션 키를 포함해야 하므로 PK 는 (id, created_at),
+    url / rcept_no 는 일반 인덱스 (중복 방지는 0007 의 키 테이블 news_urls / filing_keys)
+그 외 DB: created_at 인덱스만 추가 (최신순 조회용)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.config.settings import settings
+from src.db.partitions import add_months, ensure_partitions_between, month_start, KST
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+NEWS_COLUMNS = """
+    id INTEGER NOT NULL DEFAULT nextval('news_id_seq'),
+    title VARCHAR(300) NOT NULL,
+    content TEXT,
+    url VARCHAR(500),
+    source VARCHAR(50) NOT NULL,
+    market VARCHAR(10),
+    published_at TIMESTAMP WITHOUT TIME ZONE,
+    stock_codes JSON,
+    sentiment_score DOUBLE PRECISION,
+    importance_score DOUBLE PRECISION,
+    ai_summary TEXT,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'Asia/Seoul'),
+    PRIMARY KEY (id, created_at)
+"""
+
+DART_FILINGS_COLUMNS = """
+    id INTEGER NOT NULL DEFAULT nextval('dart_filings_id_seq'),
+    rcept_no VARCHAR(50) NOT NULL,
+    stock_code VARCHAR(10) REFERENCES stocks (stock_code),
+    corp_code VARCHAR(10),
+    corp_name VARCHAR(100) NOT NULL,
+    corp_cls VARCHAR(10),
+    report_nm VARCHAR(200) NOT NULL,
+    rcept_dt VARCHAR(10),
+    flr_nm VARCHAR(100),
+    rm TEXT,
+    grade VARCHAR(1),
+    category VARCHAR(50),
+    ai_summary TEXT,
+    ai_analysis TEXT,
+    is_alerted BOOLEAN,
+    revenue DOUBLE PRECISION,
+    operating_income DOUBLE PRECISION,
+    net_income DOUBLE PRECISION,
+    revenue_prev DOUBLE PRECISION,
+    operating_income_prev DOUBLE PRECISION,
+    net_income_prev DOUBLE PRECISION,
+    revenue_estimate DOUBLE PRECISION,
+    operating_income_estimate DOUBLE PRECISION,
+    created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT (now() AT TIME ZONE 'Asia/Seoul'),
+    PRIMARY KEY (id, created_at)
+"""
+
+# 테이블 -> (컬럼 DDL, 인덱스 [(이름, 컬럼)], UNIQUE 였던 인덱스)
+TABLES = {
+    'news': (NEWS_COLUMNS, [
+        ('ix_news_id', 'id'),
+        ('ix_news_url', 'url'),
+        ('ix_news_market', 'market'),
+        ('ix_news_created', 'created_at'),
+    ], 'ix_news_url'),
+    'dart_filings': (DART_FILINGS_COLUMNS, [
+        ('ix_dart_filings_id', 'id'),
+        ('ix_dart_filings_rcept_no', 'rcept_no'),
+        ('ix_dart_filings_stock_code', 'stock_code'),
+        ('ix_dart_filings_corp_code', 'corp_code'),
+        ('ix_dart_filings_rcept_dt', 'rcept_dt'),
+        ('ix_dart_stock_date', 'stock_code, rcept_dt'),
+        ('ix_dart_created', 'created_at'),
+    ], 'ix_dart_filings_rcept_no'),
+}
+
+
+def _column_names(columns_ddl: str) -> str:
+    return ', '.join(
+        line.strip().split()[0] for line in columns_ddl.strip().splitlines()
+        if not line.strip().startswith('PRIMARY KEY')
+    )
+
+
+def _partition_table(conn, table: str):
+    columns_ddl, indexes, _ = TABLES[table]
+    columns = _column_names(columns_ddl)
+    staging = f"{table}_partitioned"
+
+    oldest = conn.execute(sa.text(f"SELECT MIN(created_at) FROM {table}")).scalar()
+    current = month_start(datetime.now(KST))
+
+    conn.execute(sa.text(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE"))
+    conn.execute(sa.text(f"CREATE TABLE {staging} ({columns_ddl}) PARTITION BY RANGE (created_at)"))
+    ensure_partitions_between(conn, staging, oldest or current,
+                              add_months(current, settings.PARTITION_MONTHS_AHEAD))
+    conn.execute(sa.text(f"CREATE TABLE {table}_default PARTITION OF {staging} DEFAULT"))
+
+    conn.execute(sa.text(
+        f"INSERT INTO {staging} ({columns}) "
+        f"SELECT {columns.replace('created_at', 'COALESCE(created_at, now())')} FROM {table}"
+    ))
+    conn.execute(sa.text(f"DROP TABLE {table}"))
+    conn.execute(sa.text(f"ALTER TABLE {staging} RENAME TO {table}"))
+    conn.execute(sa.text(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id"))
+
+    # 파티션 이름은 staging 기준으로 만들어졌으므로 정식 이름으로 변경
+    for (name,) in conn.execute(sa.text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = :table"
+    ), {'table': table}).fetchall():
+        if name.startswith(f"{staging}_"):
+            conn.execute(sa.text(f"ALTER TABLE {name} RENAME TO {table}_{name[len(staging) + 1:]}"))
+
+    for name, cols in indexes:
+        conn.execute(sa.text(f"CREATE INDEX {name} ON {table} ({cols})"))
+
+
+def _unpartition_table(conn, table: str):
+    columns_ddl, indexes, unique_index = TABLES[table]
+    columns = _column_names(columns_ddl)
+    plain_ddl = columns_ddl.replace('PRIMARY KEY (id, created_at)', 'PRIMARY KEY (id)')
+
+    conn.execute(sa.text(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE"))
+    conn.execute(sa.text(f"CREATE TABLE {table}_plain ({plain_ddl})"))
+    conn.execute(sa.text(f"INSERT INTO {table}_plain ({columns}) SELECT {columns} FROM {table}"))
+    conn.execute(sa.text(f"DROP TABLE {table}"))
+    conn.execute(sa.text(f"ALTER TABLE {table}_plain RENAME TO {table}"))
+    conn.execute(sa.text(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id"))
+    for name, cols in indexes:
+        unique = 'UNIQUE ' if name == unique_index else ''
+        conn.execute(sa.text(f"CREATE {unique}INDEX {name} ON {table} ({cols})"))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        op.execute("CREATE INDEX IF NOT EXISTS ix_news_created ON news (created_at)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_dart_created ON dart_filings (created_at)")
+        return
+    for table in TABLES:
+        _partition_table(conn, table)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_news_created")
+        op.execute("DROP INDEX IF EXISTS ix_dart_created")
+        return
+    for table in TABLES:
+        _unpartition_table(conn, table)
@@ -0,0 +1,55 @@
+"""task queue
+
+워커 프로세스용 작업 큐 테이블 (src/tasks)
+  - 대기 중(status='queued') 작업은 dedupe_key 당 1개 (부분 UNIQUE 인덱스)
+  - PostgreSQL 워커는 SELECT ... FOR UPDATE SKIP LOCKED 로 가져감
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+QUEUED = sa.text("status = 'queued'")
+
+
+def upgrade() -> None:
+    # alembic 없이 create_tables() 로 먼저 만든 DB 는 이미 있음
+    if sa.inspect(op.get_bind()).has_table('task_queue'):
+        return
+    op.create_table(
+        'task_queue',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(50), nullable=False),
+        sa.Column('dedupe_key', sa.String(100), nullable=False),
+        sa.Column('source', sa.String(20)),
+        sa.Column('payload', sa.JSON()),
+        sa.Column('resources', sa.String(100)),
+        sa.Column('priority', sa.Integer()),
+        sa.Column('status', sa.String(10), nullable=False),
+        sa.Column('attempts', sa.Integer()),
+        sa.Column('max_attempts', sa.Integer()),
+        sa.Column('run_at', sa.DateTime()),
+        sa.Column('locked_by', sa.String(100)),
+        sa.Column('locked_until', sa.DateTime()),
+        sa.Column('result', sa.Text()),
+        sa.Column('last_error', sa.Text()),
+        sa.Column('created_at', sa.DateTime()),
+        sa.Column('started_at', sa.DateTime()),
+        sa.Column('finished_at', sa.DateTime()),
+    )
+    op.create_index('ix_task_queue_id', 'task_queue', ['id'])
+    op.create_index('ix_task_queue_claim', 'task_queue', ['status', 'run_at'])
+    op.create_index('ix_task_queue_dedupe', 'task_queue', ['dedupe_key'], unique=True,
+                    sqlite_where=QUEUED, postgresql_where=QUEUED)
+
+
+def downgrade() -> None:
+    op.drop_table('task_queue')
@@ -0,0 +1,33 @@
+"""scheduler lease
+
+여러 API 프로세스 중 하나만 스케줄러를 실행하기 위한 리더 임대 테이블 (src/scheduler/leader.py)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # alembic 없이 create_tables() 로 먼저 만든 DB 는 이미 있음
+    if sa.inspect(op.get_bind()).has_table('scheduler_leases'):
+        return
+    op.create_table(
+        'scheduler_leases',
+        sa.Column('name', sa.String(50), primary_key=True),
+        sa.Column('holder', sa.String(100), nullable=False),
+        sa.Column('acquired_at', sa.DateTime()),
+        sa.Column('renewed_at', sa.DateTime()),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('scheduler_leases')
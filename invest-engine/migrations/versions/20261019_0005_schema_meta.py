@@ -0,0 +1,31 @@
+"""schema meta
+
+FAST_START 시 마지막으로 확인한 스키마 fingerprint 를 저장하는 테이블 (src/db/database.py)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # alembic 없이 create_tables() 로 먼저 만든 DB 는 이미 있음
+    if sa.inspect(op.get_bind()).has_table('schema_meta'):
+        return
+    op.create_table(
+        'schema_meta',
+        sa.Column('key', sa.String(50), primary_key=True),
+        sa.Column('value', sa.String(100), nullable=False),
+        sa.Column('updated_at', sa.DateTime()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('schema_meta')
@@ -0,0 +1,71 @@
+"""influencer signal columns
+
+SNS 파이프라인 동기화(src/services/influencer_sync.py)용 influencer_signals 컬럼
+  - signal_key (UNIQUE), asset, channel_id, content, timestamp_seconds, verdict 추가
+  - stock_code NULL 허용 (코인/해외 종목은 종목 마스터에 없음)
+  - 리더보드/피드 조회용 인덱스 (mentioned_at, channel_id + mentioned_at)
+create_tables() 로 만든 기존 DB 는 테이블이 이미 있어 컬럼이 추가되지 않았으므로,
+이미 있는 컬럼/인덱스는 건너뜀
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+TABLE = 'influencer_signals'
+
+# (이름, 컬럼, UNIQUE)
+INDEXES = [
+    ('ix_influencer_signals_signal_key', ['signal_key'], True),
+    ('ix_influencer_signals_asset', ['asset'], False),
+    ('ix_influencer_signals_channel_id', ['channel_id'], False),
+    ('ix_signal_mentioned', ['mentioned_at'], False),
+    ('ix_signal_channel_date', ['channel_id', 'mentioned_at'], False),
+]
+
+
+def _columns():
+    return [
+        sa.Column('signal_key', sa.String(32)),
+        sa.Column('asset', sa.String(100)),
+        sa.Column('channel_id', sa.String(50)),
+        sa.Column('content', sa.Text()),
+        sa.Column('timestamp_seconds', sa.Integer()),
+        sa.Column('verdict', sa.String(20)),
+    ]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing_columns = {column['name'] for column in inspector.get_columns(TABLE)}
+    existing_indexes = {index['name'] for index in inspector.get_indexes(TABLE)}
+
+    # SQLite 는 컬럼 NULL 허용 변경을 테이블 재생성으로 처리 (batch)
+    with op.batch_alter_table(TABLE) as batch:
+        for column in _columns():
+            if column.name not in existing_columns:
+                batch.add_column(column)
+        batch.alter_column('stock_code', existing_type=sa.String(10), nullable=True)
+
+    for name, columns, unique in INDEXES:
+        if name not in existing_indexes:
+            op.create_index(name, TABLE, columns, unique=unique)
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=TABLE)
+
+    # 종목 코드 없는 시그널(코인/해외 종목)은 이전 스키마에 넣을 수 없음
+    op.execute(f"DELETE FROM {TABLE} WHERE stock_code IS NULL")
+    with op.batch_alter_table(TABLE) as batch:
+        batch.alter_column('stock_code', existing_type=sa.String(10), nullable=False)
+        for column in reversed(_columns()):
+            batch.drop_column(column.name)
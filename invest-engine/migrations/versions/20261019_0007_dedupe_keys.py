@@ -0,0 +1,59 @@
+"""dedupe key tables for news / dart_filings
+
+파티션된 news / dart_filings 는 파티션 키 없는 UNIQUE 를 가질 수 없어(0002) url / rcept_no 중복을 DB 가 막지 못함
+  - news_urls(url PK) / filing_keys(rcept_no PK): 파티션되지 않은 키 테이블, 기존 행의 키로 채움
+  - 수집기는 INSERT ... ON CONFLICT DO NOTHING 으로 키를 먼저 등록한 행만 저장 (src/db/partitions.py claim_keys)
+  - 그 외 DB: news.url / dart_filings.rcept_no UNIQUE 인덱스를 일반 인덱스로 바꿔 모델/PostgreSQL 과 같은 스키마 유지
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+# 키 테이블 -> (원본 테이블, 키 컬럼, 키 길이, 원본의 키 인덱스)
+KEY_TABLES = {
+    'news_urls': ('news', 'url', 500, 'ix_news_url'),
+    'filing_keys': ('dart_filings', 'rcept_no', 50, 'ix_dart_filings_rcept_no'),
+}
+
+
+def _replace_index(bind, table: str, name: str, column: str, unique: bool):
+    """원본 키 인덱스의 UNIQUE 여부 변경 (PostgreSQL 파티션 테이블은 0002 부터 일반 인덱스)"""
+    if bind.dialect.name == 'postgresql':
+        return
+    indexes = {index['name']: index for index in sa.inspect(bind).get_indexes(table)}
+    if name in indexes and bool(indexes[name]['unique']) == unique:
+        return
+    if name in indexes:
+        op.drop_index(name, table_name=table)
+    op.create_index(name, table, [column], unique=unique)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for key_table, (table, column, length, index) in KEY_TABLES.items():
+        if not sa.inspect(bind).has_table(key_table):
+            op.create_table(
+                key_table,
+                sa.Column(column, sa.String(length), primary_key=True),
+                sa.Column('created_at', sa.DateTime()),
+            )
+            op.execute(
+                f"INSERT INTO {key_table} ({column}, created_at) "
+                f"SELECT {column}, MIN(created_at) FROM {table} WHERE {column} IS NOT NULL GROUP BY {column}"
+            )
+        _replace_index(bind, table, index, column, unique=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for key_table, (table, column, _, index) in KEY_TABLES.items():
+        _replace_index(bind, table, index, column, unique=True)
+        op.drop_table(key_table)
@@ -0,0 +1,32 @@
+"""cache generations
+
+응답 캐시 무효화 세대를 DB 에 저장 (src/services/response_cache.py)
+워커 프로세스의 수집기가 invalidate 하면 API 프로세스들이 조회 시 세대 변화를 보고 캐시를 비움
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # alembic 없이 create_tables() 로 먼저 만든 DB 는 이미 있음
+    if sa.inspect(op.get_bind()).has_table('cache_generations'):
+        return
+    op.create_table(
+        'cache_generations',
+        sa.Column('source', sa.String(20), primary_key=True),
+        sa.Column('generation', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cache_generations')
@@ -120,8 +120,11 @@ class BriefingGenerator:
     def _get_dart_summary(self, db: Session, date_str: str, limit: int = 5) -> Optional[str]:
         """DART 공시 요약"""
         try:
+            # 접수일 이후에 수집되므로 created_at 하한 -> 파티션 테이블에서 해당 월 이후만 스캔
+            received = datetime.strptime(date_str, '%Y%m%d')
             filings = db.query(DartFiling).filter(
-                DartFiling.rcept_dt == date_str
+                DartFiling.rcept_dt == date_str,
+                DartFiling.created_at >= received
             ).order_by(DartFiling.created_at.desc()).limit(limit).all()
             
             if not filings:
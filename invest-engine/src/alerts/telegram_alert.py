@@ -4,8 +4,6 @@ Telegram Alert System for High-Priority News and Disclosures
 """
 import asyncio
 from typing import List, Dict, Optional
-from telegram import Bot
-from telegram.error import TelegramError
 from loguru import logger
 from datetime import datetime, timedelta
 import pytz
@@ -14,6 +12,9 @@ from sqlalchemy.orm import Session
 from ..config.settings import settings
 from ..db.database import get_db_session
 from ..db.models import News, DartFiling, AlertsLog
+from ..services.response_cache import invalidate_cache
+from ..monitoring.tracing import traced
+from .telegram_bot import create_bot, telegram_error
 
 class TelegramAlert:
     """텔레그램 알림 시스템"""
@@ -21,16 +22,21 @@ class TelegramAlert:
     def __init__(self):
         self.bot_token = settings.TELEGRAM_BOT_TOKEN
         self.chat_id = settings.TELEGRAM_CHAT_ID
-        self.bot = None
+        self._bot = None
         self.kst = pytz.timezone('Asia/Seoul')
-        
-        if self.bot_token:
-            self.bot = Bot(token=self.bot_token)
+    
+    @property
+    def bot(self):
+        """Bot (토큰이 없으면 None, 첫 접근 때 생성)"""
+        if self._bot is None and self.bot_token:
+            self._bot = create_bot(self.bot_token)
+        return self._bot
     
     def is_configured(self) -> bool:
         """알림 설정 여부 확인"""
         return bool(self.bot_token and self.chat_id)
     
+    @traced('telegram.send_alert', kind='client')
     async def send_alert(self, message: str, content_type: str = "general", 
                         content_id: Optional[int] = None, stock_code: Optional[str] = None) -> bool:
         """
@@ -63,7 +69,7 @@ class TelegramAlert:
             logger.info(f"Telegram alert sent: {content_type}")
             return True
             
-        except TelegramError as e:
+        except telegram_error() as e:
             logger.error(f"Failed to send Telegram alert: {e}")
             self._log_alert_failed(content_type, message, stock_code, content_id, str(e))
             return False
@@ -215,6 +221,7 @@ class TelegramAlert:
             
             db.add(alert_log)
             db.commit()
+            invalidate_cache('alerts')
             
         except Exception as e:
             logger.error(f"Failed to log alert: {e}")
@@ -242,6 +249,7 @@ class TelegramAlert:
             
             db.add(alert_log)
             db.commit()
+            invalidate_cache('alerts')
             
         except Exception as e:
             logger.error(f"Failed to log failed alert: {e}")
@@ -295,6 +303,7 @@ class TelegramAlert:
 
         return await self.send_alert(test_message, "test")
     
+    @traced('alerts.high_importance_news')
     async def process_high_importance_news(self, min_importance: float = 0.7) -> int:
         """
         높은 중요도 뉴스들을 찾아서 알림 전송
@@ -359,6 +368,7 @@ class TelegramAlert:
         finally:
             db.close()
     
+    @traced('alerts.important_filings')
     async def process_important_filings(self, grades: List[str] = ['A', 'B']) -> int:
         """
         중요 공시들을 찾아서 알림 전송
@@ -3,8 +3,6 @@ Telegram Bot for investment alerts
 """
 import asyncio
 from typing import List, Dict, Optional
-from telegram import Bot
-from telegram.error import TelegramError
 from loguru import logger
 from datetime import datetime
 import pytz
@@ -12,6 +10,21 @@ import pytz
 from ..config.settings import settings
 from ..db.database import get_db_session
 from ..db.models import AlertsLog
+from ..services.response_cache import invalidate_cache
+from ..monitoring.tracing import traced
+
+
+def create_bot(token: str):
+    """텔레그램 Bot 생성 (python-telegram-bot import 가 무거워 첫 사용 때 로드)"""
+    from telegram import Bot
+    return Bot(token=token)
+
+
+def telegram_error() -> type:
+    """TelegramError 클래스 (except 절에서 호출 - 예외가 났을 때만 평가됨)"""
+    from telegram.error import TelegramError
+    return TelegramError
+
 
 class InvestmentTelegramBot:
     """투자 알림 텔레그램 봇"""
@@ -19,11 +32,16 @@ class InvestmentTelegramBot:
     def __init__(self):
         self.bot_token = settings.TELEGRAM_BOT_TOKEN
         self.default_chat_id = settings.TELEGRAM_CHAT_ID
-        self.bot = None
-        
-        if self.bot_token:
-            self.bot = Bot(token=self.bot_token)
+        self._bot = None
     
+    @property
+    def bot(self):
+        """Bot (토큰이 없으면 None, 첫 접근 때 생성)"""
+        if self._bot is None and self.bot_token:
+            self._bot = create_bot(self.bot_token)
+        return self._bot
+    
+    @traced('telegram.send_message', kind='client')
     async def send_message(self, message: str, chat_id: Optional[str] = None, parse_mode: str = "HTML") -> bool:
         """
         메시지 전송
@@ -57,7 +75,7 @@ class InvestmentTelegramBot:
             
             return True
             
-        except TelegramError as e:
+        except telegram_error() as e:
             logger.error(f"Failed to send Telegram message: {e}")
             self._log_alert("MESSAGE", "General Message", message, target_chat_id, "failed")
             return False
@@ -295,6 +313,14 @@ class InvestmentTelegramBot:
         investment_impact = analysis.get('investment_impact', '분석 불가')
         message += f"💡 <b>투자 포인트:</b> {investment_impact}\n"
         
+        # 과거 같은 유형 공시 후 주가 반응 (이벤트 스터디 캐시)
+        event_study = filing.get('event_study')
+        if event_study and event_study.get('caar') is not None:
+            start, end = event_study.get('window', [-1, 5])
+            message += (f"📊 <b>과거 동일 유형:</b> 공시 후 {end}거래일 평균 초과수익률 "
+                        f"{event_study['caar']:+.1f}% ({event_study['n_events']}건, "
+                        f"상승 {event_study['positive_ratio'] * 100:.0f}%)\n")
+        
         # DART 링크
         if rcept_no:
             message += f"🔗 <a href='http://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}'>DART 상세보기</a>"
@@ -389,6 +415,7 @@ class InvestmentTelegramBot:
             )
             db.add(alert_log)
             db.commit()
+            invalidate_cache('alerts')
         except Exception as e:
             logger.error(f"Failed to log alert: {e}")
             db.rollback()
@@ -27,6 +27,8 @@ except ImportError:
     logger.warning("OpenAI library not available. Will use mock mode.")
 
 from ..config.settings import settings
+from ..monitoring.metrics import llm_completion
+from ..monitoring.tracing import traced
 
 class MockAISummarizer:
     """OpenAI API가 없을 때 사용하는 목업 클래스"""
@@ -75,6 +77,7 @@ class AISummarizer:
             self.client = AsyncOpenAI(api_key=self.openai_api_key)
             logger.info("Using OpenAI GPT-4o-mini for analysis")
     
+    @traced('dart.filing_content', kind='client')
     async def get_filing_content(self, rcept_no: str) -> Optional[str]:
         """
         DART API에서 공시 본문 내용 가져오기 (기존 방식)
@@ -118,6 +121,7 @@ class AISummarizer:
             logger.error(f"Failed to fetch filing content for {rcept_no}: {e}")
             return None
     
+    @traced('dart.financial_data', kind='client')
     async def get_financial_data(self, corp_code: str, bsns_year: str, reprt_code: str) -> Optional[Dict]:
         """
         DART API에서 단일회사 재무제표 데이터 가져오기
@@ -275,6 +279,7 @@ class AISummarizer:
         except (ValueError, TypeError):
             return "정보 없음"
     
+    @traced('analyze.grade_a')
     async def analyze_grade_a_filing(self, filing: Dict, content: str = None) -> Dict[str, str]:
         """
         A등급 공시 분석 (정기공시 - 매출/영업익/순이익 추출)
@@ -374,7 +379,8 @@ class AISummarizer:
 """
             
             try:
-                response = await self.client.chat.completions.create(
+                response = await llm_completion(
+                    self.client, 'grade_a_financial',
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": prompt}],
                     temperature=0.1,
@@ -461,7 +467,8 @@ class AISummarizer:
 """
             
             try:
-                response = await self.client.chat.completions.create(
+                response = await llm_completion(
+                    self.client, 'grade_a_content',
                     model="gpt-4o-mini",
                     messages=[{"role": "user", "content": prompt}],
                     temperature=0.1,
@@ -490,6 +497,7 @@ class AISummarizer:
                     'summary': '분석 중 오류가 발생했습니다.'
                 }
     
+    @traced('analyze.grade_b')
     async def analyze_grade_b_filing(self, filing: Dict, content: str = None) -> Dict[str, str]:
         """
         B등급 공시 분석 (중요 비정기공시 - 핵심 내용 + 투자 영향)
@@ -540,7 +548,8 @@ class AISummarizer:
 """
         
         try:
-            response = await self.client.chat.completions.create(
+            response = await llm_completion(
+                self.client, 'grade_b_filing',
                 model="gpt-4o-mini", 
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
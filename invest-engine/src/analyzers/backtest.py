@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""
+인플루언서 시그널 백테스트 모듈
+시그널과 가격 패널을 NumPy 배열로 받아 종목/시그널 단위 반복 없이 벡터 연산으로 계산
+
+- 보유 기간별 선행 수익률 (시그널 다음 거래일 종가에 진입)
+- 시그널 타입/인플루언서별 적중률, 평균 수익률
+- 인플루언서별 모의 포트폴리오 (시그널 타입 가중치로 포지션, 보유 기간 동안 일별 손익)
+
+입력 배열:
+    prices: (거래일 수, 종목 수) 종가 패널, 거래가 없으면 NaN
+    signals: SignalArrays (종목 인덱스, 진입 거래일 인덱스, 시그널 타입 코드, 인플루언서 인덱스)
+             진입 거래일 = 시그널 날짜 다음 거래일 (build_signal_arrays 에서 계산)
+"""
+from datetime import datetime, date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+# 파이프라인 8가지 시그널 타입 (강한 매수 -> 강한 매도)
+SIGNAL_TYPES = ('STRONG_BUY', 'BUY', 'POSITIVE', 'HOLD', 'NEUTRAL', 'CONCERN', 'SELL', 'STRONG_SELL')
+SIGNAL_TYPE_INDEX = {name: i for i, name in enumerate(SIGNAL_TYPES)}
+
+# 시그널 타입 -> 포지션 가중치 (양수 매수, 음수 매도, 0은 포지션 없음)
+DEFAULT_SIGNAL_WEIGHTS = {
+    'STRONG_BUY': 1.0, 'BUY': 0.75, 'POSITIVE': 0.5,
+    'HOLD': 0.0, 'NEUTRAL': 0.0,
+    'CONCERN': -0.5, 'SELL': -0.75, 'STRONG_SELL': -1.0,
+}
+
+DEFAULT_HOLDING_PERIODS = (1, 5, 20)  # 거래일 (1일, 1주, 1개월)
+TRADING_DAYS_PER_YEAR = 252
+
+
+class SignalArrays:
+    """시그널 배열 묶음 (모두 같은 길이의 1차원 정수 배열, day_idx 는 진입 거래일)"""
+
+    def __init__(self, symbol_idx, day_idx, type_idx, influencer_idx,
+                 influencers: Optional[Sequence[str]] = None):
+        self.symbol_idx = np.asarray(symbol_idx, dtype=np.int64)
+        self.day_idx = np.asarray(day_idx, dtype=np.int64)
+        self.type_idx = np.asarray(type_idx, dtype=np.int64)
+        self.influencer_idx = np.asarray(influencer_idx, dtype=np.int64)
+        n = len(self.symbol_idx)
+        if not (len(self.day_idx) == len(self.type_idx) == len(self.influencer_idx) == n):
+            raise ValueError("Signal arrays must have the same length")
+        self.n_influencers = int(self.influencer_idx.max()) + 1 if n else 0
+        self.influencers = list(influencers) if influencers is not None else [str(i) for i in range(self.n_influencers)]
+        self.n_influencers = max(self.n_influencers, len(self.influencers))
+
+    def __len__(self):
+        return len(self.symbol_idx)
+
+
+def weight_vector(weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+    """시그널 타입 코드 -> 가중치 조회용 배열"""
+    merged = {**DEFAULT_SIGNAL_WEIGHTS, **(weights or {})}
+    return np.array([merged[name] for name in SIGNAL_TYPES], dtype=np.float64)
+
+
+def daily_returns(prices: np.ndarray) -> np.ndarray:
+    """종가 패널 -> 일간 수익률 패널 (첫 날/결측은 0)"""
+    returns = np.zeros_like(prices, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns[1:] = prices[1:] / prices[:-1] - 1.0
+    returns[~np.isfinite(returns)] = 0.0
+    return returns
+
+
+def forward_returns(prices: np.ndarray, signals: SignalArrays,
+                    holding_periods: Sequence[int] = DEFAULT_HOLDING_PERIODS) -> np.ndarray:
+    """
+    보유 기간별 선행 수익률
+
+    진입 거래일(day_idx) 종가에 진입, 진입 h 거래일 뒤 종가에 청산
+
+    Returns:
+        (시그널 수, 보유 기간 수) 배열, 기간이 패널 밖이거나 가격이 없으면 NaN
+    """
+    n_days = prices.shape[0]
+    holding = np.asarray(holding_periods, dtype=np.int64)
+    entry_day = signals.day_idx
+    entry = prices[np.minimum(entry_day, n_days - 1), signals.symbol_idx]
+    entry[entry_day >= n_days] = np.nan
+
+    exit_day = entry_day[:, None] + holding[None, :]
+    in_range = exit_day < n_days
+    exit_price = prices[np.minimum(exit_day, n_days - 1), signals.symbol_idx[:, None]]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = exit_price / entry[:, None] - 1.0
+    result[~in_range | ~(entry[:, None] > 0)] = np.nan
+    return result
+
+
+def _grouped_rates(directed: np.ndarray, groups: np.ndarray, n_groups: int) -> Dict[str, np.ndarray]:
+    """그룹별 (평가된 수, 적중 수, 적중률, 평균 수익률) - bincount 한 번씩"""
+    valid = np.isfinite(directed)
+    scored = np.bincount(groups[valid], minlength=n_groups).astype(np.float64)
+    hits = np.bincount(groups[valid], weights=(directed[valid] > 0).astype(np.float64), minlength=n_groups)
+    total = np.bincount(groups[valid], weights=directed[valid], minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {
+            'scored': scored.astype(np.int64),
+            'hits': hits.astype(np.int64),
+            'hit_rate': np.where(scored > 0, hits / scored, np.nan),
+            'avg_return': np.where(scored > 0, total / scored, np.nan),
+        }
+
+
+def hit_rates(fwd: np.ndarray, signals: SignalArrays, weights: Optional[Dict[str, float]] = None
+              ) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    시그널 방향을 반영한 적중률/평균 수익률
+
+    가중치가 0인 타입(HOLD/NEUTRAL)은 방향이 없어 평가에서 제외
+
+    Returns:
+        {'by_influencer': {...: (인플루언서 수, 기간 수)}, 'by_type': {...: (8, 기간 수)}}
+    """
+    direction = np.sign(weight_vector(weights))[signals.type_idx]
+    directed = fwd * direction[:, None]
+    directed[direction == 0] = np.nan
+
+    by_influencer, by_type = {}, {}
+    for k in range(fwd.shape[1]):
+        for target, groups, n_groups in ((by_influencer, signals.influencer_idx, signals.n_influencers),
+                                         (by_type, signals.type_idx, len(SIGNAL_TYPES))):
+            for name, values in _grouped_rates(directed[:, k], groups, n_groups).items():
+                target.setdefault(name, []).append(values)
+
+    stack = lambda d: {name: np.stack(values, axis=1) for name, values in d.items()}
+    return {'by_influencer': stack(by_influencer), 'by_type': stack(by_type)}
+
+
+def simulate_portfolios(prices: np.ndarray, signals: SignalArrays, holding_period: int,
+                        weights: Optional[Dict[str, float]] = None,
+                        returns: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    인플루언서별 모의 포트폴리오
+
+    시그널마다 진입 거래일 종가에 가중치만큼 진입해 holding_period 거래일 동안 보유.
+    일별 수익률 = 그날 보유 중인 포지션의 가중 수익률 합 / 총 노출(|가중치| 합) -> 항상 자본 100% 기준
+
+    Returns:
+        daily_return: (인플루언서 수, 거래일 수), equity: 누적 자산 곡선 (시작 1.0),
+        total_return, annual_return, volatility, sharpe, max_drawdown: (인플루언서 수,)
+    """
+    n_days = prices.shape[0]
+    n_inf = signals.n_influencers
+    if returns is None:
+        returns = daily_returns(prices)
+
+    w = weight_vector(weights)[signals.type_idx]
+    entry_day = signals.day_idx
+    active = (w != 0) & (entry_day < n_days - 1)
+    w = w[active]
+    sym = signals.symbol_idx[active]
+    inf = signals.influencer_idx[active]
+
+    # (시그널, 보유일) 격자: 진입 다음 날부터 holding_period일 동안의 일간 수익률
+    days = entry_day[active][:, None] + np.arange(1, holding_period + 1)[None, :]
+    in_range = days < n_days
+    days_clipped = np.minimum(days, n_days - 1)
+    pnl = w[:, None] * returns[days_clipped, sym[:, None]]
+
+    flat = (inf[:, None] * n_days + days_clipped)[in_range]
+    size = n_inf * n_days
+    gross = np.bincount(flat, weights=np.broadcast_to(np.abs(w)[:, None], days.shape)[in_range], minlength=size)
+    net = np.bincount(flat, weights=pnl[in_range], minlength=size)
+
+    gross = gross.reshape(n_inf, n_days)
+    net = net.reshape(n_inf, n_days)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        daily = np.where(gross > 0, net / gross, 0.0)
+
+    equity = np.cumprod(1.0 + daily, axis=1)
+    peak = np.maximum.accumulate(equity, axis=1)
+    drawdown = equity / peak - 1.0
+
+    years = n_days / TRADING_DAYS_PER_YEAR
+    total = equity[:, -1] - 1.0 if n_days else np.zeros(n_inf)
+    vol = daily.std(axis=1) * np.sqrt(TRADING_DAYS_PER_YEAR)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annual = np.where(years > 0, (1.0 + total) ** (1.0 / years) - 1.0, np.nan)
+        sharpe = np.where(vol > 0, daily.mean(axis=1) * TRADING_DAYS_PER_YEAR / vol, np.nan)
+
+    return {
+        'daily_return': daily,
+        'equity': equity,
+        'total_return': total,
+        'annual_return': annual,
+        'volatility': vol,
+        'sharpe': sharpe,
+        'max_drawdown': drawdown.min(axis=1) if n_days else np.zeros(n_inf),
+    }
+
+
+class SignalBacktester:
+    """인플루언서 시그널 백테스터"""
+
+    def __init__(self, holding_periods: Sequence[int] = DEFAULT_HOLDING_PERIODS,
+                 weights: Optional[Dict[str, float]] = None):
+        self.holding_periods = tuple(holding_periods)
+        self.weights = {**DEFAULT_SIGNAL_WEIGHTS, **(weights or {})}
+        unknown = set(self.weights) - set(SIGNAL_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown signal types in weights: {sorted(unknown)}")
+
+    def run(self, prices: np.ndarray, signals: SignalArrays, portfolio_period: Optional[int] = None) -> Dict:
+        """
+        백테스트 실행
+
+        Args:
+            prices: (거래일 수, 종목 수) 종가 패널
+            signals: SignalArrays
+            portfolio_period: 포트폴리오 보유 기간 (기본: 가장 긴 보유 기간)
+
+        Returns:
+            forward_returns, hit_rates, portfolio (배열) + summary (인플루언서별 dict 리스트)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        fwd = forward_returns(prices, signals, self.holding_periods)
+        rates = hit_rates(fwd, signals, self.weights)
+        period = portfolio_period or max(self.holding_periods)
+        portfolio = simulate_portfolios(prices, signals, period, self.weights)
+        return {
+            'holding_periods': self.holding_periods,
+            'forward_returns': fwd,
+            'hit_rates': rates,
+            'portfolio': portfolio,
+            'summary': self.summarize(signals, rates, portfolio),
+        }
+
+    def summarize(self, signals: SignalArrays, rates: Dict, portfolio: Dict) -> List[Dict]:
+        """인플루언서별 요약 (API/리포트용 파이썬 값)"""
+        by_inf = rates['by_influencer']
+        counts = np.bincount(signals.influencer_idx, minlength=signals.n_influencers)
+
+        def value(x):
+            return None if not np.isfinite(x) else round(float(x), 4)
+
+        summary = []
+        for i, name in enumerate(signals.influencers):
+            summary.append({
+                'influencer': name,
+                'signal_count': int(counts[i]),
+                'horizons': {
+                    str(h): {
+                        'scored': int(by_inf['scored'][i, k]),
+                        'hit_rate': value(by_inf['hit_rate'][i, k]),
+                        'avg_return': value(by_inf['avg_return'][i, k]),
+                    } for k, h in enumerate(self.holding_periods)
+                },
+                'total_return': value(portfolio['total_return'][i]),
+                'annual_return': value(portfolio['annual_return'][i]),
+                'sharpe': value(portfolio['sharpe'][i]),
+                'max_drawdown': value(portfolio['max_drawdown'][i]),
+            })
+        return summary
+
+
+# ----------------------------------------------------------------------
+# DB / 파이프라인 레코드 -> 배열
+# ----------------------------------------------------------------------
+def _to_yyyymmdd(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.strftime('%Y%m%d')
+    digits = str(value).replace('-', '')[:8]
+    return digits if len(digits) == 8 and digits.isdigit() else None
+
+
+def build_signal_arrays(records: Iterable[Dict], symbols: Sequence[str], dates: Sequence[str]
+                        ) -> Tuple[SignalArrays, int]:
+    """
+    시그널 레코드 -> SignalArrays
+
+    Args:
+        records: {'symbol', 'date'(YYYYMMDD/YYYY-MM-DD/datetime), 'signal_type', 'influencer'} 딕셔너리들
+        symbols: 가격 패널 열 순서의 종목코드
+        dates: 가격 패널 행 순서의 거래일 (YYYYMMDD, 오름차순)
+
+    Returns:
+        (SignalArrays, 패널 밖이라 버린 시그널 수) - day_idx 는 시그널 날짜보다 뒤인 첫 거래일
+        (거래일 시그널은 다음 거래일, 주말/휴일 시그널도 바로 다음 거래일 - 영상은 장 마감 후
+        공개될 수 있어 당일 종가는 미리 보기)
+    """
+    symbol_index = {code: i for i, code in enumerate(symbols)}
+    date_array = np.asarray(dates)
+    influencers: Dict[str, int] = {}
+    rows = []
+    dropped = 0
+    for record in records:
+        sym = symbol_index.get(record.get('symbol'))
+        type_code = SIGNAL_TYPE_INDEX.get((record.get('signal_type') or '').upper())
+        day = _to_yyyymmdd(record.get('date'))
+        if sym is None or type_code is None or day is None:
+            dropped += 1
+            continue
+        rows.append((sym, day, type_code, influencers.setdefault(record.get('influencer') or '', len(influencers))))
+
+    if not rows:
+        empty = np.zeros(0, dtype=np.int64)
+        return SignalArrays(empty, empty, empty, empty, influencers=[]), dropped
+
+    sym, day, type_code, inf = zip(*rows)
+    day_idx = np.searchsorted(date_array, np.asarray(day), side='right')
+    keep = day_idx < len(date_array)
+    dropped += int((~keep).sum())
+    arrays = SignalArrays(np.asarray(sym)[keep], day_idx[keep], np.asarray(type_code)[keep],
+                          np.asarray(inf)[keep], influencers=list(influencers))
+    return arrays, dropped
+
+
+def load_price_panel(db, stock_codes: Optional[Sequence[str]] = None, start: Optional[str] = None,
+                     end: Optional[str] = None) -> Tuple[np.ndarray, List[str], List[str]]:
+    """
+    PriceHistory -> (종가 패널, 거래일 리스트, 종목코드 리스트)
+
+    Args:
+        stock_codes: 종목코드 (None이면 전체)
+        start/end: YYYYMMDD (포함)
+    """
+    from ..db.models import PriceHistory
+
+    query = db.query(PriceHistory.date, PriceHistory.stock_code, PriceHistory.close_price)
+    if stock_codes is not None:
+        codes = sorted(set(stock_codes))
+        query = query.filter(PriceHistory.stock_code.in_(codes))
+    else:
+        codes = sorted(code for (code,) in db.query(PriceHistory.stock_code).distinct())
+    if start:
+        query = query.filter(PriceHistory.date >= start)
+    if end:
+        query = query.filter(PriceHistory.date <= end)
+    rows = query.all()
+    if not rows:
+        return np.zeros((0, len(codes))), [], codes
+
+    day_values, code_values, closes = zip(*rows)
+    dates, day_idx = np.unique(np.asarray(day_values), return_inverse=True)
+    code_index = {code: i for i, code in enumerate(codes)}
+    panel = np.full((len(dates), len(codes)), np.nan)
+    panel[day_idx, [code_index[c] for c in code_values]] = np.asarray(closes, dtype=np.float64)
+    return panel, dates.tolist(), codes
+
+
+def backtest_influencer_signals(db, holding_periods: Sequence[int] = DEFAULT_HOLDING_PERIODS,
+                                weights: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    DB의 InfluencerSignal(종목코드가 있는 시그널) 전체 백테스트
+
+    Returns:
+        SignalBacktester.run 결과 + dropped (가격이 없어 제외된 시그널 수)
+    """
+    from ..db.models import InfluencerSignal
+
+    rows = db.query(
+        InfluencerSignal.stock_code, InfluencerSignal.mentioned_at,
+        InfluencerSignal.signal_type, InfluencerSignal.channel_id
+    ).filter(
+        InfluencerSignal.stock_code.isnot(None),
+        (InfluencerSignal.verdict.is_(None)) | (InfluencerSignal.verdict != 'rejected')
+    ).all()
+    records = [{'symbol': code, 'date': mentioned, 'signal_type': signal_type, 'influencer': channel}
+               for code, mentioned, signal_type, channel in rows]
+    if not records:
+        logger.info("No influencer signals with stock codes to backtest")
+        return {'summary': [], 'dropped': 0}
+
+    start = min(_to_yyyymmdd(r['date']) for r in records)
+    prices, dates, codes = load_price_panel(db, [r['symbol'] for r in records], start=start)
+    signals, dropped = build_signal_arrays(records, codes, dates)
+    result = SignalBacktester(holding_periods, weights).run(prices, signals)
+    result['dropped'] = dropped
+    logger.info(f"Backtested {len(signals)} influencer signals ({dropped} dropped)")
+    return result
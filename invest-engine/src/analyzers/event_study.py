@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+DART 공시 이벤트 스터디 모듈
+공시 유형(FilingFilter 키워드/등급)별로 공시 전후 초과수익률을 계산해 캐시
+
+- 초과수익률: 시장모형 (추정 구간에서 종목별 alpha/beta 회귀), 추정 데이터가 부족하면 시장조정 수익률
+- 시장 수익률: 가격 패널 전 종목의 동일가중 평균 일간 수익률
+- 모든 이벤트의 추정/이벤트 윈도우를 (이벤트 수, 윈도우 길이) 격자로 한 번에 뽑아 벡터 연산
+- 결과는 (유형, 윈도우)별로 EventStudyResult 테이블에 저장 -> 알림/API는 캐시만 조회
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..db.database import get_db_session
+from ..db.models import DartFiling, EventStudyResult
+from .backtest import load_price_panel
+from .filing_filter import FilingFilter
+
+DEFAULT_WINDOWS = ((-1, 1), (-1, 5), (0, 20))  # 공시일(다음 거래일) 기준 거래일
+DEFAULT_ESTIMATION = (-120, -21)
+MIN_ESTIMATION_DAYS = 30
+MIN_EVENTS = 5  # 이보다 적은 유형은 저장하지 않음
+
+
+def event_type_of(filing_filter: FilingFilter, report_nm: str) -> Tuple[str, Optional[str]]:
+    """공시명 -> (등급 그룹 'grade_B', 키워드 그룹 '자기주식' 또는 None)"""
+    grade, keyword = filing_filter.match_keyword(report_nm)
+    return f"grade_{grade.value}", keyword
+
+
+def panel_returns(prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    종가 패널 -> (종목 일간 수익률 NaN 유지, 시장 동일가중 수익률)
+    """
+    returns = np.full_like(prices, np.nan, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns[1:] = prices[1:] / prices[:-1] - 1.0
+    returns[~np.isfinite(returns)] = np.nan
+    counts = np.isfinite(returns).sum(axis=1)
+    market = np.where(counts > 0, np.nansum(returns, axis=1) / np.maximum(counts, 1), np.nan)
+    return returns, market
+
+
+def _gather(panel: np.ndarray, day_idx: np.ndarray, offsets: np.ndarray, col_idx: Optional[np.ndarray] = None
+            ) -> np.ndarray:
+    """(이벤트, 오프셋) 격자로 패널 값 추출 (패널 밖은 NaN)"""
+    days = day_idx[:, None] + offsets[None, :]
+    in_range = (days >= 0) & (days < panel.shape[0])
+    days = np.clip(days, 0, panel.shape[0] - 1)
+    values = panel[days] if col_idx is None else panel[days, col_idx[:, None]]
+    return np.where(in_range, values, np.nan)
+
+
+def abnormal_returns(returns: np.ndarray, market: np.ndarray, symbol_idx: np.ndarray, day_idx: np.ndarray,
+                     window: Tuple[int, int], estimation: Tuple[int, int] = DEFAULT_ESTIMATION) -> np.ndarray:
+    """
+    이벤트별 윈도우 초과수익률
+
+    Args:
+        returns: (거래일 수, 종목 수) 일간 수익률 (결측 NaN)
+        market: (거래일 수,) 시장 수익률
+        symbol_idx, day_idx: 이벤트의 종목/거래일 인덱스
+        window: (시작, 끝) 오프셋, 끝 포함
+        estimation: 시장모형 추정 구간 오프셋
+
+    Returns:
+        (이벤트 수, 윈도우 길이) 초과수익률, 데이터 없으면 NaN
+    """
+    est_offsets = np.arange(estimation[0], estimation[1] + 1)
+    est_r = _gather(returns, day_idx, est_offsets, symbol_idx)
+    est_m = _gather(market, day_idx, est_offsets)
+    valid = np.isfinite(est_r) & np.isfinite(est_m)
+    n = valid.sum(axis=1)
+
+    # 이벤트별 OLS (r = alpha + beta * m) - 유효한 관측치만으로 평균/공분산
+    r0 = np.where(valid, est_r, 0.0)
+    m0 = np.where(valid, est_m, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_r = r0.sum(axis=1) / n
+        mean_m = m0.sum(axis=1) / n
+        dm = np.where(valid, est_m - mean_m[:, None], 0.0)
+        dr = np.where(valid, est_r - mean_r[:, None], 0.0)
+        beta = (dm * dr).sum(axis=1) / (dm * dm).sum(axis=1)
+        alpha = mean_r - beta * mean_m
+
+    # 추정 데이터가 부족하면 시장조정 (alpha=0, beta=1)
+    fallback = (n < MIN_ESTIMATION_DAYS) | ~np.isfinite(beta)
+    alpha = np.where(fallback, 0.0, alpha)
+    beta = np.where(fallback, 1.0, beta)
+
+    win_offsets = np.arange(window[0], window[1] + 1)
+    win_r = _gather(returns, day_idx, win_offsets, symbol_idx)
+    win_m = _gather(market, day_idx, win_offsets)
+    return win_r - (alpha[:, None] + beta[:, None] * win_m)
+
+
+def aggregate_by_group(ar: np.ndarray, group_idx: np.ndarray, n_groups: int) -> Dict[str, np.ndarray]:
+    """
+    그룹별 AAR 경로, CAAR, t값, 양수 비율 (bincount로 한 번에)
+
+    윈도우 안에 결측이 있는 이벤트는 CAR 계산에서 제외
+    """
+    complete = np.isfinite(ar).all(axis=1)
+    ar_c = ar[complete]
+    groups = group_idx[complete]
+    car = ar_c.sum(axis=1)
+
+    n = np.bincount(groups, minlength=n_groups).astype(np.float64)
+    car_sum = np.bincount(groups, weights=car, minlength=n_groups)
+    car_sq = np.bincount(groups, weights=car * car, minlength=n_groups)
+    positive = np.bincount(groups, weights=(car > 0).astype(np.float64), minlength=n_groups)
+    aar_sum = np.stack([np.bincount(groups, weights=ar_c[:, k], minlength=n_groups)
+                        for k in range(ar.shape[1])], axis=1) if ar.shape[1] else np.zeros((n_groups, 0))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        caar = car_sum / n
+        var = (car_sq - n * caar ** 2) / (n - 1)
+        t = caar / np.sqrt(var / n)
+        return {
+            'n_events': n.astype(np.int64),
+            'caar': caar,
+            'caar_t': np.where(n > 1, t, np.nan),
+            'positive_ratio': positive / n,
+            'aar_path': aar_sum / n[:, None],
+        }
+
+
+class EventStudyEngine:
+    """공시 유형별 이벤트 스터디 (결과 캐시)"""
+
+    def __init__(self, windows: Sequence[Tuple[int, int]] = DEFAULT_WINDOWS,
+                 estimation: Tuple[int, int] = DEFAULT_ESTIMATION, min_events: int = MIN_EVENTS):
+        self.windows = tuple(tuple(w) for w in windows)
+        self.estimation = estimation
+        self.min_events = min_events
+        self.filing_filter = FilingFilter()
+
+    def compute(self, filings: List[Dict], prices: np.ndarray, dates: Sequence[str], codes: Sequence[str],
+                windows: Optional[Sequence[Tuple[int, int]]] = None) -> List[Dict]:
+        """
+        공시 목록 + 가격 패널 -> 유형/윈도우별 결과
+
+        Args:
+            filings: {'stock_code', 'rcept_dt'(YYYYMMDD), 'report_nm'} 딕셔너리들
+            prices, dates, codes: load_price_panel 결과
+
+        Returns:
+            [{event_type, window_start, window_end, n_events, caar, caar_t, positive_ratio, aar_path, last_event_date}]
+        """
+        code_index = {code: i for i, code in enumerate(codes)}
+        date_array = np.asarray(dates)
+        group_names: Dict[str, int] = {}
+        sym, day, grp, event_dates = [], [], [], []
+
+        for filing in filings:
+            col = code_index.get(filing.get('stock_code'))
+            rcept_dt = filing.get('rcept_dt')
+            if col is None or not rcept_dt:
+                continue
+            # 공시일이 휴일이면 다음 거래일이 이벤트일
+            day_idx = int(np.searchsorted(date_array, rcept_dt))
+            if day_idx >= len(date_array):
+                continue
+            # 한 공시는 등급 그룹과 키워드 그룹 양쪽에 속함
+            for name in event_type_of(self.filing_filter, filing.get('report_nm')):
+                if name:
+                    sym.append(col)
+                    day.append(day_idx)
+                    grp.append(group_names.setdefault(name, len(group_names)))
+                    event_dates.append(rcept_dt)
+
+        if not sym:
+            return []
+
+        sym, day, grp = np.asarray(sym), np.asarray(day), np.asarray(grp)
+        last_dates = {}
+        for g, d in zip(grp.tolist(), event_dates):
+            last_dates[g] = max(last_dates.get(g, d), d)
+
+        returns, market = panel_returns(np.asarray(prices, dtype=np.float64))
+        results = []
+        for window in windows or self.windows:
+            ar = abnormal_returns(returns, market, sym, day, window, self.estimation)
+            stats = aggregate_by_group(ar, grp, len(group_names))
+            for name, g in group_names.items():
+                n = int(stats['n_events'][g])
+                if n < self.min_events:
+                    continue
+                results.append({
+                    'event_type': name,
+                    'window_start': window[0],
+                    'window_end': window[1],
+                    'n_events': n,
+                    'caar': round(float(stats['caar'][g]) * 100, 3),
+                    'caar_t': round(float(stats['caar_t'][g]), 2) if np.isfinite(stats['caar_t'][g]) else None,
+                    'positive_ratio': round(float(stats['positive_ratio'][g]), 3),
+                    'aar_path': [round(float(x) * 100, 3) for x in stats['aar_path'][g]],
+                    'last_event_date': last_dates.get(g),
+                })
+        return results
+
+    def refresh(self, db=None, windows: Optional[Sequence[Tuple[int, int]]] = None) -> int:
+        """
+        DB의 공시/가격으로 전체 재계산 후 캐시 갱신
+
+        Returns:
+            저장된 (유형, 윈도우) 결과 수
+        """
+        own_session = db is None
+        db = db or get_db_session()
+        try:
+            filings = [
+                {'stock_code': code, 'rcept_dt': rcept_dt, 'report_nm': report_nm}
+                for code, rcept_dt, report_nm in db.query(
+                    DartFiling.stock_code, DartFiling.rcept_dt, DartFiling.report_nm
+                ).filter(DartFiling.stock_code.isnot(None)).all()
+            ]
+            if not filings:
+                logger.info("No DART filings for event study")
+                return 0
+
+            prices, dates, codes = load_price_panel(db)
+            results = self.compute(filings, prices, dates, codes, windows)
+
+            existing = {(r.event_type, r.window_start, r.window_end): r for r in db.query(EventStudyResult).all()}
+            for result in results:
+                key = (result['event_type'], result['window_start'], result['window_end'])
+                row = existing.get(key)
+                if row is None:
+                    row = EventStudyResult(event_type=key[0], window_start=key[1], window_end=key[2])
+                    db.add(row)
+                for field in ('n_events', 'caar', 'caar_t', 'positive_ratio', 'aar_path', 'last_event_date'):
+                    setattr(row, field, result[field])
+            db.commit()
+
+            logger.info(f"Event study refreshed: {len(results)} results from {len(filings)} filings")
+            return len(results)
+
+        except Exception as e:
+            logger.error(f"Event study refresh failed: {e}")
+            db.rollback()
+            raise
+        finally:
+            if own_session:
+                db.close()
+
+    def get_results(self, db, event_type: Optional[str] = None,
+                    window: Optional[Tuple[int, int]] = None) -> List[EventStudyResult]:
+        """캐시 조회 (유형/윈도우 필터)"""
+        query = db.query(EventStudyResult)
+        if event_type:
+            query = query.filter(EventStudyResult.event_type == event_type)
+        if window:
+            query = query.filter(EventStudyResult.window_start == window[0],
+                                 EventStudyResult.window_end == window[1])
+        return query.order_by(EventStudyResult.event_type, EventStudyResult.window_start,
+                              EventStudyResult.window_end).all()
+
+    def lookup_for_filing(self, db, report_nm: str, window: Tuple[int, int] = (-1, 5)) -> Optional[Dict]:
+        """
+        알림용: 공시명에 해당하는 유형의 캐시된 결과 (키워드 그룹 우선, 없으면 등급 그룹)
+
+        Returns:
+            {'event_type', 'window', 'n_events', 'caar', 'positive_ratio'} 또는 None
+        """
+        grade_group, keyword = event_type_of(self.filing_filter, report_nm)
+        for name in (keyword, grade_group):
+            if not name:
+                continue
+            rows = self.get_results(db, name, window)
+            if rows:
+                row = rows[0]
+                return {'event_type': row.event_type, 'window': list(window), 'n_events': row.n_events,
+                        'caar': row.caar, 'positive_ratio': row.positive_ratio}
+        return None
+
+
+# 글로벌 인스턴스
+event_study_engine = EventStudyEngine()
+
+
+if __name__ == "__main__":
+    count = event_study_engine.refresh()
+    print(f"Event study results: {count}")
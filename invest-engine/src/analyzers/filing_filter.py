@@ -4,7 +4,7 @@ DART 공시 필터링 시스템
 공시를 A/B/C 등급으로 분류하는 모듈
 """
 from enum import Enum
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 import re
 
@@ -68,6 +68,25 @@ class FilingFilter:
         logger.debug(f"Grade C: {corp_name} - {reason}")
         return FilingGrade.C, reason
     
+    def match_keyword(self, report_nm: str) -> Tuple[FilingGrade, Optional[str]]:
+        """
+        공시명에 걸린 등급 키워드 (이벤트 스터디 유형 분류용, 로그 없이 classify_filing과 같은 순서)
+        
+        Args:
+            report_nm: 공시명
+            
+        Returns:
+            Tuple[FilingGrade, Optional[str]]: (등급, 처음 일치한 키워드 - C등급이면 None)
+        """
+        report_nm = (report_nm or '').strip()
+        for keyword in self.grade_a_keywords:
+            if keyword in report_nm:
+                return FilingGrade.A, keyword
+        for keyword in self.grade_b_keywords:
+            if keyword in report_nm:
+                return FilingGrade.B, keyword
+        return FilingGrade.C, None
+    
     def filter_filings_by_grade(self, filings: List[Dict], target_grades: List[FilingGrade]) -> List[Dict]:
         """
         특정 등급의 공시만 필터링
@@ -0,0 +1,87 @@
+"""
+Admin API Router - 운영 중 프로파일링 / 작업 큐 상태
+모든 엔드포인트는 X-Admin-Token 헤더가 ADMIN_TOKEN 과 같아야 함 (ADMIN_TOKEN 이 비어 있으면 비활성)
+
+- POST /admin/profile/sample: 시간 제한 스택 샘플링 -> collapsed stack (flamegraph 입력)
+- GET /admin/profiles: 저장된 샘플링 / 요청 프로파일 목록
+- GET /admin/profiles/{name}: 결과 다운로드
+- GET /admin/tasks: 작업 큐 작업별/상태별 개수, 실행 중인 작업 (TASK_QUEUE_ENABLED)
+
+요청 단위 프로파일: 아무 API 요청에 X-Profile: 1 + X-Admin-Token 헤더
+  -> 응답 X-Profile-Id, 결과는 /admin/profiles/{X-Profile-Id}.txt (요약) / .prof (pstats, snakeviz 등)
+"""
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse
+from loguru import logger
+
+from src.config.settings import settings
+from src.monitoring.profiler import find_profile, is_admin_token, list_profiles, sample_process
+from src.tasks.queue import task_queue
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """관리자 토큰 확인"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (ADMIN_TOKEN not set)")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.post("/profile/sample", dependencies=[Depends(require_admin)])
+async def sample_profile(
+    seconds: float = Query(10, gt=0, description="샘플링 시간 (최대 PROFILER_MAX_SECONDS)"),
+    interval_ms: float = Query(10, ge=1, le=1000),
+    include_idle: bool = False
+):
+    """프로세스 스택 샘플링 -> collapsed stack 텍스트 (X-Profile-Id: 저장된 파일 이름)"""
+    try:
+        result = await asyncio.to_thread(sample_process, seconds, interval_ms, include_idle)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error(f"Sampling profile failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return PlainTextResponse(result['collapsed'], headers={
+        "X-Profile-Id": result['name'],
+        "X-Profile-Samples": str(result['samples']),
+    })
+
+
+@router.get("/profiles", dependencies=[Depends(require_admin)])
+async def get_profiles():
+    """저장된 프로파일 목록 (최신순)"""
+    return {
+        "success": True,
+        "data": list_profiles()
+    }
+
+
+@router.get("/profiles/{name}", dependencies=[Depends(require_admin)])
+async def download_profile(name: str):
+    """프로파일 다운로드 (.collapsed / .prof / .txt)"""
+    path = find_profile(name)
+    if not path:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    media_type = "application/octet-stream" if name.endswith('.prof') else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=name)
+
+
+@router.get("/tasks", dependencies=[Depends(require_admin)])
+async def get_task_queue():
+    """작업 큐 상태"""
+    try:
+        stats = await asyncio.to_thread(task_queue.stats)
+    except Exception as e:
+        logger.error(f"Failed to read task queue: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "success": True,
+        "enabled": settings.TASK_QUEUE_ENABLED,
+        "data": stats
+    }
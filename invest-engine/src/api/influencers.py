@@ -0,0 +1,115 @@
+"""
+Influencer API Router - 인플루언서 목록/최근 시그널 API
+SNS 파이프라인에서 동기화된 InfluencerSignal 테이블을 인덱스 조회로 제공
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from typing import Optional
+from loguru import logger
+
+from src.db.database import get_db
+from src.db.models import InfluencerSignal
+from src.services.leaderboard import influencer_leaderboard
+
+router = APIRouter(prefix="/api", tags=["influencers"])
+
+# 화면 표시용 채널 프로필 (DB에 없는 정보)
+INFLUENCER_PROFILES = {
+    "corinpapa1106": {
+        "name": "코린이아빠",
+        "channel": "YouTube",
+        "style": "코인/주식",
+        "color": "#f59e0b",
+        "img": "https://randomuser.me/api/portraits/men/67.jpg",
+        "follower_count": 23400,
+    },
+}
+DEFAULT_PROFILE = {"channel": "YouTube", "style": "", "color": "#6b7280", "img": None, "follower_count": 0}
+
+
+def visible_signals():
+    """AI 검증에서 기각된 시그널 제외 조건"""
+    return or_(InfluencerSignal.verdict.is_(None), InfluencerSignal.verdict != "rejected")
+
+
+def format_signal_type(signal_type: Optional[str]) -> str:
+    """STRONG_BUY -> strong-buy (프론트엔드 표기)"""
+    return (signal_type or "mention").lower().replace("_", "-")
+
+
+@router.get("/influencers")
+async def get_influencers(
+    db: Session = Depends(get_db),
+    horizon: str = Query("1m", pattern="^(1d|3d|1w|1m)$", description="적중률/수익률 기준 기간")
+):
+    """인플루언서 목록 조회 (리더보드 집계 테이블에서 채널별 시그널 수/적중률/평균 수익률)"""
+    try:
+        influencers = []
+        for row in influencer_leaderboard.leaderboard(db, horizon=horizon):
+            profile = {**DEFAULT_PROFILE, **INFLUENCER_PROFILES.get(row["channel_id"], {})}
+            influencers.append({
+                "id": row["channel_id"],
+                "name": profile.get("name") or row["channel_name"],
+                "channel": profile["channel"],
+                "style": profile["style"],
+                "color": profile["color"],
+                "accuracy": row["accuracy"],
+                "avg_return": row["avg_return"],
+                "main_stock": row["main_stock"],
+                "img": profile["img"],
+                "signal_count": row["signal_count"],
+                "scored_count": row["scored"],
+                "follower_count": profile["follower_count"],
+            })
+        influencers.sort(key=lambda item: (item["accuracy"] is not None, item["accuracy"] or 0,
+                                           item["signal_count"]), reverse=True)
+
+        return {
+            "success": True,
+            "data": influencers
+        }
+    except Exception as e:
+        logger.error(f"Failed to get influencers: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/signals/recent")
+async def get_recent_signals(
+    db: Session = Depends(get_db),
+    limit: int = Query(10, ge=1, le=100),
+    channel_id: Optional[str] = Query(None, description="특정 채널의 시그널만 조회")
+):
+    """최근 인플루언서 시그널 조회"""
+    try:
+        query = db.query(InfluencerSignal).filter(visible_signals())
+        if channel_id:
+            query = query.filter(InfluencerSignal.channel_id == channel_id)
+        signals = query.order_by(
+            InfluencerSignal.mentioned_at.desc(), InfluencerSignal.id.desc()
+        ).limit(limit).all()
+
+        recent_signals = []
+        for signal in signals:
+            profile = INFLUENCER_PROFILES.get(signal.channel_id, {})
+            recent_signals.append({
+                "id": signal.id,
+                "influencer_name": profile.get("name") or signal.channel_name,
+                "stock": signal.asset or signal.stock_code,
+                "stock_code": signal.stock_code,
+                "signal": format_signal_type(signal.signal_type),
+                "content": signal.content,
+                "date": signal.mentioned_at.isoformat() if signal.mentioned_at else None,
+                "accuracy": round(signal.confidence * 100) if signal.confidence is not None else None,
+                "video_id": signal.video_id,
+                "timestamp_seconds": signal.timestamp_seconds,
+                "verdict": signal.verdict,
+            })
+
+        return {
+            "success": True,
+            "data": recent_signals
+        }
+    except Exception as e:
+        logger.error(f"Failed to get recent signals: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
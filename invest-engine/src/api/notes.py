@@ -2,12 +2,14 @@
 Notes API Router - 노트 (메모+스크랩) 관리 API
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 import json
 
-from src.db.database import get_db
+from src.db.database import get_db, get_async_db
 from src.db.models import Note, NoteFolder, Stock, SNSPost, UserProfile
 from pydantic import BaseModel
 
@@ -76,17 +78,17 @@ def update_folder_count(db: Session, user_id: str, folder_name: str):
         folder.note_count = count
         db.commit()
 
+DEFAULT_FOLDERS = [
+    {"name": "투자아이디어", "type": "memo", "color": "#667eea"},
+    {"name": "종목분석", "type": "memo", "color": "#10b981"},
+    {"name": "외부링크", "type": "scrap", "color": "#f59e0b"},
+    {"name": "뉴스", "type": "scrap", "color": "#dc2626"},
+    {"name": "공시", "type": "scrap", "color": "#3b82f6"},
+]
+
 def ensure_default_folders(db: Session, user_id: str):
     """기본 폴더들이 없으면 생성"""
-    default_folders = [
-        {"name": "투자아이디어", "type": "memo", "color": "#667eea"},
-        {"name": "종목분석", "type": "memo", "color": "#10b981"},
-        {"name": "외부링크", "type": "scrap", "color": "#f59e0b"},
-        {"name": "뉴스", "type": "scrap", "color": "#dc2626"},
-        {"name": "공시", "type": "scrap", "color": "#3b82f6"},
-    ]
-    
-    for folder_data in default_folders:
+    for folder_data in DEFAULT_FOLDERS:
         existing = db.query(NoteFolder).filter(
             NoteFolder.user_id == user_id,
             NoteFolder.folder_name == folder_data["name"]
@@ -104,11 +106,30 @@ def ensure_default_folders(db: Session, user_id: str):
     
     db.commit()
 
+async def ensure_default_folders_async(db: AsyncSession, user_id: str):
+    """기본 폴더들이 없으면 생성 (비동기 세션, 기존 폴더명 한 번에 조회)"""
+    existing = set((await db.scalars(
+        select(NoteFolder.folder_name).where(NoteFolder.user_id == user_id)
+    )).all())
+    
+    missing = [folder_data for folder_data in DEFAULT_FOLDERS if folder_data["name"] not in existing]
+    for folder_data in missing:
+        db.add(NoteFolder(
+            user_id=user_id,
+            folder_name=folder_data["name"],
+            folder_type=folder_data["type"],
+            color=folder_data["color"],
+            is_default=True
+        ))
+    
+    if missing:
+        await db.commit()
+
 
 # API Endpoints
 @router.get("/")
 async def get_notes(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     note_type: Optional[str] = Query(None, description="all, memo, scrap, news, filing"),
     folder: Optional[str] = Query(None, description="폴더명"),
     search: Optional[str] = Query(None, description="검색어"),
@@ -120,40 +141,40 @@ async def get_notes(
     user_id = get_current_user_id()
     
     # 기본 폴더 확인/생성
-    ensure_default_folders(db, user_id)
+    await ensure_default_folders_async(db, user_id)
     
     # Calculate offset
     offset = (page - 1) * limit
     
     # Build query
-    query = db.query(Note).filter(Note.user_id == user_id)
+    query = select(Note).where(Note.user_id == user_id)
     
     # Apply filters
     if note_type and note_type != "all":
-        query = query.filter(Note.note_type == note_type)
+        query = query.where(Note.note_type == note_type)
     
     if folder:
-        query = query.filter(Note.folder == folder)
+        query = query.where(Note.folder == folder)
     
     if search:
         search_filter = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             (Note.title.ilike(search_filter)) |
             (Note.content.ilike(search_filter)) |
             (Note.stock_name.ilike(search_filter))
         )
     
+    # Get total count
+    total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
+    
     # Sort
     if sort == "oldest":
         query = query.order_by(Note.created_at.asc())
     else:
         query = query.order_by(Note.created_at.desc())
     
-    # Get total count
-    total_count = query.count()
-    
     # Apply pagination
-    notes = query.offset(offset).limit(limit).all()
+    notes = (await db.scalars(query.offset(offset).limit(limit))).all()
     
     # Format response
     formatted_notes = []
@@ -2,11 +2,13 @@
 SNS API Router - 소셜 피드 관리 API
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 
-from src.db.database import get_db
+from src.db.database import get_db, get_async_db
 from src.db.models import SNSPost, SNSComment, UserProfile, UserFollow, Note
 from pydantic import BaseModel
 
@@ -30,22 +32,45 @@ def get_current_user_id() -> str:
     # TODO: 실제 인증 시스템 연동
     return "user_me"
 
+def new_user_profile(user_id: str) -> UserProfile:
+    """기본 프로필 (임시 사용자명)"""
+    return UserProfile(
+        user_id=user_id,
+        username="사용자" + user_id[-4:],
+        avatar_text=user_id[0].upper(),
+        bio="투자자입니다"
+    )
+
 def get_user_profile(db: Session, user_id: str) -> UserProfile:
     """사용자 프로필 조회 또는 생성"""
     profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
     if not profile:
         # 기본 프로필 생성
-        profile = UserProfile(
-            user_id=user_id,
-            username="사용자" + user_id[-4:],  # 임시 사용자명
-            avatar_text=user_id[0].upper(),
-            bio="투자자입니다"
-        )
+        profile = new_user_profile(user_id)
         db.add(profile)
         db.commit()
         db.refresh(profile)
     return profile
 
+async def get_user_profiles_async(db: AsyncSession, user_ids: Iterable[str]) -> Dict[str, UserProfile]:
+    """여러 사용자 프로필을 한 번에 조회, 없는 프로필은 생성 (비동기 세션)"""
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    profiles = {
+        profile.user_id: profile
+        for profile in (await db.scalars(
+            select(UserProfile).where(UserProfile.user_id.in_(user_ids))
+        )).all()
+    }
+    missing = user_ids - profiles.keys()
+    if missing:
+        for user_id in missing:
+            profiles[user_id] = new_user_profile(user_id)
+            db.add(profiles[user_id])
+        await db.commit()
+    return profiles
+
 def update_user_stats(db: Session, user_id: str):
     """사용자 통계 업데이트"""
     profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
@@ -65,7 +90,7 @@ def update_user_stats(db: Session, user_id: str):
 # API Endpoints
 @router.get("/feed")
 async def get_feed(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=50),
     user_id: Optional[str] = Query(None, description="특정 사용자의 포스트만 조회")
@@ -77,44 +102,60 @@ async def get_feed(
     offset = (page - 1) * limit
     
     # Build query
-    query = db.query(SNSPost).filter(SNSPost.is_public == True)
+    query = select(SNSPost).where(SNSPost.is_public == True)
     
     if user_id:
-        query = query.filter(SNSPost.user_id == user_id)
+        query = query.where(SNSPost.user_id == user_id)
     else:
         # 팔로우한 사용자들의 포스트 + 내 포스트
-        following_ids = db.query(UserFollow.following_id).filter(
+        following_ids = select(UserFollow.following_id).where(
             UserFollow.follower_id == current_user_id
-        ).subquery()
+        )
         
-        query = query.filter(
+        query = query.where(
             (SNSPost.user_id == current_user_id) |
             (SNSPost.user_id.in_(following_ids))
         )
     
-    # Sort by created_at desc
-    query = query.order_by(SNSPost.created_at.desc())
-    
     # Get total count
-    total_count = query.count()
-    
-    # Apply pagination
-    posts = query.offset(offset).limit(limit).all()
+    total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
+    
+    # Sort by created_at desc + pagination
+    posts = (await db.scalars(
+        query.order_by(SNSPost.created_at.desc()).offset(offset).limit(limit)
+    )).all()
+    
+    # 페이지의 댓글/스크랩 노트/프로필을 포스트별 조회 대신 한 번씩 조회
+    post_ids = [post.id for post in posts]
+    comments_by_post = {post_id: [] for post_id in post_ids}
+    if post_ids:
+        for comment in (await db.scalars(
+            select(SNSComment).where(SNSComment.post_id.in_(post_ids))
+            .order_by(SNSComment.created_at.asc())
+        )).all():
+            if len(comments_by_post[comment.post_id]) < 3:
+                comments_by_post[comment.post_id].append(comment)
+    
+    note_ids = [post.note_id for post in posts if post.is_scrap_share and post.note_id]
+    notes = {}
+    if note_ids:
+        notes = {note.id: note for note in (await db.scalars(select(Note).where(Note.id.in_(note_ids)))).all()}
+    
+    profiles = await get_user_profiles_async(
+        db,
+        [post.user_id for post in posts] +
+        [comment.user_id for comments in comments_by_post.values() for comment in comments]
+    )
     
     # Format response
     formatted_posts = []
     for post in posts:
         # Get user profile
-        profile = get_user_profile(db, post.user_id)
-        
-        # Get comments
-        comments = db.query(SNSComment).filter(
-            SNSComment.post_id == post.id
-        ).order_by(SNSComment.created_at.asc()).limit(3).all()
+        profile = profiles[post.user_id]
         
         formatted_comments = []
-        for comment in comments:
-            comment_profile = get_user_profile(db, comment.user_id)
+        for comment in comments_by_post[post.id]:
+            comment_profile = profiles[comment.user_id]
             formatted_comments.append({
                 "id": comment.id,
                 "author": comment_profile.username,
@@ -125,14 +166,13 @@ async def get_feed(
         
         # Get scrap data if it's a scrap share
         scrap_data = None
-        if post.is_scrap_share and post.note_id:
-            note = db.query(Note).filter(Note.id == post.note_id).first()
-            if note:
-                scrap_data = {
-                    "title": note.source_title or note.title,
-                    "url": note.url,
-                    "description": note.source_description or note.content[:100]
-                }
+        note = notes.get(post.note_id) if post.is_scrap_share else None
+        if note:
+            scrap_data = {
+                "title": note.source_title or note.title,
+                "url": note.url,
+                "description": note.source_description or note.content[:100]
+            }
         
         formatted_post = {
             "id": post.id,
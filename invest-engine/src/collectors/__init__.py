@@ -1,13 +1,27 @@
 # Collectors package
-from .dart import DartCollector
-from .naver_news import NaverNewsCollector
-from .us_news import USNewsCollector
-from .crypto_news import CryptoNewsCollector
-from .price import *
+# 수집기는 처음 접근할 때 import (bs4, feedparser, httpx 가 API 시작 시간에 포함되지 않도록)
+import importlib
+
+_EXPORTS = {
+    'DartCollector': '.dart',
+    'NaverNewsCollector': '.naver_news',
+    'USNewsCollector': '.us_news',
+    'CryptoNewsCollector': '.crypto_news',
+    'PriceMonitor': '.price',
+    'KoreanStockAPI': '.price',
+    'SAMPLE_STOCKS': '.price',
+    'initialize_sample_stocks': '.price',
+}
 
 __all__ = [
     'DartCollector',
     'NaverNewsCollector', 
     'USNewsCollector',
     'CryptoNewsCollector'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
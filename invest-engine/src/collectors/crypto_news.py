@@ -14,8 +14,13 @@ from urllib.parse import urljoin
 from sqlalchemy.orm import Session
 
 from ..config.settings import settings
-from ..db.database import get_db_session
-from ..db.models import News
+from ..db.database import get_async_db_session
+from ..db.models import News, NewsUrl
+from ..db.partitions import claim_keys_async
+from ..services.response_cache import invalidate_cache
+from ..monitoring.metrics import CollectorTimer, store_timer
+from ..monitoring.tracing import traced
+from .http_replay import cassette_transport, request_delay
 
 class CryptoNewsCollector:
     """암호화폐 뉴스 수집기"""
@@ -66,7 +71,8 @@ class CryptoNewsCollector:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             },
             timeout=30.0,
-            follow_redirects=True
+            follow_redirects=True,
+            transport=cassette_transport('crypto_news')
         )
         return self
     
@@ -81,56 +87,74 @@ class CryptoNewsCollector:
         Returns:
             뉴스 정보 리스트
         """
+        timer = CollectorTimer('coindesk')
         try:
             logger.info("Fetching CoinDesk RSS...")
             response = await self.session.get(self.rss_feeds['coindesk'])
             response.raise_for_status()
+            timer.done('fetch')
             
-            # feedparser로 RSS 파싱
-            feed = feedparser.parse(response.text)
-            news_list = []
+            news_list = self.parse_coindesk_rss(response.text)
             
-            logger.info(f"CoinDesk RSS parsed, found {len(feed.entries)} entries")
-            
-            for entry in feed.entries[:20]:  # 최근 20개
-                try:
-                    title = entry.title.strip()
-                    url = entry.link
-                    description = getattr(entry, 'description', '') or getattr(entry, 'summary', '')
-                    
-                    # 발행 시간 파싱
-                    published_at = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        published_at = datetime(*entry.published_parsed[:6], tzinfo=pytz.UTC)
-                        # KST로 변환
-                        published_at = published_at.astimezone(self.kst)
-                    
-                    # 관련 암호화폐 추출
-                    crypto_symbols = self.extract_crypto_symbols(f"{title} {description}")
-                    
-                    news_data = {
-                        'title': title,
-                        'url': url,
-                        'content': description,
-                        'source': 'coindesk',
-                        'published_at': published_at,
-                        'crypto_symbols': crypto_symbols,
-                        'market': 'crypto'
-                    }
-                    
-                    news_list.append(news_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse CoinDesk entry: {e}")
-                    continue
-                    
             logger.info(f"Collected {len(news_list)} CoinDesk news items")
+            timer.done('parse', items=len(news_list))
             return news_list
             
         except Exception as e:
             logger.error(f"Failed to fetch CoinDesk news: {e}")
+            timer.fail()
             return []
     
+    def parse_coindesk_rss(self, text: str) -> List[Dict]:
+        """
+        CoinDesk RSS 파싱
+        
+        Args:
+            text: RSS 본문
+            
+        Returns:
+            뉴스 정보 리스트
+        """
+        # feedparser로 RSS 파싱
+        feed = feedparser.parse(text)
+        news_list = []
+        
+        logger.info(f"CoinDesk RSS parsed, found {len(feed.entries)} entries")
+        
+        for entry in feed.entries[:20]:  # 최근 20개
+            try:
+                title = entry.title.strip()
+                url = entry.link
+                description = getattr(entry, 'description', '') or getattr(entry, 'summary', '')
+                
+                # 발행 시간 파싱
+                published_at = None
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    published_at = datetime(*entry.published_parsed[:6], tzinfo=pytz.UTC)
+                    # KST로 변환
+                    published_at = published_at.astimezone(self.kst)
+                
+                # 관련 암호화폐 추출
+                crypto_symbols = self.extract_crypto_symbols(f"{title} {description}")
+                
+                news_data = {
+                    'title': title,
+                    'url': url,
+                    'content': description,
+                    'source': 'coindesk',
+                    'published_at': published_at,
+                    'crypto_symbols': crypto_symbols,
+                    'market': 'crypto'
+                }
+                
+                news_list.append(news_data)
+                
+            except Exception as e:
+                logger.warning(f"Failed to parse CoinDesk entry: {e}")
+                continue
+        
+        return news_list
+    
     async def fetch_cointelegraph_news(self) -> List[Dict]:
         """
         CoinTelegraph RSS 피드에서 뉴스 수집
@@ -138,56 +162,74 @@ class CryptoNewsCollector:
         Returns:
             뉴스 정보 리스트
         """
+        timer = CollectorTimer('cointelegraph')
         try:
             logger.info("Fetching CoinTelegraph RSS...")
             response = await self.session.get(self.rss_feeds['cointelegraph'])
             response.raise_for_status()
+            timer.done('fetch')
             
-            # feedparser로 RSS 파싱
-            feed = feedparser.parse(response.text)
-            news_list = []
+            news_list = self.parse_cointelegraph_rss(response.text)
             
-            logger.info(f"CoinTelegraph RSS parsed, found {len(feed.entries)} entries")
-            
-            for entry in feed.entries[:20]:  # 최근 20개
-                try:
-                    title = entry.title.strip()
-                    url = entry.link
-                    description = getattr(entry, 'description', '') or getattr(entry, 'summary', '')
-                    
-                    # 발행 시간 파싱
-                    published_at = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        published_at = datetime(*entry.published_parsed[:6], tzinfo=pytz.UTC)
-                        # KST로 변환
-                        published_at = published_at.astimezone(self.kst)
-                    
-                    # 관련 암호화폐 추출
-                    crypto_symbols = self.extract_crypto_symbols(f"{title} {description}")
-                    
-                    news_data = {
-                        'title': title,
-                        'url': url,
-                        'content': description,
-                        'source': 'cointelegraph',
-                        'published_at': published_at,
-                        'crypto_symbols': crypto_symbols,
-                        'market': 'crypto'
-                    }
-                    
-                    news_list.append(news_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse CoinTelegraph entry: {e}")
-                    continue
-                    
             logger.info(f"Collected {len(news_list)} CoinTelegraph news items")
+            timer.done('parse', items=len(news_list))
             return news_list
             
         except Exception as e:
             logger.error(f"Failed to fetch CoinTelegraph news: {e}")
+            timer.fail()
             return []
     
+    def parse_cointelegraph_rss(self, text: str) -> List[Dict]:
+        """
+        CoinTelegraph RSS 파싱
+        
+        Args:
+            text: RSS 본문
+            
+        Returns:
+            뉴스 정보 리스트
+        """
+        # feedparser로 RSS 파싱
+        feed = feedparser.parse(text)
+        news_list = []
+        
+        logger.info(f"CoinTelegraph RSS parsed, found {len(feed.entries)} entries")
+        
+        for entry in feed.entries[:20]:  # 최근 20개
+            try:
+                title = entry.title.strip()
+                url = entry.link
+                description = getattr(entry, 'description', '') or getattr(entry, 'summary', '')
+                
+                # 발행 시간 파싱
+                published_at = None
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    published_at = datetime(*entry.published_parsed[:6], tzinfo=pytz.UTC)
+                    # KST로 변환
+                    published_at = published_at.astimezone(self.kst)
+                
+                # 관련 암호화폐 추출
+                crypto_symbols = self.extract_crypto_symbols(f"{title} {description}")
+                
+                news_data = {
+                    'title': title,
+                    'url': url,
+                    'content': description,
+                    'source': 'cointelegraph',
+                    'published_at': published_at,
+                    'crypto_symbols': crypto_symbols,
+                    'market': 'crypto'
+                }
+                
+                news_list.append(news_data)
+                
+            except Exception as e:
+                logger.warning(f"Failed to parse CoinTelegraph entry: {e}")
+                continue
+        
+        return news_list
+    
     def extract_crypto_symbols(self, text: str) -> List[str]:
         """
         텍스트에서 암호화폐 심볼 추출
@@ -270,10 +312,14 @@ class CryptoNewsCollector:
         
         return min(score, 1.0)  # 최대 1.0으로 제한
     
-    async def collect_and_store_news(self) -> int:
+    @traced('collector.crypto_news')
+    async def collect_and_store_news(self, translate: bool = True) -> int:
         """
         암호화폐 뉴스 수집하여 DB에 저장
         
+        Args:
+            translate: 저장 후 바로 번역할지 여부 (오케스트레이터는 별도 번역 작업으로 처리)
+            
         Returns:
             저장된 뉴스 개수
         """
@@ -284,7 +330,7 @@ class CryptoNewsCollector:
         all_news.extend(coindesk_news)
         
         # 요청 간 딜레이
-        await asyncio.sleep(2)
+        await request_delay(2)
         
         # CoinTelegraph 뉴스 수집
         cointelegraph_news = await self.fetch_cointelegraph_news()
@@ -295,78 +341,82 @@ class CryptoNewsCollector:
         if not all_news:
             return 0
         
-        db = get_db_session()
         new_news_count = 0
         
-        try:
-            for news_data in all_news:
-                # 이미 저장된 뉴스인지 확인 (URL 기준)
-                existing = db.query(News).filter(
-                    News.url == news_data['url']
-                ).first()
+        timer = store_timer('crypto_news')
+        async with get_async_db_session() as db:
+            try:
+                # 새 URL을 한 번에 등록 (이미 저장됐거나 다른 수집이 먼저 등록한 URL은 제외)
+                new_urls = await claim_keys_async(db, NewsUrl.url, [news_data['url'] for news_data in all_news])
                 
-                if existing:
-                    logger.debug(f"News already exists: {news_data['url']}")
-                    continue
+                for news_data in all_news:
+                    # 새로 등록된 URL만 저장 (URL 기준, 같은 배치 안의 중복 포함)
+                    if news_data['url'] not in new_urls:
+                        logger.debug(f"News already exists: {news_data['url']}")
+                        continue
+                    new_urls.discard(news_data['url'])
                 
-                # 중요도 점수 계산
-                importance_score = self.calculate_importance_score(news_data)
+                    # 중요도 점수 계산
+                    importance_score = self.calculate_importance_score(news_data)
                 
-                # 새 뉴스 저장
-                try:
-                    news = News(
-                        title=news_data['title'],
-                        content=news_data.get('content'),
-                        url=news_data['url'],
-                        source=news_data['source'],
-                        published_at=news_data.get('published_at'),
-                        stock_codes=news_data.get('crypto_symbols', []),  # crypto symbols을 stock_codes 필드에 저장
-                        importance_score=importance_score
-                    )
+                    # 새 뉴스 저장
+                    try:
+                        news = News(
+                            title=news_data['title'],
+                            content=news_data.get('content'),
+                            url=news_data['url'],
+                            source=news_data['source'],
+                            published_at=news_data.get('published_at'),
+                            stock_codes=news_data.get('crypto_symbols', []),  # crypto symbols을 stock_codes 필드에 저장
+                            importance_score=importance_score
+                        )
                     
-                    # market 필드가 있으면 설정 (DB 스키마에 따라)
-                    if hasattr(news, 'market'):
-                        news.market = news_data['market']
+                        # market 필드가 있으면 설정 (DB 스키마에 따라)
+                        if hasattr(news, 'market'):
+                            news.market = news_data['market']
                     
-                    db.add(news)
-                    new_news_count += 1
+                        db.add(news)
+                        new_news_count += 1
                     
-                    logger.info(f"New crypto news: {news.title[:50]}... (symbols: {news_data.get('crypto_symbols', [])})")
+                        logger.info(f"New crypto news: {news.title[:50]}... (symbols: {news_data.get('crypto_symbols', [])})")
                     
-                except Exception as e:
-                    logger.warning(f"Failed to save news item, trying without market field: {e}")
-                    # market 필드 없이 다시 시도
-                    news = News(
-                        title=news_data['title'],
-                        content=news_data.get('content'),
-                        url=news_data['url'],
-                        source=news_data['source'],
-                        published_at=news_data.get('published_at'),
-                        stock_codes=news_data.get('crypto_symbols', []),
-                        importance_score=importance_score
-                    )
-                    db.add(news)
-                    new_news_count += 1
-                    logger.info(f"New crypto news (fallback): {news.title[:50]}...")
+                    except Exception as e:
+                        logger.warning(f"Failed to save news item, trying without market field: {e}")
+                        # market 필드 없이 다시 시도
+                        news = News(
+                            title=news_data['title'],
+                            content=news_data.get('content'),
+                            url=news_data['url'],
+                            source=news_data['source'],
+                            published_at=news_data.get('published_at'),
+                            stock_codes=news_data.get('crypto_symbols', []),
+                            importance_score=importance_score
+                        )
+                        db.add(news)
+                        new_news_count += 1
+                        logger.info(f"New crypto news (fallback): {news.title[:50]}...")
             
-            db.commit()
-            logger.info(f"Successfully saved {new_news_count} new crypto news items")
+                await db.commit()
             
-            # 수집된 뉴스 자동 번역 실행
-            if new_news_count > 0:
-                try:
-                    from ..services.translator import translate_news_batch
-                    translated_count = await translate_news_batch(market='crypto', limit=new_news_count)
-                    logger.info(f"Auto-translated {translated_count} crypto news items")
-                except Exception as e:
-                    logger.warning(f"Auto-translation failed: {e}")
+                timer.done('store', items=new_news_count)
+                if new_news_count:
+                    invalidate_cache('news')
+                logger.info(f"Successfully saved {new_news_count} new crypto news items")
             
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Failed to store crypto news: {e}")
+                # 수집된 뉴스 자동 번역 실행
+                if translate and new_news_count > 0:
+                    try:
+                        from ..services.translator import translate_news_batch
+                        translated_count = await translate_news_batch(market='crypto', limit=new_news_count)
+                        logger.info(f"Auto-translated {translated_count} crypto news items")
+                    except Exception as e:
+                        logger.warning(f"Auto-translation failed: {e}")
+            
+            except Exception as e:
+                await db.rollback()
+                timer.fail()
+                logger.error(f"Failed to store crypto news: {e}")
             
-        finally:
-            db.close()
             
         return new_news_count
 
@@ -11,8 +11,13 @@ import pytz
 from sqlalchemy.orm import Session
 
 from ..config.settings import settings
-from ..db.database import get_db_session
-from ..db.models import DartFiling, AlertsLog
+from ..db.database import get_async_db_session
+from ..db.models import DartFiling, FilingKey, AlertsLog
+from ..db.partitions import claim_keys_async
+from ..services.response_cache import invalidate_cache
+from ..monitoring.metrics import CollectorTimer, store_timer
+from ..monitoring.tracing import traced
+from .http_replay import cassette_transport
 
 class DartCollector:
     """DART 공시 정보 수집기"""
@@ -23,7 +28,7 @@ class DartCollector:
         self.session = None
         
     async def __aenter__(self):
-        self.session = httpx.AsyncClient()
+        self.session = httpx.AsyncClient(transport=cassette_transport('dart'))
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -56,24 +61,31 @@ class DartCollector:
             'pblntf_ty': 'A',  # 정기공시: A, 주요사항보고: B, 발행공시: C, 지분공시: D, 기타공시: E
         }
         
+        timer = CollectorTimer('dart')
         try:
             response = await self.session.get(
                 f"{self.base_url}/list.json",
                 params=params
             )
             response.raise_for_status()
+            timer.done('fetch')
             data = response.json()
             
             if data.get('status') != '000':
                 logger.error(f"DART API error: {data.get('message')}")
+                timer.fail()
                 return []
                 
-            return data.get('list', [])
+            filings = data.get('list', [])
+            timer.done('parse', items=len(filings))
+            return filings
             
         except Exception as e:
             logger.error(f"Failed to fetch DART filings: {e}")
+            timer.fail()
             return []
     
+    @traced('collector.dart')
     async def collect_and_store_filings(self, days_back: int = 1) -> int:
         """
         공시 정보 수집하여 DB에 저장
@@ -88,45 +100,48 @@ class DartCollector:
         if not filings:
             return 0
             
-        db = get_db_session()
         new_filings = 0
         
-        try:
-            for filing_data in filings:
-                # 이미 저장된 공시인지 확인
-                existing = db.query(DartFiling).filter(
-                    DartFiling.rcept_no == filing_data.get('rcept_no')
-                ).first()
+        timer = store_timer('dart')
+        async with get_async_db_session() as db:
+            try:
+                # 새 접수번호를 한 번에 등록 (이미 저장됐거나 다른 수집이 먼저 등록한 공시는 제외)
+                new_rcept_nos = await claim_keys_async(db, FilingKey.rcept_no, [f.get('rcept_no') for f in filings])
                 
-                if existing:
-                    continue
+                for filing_data in filings:
+                    # 새로 등록된 공시만 저장 (같은 응답 안의 중복 포함)
+                    if filing_data.get('rcept_no') not in new_rcept_nos:
+                        continue
+                    new_rcept_nos.discard(filing_data.get('rcept_no'))
                     
-                # 새 공시 저장
-                filing = DartFiling(
-                    rcept_no=filing_data.get('rcept_no'),
-                    corp_cls=filing_data.get('corp_cls'),
-                    corp_name=filing_data.get('corp_name'),
-                    corp_code=filing_data.get('corp_code'),
-                    stock_code=filing_data.get('stock_code'),
-                    report_nm=filing_data.get('report_nm'),
-                    rcept_dt=filing_data.get('rcept_dt'),
-                    flr_nm=filing_data.get('flr_nm'),
-                    rm=filing_data.get('rm', '')
-                )
-                
-                db.add(filing)
-                new_filings += 1
-                
-                logger.info(f"New DART filing: {filing.corp_name} - {filing.report_nm}")
+                    # 새 공시 저장
+                    filing = DartFiling(
+                        rcept_no=filing_data.get('rcept_no'),
+                        corp_cls=filing_data.get('corp_cls'),
+                        corp_name=filing_data.get('corp_name'),
+                        corp_code=filing_data.get('corp_code'),
+                        stock_code=filing_data.get('stock_code'),
+                        report_nm=filing_data.get('report_nm'),
+                        rcept_dt=filing_data.get('rcept_dt'),
+                        flr_nm=filing_data.get('flr_nm'),
+                        rm=filing_data.get('rm', '')
+                    )
+                    
+                    db.add(filing)
+                    new_filings += 1
+                    
+                    logger.info(f"New DART filing: {filing.corp_name} - {filing.report_nm}")
+                    
+                await db.commit()
+                    
+                timer.done('store', items=new_filings)
+                if new_filings:
+                    invalidate_cache('filings')
                 
-            db.commit()
-            
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Failed to store DART filings: {e}")
-            
-        finally:
-            db.close()
+            except Exception as e:
+                await db.rollback()
+                timer.fail()
+                logger.error(f"Failed to store DART filings: {e}")
             
         return new_filings
     
@@ -162,6 +177,7 @@ class DartCollector:
         
         return any(keyword in report_name for keyword in keywords)
     
+    @traced('dart.filing_detail', kind='client')
     async def get_filing_detail(self, rcept_no: str) -> Optional[Dict]:
         """
         공시 상세 정보 조회
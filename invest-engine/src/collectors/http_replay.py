@@ -0,0 +1,280 @@
+"""
+HTTP record/replay
+수집기 httpx 클라이언트용 transport - 실제 응답을 cassette(JSON)에 기록해 두고 오프라인에서 그대로 재생
+
+- HTTP_CASSETTE_MODE=record: 실제로 요청하고 응답을 HTTP_CASSETTE_DIR/<수집기>.json 에 기록
+- HTTP_CASSETTE_MODE=replay: cassette 응답만 반환 (네트워크 없음, 기록에 없는 요청은 CassetteMiss)
+- off (기본): 기존과 같이 네트워크 사용
+
+재생 중에는 request_delay() (요청 간 rate limit 대기)를 건너뛰어 수집 -> 파싱 -> 저장 경로를 최대 속도로 실행.
+API 키(crtfc_key 등)는 기록 전에 REDACTED 로 치환.
+
+코드에서 구간별로 켜기 (벤치마크 / 셀렉터 회귀 확인):
+    with use_cassette('naver_news', 'replay', directory='benchmarks/cassettes'):
+        async with NaverNewsCollector() as collector:
+            await collector.collect_and_store_news()
+
+cassette 형식:
+    {"version": 1, "interactions": [
+        {"request": {"method": "GET", "url": "..."},
+         "response": {"status": 200, "headers": {...}, "encoding": "text" | "base64", "body": "..."}}]}
+    손으로 만든 cassette 는 body 대신 "body_file" (cassette 기준 상대 경로)로 응답 파일을 가리킬 수 있음.
+    benchmarks/cassettes 는 이렇게 만든 합성 cassette ("synthetic": true, 실제 응답을 기록한 것이 아님).
+"""
+import asyncio
+import base64
+import contextvars
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+import pytz
+from loguru import logger
+
+from ..config.settings import settings
+
+KST = pytz.timezone('Asia/Seoul')
+
+MODES = ('off', 'record', 'replay')
+
+CASSETTE_VERSION = 1
+
+# 기록 전에 값을 가리는 쿼리 파라미터
+SENSITIVE_PARAMS = {'crtfc_key', 'api_key', 'apikey', 'servicekey', 'token', 'access_token'}
+REDACTED = 'REDACTED'
+
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 버림
+DROP_RESPONSE_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection', 'set-cookie'}
+
+_override: contextvars.ContextVar = contextvars.ContextVar('http_cassette', default=None)
+
+
+class CassetteMiss(httpx.TransportError):
+    """재생 모드에서 기록에 없는 요청"""
+
+
+def redact_url(url: httpx.URL) -> str:
+    """민감한 쿼리 파라미터 값을 REDACTED 로 치환한 URL"""
+    if not url.query:
+        return str(url)
+    params = [(key, REDACTED if key.lower() in SENSITIVE_PARAMS else value)
+              for key, value in url.params.multi_items()]
+    return str(url.copy_with(query=urlencode(params).encode()))
+
+
+def _exact_key(method: str, url: str) -> str:
+    return f"{method.upper()} {url}"
+
+
+def _path_key(method: str, url: str) -> str:
+    """쿼리를 뺀 키 - 날짜 등이 매번 바뀌는 요청(DART list.json)은 경로로 대체 매칭"""
+    parsed = httpx.URL(url)
+    return f"{method.upper()} {parsed.scheme}://{parsed.host}{parsed.path}"
+
+
+class Cassette:
+    """기록된 요청/응답 묶음 (JSON 파일 하나)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.interactions: List[Dict] = []
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.interactions = data.get('interactions', [])
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = {
+                'version': CASSETTE_VERSION,
+                'recorded_at': datetime.now(KST).isoformat(timespec='seconds'),
+                'interactions': self.interactions,
+            }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def record(self, request: httpx.Request, response: httpx.Response):
+        """응답 기록 (같은 요청이 이미 있으면 새 응답으로 교체)"""
+        url = redact_url(request.url)
+        content = response.content
+        try:
+            body, encoding = content.decode('utf-8'), 'text'
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+        interaction = {
+            'request': {'method': request.method, 'url': url},
+            'response': {
+                'status': response.status_code,
+                'headers': {key: value for key, value in response.headers.items()
+                            if key.lower() not in DROP_RESPONSE_HEADERS},
+                'encoding': encoding,
+                'body': body,
+            },
+        }
+        key = _exact_key(request.method, url)
+        with self._lock:
+            self.interactions = [item for item in self.interactions
+                                 if _exact_key(item['request']['method'], item['request']['url']) != key]
+            self.interactions.append(interaction)
+
+    def find(self, request: httpx.Request) -> Optional[Dict]:
+        """
+        재생할 응답 찾기
+
+        같은 URL 이 여러 번 기록되어 있으면 기록 순서대로 돌려주고 마지막 응답을 반복.
+        정확히 같은 URL 이 없으면 쿼리를 뺀 경로가 같은 기록으로 대체.
+        """
+        url = redact_url(request.url)
+        for key_func in (_exact_key, _path_key):
+            key = key_func(request.method, url)
+            matches = [item for item in self.interactions
+                       if key_func(item['request']['method'], item['request']['url']) == key]
+            if matches:
+                with self._lock:
+                    index = self._cursors.get(key, 0)
+                    self._cursors[key] = index + 1
+                return matches[min(index, len(matches) - 1)]
+        return None
+
+    def build_response(self, interaction: Dict, request: httpx.Request) -> httpx.Response:
+        data = interaction['response']
+        if 'body_file' in data:
+            with open(os.path.join(os.path.dirname(self.path), data['body_file']), 'rb') as f:
+                content = f.read()
+        elif data.get('encoding') == 'base64':
+            content = base64.b64decode(data['body'])
+        else:
+            content = data.get('body', '').encode('utf-8')
+        return httpx.Response(data['status'], headers=data.get('headers') or {}, content=content, request=request)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """실제 transport 로 요청하고 응답을 cassette 에 기록"""
+
+    def __init__(self, cassette: Cassette, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.cassette = cassette
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        # 스트림 응답을 읽어 (압축 해제된) 본문으로 기록하고 재생과 같은 형태의 응답을 돌려줌
+        recorded = httpx.Response(response.status_code, headers=response.headers, stream=response.stream,
+                                  request=request)
+        await recorded.aread()
+        await recorded.aclose()
+        self.cassette.record(request, recorded)
+        self.cassette.save()
+        return httpx.Response(recorded.status_code, content=recorded.content, request=request,
+                              headers={key: value for key, value in recorded.headers.items()
+                                       if key.lower() not in DROP_RESPONSE_HEADERS})
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """cassette 에 기록된 응답만 반환 (네트워크 사용 안 함)"""
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        interaction = self.cassette.find(request)
+        if interaction is None:
+            message = f"No recorded response for {request.method} {redact_url(request.url)} in {self.cassette.path}"
+            logger.error(message)
+            raise CassetteMiss(message, request=request)
+        return self.cassette.build_response(interaction, request)
+
+
+# 프로세스 안에서 같은 파일은 같은 Cassette 객체 공유 (재생 커서 / 기록 누적)
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str) -> Cassette:
+    path = os.path.abspath(path)
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+        return _cassettes[path]
+
+
+def _active(name: str) -> Tuple[str, str]:
+    """(모드, cassette 경로) - use_cassette() 가 설정한 값이 settings 보다 우선"""
+    override = _override.get()
+    if override is not None:
+        mode, directory = override
+    else:
+        mode, directory = settings.HTTP_CASSETTE_MODE.lower(), settings.HTTP_CASSETTE_DIR
+    if mode not in MODES:
+        logger.warning(f"Unknown HTTP_CASSETTE_MODE '{mode}', using off")
+        mode = 'off'
+    return mode, os.path.join(directory, f"{name}.json")
+
+
+def cassette_transport(name: str) -> Optional[httpx.AsyncBaseTransport]:
+    """
+    수집기 클라이언트용 transport
+
+    Args:
+        name: cassette 이름 (수집기 단위, 예: 'naver_news')
+
+    Returns:
+        record/replay transport, off 이면 None (httpx 기본 transport)
+    """
+    mode, path = _active(name)
+    if mode == 'off':
+        return None
+    cassette = get_cassette(path)
+    if mode == 'record':
+        logger.info(f"Recording HTTP responses to {path}")
+        return RecordingTransport(cassette)
+    if not cassette.interactions:
+        logger.warning(f"Replaying from empty cassette {path}")
+    return ReplayTransport(cassette)
+
+
+def is_replaying() -> bool:
+    override = _override.get()
+    mode = override[0] if override is not None else settings.HTTP_CASSETTE_MODE.lower()
+    return mode == 'replay'
+
+
+async def request_delay(seconds: float):
+    """요청 간 rate limit 대기 (재생 중에는 건너뜀)"""
+    if not is_replaying():
+        await asyncio.sleep(seconds)
+
+
+@contextmanager
+def use_cassette(name: str, mode: str = 'replay', directory: Optional[str] = None):
+    """
+    with 블록 안에서 만든 수집기 클라이언트에 record/replay 적용
+
+    Args:
+        name: cassette 이름 (재생 커서를 처음부터 다시 시작)
+        mode: record / replay / off
+        directory: cassette 디렉터리 (기본 HTTP_CASSETTE_DIR)
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    directory = directory or settings.HTTP_CASSETTE_DIR
+    get_cassette(os.path.join(directory, f"{name}.json"))._cursors.clear()
+    token = _override.set((mode, directory))
+    try:
+        yield
+    finally:
+        _override.reset(token)
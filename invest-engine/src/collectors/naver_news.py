@@ -14,8 +14,13 @@ from urllib.parse import urljoin, parse_qs, urlparse
 from sqlalchemy.orm import Session
 
 from ..config.settings import settings
-from ..db.database import get_db_session
-from ..db.models import News
+from ..db.database import get_async_db_session
+from ..db.models import News, NewsUrl
+from ..db.partitions import claim_keys_async
+from ..services.response_cache import invalidate_cache
+from ..monitoring.metrics import CollectorTimer, store_timer
+from ..monitoring.tracing import traced
+from .http_replay import cassette_transport, request_delay
 
 class NaverNewsCollector:
     """네이버 증권 뉴스 수집기"""
@@ -31,7 +36,8 @@ class NaverNewsCollector:
             headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             },
-            timeout=30.0
+            timeout=30.0,
+            transport=cassette_transport('naver_news')
         )
         return self
     
@@ -46,72 +52,90 @@ class NaverNewsCollector:
         Returns:
             뉴스 정보 리스트
         """
+        timer = CollectorTimer('naver_finance')
         try:
             response = await self.session.get(self.main_news_url)
             response.raise_for_status()
+            timer.done('fetch')
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            news_list = []
+            news_list = self.parse_main_news(response.text)
             
-            # 주요 뉴스 섹션 찾기
-            main_news_area = soup.find('div', class_='mainNewsList')
-            if not main_news_area:
-                logger.warning("Main news area not found")
-                return []
-            
-            # 뉴스 아이템들 찾기
-            news_items = main_news_area.find_all('dd')
-            
-            for item in news_items:
-                try:
-                    link_elem = item.find('a')
-                    if not link_elem:
-                        continue
-                        
-                    title = link_elem.get_text().strip()
-                    if not title:
-                        continue
-                        
-                    # URL 정리
-                    url = link_elem.get('href')
-                    if not url:
-                        continue
-                        
-                    if url.startswith('/'):
-                        url = urljoin(self.base_url, url)
-                    
-                    # 시간 정보 찾기
-                    time_elem = item.find('span', class_='wdate')
-                    time_str = None
-                    published_at = None
-                    
-                    if time_elem:
-                        time_str = time_elem.get_text().strip()
-                        published_at = self._parse_time(time_str)
-                    
-                    # 뉴스 데이터 생성
-                    news_data = {
-                        'title': title,
-                        'url': url,
-                        'source': 'naver_finance',
-                        'category': 'market_news',
-                        'published_at': published_at,
-                        'time_str': time_str
-                    }
-                    
-                    news_list.append(news_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse news item: {e}")
-                    continue
-                    
             logger.info(f"Collected {len(news_list)} main news items")
+            timer.done('parse', items=len(news_list))
             return news_list
             
         except Exception as e:
             logger.error(f"Failed to fetch main news: {e}")
+            timer.fail()
             return []
     
+    def parse_main_news(self, html: str) -> List[Dict]:
+        """
+        네이버 증권 주요 뉴스 HTML 파싱
+        
+        Args:
+            html: 페이지 HTML
+            
+        Returns:
+            뉴스 정보 리스트
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        news_list = []
+        
+        # 주요 뉴스 섹션 찾기
+        main_news_area = soup.find('div', class_='mainNewsList')
+        if not main_news_area:
+            logger.warning("Main news area not found")
+            return []
+        
+        # 뉴스 아이템들 찾기
+        news_items = main_news_area.find_all('dd')
+        
+        for item in news_items:
+            try:
+                link_elem = item.find('a')
+                if not link_elem:
+                    continue
+                    
+                title = link_elem.get_text().strip()
+                if not title:
+                    continue
+                    
+                # URL 정리
+                url = link_elem.get('href')
+                if not url:
+                    continue
+                    
+                if url.startswith('/'):
+                    url = urljoin(self.base_url, url)
+                
+                # 시간 정보 찾기
+                time_elem = item.find('span', class_='wdate')
+                time_str = None
+                published_at = None
+                
+                if time_elem:
+                    time_str = time_elem.get_text().strip()
+                    published_at = self._parse_time(time_str)
+                
+                # 뉴스 데이터 생성
+                news_data = {
+                    'title': title,
+                    'url': url,
+                    'source': 'naver_finance',
+                    'category': 'market_news',
+                    'published_at': published_at,
+                    'time_str': time_str
+                }
+                
+                news_list.append(news_data)
+                
+            except Exception as e:
+                logger.warning(f"Failed to parse news item: {e}")
+                continue
+        
+        return news_list
+    
     async def get_stock_news(self, stock_code: str, limit: int = 10) -> List[Dict]:
         """
         특정 종목 관련 뉴스 수집
@@ -123,79 +147,99 @@ class NaverNewsCollector:
         Returns:
             뉴스 정보 리스트
         """
+        timer = CollectorTimer('naver_stock')
         try:
             # 종목별 뉴스 URL
             stock_news_url = f"https://finance.naver.com/item/news_news.naver?code={stock_code}"
             
             response = await self.session.get(stock_news_url)
             response.raise_for_status()
+            timer.done('fetch')
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            news_list = []
+            news_list = self.parse_stock_news(response.text, stock_code, limit)
             
-            # 뉴스 테이블 찾기
-            news_table = soup.find('table', class_='type5')
-            if not news_table:
-                logger.warning(f"News table not found for stock {stock_code}")
-                return []
+            logger.info(f"Collected {len(news_list)} stock news items for {stock_code}")
+            timer.done('parse', items=len(news_list))
+            return news_list
             
-            # 뉴스 행들 찾기
-            news_rows = news_table.find_all('tr')[2:]  # 헤더 제외
+        except Exception as e:
+            logger.error(f"Failed to fetch stock news for {stock_code}: {e}")
+            timer.fail()
+            return []
+    
+    def parse_stock_news(self, html: str, stock_code: str, limit: int = 10) -> List[Dict]:
+        """
+        종목 뉴스 HTML 파싱
+        
+        Args:
+            html: 페이지 HTML
+            stock_code: 종목코드
+            limit: 파싱할 뉴스 개수
             
-            for row in news_rows[:limit]:
-                try:
-                    cells = row.find_all('td')
-                    if len(cells) < 3:
-                        continue
-                        
-                    # 제목과 링크
-                    title_cell = cells[0]
-                    link_elem = title_cell.find('a')
-                    if not link_elem:
-                        continue
-                        
-                    title = link_elem.get_text().strip()
-                    if not title:
-                        continue
-                        
-                    url = link_elem.get('href')
-                    if not url:
-                        continue
-                        
-                    if url.startswith('/'):
-                        url = urljoin(self.base_url, url)
-                    
-                    # 정보제공 (출처)
-                    source_cell = cells[1]
-                    source = source_cell.get_text().strip() if source_cell else 'Unknown'
-                    
-                    # 날짜
-                    date_cell = cells[2]
-                    date_str = date_cell.get_text().strip() if date_cell else None
-                    published_at = self._parse_date(date_str)
+        Returns:
+            뉴스 정보 리스트
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        news_list = []
+        
+        # 뉴스 테이블 찾기
+        news_table = soup.find('table', class_='type5')
+        if not news_table:
+            logger.warning(f"News table not found for stock {stock_code}")
+            return []
+        
+        # 뉴스 행들 찾기
+        news_rows = news_table.find_all('tr')[2:]  # 헤더 제외
+        
+        for row in news_rows[:limit]:
+            try:
+                cells = row.find_all('td')
+                if len(cells) < 3:
+                    continue
                     
-                    news_data = {
-                        'title': title,
-                        'url': url,
-                        'source': f'naver_finance_{source.lower()}',
-                        'category': 'stock_news',
-                        'published_at': published_at,
-                        'stock_codes': [stock_code],
-                        'date_str': date_str
-                    }
+                # 제목과 링크
+                title_cell = cells[0]
+                link_elem = title_cell.find('a')
+                if not link_elem:
+                    continue
                     
-                    news_list.append(news_data)
+                title = link_elem.get_text().strip()
+                if not title:
+                    continue
                     
-                except Exception as e:
-                    logger.warning(f"Failed to parse stock news item: {e}")
+                url = link_elem.get('href')
+                if not url:
                     continue
                     
-            logger.info(f"Collected {len(news_list)} stock news items for {stock_code}")
-            return news_list
-            
-        except Exception as e:
-            logger.error(f"Failed to fetch stock news for {stock_code}: {e}")
-            return []
+                if url.startswith('/'):
+                    url = urljoin(self.base_url, url)
+                
+                # 정보제공 (출처)
+                source_cell = cells[1]
+                source = source_cell.get_text().strip() if source_cell else 'Unknown'
+                
+                # 날짜
+                date_cell = cells[2]
+                date_str = date_cell.get_text().strip() if date_cell else None
+                published_at = self._parse_date(date_str)
+                
+                news_data = {
+                    'title': title,
+                    'url': url,
+                    'source': f'naver_finance_{source.lower()}',
+                    'category': 'stock_news',
+                    'published_at': published_at,
+                    'stock_codes': [stock_code],
+                    'date_str': date_str
+                }
+                
+                news_list.append(news_data)
+                
+            except Exception as e:
+                logger.warning(f"Failed to parse stock news item: {e}")
+                continue
+        
+        return news_list
     
     def _parse_time(self, time_str: str) -> Optional[datetime]:
         """
@@ -335,12 +379,14 @@ class NaverNewsCollector:
         
         return min(score, 1.0)  # 최대 1.0으로 제한
     
-    async def collect_and_store_news(self, collect_stock_news: bool = False) -> int:
+    @traced('collector.naver_news')
+    async def collect_and_store_news(self, collect_stock_news: bool = False, alert: bool = True) -> int:
         """
         뉴스 수집하여 DB에 저장
         
         Args:
             collect_stock_news: 종목별 뉴스도 수집할지 여부
+            alert: 저장 후 바로 중요 뉴스 알림을 보낼지 여부 (오케스트레이터는 high_priority_alerts 작업으로 처리)
             
         Returns:
             저장된 뉴스 개수
@@ -361,62 +407,66 @@ class NaverNewsCollector:
                     stock_news = await self.get_stock_news(stock_code, limit=5)
                     all_news.extend(stock_news)
                     # 요청 간 딜레이
-                    await asyncio.sleep(1)
+                    await request_delay(1)
                 except Exception as e:
                     logger.error(f"Failed to collect news for stock {stock_code}: {e}")
         
         if not all_news:
             return 0
         
-        db = get_db_session()
         new_news_count = 0
         
-        try:
-            for news_data in all_news:
-                # 이미 저장된 뉴스인지 확인
-                existing = db.query(News).filter(
-                    News.url == news_data['url']
-                ).first()
+        timer = store_timer('naver_news')
+        async with get_async_db_session() as db:
+            try:
+                # 새 URL을 한 번에 등록 (이미 저장됐거나 다른 수집이 먼저 등록한 URL은 제외)
+                new_urls = await claim_keys_async(db, NewsUrl.url, [news_data['url'] for news_data in all_news])
                 
-                if existing:
-                    continue
+                for news_data in all_news:
+                    # 새로 등록된 URL만 저장 (같은 배치 안의 중복 포함)
+                    if news_data['url'] not in new_urls:
+                        continue
+                    new_urls.discard(news_data['url'])
                 
-                # 제목에서 종목코드 추출 (stock_codes가 없는 경우)
-                if not news_data.get('stock_codes'):
-                    news_data['stock_codes'] = self.extract_stock_codes_from_title(
-                        news_data['title']
-                    )
+                    # 제목에서 종목코드 추출 (stock_codes가 없는 경우)
+                    if not news_data.get('stock_codes'):
+                        news_data['stock_codes'] = self.extract_stock_codes_from_title(
+                            news_data['title']
+                        )
                 
-                # 중요도 점수 계산
-                importance_score = self.calculate_importance_score(news_data)
+                    # 중요도 점수 계산
+                    importance_score = self.calculate_importance_score(news_data)
                 
-                # 새 뉴스 저장
-                news = News(
-                    title=news_data['title'],
-                    url=news_data['url'],
-                    source=news_data['source'],
-                    market='kr',  # 한국 뉴스로 설정
-                    published_at=news_data.get('published_at'),
-                    stock_codes=news_data.get('stock_codes', []),
-                    importance_score=importance_score
-                )
+                    # 새 뉴스 저장
+                    news = News(
+                        title=news_data['title'],
+                        url=news_data['url'],
+                        source=news_data['source'],
+                        market='kr',  # 한국 뉴스로 설정
+                        published_at=news_data.get('published_at'),
+                        stock_codes=news_data.get('stock_codes', []),
+                        importance_score=importance_score
+                    )
                 
-                db.add(news)
-                new_news_count += 1
+                    db.add(news)
+                    new_news_count += 1
                 
-                logger.info(f"New news: {news.title[:50]}...")
+                    logger.info(f"New news: {news.title[:50]}...")
             
-            db.commit()
+                await db.commit()
             
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Failed to store news: {e}")
+                timer.done('store', items=new_news_count)
+                if new_news_count:
+                    invalidate_cache('news')
+            
+            except Exception as e:
+                await db.rollback()
+                timer.fail()
+                logger.error(f"Failed to store news: {e}")
             
-        finally:
-            db.close()
             
         # 중요도 높은 뉴스는 텔레그램 알림 자동 발송
-        if new_news_count > 0:
+        if alert and new_news_count > 0:
             try:
                 from ..alerts.telegram_alert import telegram_alert
                 await telegram_alert.process_high_importance_news(min_importance=0.7)
@@ -16,8 +16,13 @@ from urllib.parse import urljoin, parse_qs, urlparse
 from sqlalchemy.orm import Session
 
 from ..config.settings import settings
-from ..db.database import get_db_session
-from ..db.models import News
+from ..db.database import get_async_db_session
+from ..db.models import News, NewsUrl
+from ..db.partitions import claim_keys_async
+from ..services.response_cache import invalidate_cache
+from ..monitoring.metrics import CollectorTimer, store_timer
+from ..monitoring.tracing import traced
+from .http_replay import cassette_transport, request_delay
 
 class USNewsCollector:
     """미국 주식 뉴스 수집기"""
@@ -45,7 +50,8 @@ class USNewsCollector:
             headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             },
-            timeout=30.0
+            timeout=30.0,
+            transport=cassette_transport('us_news')
         )
         return self
     
@@ -63,74 +69,93 @@ class USNewsCollector:
         Returns:
             뉴스 정보 리스트
         """
+        timer = CollectorTimer('yahoo_finance')
         try:
             response = await self.session.get(self.yahoo_rss_urls['market_news'])
             response.raise_for_status()
+            timer.done('fetch')
             
-            # RSS 파싱
-            feed = feedparser.parse(response.content)
-            news_list = []
+            news_list = self.parse_yahoo_market_rss(response.content, limit)
             
-            if not feed.entries:
-                logger.warning("No RSS entries found from Yahoo Finance")
-                return []
-            
-            for entry in feed.entries[:limit]:
-                try:
-                    # 기본 정보 추출
-                    title = entry.title.strip() if hasattr(entry, 'title') else ''
-                    if not title:
-                        continue
-                        
-                    url = entry.link if hasattr(entry, 'link') else ''
-                    if not url:
-                        continue
-                    
-                    # 발행 시간
-                    published_at = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        # RSS의 published_parsed는 GMT 시간
-                        dt = datetime(*entry.published_parsed[:6])
-                        published_at = self.utc.localize(dt)
-                    elif hasattr(entry, 'published'):
-                        # 문자열로 된 날짜 파싱 시도
-                        published_at = self._parse_date_string(entry.published)
-                    
-                    # 요약/설명
-                    summary = ''
-                    if hasattr(entry, 'summary'):
-                        # HTML 태그 제거
-                        soup = BeautifulSoup(entry.summary, 'html.parser')
-                        summary = soup.get_text().strip()
-                    
-                    # 뉴스 데이터 생성
-                    news_data = {
-                        'title': title,
-                        'url': url,
-                        'source': 'yahoo_finance',
-                        'category': 'us_market_news',
-                        'published_at': published_at,
-                        'summary': summary[:500] if summary else None  # 요약문 길이 제한
-                    }
-                    
-                    # 제목에서 종목 추출
-                    tickers = self.extract_tickers_from_text(title + ' ' + summary)
-                    if tickers:
-                        news_data['stock_codes'] = tickers
-                    
-                    news_list.append(news_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse RSS entry: {e}")
-                    continue
-                    
             logger.info(f"Collected {len(news_list)} market news from Yahoo Finance RSS")
+            timer.done('parse', items=len(news_list))
             return news_list
             
         except Exception as e:
             logger.error(f"Failed to fetch Yahoo Finance RSS: {e}")
+            timer.fail()
             return []
     
+    def parse_yahoo_market_rss(self, content: bytes, limit: int = 20) -> List[Dict]:
+        """
+        Yahoo Finance 마켓 뉴스 RSS 파싱
+        
+        Args:
+            content: RSS 본문
+            limit: 파싱할 뉴스 개수
+            
+        Returns:
+            뉴스 정보 리스트
+        """
+        # RSS 파싱
+        feed = feedparser.parse(content)
+        news_list = []
+        
+        if not feed.entries:
+            logger.warning("No RSS entries found from Yahoo Finance")
+            return []
+        
+        for entry in feed.entries[:limit]:
+            try:
+                # 기본 정보 추출
+                title = entry.title.strip() if hasattr(entry, 'title') else ''
+                if not title:
+                    continue
+                    
+                url = entry.link if hasattr(entry, 'link') else ''
+                if not url:
+                    continue
+                
+                # 발행 시간
+                published_at = None
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    # RSS의 published_parsed는 GMT 시간
+                    dt = datetime(*entry.published_parsed[:6])
+                    published_at = self.utc.localize(dt)
+                elif hasattr(entry, 'published'):
+                    # 문자열로 된 날짜 파싱 시도
+                    published_at = self._parse_date_string(entry.published)
+                
+                # 요약/설명
+                summary = ''
+                if hasattr(entry, 'summary'):
+                    # HTML 태그 제거
+                    soup = BeautifulSoup(entry.summary, 'html.parser')
+                    summary = soup.get_text().strip()
+                
+                # 뉴스 데이터 생성
+                news_data = {
+                    'title': title,
+                    'url': url,
+                    'source': 'yahoo_finance',
+                    'category': 'us_market_news',
+                    'published_at': published_at,
+                    'summary': summary[:500] if summary else None  # 요약문 길이 제한
+                }
+                
+                # 제목에서 종목 추출
+                tickers = self.extract_tickers_from_text(title + ' ' + summary)
+                if tickers:
+                    news_data['stock_codes'] = tickers
+                
+                news_list.append(news_data)
+                
+            except Exception as e:
+                logger.warning(f"Failed to parse RSS entry: {e}")
+                continue
+        
+        return news_list
+    
     async def get_stock_specific_news(self, ticker: str, limit: int = 10) -> List[Dict]:
         """
         특정 종목 관련 뉴스 수집 (Yahoo Finance RSS)
@@ -142,73 +167,93 @@ class USNewsCollector:
         Returns:
             뉴스 정보 리스트
         """
+        timer = CollectorTimer('yahoo_ticker')
         try:
             # 종목별 RSS URL
             rss_url = self.yahoo_rss_urls['stock_news'].format(ticker=ticker)
             
             response = await self.session.get(rss_url)
             response.raise_for_status()
+            timer.done('fetch')
             
-            # RSS 파싱
-            feed = feedparser.parse(response.content)
-            news_list = []
-            
-            if not feed.entries:
-                logger.debug(f"No RSS entries found for ticker {ticker}")
-                return []
+            news_list = self.parse_yahoo_stock_rss(response.content, ticker, limit)
             
-            for entry in feed.entries[:limit]:
-                try:
-                    title = entry.title.strip() if hasattr(entry, 'title') else ''
-                    if not title:
-                        continue
-                        
-                    url = entry.link if hasattr(entry, 'link') else ''
-                    if not url:
-                        continue
-                    
-                    # 발행 시간
-                    published_at = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        dt = datetime(*entry.published_parsed[:6])
-                        published_at = self.utc.localize(dt)
-                    
-                    # 요약
-                    summary = ''
-                    if hasattr(entry, 'summary'):
-                        soup = BeautifulSoup(entry.summary, 'html.parser')
-                        summary = soup.get_text().strip()
-                    
-                    news_data = {
-                        'title': title,
-                        'url': url,
-                        'source': 'yahoo_finance',
-                        'category': 'us_stock_news',
-                        'published_at': published_at,
-                        'summary': summary[:500] if summary else None,
-                        'stock_codes': [ticker]  # 요청된 종목 코드 포함
-                    }
-                    
-                    # 다른 종목도 언급되었는지 확인
-                    other_tickers = self.extract_tickers_from_text(title + ' ' + summary)
-                    if other_tickers:
-                        # 중복 제거하면서 추가
-                        all_tickers = list(set([ticker] + other_tickers))
-                        news_data['stock_codes'] = all_tickers
-                    
-                    news_list.append(news_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse stock news entry for {ticker}: {e}")
-                    continue
-                    
             logger.info(f"Collected {len(news_list)} stock news for {ticker}")
+            timer.done('parse', items=len(news_list))
             return news_list
             
         except Exception as e:
             logger.error(f"Failed to fetch stock news for {ticker}: {e}")
+            timer.fail()
             return []
     
+    def parse_yahoo_stock_rss(self, content: bytes, ticker: str, limit: int = 10) -> List[Dict]:
+        """
+        Yahoo Finance 종목 뉴스 RSS 파싱
+        
+        Args:
+            content: RSS 본문
+            ticker: 종목 심볼
+            limit: 파싱할 뉴스 개수
+            
+        Returns:
+            뉴스 정보 리스트
+        """
+        # RSS 파싱
+        feed = feedparser.parse(content)
+        news_list = []
+        
+        if not feed.entries:
+            logger.debug(f"No RSS entries found for ticker {ticker}")
+            return []
+        
+        for entry in feed.entries[:limit]:
+            try:
+                title = entry.title.strip() if hasattr(entry, 'title') else ''
+                if not title:
+                    continue
+                    
+                url = entry.link if hasattr(entry, 'link') else ''
+                if not url:
+                    continue
+                
+                # 발행 시간
+                published_at = None
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    dt = datetime(*entry.published_parsed[:6])
+                    published_at = self.utc.localize(dt)
+                
+                # 요약
+                summary = ''
+                if hasattr(entry, 'summary'):
+                    soup = BeautifulSoup(entry.summary, 'html.parser')
+                    summary = soup.get_text().strip()
+                
+                news_data = {
+                    'title': title,
+                    'url': url,
+                    'source': 'yahoo_finance',
+                    'category': 'us_stock_news',
+                    'published_at': published_at,
+                    'summary': summary[:500] if summary else None,
+                    'stock_codes': [ticker]  # 요청된 종목 코드 포함
+                }
+                
+                # 다른 종목도 언급되었는지 확인
+                other_tickers = self.extract_tickers_from_text(title + ' ' + summary)
+                if other_tickers:
+                    # 중복 제거하면서 추가
+                    all_tickers = list(set([ticker] + other_tickers))
+                    news_data['stock_codes'] = all_tickers
+                
+                news_list.append(news_data)
+                
+            except Exception as e:
+                logger.warning(f"Failed to parse stock news entry for {ticker}: {e}")
+                continue
+        
+        return news_list
+    
     async def get_google_finance_news(self, query: str = "US stocks", limit: int = 10) -> List[Dict]:
         """
         Google Finance 뉴스 스크래핑 (백업용)
@@ -220,72 +265,91 @@ class USNewsCollector:
         Returns:
             뉴스 정보 리스트
         """
+        timer = CollectorTimer('google_finance')
         try:
             # Google Finance 뉴스 URL
             url = f"https://www.google.com/finance/quote/{query}:NASDAQ"
             
             response = await self.session.get(url)
             response.raise_for_status()
+            timer.done('fetch')
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            news_list = []
-            
-            # Google Finance의 뉴스 섹션 찾기 (구조가 자주 변경됨)
-            # 이 부분은 실제 Google Finance 페이지 구조에 따라 조정 필요
-            news_articles = soup.find_all('div', class_='yY3Lee')  # 예시 클래스명
+            news_list = self.parse_google_finance(response.text, limit)
             
-            for article in news_articles[:limit]:
-                try:
-                    title_elem = article.find('div', class_='Yfwt5')
-                    if not title_elem:
-                        continue
-                        
-                    title = title_elem.get_text().strip()
-                    if not title:
-                        continue
-                    
-                    # URL 추출
-                    link_elem = article.find('a')
-                    url = link_elem.get('href') if link_elem else ''
-                    if url and url.startswith('/url?'):
-                        # Google redirect URL 디코딩
-                        parsed = urlparse(url)
-                        query_params = parse_qs(parsed.query)
-                        if 'url' in query_params:
-                            url = query_params['url'][0]
-                    
-                    # 시간 정보
-                    time_elem = article.find('div', class_='Adak')
-                    time_str = time_elem.get_text().strip() if time_elem else ''
-                    published_at = self._parse_relative_time(time_str)
-                    
-                    news_data = {
-                        'title': title,
-                        'url': url,
-                        'source': 'google_finance',
-                        'category': 'us_market_news',
-                        'published_at': published_at,
-                        'time_str': time_str
-                    }
-                    
-                    # 종목 추출
-                    tickers = self.extract_tickers_from_text(title)
-                    if tickers:
-                        news_data['stock_codes'] = tickers
-                    
-                    news_list.append(news_data)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to parse Google Finance article: {e}")
-                    continue
-                    
             logger.info(f"Collected {len(news_list)} news from Google Finance")
+            timer.done('parse', items=len(news_list))
             return news_list
             
         except Exception as e:
             logger.error(f"Failed to fetch Google Finance news: {e}")
+            timer.fail()
             return []
     
+    def parse_google_finance(self, html: str, limit: int = 10) -> List[Dict]:
+        """
+        Google Finance 뉴스 HTML 파싱
+        
+        Args:
+            html: 페이지 HTML
+            limit: 파싱할 뉴스 개수
+            
+        Returns:
+            뉴스 정보 리스트
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        news_list = []
+        
+        # Google Finance의 뉴스 섹션 찾기 (구조가 자주 변경됨)
+        # 이 부분은 실제 Google Finance 페이지 구조에 따라 조정 필요
+        news_articles = soup.find_all('div', class_='yY3Lee')  # 예시 클래스명
+        
+        for article in news_articles[:limit]:
+            try:
+                title_elem = article.find('div', class_='Yfwt5')
+                if not title_elem:
+                    continue
+                    
+                title = title_elem.get_text().strip()
+                if not title:
+                    continue
+                
+                # URL 추출
+                link_elem = article.find('a')
+                url = link_elem.get('href') if link_elem else ''
+                if url and url.startswith('/url?'):
+                    # Google redirect URL 디코딩
+                    parsed = urlparse(url)
+                    query_params = parse_qs(parsed.query)
+                    if 'url' in query_params:
+                        url = query_params['url'][0]
+                
+                # 시간 정보
+                time_elem = article.find('div', class_='Adak')
+                time_str = time_elem.get_text().strip() if time_elem else ''
+                published_at = self._parse_relative_time(time_str)
+                
+                news_data = {
+                    'title': title,
+                    'url': url,
+                    'source': 'google_finance',
+                    'category': 'us_market_news',
+                    'published_at': published_at,
+                    'time_str': time_str
+                }
+                
+                # 종목 추출
+                tickers = self.extract_tickers_from_text(title)
+                if tickers:
+                    news_data['stock_codes'] = tickers
+                
+                news_list.append(news_data)
+                
+            except Exception as e:
+                logger.warning(f"Failed to parse Google Finance article: {e}")
+                continue
+        
+        return news_list
+    
     def extract_tickers_from_text(self, text: str) -> List[str]:
         """
         텍스트에서 미국 주식 티커 추출
@@ -463,11 +527,13 @@ class USNewsCollector:
             logger.warning(f"Failed to parse relative time '{time_str}': {e}")
             return None
     
+    @traced('collector.us_news')
     async def collect_and_store_news(
         self, 
         collect_stock_specific: bool = True,
         stock_limit_per_ticker: int = 5,
-        market_news_limit: int = 20
+        market_news_limit: int = 20,
+        translate: bool = True
     ) -> int:
         """
         미국 뉴스 수집하여 DB에 저장
@@ -476,6 +542,7 @@ class USNewsCollector:
             collect_stock_specific: 종목별 뉴스도 수집할지 여부
             stock_limit_per_ticker: 종목당 수집할 뉴스 개수
             market_news_limit: 마켓 뉴스 수집 개수
+            translate: 저장 후 바로 번역할지 여부 (오케스트레이터는 별도 번역 작업으로 처리)
             
         Returns:
             저장된 뉴스 개수
@@ -504,7 +571,7 @@ class USNewsCollector:
                     all_news.extend(stock_news)
                     
                     # API 요청 간 딜레이 (Rate limiting 방지)
-                    await asyncio.sleep(1)
+                    await request_delay(1)
                     
                 except Exception as e:
                     logger.error(f"Failed to collect news for {ticker}: {e}")
@@ -514,57 +581,61 @@ class USNewsCollector:
             return 0
         
         # DB에 저장
-        db = get_db_session()
         new_news_count = 0
         
-        try:
-            for news_data in all_news:
-                # 중복 확인
-                existing = db.query(News).filter(
-                    News.url == news_data['url']
-                ).first()
+        timer = store_timer('us_news')
+        async with get_async_db_session() as db:
+            try:
+                # 새 URL을 한 번에 등록 (이미 저장됐거나 다른 수집이 먼저 등록한 URL은 제외)
+                new_urls = await claim_keys_async(db, NewsUrl.url, [news_data['url'] for news_data in all_news])
                 
-                if existing:
-                    continue
+                for news_data in all_news:
+                    # 중복 확인 (같은 배치 안의 중복 포함)
+                    if news_data['url'] not in new_urls:
+                        continue
+                    new_urls.discard(news_data['url'])
                 
-                # 중요도 점수 계산
-                importance_score = self.calculate_importance_score(news_data)
+                    # 중요도 점수 계산
+                    importance_score = self.calculate_importance_score(news_data)
                 
-                # 새 뉴스 저장
-                news = News(
-                    title=news_data['title'],
-                    url=news_data['url'],
-                    source=news_data['source'],
-                    market='us',  # 미국 뉴스로 설정
-                    published_at=news_data.get('published_at'),
-                    stock_codes=news_data.get('stock_codes', []),
-                    importance_score=importance_score,
-                    content=news_data.get('summary')  # 요약을 content에 저장
-                )
+                    # 새 뉴스 저장
+                    news = News(
+                        title=news_data['title'],
+                        url=news_data['url'],
+                        source=news_data['source'],
+                        market='us',  # 미국 뉴스로 설정
+                        published_at=news_data.get('published_at'),
+                        stock_codes=news_data.get('stock_codes', []),
+                        importance_score=importance_score,
+                        content=news_data.get('summary')  # 요약을 content에 저장
+                    )
                 
-                db.add(news)
-                new_news_count += 1
+                    db.add(news)
+                    new_news_count += 1
                 
-                logger.info(f"New US news: {news.title[:50]}...")
+                    logger.info(f"New US news: {news.title[:50]}...")
             
-            db.commit()
-            logger.info(f"Successfully stored {new_news_count} US news items")
+                await db.commit()
             
-            # 수집된 뉴스 자동 번역 실행
-            if new_news_count > 0:
-                try:
-                    from ..services.translator import translate_news_batch
-                    translated_count = await translate_news_batch(market='us', limit=new_news_count)
-                    logger.info(f"Auto-translated {translated_count} US news items")
-                except Exception as e:
-                    logger.warning(f"Auto-translation failed: {e}")
+                timer.done('store', items=new_news_count)
+                if new_news_count:
+                    invalidate_cache('news')
+                logger.info(f"Successfully stored {new_news_count} US news items")
             
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Failed to store US news: {e}")
+                # 수집된 뉴스 자동 번역 실행
+                if translate and new_news_count > 0:
+                    try:
+                        from ..services.translator import translate_news_batch
+                        translated_count = await translate_news_batch(market='us', limit=new_news_count)
+                        logger.info(f"Auto-translated {translated_count} US news items")
+                    except Exception as e:
+                        logger.warning(f"Auto-translation failed: {e}")
+            
+            except Exception as e:
+                await db.rollback()
+                timer.fail()
+                logger.error(f"Failed to store US news: {e}")
             
-        finally:
-            db.close()
             
         return new_news_count
 
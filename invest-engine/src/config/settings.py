@@ -14,6 +14,22 @@ class Settings:
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./invest_engine.db")
+    # 비동기 세션용 URL (비워두면 DATABASE_URL에서 aiosqlite/asyncpg 드라이버로 변환)
+    ASYNC_DATABASE_URL: Optional[str] = os.getenv("ASYNC_DATABASE_URL") or None
+    # SQLite 성능 프로필 (WAL + 연결별 PRAGMA)
+    SQLITE_WAL: bool = os.getenv("SQLITE_WAL", "True").lower() == "true"
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_CACHE_SIZE: int = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))  # 음수 = KiB (64MB)
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", "268435456"))  # 256MB
+    # 서버형 DB(PostgreSQL) 커넥션 풀 / 쿼리 타임아웃
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+    # PostgreSQL 월별 파티션 (news / dart_filings) 미리 만들어 둘 개월 수
+    PARTITION_MONTHS_AHEAD: int = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
     
     # DART API
     DART_API_KEY: Optional[str] = os.getenv("DART_API_KEY")
@@ -30,10 +46,75 @@ class Settings:
     TIMEZONE = pytz.timezone(os.getenv("TIMEZONE", "Asia/Seoul"))
     MORNING_BRIEFING_TIME: str = os.getenv("MORNING_BRIEFING_TIME", "08:30")
     MARKET_CLOSE_TIME: str = os.getenv("MARKET_CLOSE_TIME", "16:00")
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "True").lower() == "true"  # False: API 전용 인스턴스
+    # 작업 오케스트레이터: 시작 시각 분산(초), 자원별 동시 실행 한도 ("자원=개수,...")
+    ORCHESTRATOR_JITTER_SECONDS: int = int(os.getenv("ORCHESTRATOR_JITTER_SECONDS", "30"))
+    ORCHESTRATOR_BUDGETS: str = os.getenv("ORCHESTRATOR_BUDGETS", "dart_api=1,llm=2,telegram=1,web=3")
+    FILING_ANALYSIS_BATCH: int = int(os.getenv("FILING_ANALYSIS_BATCH", "10"))  # 1회 실행당 AI 분석할 A/B 공시 수
+    # 작업 큐 (True: 스케줄러는 task_queue 에 넣기만 하고 worker.py 프로세스가 실행)
+    TASK_QUEUE_ENABLED: bool = os.getenv("TASK_QUEUE_ENABLED", "False").lower() == "true"
+    TASK_LEASE_SECONDS: int = int(os.getenv("TASK_LEASE_SECONDS", "600"))  # 워커가 죽으면 이 시간 뒤 다른 워커가 다시 실행
+    TASK_MAX_ATTEMPTS: int = int(os.getenv("TASK_MAX_ATTEMPTS", "3"))
+    TASK_RETRY_BACKOFF_SECONDS: int = int(os.getenv("TASK_RETRY_BACKOFF_SECONDS", "60"))  # 재시도 간격 (시도마다 2배)
+    TASK_RETENTION_DAYS: int = int(os.getenv("TASK_RETENTION_DAYS", "7"))  # 끝난 작업 기록 보관 기간
+    WORKER_CONCURRENCY: int = int(os.getenv("WORKER_CONCURRENCY", "4"))  # 워커 프로세스당 동시 실행 작업 수
+    WORKER_POLL_SECONDS: float = float(os.getenv("WORKER_POLL_SECONDS", "2"))
+    # 스케줄러 리더 선출 (uvicorn --workers N / 여러 인스턴스 중 하나만 정기 작업 실행)
+    LEADER_ELECTION_ENABLED: bool = os.getenv("LEADER_ELECTION_ENABLED", "True").lower() == "true"
+    LEADER_LEASE_SECONDS: int = int(os.getenv("LEADER_LEASE_SECONDS", "30"))  # 리더가 죽으면 이 시간 안에 다른 프로세스가 이어받음
+    # 빠른 시작 (컨테이너 오토스케일링): 스키마가 마지막으로 확인한 버전과 같으면 테이블 생성/마이그레이션 생략
+    FAST_START: bool = os.getenv("FAST_START", "False").lower() == "true"
     
     # Stock Alerts
     PRICE_ALERT_THRESHOLD: float = float(os.getenv("PRICE_ALERT_THRESHOLD", "3.0"))
     
+    # Influencer signals (SNS 파이프라인 JSON -> DB 동기화)
+    INFLUENCER_DATA_DIR: str = os.getenv("INFLUENCER_DATA_DIR", "../invest-sns/smtr_data")
+    INFLUENCER_SIGNAL_FILES: str = os.getenv(
+        "INFLUENCER_SIGNAL_FILES", "corinpapa1106/_deduped_signals_8types_dated.json"
+    )
+    INFLUENCER_VERDICT_FILES: str = os.getenv(
+        "INFLUENCER_VERDICT_FILES",
+        "corinpapa1106/_claude_verify_full.json,corinpapa1106/_claude_partial_164.json"
+    )
+    INFLUENCER_SYNC_INTERVAL_MINUTES: int = int(os.getenv("INFLUENCER_SYNC_INTERVAL_MINUTES", "30"))
+    
+    # API 응답 캐시 (초 단위 TTL, 수집기 커밋 시 무효화)
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "True").lower() == "true"
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+    RESPONSE_CACHE_DEFAULT_TTL: int = int(os.getenv("RESPONSE_CACHE_DEFAULT_TTL", "30"))
+    RESPONSE_CACHE_SYNC_INTERVAL: float = float(os.getenv("RESPONSE_CACHE_SYNC_INTERVAL", "1.0"))  # 다른 프로세스 무효화 확인 주기
+    CACHE_TTL_FEED: int = int(os.getenv("CACHE_TTL_FEED", "30"))
+    CACHE_TTL_FILINGS: int = int(os.getenv("CACHE_TTL_FILINGS", "60"))
+    CACHE_TTL_NEWS: int = int(os.getenv("CACHE_TTL_NEWS", "30"))
+    CACHE_TTL_ALERTS: int = int(os.getenv("CACHE_TTL_ALERTS", "15"))
+    
+    # Cold storage archive (오래된 뉴스/알림 기록 -> 월별 zstd Parquet)
+    ARCHIVE_DIR: str = os.getenv("ARCHIVE_DIR", "data/archive")
+    ARCHIVE_NEWS_AFTER_DAYS: int = int(os.getenv("ARCHIVE_NEWS_AFTER_DAYS", "180"))
+    ARCHIVE_ALERTS_AFTER_DAYS: int = int(os.getenv("ARCHIVE_ALERTS_AFTER_DAYS", "90"))
+    ARCHIVE_BATCH_SIZE: int = int(os.getenv("ARCHIVE_BATCH_SIZE", "5000"))
+    ARCHIVE_ZSTD_LEVEL: int = int(os.getenv("ARCHIVE_ZSTD_LEVEL", "9"))
+    
+    # Metrics (GET /metrics, Prometheus text format)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+    
+    # Tracing (OTLP/JSON 파일 exporter + GET /debug/traces)
+    TRACING_ENABLED: bool = os.getenv("TRACING_ENABLED", "True").lower() == "true"
+    TRACE_FILE: str = os.getenv("TRACE_FILE", "logs/traces.jsonl")
+    TRACE_FILE_MAX_MB: int = int(os.getenv("TRACE_FILE_MAX_MB", "50"))
+    TRACE_RECENT_LIMIT: int = int(os.getenv("TRACE_RECENT_LIMIT", "200"))
+    
+    # Admin / profiling (ADMIN_TOKEN 이 비어 있으면 /admin 엔드포인트와 요청 프로파일 비활성)
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", "logs/profiles")
+    PROFILE_KEEP: int = int(os.getenv("PROFILE_KEEP", "50"))
+    PROFILER_MAX_SECONDS: int = int(os.getenv("PROFILER_MAX_SECONDS", "60"))
+    
+    # 수집기 HTTP record/replay (off / record / replay, src/collectors/http_replay.py)
+    HTTP_CASSETTE_MODE: str = os.getenv("HTTP_CASSETTE_MODE", "off")
+    HTTP_CASSETTE_DIR: str = os.getenv("HTTP_CASSETTE_DIR", "data/cassettes")
+    
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE: str = os.getenv("LOG_FILE", "logs/invest_engine.log")
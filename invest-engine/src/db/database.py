@@ -1,24 +1,167 @@
 """
 Database connection and session management
 """
+import hashlib
+import importlib.util
+import os
+import time
+from contextlib import asynccontextmanager
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
+from loguru import logger
 from ..config.settings import settings
-from .models import Base
+from .models import Base, SchemaMeta, now_kst
+from .profiles import engine_options, configure_engine
 
-# Create engine
-engine = create_engine(
+try:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+    ASYNC_DB_AVAILABLE = True
+except ImportError:
+    ASYNC_DB_AVAILABLE = False
+    logger.warning("SQLAlchemy asyncio extension not available. Async DB sessions disabled.")
+
+# alembic 은 마이그레이션을 실행할 때만 import (FAST_START 로 생략하면 로드하지 않음)
+ALEMBIC_AVAILABLE = importlib.util.find_spec("alembic") is not None
+
+# invest-engine/ (alembic.ini, migrations/)
+ENGINE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CREATE_TABLES_ATTEMPTS = 10
+SCHEMA_FINGERPRINT_KEY = "schema_fingerprint"
+
+# Create engine (SQLite: WAL/PRAGMA, PostgreSQL: 풀 크기/statement_timeout - profiles.py)
+engine = configure_engine(create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
-)
+    **engine_options(settings.DATABASE_URL)
+))
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-def create_tables():
-    """Create all tables"""
-    Base.metadata.create_all(bind=engine)
+# 동기 URL -> 비동기 드라이버 URL (sqlite -> aiosqlite, postgresql -> asyncpg)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_database_url(url: str = None) -> str:
+    """ASYNC_DATABASE_URL이 있으면 그대로, 없으면 DATABASE_URL의 드라이버를 비동기 드라이버로 교체"""
+    if settings.ASYNC_DATABASE_URL and url is None:
+        return settings.ASYNC_DATABASE_URL
+    url = url or settings.DATABASE_URL
+    scheme, sep, rest = url.partition("://")
+    dialect = scheme.split("+")[0]
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database URL scheme: {scheme}")
+    return f"{ASYNC_DRIVERS[dialect]}{sep}{rest}"
+
+
+def get_async_engine():
+    """비동기 엔진 (첫 사용 시 생성 - 드라이버가 없으면 여기서 ImportError)"""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        if not ASYNC_DB_AVAILABLE:
+            raise RuntimeError("Async database support requires sqlalchemy[asyncio]")
+        url = get_async_database_url()
+        _async_engine = create_async_engine(url, **engine_options(url, is_async=True))
+        configure_engine(_async_engine.sync_engine)
+        _async_session_factory = async_sessionmaker(
+            _async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
+
+def run_migrations(revision: str = "head"):
+    """alembic 마이그레이션 적용 (PostgreSQL: news/dart_filings 월별 파티션 포함)"""
+    from alembic import command as alembic_command
+    from alembic.config import Config as AlembicConfig
+
+    config = AlembicConfig(os.path.join(ENGINE_ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ENGINE_ROOT, "migrations"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        alembic_command.upgrade(config, revision)
+
+def schema_fingerprint() -> str:
+    """현재 코드의 스키마 버전 - 모델 DDL(테이블 + 인덱스) 과 마이그레이션 파일 이름의 해시"""
+    digest = hashlib.sha256()
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=engine.dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=engine.dialect)).encode())
+    versions_dir = os.path.join(ENGINE_ROOT, "migrations", "versions")
+    if os.path.isdir(versions_dir):
+        for name in sorted(os.listdir(versions_dir)):
+            if name.endswith(".py"):
+                digest.update(name.encode())
+    return digest.hexdigest()[:32]
+
+
+def stored_schema_fingerprint():
+    """마지막 create_tables 가 저장한 fingerprint (테이블이 없거나 처음이면 None)"""
+    db = SessionLocal()
+    try:
+        meta = db.get(SchemaMeta, SCHEMA_FINGERPRINT_KEY)
+        return meta.value if meta else None
+    except SQLAlchemyError:
+        return None
+    finally:
+        db.close()
+
+
+def _store_schema_fingerprint(fingerprint: str):
+    db = SessionLocal()
+    try:
+        db.merge(SchemaMeta(key=SCHEMA_FINGERPRINT_KEY, value=fingerprint, updated_at=now_kst()))
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()  # uvicorn --workers N: 다른 프로세스가 같은 값을 먼저 저장
+        logger.debug(f"Schema fingerprint not stored: {e}")
+    finally:
+        db.close()
+
+
+def create_tables(force: bool = False) -> bool:
+    """
+    Create all tables (alembic이 있으면 마이그레이션으로 생성/갱신)
+
+    Args:
+        force: FAST_START 여도 항상 확인
+
+    Returns:
+        bool: 테이블을 확인/생성했으면 True, 스키마가 그대로라 생략했으면 False (FAST_START)
+    """
+    fingerprint = schema_fingerprint()
+    if settings.FAST_START and not force and stored_schema_fingerprint() == fingerprint:
+        return False
+    if ALEMBIC_AVAILABLE:
+        run_migrations()
+    else:
+        _create_all()
+    _store_schema_fingerprint(fingerprint)
+    return True
+
+
+def _create_all():
+    if engine.dialect.name == "postgresql":
+        logger.warning("Creating news/dart_filings without partitioning - install alembic and run migrations")
+    for attempt in range(CREATE_TABLES_ATTEMPTS):
+        try:
+            Base.metadata.create_all(bind=engine)
+            return
+        except OperationalError as e:
+            # uvicorn --workers N: 다른 프로세스가 같은 테이블을 동시에 생성 중 -> 잠시 뒤 다시 확인 (있으면 건너뜀)
+            if "already exists" not in str(e) or attempt == CREATE_TABLES_ATTEMPTS - 1:
+                raise
+            time.sleep(0.2 * (attempt + 1))
 
 def get_db():
     """Get database session"""
@@ -30,4 +173,25 @@ def get_db():
 
 def get_db_session() -> Session:
     """Get database session (for non-FastAPI usage)"""
-    return SessionLocal()
\ No newline at end of file
+    return SessionLocal()
+
+async def get_async_db():
+    """Get async database session (FastAPI dependency)"""
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
+
+@asynccontextmanager
+async def get_async_db_session():
+    """Get async database session (for collectors: async with get_async_db_session() as db)"""
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
+
+async def dispose_async_engine():
+    """Close async engine connections (app shutdown)"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
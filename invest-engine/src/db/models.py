@@ -2,7 +2,7 @@
 Database models for the investment engine
 All tables linked through stock_code as the universal key
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -54,7 +54,7 @@ class DartFiling(Base):
     __tablename__ = "dart_filings"
     
     id = Column(Integer, primary_key=True, index=True)
-    rcept_no = Column(String(50), unique=True, index=True, nullable=False)
+    rcept_no = Column(String(50), index=True, nullable=False)  # 중복 방지는 filing_keys (파티션 테이블은 UNIQUE 불가)
     stock_code = Column(String(10), ForeignKey("stocks.stock_code"), index=True)  # 종목코드 연결
     corp_code = Column(String(10), index=True)
     corp_name = Column(String(100), nullable=False)
@@ -87,9 +87,18 @@ class DartFiling(Base):
     
     __table_args__ = (
         Index('ix_dart_stock_date', 'stock_code', 'rcept_dt'),
+        Index('ix_dart_created', 'created_at'),  # PostgreSQL: 월별 파티션 키 (migrations 0002)
     )
 
 
+class FilingKey(Base):
+    """저장한 공시 접수번호 - 파티션된 dart_filings 대신 중복을 막는 UNIQUE 키 (src/db/partitions.py claim_keys)"""
+    __tablename__ = "filing_keys"
+    
+    rcept_no = Column(String(50), primary_key=True)
+    created_at = Column(DateTime, default=now_kst)
+
+
 class AlertsLog(Base):
     """발송 알림 기록"""
     __tablename__ = "alerts_log"
@@ -112,7 +121,7 @@ class News(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(300), nullable=False)
     content = Column(Text)
-    url = Column(String(500), unique=True, index=True)
+    url = Column(String(500), index=True)  # 중복 방지는 news_urls (파티션 테이블은 UNIQUE 불가)
     source = Column(String(50), nullable=False)
     market = Column(String(10), default='kr', index=True)  # 'kr', 'us', 'global' 등
     published_at = Column(DateTime)
@@ -121,6 +130,18 @@ class News(Base):
     importance_score = Column(Float)
     ai_summary = Column(Text)
     created_at = Column(DateTime, default=now_kst)
+    
+    __table_args__ = (
+        Index('ix_news_created', 'created_at'),  # PostgreSQL: 월별 파티션 키 (migrations 0002)
+    )
+
+
+class NewsUrl(Base):
+    """저장한 뉴스 URL - 파티션된 news 대신 중복을 막는 UNIQUE 키 (src/db/partitions.py claim_keys)"""
+    __tablename__ = "news_urls"
+    
+    url = Column(String(500), primary_key=True)
+    created_at = Column(DateTime, default=now_kst)
 
 
 class PriceAlert(Base):
@@ -159,6 +180,27 @@ class PriceHistory(Base):
     )
 
 
+class EventStudyResult(Base):
+    """공시 유형별 이벤트 스터디 결과 캐시 (유형, 이벤트 윈도우)"""
+    __tablename__ = "event_study_results"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    event_type = Column(String(50), nullable=False)  # 공시 키워드 "자기주식" 또는 등급 "grade_B"
+    window_start = Column(Integer, nullable=False)  # 공시일 기준 거래일 (-1)
+    window_end = Column(Integer, nullable=False)  # (+5)
+    n_events = Column(Integer, default=0)
+    caar = Column(Float)  # 평균 누적 초과수익률 (%)
+    caar_t = Column(Float)  # 횡단면 t값
+    positive_ratio = Column(Float)  # CAR > 0 비율
+    aar_path = Column(JSON)  # 윈도우 거래일별 평균 초과수익률 (%) 리스트
+    last_event_date = Column(String(10))  # 포함된 가장 최근 공시일 YYYYMMDD
+    computed_at = Column(DateTime, default=now_kst, onupdate=now_kst)
+    
+    __table_args__ = (
+        Index('ix_event_study_key', 'event_type', 'window_start', 'window_end', unique=True),
+    )
+
+
 class BuzzData(Base):
     """쏠림 데이터"""
     __tablename__ = "buzz_data"
@@ -203,12 +245,18 @@ class InfluencerSignal(Base):
     __tablename__ = "influencer_signals"
     
     id = Column(Integer, primary_key=True, index=True)
+    signal_key = Column(String(32), unique=True, index=True)  # 파이프라인 시그널 고유 키 (재동기화 upsert용)
     video_id = Column(String(50), ForeignKey("influencer_videos.video_id"), nullable=False, index=True)
-    stock_code = Column(String(10), ForeignKey("stocks.stock_code"), nullable=False, index=True)
+    stock_code = Column(String(10), ForeignKey("stocks.stock_code"), index=True)  # 코인/해외 종목은 없음
+    asset = Column(String(100), index=True)  # 영상에서 언급한 종목/자산명 "비트코인"
+    channel_id = Column(String(50), index=True)
     channel_name = Column(String(100), nullable=False)
-    signal_type = Column(String(20))  # BUY, SELL, HOLD, MENTION
+    signal_type = Column(String(20))  # STRONG_BUY, BUY, POSITIVE, HOLD, NEUTRAL, CONCERN, SELL, STRONG_SELL
     confidence = Column(Float)  # 신뢰도 0~1
+    content = Column(Text)  # 발언 인용
     context = Column(Text)  # 언급 맥락
+    timestamp_seconds = Column(Integer)  # 영상 내 발언 위치
+    verdict = Column(String(20))  # AI 검증 결과: confirmed / corrected / rejected
     mentioned_at = Column(DateTime, nullable=False)
     
     # 시그널 이후 수익률 추적
@@ -229,9 +277,67 @@ class InfluencerSignal(Base):
     
     __table_args__ = (
         Index('ix_signal_stock_date', 'stock_code', 'mentioned_at'),
+        Index('ix_signal_mentioned', 'mentioned_at'),
+        Index('ix_signal_channel_date', 'channel_id', 'mentioned_at'),
     )
 
 
+class InfluencerStats(Base):
+    """인플루언서별 리더보드 집계 (시그널/가격 갱신 때마다 증분 반영되는 누적 합계)"""
+    __tablename__ = "influencer_stats"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(String(50), unique=True, index=True, nullable=False)
+    channel_name = Column(String(100))
+    signal_count = Column(Integer, default=0)  # 기각되지 않은 시그널 수
+    main_asset = Column(String(100))  # 가장 많이 언급한 종목
+    main_asset_count = Column(Integer, default=0)
+    
+    # 기간별: 수익률이 확정된 방향성 시그널 수 / 방향이 맞은 수 / 방향 반영 수익률 합계(%)
+    scored_1d = Column(Integer, default=0)
+    hits_1d = Column(Integer, default=0)
+    return_sum_1d = Column(Float, default=0.0)
+    scored_3d = Column(Integer, default=0)
+    hits_3d = Column(Integer, default=0)
+    return_sum_3d = Column(Float, default=0.0)
+    scored_1w = Column(Integer, default=0)
+    hits_1w = Column(Integer, default=0)
+    return_sum_1w = Column(Float, default=0.0)
+    scored_1m = Column(Integer, default=0)
+    hits_1m = Column(Integer, default=0)
+    return_sum_1m = Column(Float, default=0.0)
+    
+    updated_at = Column(DateTime, default=now_kst, onupdate=now_kst)
+
+
+class InfluencerAssetStats(Base):
+    """인플루언서별 종목 언급 수 (대표 종목 계산용)"""
+    __tablename__ = "influencer_asset_stats"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(String(50), nullable=False)
+    asset = Column(String(100), nullable=False)
+    signal_count = Column(Integer, default=0)
+    
+    __table_args__ = (
+        Index('ix_influencer_asset', 'channel_id', 'asset', unique=True),
+        Index('ix_influencer_asset_count', 'channel_id', 'signal_count'),
+    )
+
+
+class InfluencerSyncState(Base):
+    """SNS 파이프라인 JSON -> DB 동기화 상태 (파일별 해시)"""
+    __tablename__ = "influencer_sync_state"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source_path = Column(String(300), unique=True, index=True, nullable=False)  # 데이터 폴더 기준 상대 경로
+    content_hash = Column(String(64), nullable=False)
+    file_size = Column(Integer)
+    file_mtime = Column(Float)
+    record_count = Column(Integer, default=0)
+    synced_at = Column(DateTime, default=now_kst, onupdate=now_kst)
+
+
 class FundFlow(Base):
     """외국인/기관 수급"""
     __tablename__ = "fund_flow"
@@ -507,3 +613,65 @@ class UserBadge(Base):
     __table_args__ = (
         Index('ix_user_badge_unique', 'user_id', 'badge_id', unique=True),
     )
+
+
+class QueuedTask(Base):
+    """작업 큐 - 스케줄러가 넣고 워커 프로세스가 가져가 실행 (src/tasks)"""
+    __tablename__ = "task_queue"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(50), nullable=False)  # 오케스트레이터 작업 ID "dart_collection"
+    dedupe_key = Column(String(100), nullable=False)  # 대기 중(queued)에는 키당 1개만
+    source = Column(String(20))  # schedule / manual / upstream
+    payload = Column(JSON)
+    resources = Column(String(100))  # 자원 한도 이름 "dart_api,llm"
+    priority = Column(Integer, default=0)  # 클수록 먼저
+    
+    # 상태: queued -> running -> done / failed (실패 시 attempts < max_attempts 면 다시 queued)
+    status = Column(String(10), nullable=False, default="queued")
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    run_at = Column(DateTime, default=now_kst)  # 이 시각 이후 실행 (재시도 backoff)
+    locked_by = Column(String(100))  # 워커 ID "hostname:pid"
+    locked_until = Column(DateTime)  # 임대 만료 - 지나면 다른 워커가 다시 가져감
+    
+    result = Column(Text)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=now_kst)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    
+    __table_args__ = (
+        Index('ix_task_queue_claim', 'status', 'run_at'),
+        Index('ix_task_queue_dedupe', 'dedupe_key', unique=True,
+              sqlite_where=text("status = 'queued'"), postgresql_where=text("status = 'queued'")),
+    )
+
+
+class SchedulerLease(Base):
+    """스케줄러 리더 임대 - 여러 API 프로세스 중 임대를 가진 하나만 정기 작업 실행 (src/scheduler/leader.py)"""
+    __tablename__ = "scheduler_leases"
+    
+    name = Column(String(50), primary_key=True)  # "scheduler"
+    holder = Column(String(100), nullable=False)  # 프로세스 ID "hostname:pid:xxxxxx"
+    acquired_at = Column(DateTime, default=now_kst)  # 현재 리더가 된 시각
+    renewed_at = Column(DateTime, default=now_kst)  # 마지막 heartbeat
+    expires_at = Column(DateTime, nullable=False)  # 이 시각까지 갱신이 없으면 다른 프로세스가 가져감
+
+
+class CacheGeneration(Base):
+    """응답 캐시 무효화 세대 - 워커/API 프로세스가 공유 (src/services/response_cache.py)"""
+    __tablename__ = "cache_generations"
+    
+    source = Column(String(20), primary_key=True)  # "filings", "news", "alerts", "*"(전체)
+    generation = Column(Integer, nullable=False, default=0)  # invalidate 마다 +1
+    updated_at = Column(DateTime, default=now_kst)
+
+
+class SchemaMeta(Base):
+    """스키마 메타 정보 - FAST_START 시작 시 테이블 확인 생략 판단 (src/db/database.py create_tables)"""
+    __tablename__ = "schema_meta"
+    
+    key = Column(String(50), primary_key=True)  # "schema_fingerprint"
+    value = Column(String(100), nullable=False)
+    updated_at = Column(DateTime, default=now_kst)
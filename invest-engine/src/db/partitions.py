@@ -0,0 +1,189 @@
+"""
+Time-partitioned tables (PostgreSQL)
+news / dart_filings 를 created_at 기준 월별 RANGE 파티션으로 운영
+
+- ensure_future_partitions(): 이번 달부터 N개월 앞까지 파티션 생성 (스케줄러가 매일 호출, 멱등)
+- fetch_newest(): created_at 최신순 조회를 최근 구간부터 넓혀가며 실행
+  -> created_at 범위 조건이 항상 붙으므로 PostgreSQL은 최근 파티션만 스캔 (partition pruning)
+- estimated_count(): 필터 없는 전체 건수는 파티션 통계(reltuples) 합으로 대체
+- claim_keys() / claim_keys_async(): 파티션 테이블은 파티션 키 없는 UNIQUE 를 가질 수 없으므로
+  news.url / dart_filings.rcept_no 중복은 파티션되지 않은 키 테이블(news_urls / filing_keys)에
+  INSERT ... ON CONFLICT DO NOTHING 으로 먼저 등록해 막음 (동시 수집도 키 하나당 한 트랜잭션만 성공)
+
+SQLite 등 다른 DB에서는 파티션 관련 함수가 아무 것도 하지 않고, 조회/키 헬퍼는 같은 결과를 반환
+"""
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Sequence, Set
+
+import pytz
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..config.settings import settings
+
+KST = pytz.timezone('Asia/Seoul')
+
+# 파티션 테이블 -> 파티션 키
+PARTITIONED_TABLES = {
+    'news': 'created_at',
+    'dart_filings': 'created_at',
+}
+
+# fetch_newest 탐색 구간 (일) - None은 전체
+NEWEST_WINDOWS_DAYS = (31, 92, 366, None)
+
+
+def month_start(value: datetime) -> datetime:
+    """해당 월 1일 00:00 (naive)"""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """월 단위 이동 (value는 월초)"""
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """news, 2026-10 -> news_y2026m10"""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def is_postgres(bind) -> bool:
+    return bind.dialect.name == 'postgresql'
+
+
+def partitioned_tables(conn) -> List[str]:
+    """현재 DB에서 실제로 파티션된 테이블 (마이그레이션 적용 여부 확인용)"""
+    if not is_postgres(conn):
+        return []
+    rows = conn.execute(text(
+        "SELECT c.relname FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid"
+    ))
+    return [row[0] for row in rows]
+
+
+def create_month_partition(conn, table: str, month: datetime) -> str:
+    """월 파티션 생성 (이미 있으면 그대로)"""
+    name = partition_name(table, month)
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+    ))
+    return name
+
+
+def ensure_partitions_between(conn, table: str, start: datetime, end: datetime) -> List[str]:
+    """start가 속한 달부터 end가 속한 달까지 파티션 생성"""
+    month, last = month_start(start), month_start(end)
+    names = []
+    while month <= last:
+        names.append(create_month_partition(conn, table, month))
+        month = add_months(month, 1)
+    return names
+
+
+def ensure_future_partitions(engine=None, months_ahead: Optional[int] = None,
+                             now: Optional[datetime] = None) -> List[str]:
+    """
+    파티션 테이블마다 이번 달 ~ months_ahead개월 뒤 파티션 보장
+
+    Args:
+        engine: 대상 엔진 (기본: database.engine)
+        months_ahead: 미리 만들 개월 수 (기본: settings.PARTITION_MONTHS_AHEAD)
+        now: 기준 시각 (테스트용)
+
+    Returns:
+        확인/생성한 파티션 이름 리스트 (PostgreSQL이 아니거나 파티션 테이블이 없으면 빈 리스트)
+    """
+    if engine is None:
+        from .database import engine
+    if not is_postgres(engine):
+        return []
+
+    months_ahead = settings.PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+    current = month_start(now or datetime.now(KST))
+    names = []
+    with engine.begin() as conn:
+        for table in partitioned_tables(conn):
+            if table not in PARTITIONED_TABLES:
+                continue
+            names += ensure_partitions_between(conn, table, current, add_months(current, months_ahead))
+    if names:
+        logger.debug(f"Partitions ensured: {names[0]} .. {names[-1]} ({len(names)})")
+    return names
+
+
+async def fetch_newest(db, query, column, limit: int, offset: int = 0,
+                       now: Optional[datetime] = None, windows: Sequence = NEWEST_WINDOWS_DAYS) -> list:
+    """
+    column 최신순 offset/limit 조회를 최근 구간부터 실행 (AsyncSession)
+
+    구간 안에서 offset + limit 건이 채워지면 구간 밖 행은 모두 더 오래된 행이므로 결과는 전체 조회와 같음.
+    채워지지 않으면 다음 구간(마지막은 전체)으로 넓혀 다시 조회.
+
+    Args:
+        query: 정렬/페이지 조건이 없는 select()
+        column: 정렬/파티션 키 컬럼 (created_at)
+    """
+    now = (now or datetime.now(KST)).replace(tzinfo=None)
+    for days in windows:
+        windowed = query if days is None else query.where(column >= now - timedelta(days=days))
+        rows = (await db.scalars(windowed.order_by(column.desc()).offset(offset).limit(limit))).all()
+        if days is None or len(rows) == limit:
+            return rows
+    return []
+
+
+async def estimated_count(db, table: str) -> Optional[int]:
+    """
+    파티션 테이블 전체 건수 추정치 (pg_class.reltuples 합)
+
+    Returns:
+        추정 건수 또는 None (PostgreSQL이 아니거나 통계가 아직 없을 때 -> 호출한 쪽에서 COUNT 사용)
+    """
+    if db.bind.dialect.name != 'postgresql':
+        return None
+    estimate = await db.scalar(text(
+        "SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :table"
+    ), {'table': table})
+    return int(estimate) if estimate else None
+
+
+def _claim_statement(bind, column, keys: Sequence[str]):
+    insert = postgresql.insert if is_postgres(bind) else sqlite.insert
+    stmt = insert(column.table).values([{column.key: key} for key in keys])
+    return stmt.on_conflict_do_nothing(index_elements=[column]).returning(column)
+
+
+def _claimable(keys: Iterable[Optional[str]]) -> List[str]:
+    # 정렬 순서로 등록 -> 같은 키를 가진 동시 트랜잭션끼리 교착 없이 대기
+    return sorted({key for key in keys if key})
+
+
+def claim_keys(db, column, keys: Iterable[Optional[str]]) -> Set[str]:
+    """
+    키 테이블에 새 키 등록 (Session) - 호출한 트랜잭션과 함께 커밋/롤백
+
+    Args:
+        column: 키 테이블의 키 컬럼 (NewsUrl.url / FilingKey.rcept_no)
+        keys: 저장하려는 행의 키 (None/빈 값/배치 안 중복은 무시)
+
+    Returns:
+        이번에 새로 등록된 키 - 이 키의 행만 저장 (나머지는 이미 저장됐거나 다른 트랜잭션이 먼저 등록)
+    """
+    keys = _claimable(keys)
+    if not keys:
+        return set()
+    return set(db.scalars(_claim_statement(db.bind, column, keys)).all())
+
+
+async def claim_keys_async(db, column, keys: Iterable[Optional[str]]) -> Set[str]:
+    """claim_keys 의 AsyncSession 버전"""
+    keys = _claimable(keys)
+    if not keys:
+        return set()
+    return set((await db.scalars(_claim_statement(db.bind, column, keys))).all())
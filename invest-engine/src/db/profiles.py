@@ -0,0 +1,93 @@
+"""
+Database engine profiles
+DB 종류별 엔진 옵션 / 연결 초기화 설정
+
+- SQLite: WAL 저널 + synchronous=NORMAL + mmap/cache + busy_timeout
+  (API 읽기와 스케줄러 쓰기가 동시에 일어나도 "database is locked" 없이 대기 후 진행)
+- PostgreSQL: 명시적 풀 크기/오버플로/재활용 + statement_timeout
+"""
+from typing import Dict
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+from ..config.settings import settings
+
+
+def sqlite_pragmas() -> Dict[str, object]:
+    """연결마다 실행할 SQLite PRAGMA (설정값 기준)"""
+    pragmas = {
+        'busy_timeout': settings.SQLITE_BUSY_TIMEOUT_MS,
+        'synchronous': settings.SQLITE_SYNCHRONOUS,
+        'cache_size': settings.SQLITE_CACHE_SIZE,
+        'mmap_size': settings.SQLITE_MMAP_SIZE,
+        'temp_store': 'MEMORY',
+    }
+    if settings.SQLITE_WAL:
+        pragmas = {'journal_mode': 'WAL', **pragmas}
+    return pragmas
+
+
+def install_sqlite_pragmas(engine: Engine, pragmas: Dict[str, object] = None) -> Engine:
+    """
+    엔진의 새 연결마다 PRAGMA 실행 (비동기 엔진은 engine.sync_engine 전달)
+
+    journal_mode=WAL은 DB 파일에 영구 저장되지만 나머지는 연결 단위 설정이라 매번 적용
+    """
+    pragmas = sqlite_pragmas() if pragmas is None else pragmas
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return engine
+
+
+def engine_options(url: str, is_async: bool = False) -> Dict:
+    """
+    create_engine / create_async_engine 키워드 인자
+
+    Args:
+        url: 데이터베이스 URL
+        is_async: 비동기 드라이버(aiosqlite/asyncpg) 여부
+
+    Returns:
+        엔진 생성 옵션
+    """
+    backend = make_url(url).get_backend_name()
+
+    if backend == 'sqlite':
+        # pysqlite/aiosqlite 자체 잠금 대기 (초 단위) - PRAGMA busy_timeout과 같은 값
+        connect_args = {'timeout': settings.SQLITE_BUSY_TIMEOUT_MS / 1000}
+        if not is_async:
+            connect_args['check_same_thread'] = False
+        return {'connect_args': connect_args}
+
+    options = {
+        'pool_size': settings.DB_POOL_SIZE,
+        'max_overflow': settings.DB_MAX_OVERFLOW,
+        'pool_timeout': settings.DB_POOL_TIMEOUT,
+        'pool_recycle': settings.DB_POOL_RECYCLE,
+        'pool_pre_ping': True,
+    }
+    if backend == 'postgresql' and settings.DB_STATEMENT_TIMEOUT_MS:
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        if is_async:
+            options['connect_args'] = {'server_settings': {'statement_timeout': timeout}}
+        else:
+            options['connect_args'] = {'options': f'-c statement_timeout={timeout}'}
+    return options
+
+
+def configure_engine(engine: Engine) -> Engine:
+    """SQLite 엔진이면 PRAGMA 설치 (동기 엔진 기준)"""
+    if engine.dialect.name == 'sqlite':
+        install_sqlite_pragmas(engine)
+        logger.debug(f"SQLite pragmas installed: {sqlite_pragmas()}")
+    return engine
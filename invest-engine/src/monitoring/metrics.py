@@ -0,0 +1,402 @@
+"""
+Metrics Registry
+프로세스 내 카운터/게이지/히스토그램 -> GET /metrics (Prometheus text format 0.0.4)
+
+- 스케줄러 작업: track_job() 데코레이터 (실행 횟수/상태, 소요 시간, 루트 span)
+- 수집기: CollectorTimer 로 소스별 fetch / parse / store 단계 시간, 처리 건수, 오류
+- LLM 호출: llm_completion() 으로 모델/작업별 지연 시간, 토큰 사용량
+- API 라우트: MetricsMiddleware (라우트 템플릿 기준이라 /api/profile/{user_id} 가 한 줄로 집계)
+
+기록은 락 하나 + dict 갱신이 전부라 요청 경로에 넣어도 부담이 없음.
+METRICS_ENABLED=False 이면 기록하지 않음 (/metrics 는 빈 값).
+"""
+import contextvars
+import functools
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..config.settings import settings
+from .tracing import tracer
+
+# 지연 시간 버킷 (초) - API 응답(ms)부터 수집 작업/LLM 호출(수십 초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# 수집기 단계 (순서대로 진행)
+COLLECTOR_PHASES = ('fetch', 'parse', 'store')
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """라벨 조합별 값을 가진 메트릭 (labels 는 키워드 인자로 전달)"""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple, object] = {}
+
+    def _key(self, labels: Dict) -> Tuple:
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"Missing label {e} for metric {self.name}") from None
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines += self.samples()
+        return '\n'.join(lines)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(Counter):
+    """현재 값 (증감 가능)"""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (_bucket / _sum / _count)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)  # value <= bucket 인 첫 버킷
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 건수 (+Inf 포함), 합계, 건수]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, ([*state[0]], state[1], state[2])) for key, state in self._values.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float('inf')), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 등록 + Prometheus text 렌더링"""
+
+    def __init__(self, enabled: Optional[bool] = None):
+        self.enabled = settings.METRICS_ENABLED if enabled is None else enabled
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[_Metric]]] = []
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[_Metric]]):
+        """렌더링 시점에 값을 읽어오는 메트릭 (다른 서비스 통계 등)"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        blocks = [metric.render() for metric in self._metrics.values()]
+        for collector in self._collectors:
+            try:
+                blocks += [metric.render() for metric in collector()]
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+        return '\n'.join(blocks) + '\n'
+
+    def reset(self):
+        """모든 값 초기화 (테스트/벤치마크용)"""
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+# 글로벌 인스턴스
+metrics = MetricsRegistry()
+
+JOB_RUNS = metrics.counter('invest_job_runs_total', 'Scheduler job runs', ('job', 'status'))
+JOB_DURATION = metrics.histogram('invest_job_duration_seconds', 'Scheduler job duration', ('job',))
+JOB_SKIPS = metrics.counter('invest_job_skips_total', 'Scheduler job runs skipped (already running)', ('job',))
+
+COLLECTOR_PHASE_DURATION = metrics.histogram(
+    'invest_collector_phase_duration_seconds', 'Collector phase duration (fetch/parse/store)', ('source', 'phase'))
+COLLECTOR_ITEMS = metrics.counter(
+    'invest_collector_items_total', 'Items produced by a collector phase', ('source', 'phase'))
+COLLECTOR_ERRORS = metrics.counter(
+    'invest_collector_errors_total', 'Collector failures by phase', ('source', 'phase'))
+
+LLM_REQUESTS = metrics.counter('invest_llm_requests_total', 'LLM API calls', ('model', 'operation', 'status'))
+LLM_TOKENS = metrics.counter('invest_llm_tokens_total', 'LLM tokens used', ('model', 'operation', 'kind'))
+LLM_LATENCY = metrics.histogram('invest_llm_latency_seconds', 'LLM API call latency', ('model', 'operation'))
+
+HTTP_REQUESTS = metrics.counter('invest_http_requests_total', 'API requests', ('method', 'route', 'status'))
+HTTP_DURATION = metrics.histogram(
+    'invest_http_request_duration_seconds', 'API request latency', ('method', 'route'))
+
+
+# ----------------------------------------------------------------------
+# 스케줄러 작업
+# ----------------------------------------------------------------------
+_job_status: contextvars.ContextVar = contextvars.ContextVar('job_status', default=None)
+
+
+def mark_job_failed():
+    """작업 함수가 예외를 직접 처리(로그만)하는 경우 실패로 기록"""
+    status = _job_status.get()
+    if status is not None:
+        status['failed'] = True
+
+
+def track_job(name: str):
+    """
+    스케줄러 작업 코루틴 데코레이터
+
+    예외가 밖으로 나가거나 mark_job_failed() 가 호출되면 status="error".
+    작업 전체가 job.{name} span 이 되어 안에서 만든 span 은 그 자식으로 기록됨.
+    """
+    def decorator(job):
+        @functools.wraps(job)
+        async def wrapper(*args, **kwargs):
+            status = {'failed': False}
+            token = _job_status.set(status)
+            started = time.perf_counter()
+            try:
+                with tracer.span(f"job.{name}") as job_span:
+                    try:
+                        return await job(*args, **kwargs)
+                    finally:
+                        if status['failed'] and job_span is not None:
+                            job_span.set_error('job reported failure')
+            except BaseException:
+                status['failed'] = True
+                raise
+            finally:
+                _job_status.reset(token)
+                if metrics.enabled:
+                    JOB_DURATION.observe(time.perf_counter() - started, job=name)
+                    JOB_RUNS.inc(job=name, status='error' if status['failed'] else 'ok')
+        wrapper.job_name = name  # 오케스트레이터가 작업 ID 와 같은지 확인
+        return wrapper
+    return decorator
+
+
+# ----------------------------------------------------------------------
+# 수집기
+# ----------------------------------------------------------------------
+class CollectorTimer:
+    """
+    수집기 단계별 시간 측정 (들여쓰기 없이 단계 끝에서 done() 호출)
+
+        timer = CollectorTimer('coindesk')
+        response = await self.session.get(url)
+        timer.done('fetch')
+        ...파싱...
+        timer.done('parse', items=len(news_list))
+
+    예외 처리부에서 fail() 을 호출하면 아직 끝나지 않은 다음 단계의 오류로 기록.
+    각 단계는 현재 span 의 자식 span (collector.{source}.{phase}) 으로도 기록됨.
+    """
+
+    def __init__(self, source: str, phase: Optional[str] = None):
+        self.source = source
+        self.last_phase = phase  # 이미 끝난 단계 (store 만 재는 경우 'parse')
+        self.started = time.perf_counter()
+        self.started_ns = time.time_ns()
+
+    def _next_phase(self) -> str:
+        if self.last_phase in COLLECTOR_PHASES:
+            return COLLECTOR_PHASES[min(COLLECTOR_PHASES.index(self.last_phase) + 1, len(COLLECTOR_PHASES) - 1)]
+        return COLLECTOR_PHASES[0]
+
+    def _record_span(self, phase: str, error: Optional[str] = None, **attributes):
+        tracer.record_span(f"collector.{self.source}.{phase}", self.started_ns,
+                           kind='client' if phase == 'fetch' else 'internal', error=error,
+                           source=self.source, **attributes)
+
+    def done(self, phase: str, items: Optional[int] = None):
+        now = time.perf_counter()
+        if metrics.enabled:
+            COLLECTOR_PHASE_DURATION.observe(now - self.started, source=self.source, phase=phase)
+            if items is not None:
+                COLLECTOR_ITEMS.inc(items, source=self.source, phase=phase)
+        self._record_span(phase, **({} if items is None else {'items': items}))
+        self.last_phase = phase
+        self.started = now
+        self.started_ns = time.time_ns()
+
+    def fail(self, message: str = 'failed'):
+        phase = self._next_phase()
+        if metrics.enabled:
+            COLLECTOR_ERRORS.inc(source=self.source, phase=phase)
+        self._record_span(phase, error=message)
+
+
+def store_timer(source: str) -> CollectorTimer:
+    """collect_and_store_* 의 저장 단계용 타이머"""
+    return CollectorTimer(source, phase='parse')
+
+
+# ----------------------------------------------------------------------
+# LLM
+# ----------------------------------------------------------------------
+async def llm_completion(client, operation: str, **kwargs):
+    """
+    client.chat.completions.create(**kwargs) 호출 + 지연 시간/토큰 기록
+
+    Args:
+        client: AsyncOpenAI 호환 클라이언트
+        operation: 호출 용도 (translate_titles, grade_a_filing ...)
+
+    Returns:
+        원래 응답 객체
+    """
+    model = kwargs.get('model', 'unknown')
+    with tracer.span(f"llm.{operation}", kind='client', model=model) as llm_span:
+        started = time.perf_counter()
+        try:
+            response = await client.chat.completions.create(**kwargs)
+        except Exception:
+            if metrics.enabled:
+                LLM_LATENCY.observe(time.perf_counter() - started, model=model, operation=operation)
+                LLM_REQUESTS.inc(model=model, operation=operation, status='error')
+            raise
+
+        usage = getattr(response, 'usage', None)
+        tokens = {kind: getattr(usage, f"{kind}_tokens", None) or 0 for kind in ('prompt', 'completion')}
+        if llm_span is not None:
+            llm_span.set_attributes(prompt_tokens=tokens['prompt'], completion_tokens=tokens['completion'])
+        if metrics.enabled:
+            LLM_LATENCY.observe(time.perf_counter() - started, model=model, operation=operation)
+            LLM_REQUESTS.inc(model=model, operation=operation, status='ok')
+            for kind, count in tokens.items():
+                if count:
+                    LLM_TOKENS.inc(count, model=model, operation=operation, kind=kind)
+    return response
+
+
+# ----------------------------------------------------------------------
+# API 라우트
+# ----------------------------------------------------------------------
+class MetricsMiddleware:
+    """
+    ASGI 미들웨어 - 라우트 템플릿별 요청 수/지연 시간
+
+    라우팅 후 scope['route'] 의 path 템플릿을 라벨로 사용 (매칭 안 된 요청은 "unmatched").
+    """
+
+    def __init__(self, app, excluded: Iterable[str] = ('/metrics',)):
+        self.app = app
+        self.excluded = set(excluded)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_holder = {'status': 500}
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                status_holder['status'] = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get('route')
+            path = getattr(route, 'path', None) or 'unmatched'
+            if path not in self.excluded:
+                method = scope.get('method', 'GET')
+                HTTP_DURATION.observe(time.perf_counter() - started, method=method, route=path)
+                HTTP_REQUESTS.inc(method=method, route=path, status=status_holder['status'])
+
+
+def render_metrics() -> str:
+    """GET /metrics 응답 본문"""
+    return metrics.render()
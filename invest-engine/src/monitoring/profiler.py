@@ -0,0 +1,248 @@
+"""
+Profiler
+운영 중인 프로세스를 재배포 없이 프로파일링
+
+- StackSampler: 정해진 시간 동안 모든 스레드 스택을 주기적으로 샘플링 -> collapsed stack
+  (flamegraph.pl / speedscope / inferno 에 그대로 입력). 샘플링 스레드만 추가되므로 부담이 적음.
+- RequestProfilerMiddleware: X-Profile: 1 + X-Admin-Token 헤더가 있는 요청만 cProfile 로 실행,
+  결과(.prof + 상위 함수 요약 .txt)를 PROFILE_DIR 에 저장 -> /admin/profiles 에서 다운로드
+
+주의: cProfile 은 이벤트 루프 스레드 전체를 측정하므로 같은 시간에 실행된 다른 요청/작업도 포함됨.
+한 번에 하나의 요청만 프로파일링 (동시에 들어오면 X-Profile-Status: busy 로 그냥 실행).
+"""
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pytz
+from loguru import logger
+
+from ..config.settings import settings
+
+KST = pytz.timezone('Asia/Seoul')
+
+# 대기 중인 스레드의 마지막 프레임 (파일 이름, 함수) - include_idle=False 이면 제외
+IDLE_LEAVES = {
+    ('selectors.py', 'select'),
+    ('threading.py', 'wait'),
+    ('thread.py', '_worker'),
+    ('queue.py', 'get'),
+}
+
+MAX_STACK_DEPTH = 128
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    parts = code.co_filename.replace('\\', '/').rsplit('/', 2)
+    return f"{code.co_name} ({'/'.join(parts[-2:])}:{code.co_firstlineno})"
+
+
+def _timestamp() -> str:
+    return datetime.now(KST).strftime('%Y%m%d-%H%M%S-%f')
+
+
+def profile_path(name: str) -> str:
+    return os.path.join(settings.PROFILE_DIR, name)
+
+
+def _prune_profiles():
+    """PROFILE_KEEP 개를 넘는 오래된 결과 삭제"""
+    entries = list_profiles()
+    for entry in entries[settings.PROFILE_KEEP:]:
+        try:
+            os.remove(profile_path(entry['name']))
+        except OSError:
+            pass
+
+
+def save_profile(name: str, content) -> str:
+    """결과 파일 저장 (str / bytes)"""
+    os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+    mode = 'wb' if isinstance(content, bytes) else 'w'
+    with open(profile_path(name), mode, **({} if mode == 'wb' else {'encoding': 'utf-8'})) as f:
+        f.write(content)
+    _prune_profiles()
+    return name
+
+
+def list_profiles() -> List[Dict]:
+    """저장된 결과 (최신순)"""
+    directory = settings.PROFILE_DIR
+    if not os.path.isdir(directory):
+        return []
+    entries = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            entries.append({
+                'name': name,
+                'size': stat.st_size,
+                'created_at': datetime.fromtimestamp(stat.st_mtime, KST).isoformat(),
+            })
+    entries.sort(key=lambda entry: entry['created_at'], reverse=True)
+    return entries
+
+
+def find_profile(name: str) -> Optional[str]:
+    """다운로드용 경로 (PROFILE_DIR 밖 경로는 거부)"""
+    if os.path.basename(name) != name or name.startswith('.'):
+        return None
+    path = profile_path(name)
+    return path if os.path.isfile(path) else None
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """ADMIN_TOKEN 이 설정되어 있고 일치할 때만 True (비 ASCII 토큰도 예외 없이 비교하도록 bytes 로)"""
+    return (bool(settings.ADMIN_TOKEN) and bool(token)
+            and hmac.compare_digest(token.encode(), settings.ADMIN_TOKEN.encode()))
+
+
+class StackSampler:
+    """
+    시간 제한 스택 샘플러
+
+    run() 동안 별도 스레드에서 interval 마다 sys._current_frames() 를 읽어 스택별 샘플 수를 셈.
+    """
+
+    _busy = threading.Lock()  # 프로세스당 한 번에 하나
+
+    def __init__(self, interval: float = 0.01, include_idle: bool = False):
+        self.interval = max(interval, 0.001)
+        self.include_idle = include_idle
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+
+    def _sample(self, skip_idents):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident in skip_idents:
+                continue
+            leaf = frame.f_code
+            if not self.include_idle and (os.path.basename(leaf.co_filename), leaf.co_name) in IDLE_LEAVES:
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.append(f"thread {names.get(ident, ident)}")
+            self.samples[';'.join(reversed(stack))] += 1
+        self.sample_count += 1
+
+    def run(self, seconds: float) -> str:
+        """
+        seconds 동안 샘플링 (호출한 스레드는 끝날 때까지 대기)
+
+        Returns:
+            collapsed stack 텍스트 ("frame;frame;frame count" 줄)
+
+        Raises:
+            RuntimeError: 다른 샘플링이 실행 중일 때
+        """
+        if not StackSampler._busy.acquire(blocking=False):
+            raise RuntimeError("Another sampling profile is already running")
+        try:
+            stop = threading.Event()
+            caller_ident = threading.get_ident()
+
+            def loop():
+                # 샘플러 자신과 대기 중인 호출 스레드는 제외
+                skip_idents = {threading.get_ident(), caller_ident}
+                while not stop.wait(self.interval):
+                    self._sample(skip_idents)
+
+            sampler = threading.Thread(target=loop, name='stack-sampler', daemon=True)
+            sampler.start()
+            time.sleep(seconds)
+            stop.set()
+            sampler.join()
+        finally:
+            StackSampler._busy.release()
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+def sample_process(seconds: float, interval_ms: float = 10, include_idle: bool = False) -> Dict:
+    """
+    관리자 엔드포인트용: 프로세스 샘플링 후 .collapsed 파일로 저장
+
+    Returns:
+        {'name', 'samples', 'stacks', 'collapsed'}
+    """
+    seconds = min(max(seconds, 0.1), settings.PROFILER_MAX_SECONDS)
+    sampler = StackSampler(interval=interval_ms / 1000, include_idle=include_idle)
+    collapsed = sampler.run(seconds)
+    name = save_profile(f"sample-{_timestamp()}.collapsed", collapsed)
+    logger.info(f"Sampling profile saved: {name} ({sampler.sample_count} samples, {len(sampler.samples)} stacks)")
+    return {'name': name, 'samples': sampler.sample_count, 'stacks': len(sampler.samples), 'collapsed': collapsed}
+
+
+class RequestProfilerMiddleware:
+    """헤더로 켜는 요청 단위 cProfile (관리자 토큰 필요)"""
+
+    def __init__(self, app):
+        self.app = app
+        self._lock = threading.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get('headers') or [])
+        if headers.get(b'x-profile', b'').lower() not in (b'1', b'true') or \
+                not is_admin_token(headers.get(b'x-admin-token', b'').decode('latin-1')):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._lock.acquire(blocking=False):
+            await self.app(scope, receive, self._with_headers(send, [(b'x-profile-status', b'busy')]))
+            return
+
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', scope.get('path', '')).strip('_') or 'root'
+        name = f"request-{_timestamp()}-{slug[:60]}"
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profiler.enable()
+            try:
+                await self.app(scope, receive, self._with_headers(send, [(b'x-profile-id', name.encode())]))
+            finally:
+                profiler.disable()
+            elapsed = time.perf_counter() - started
+            self._store(profiler, name, scope, elapsed)
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _with_headers(send, extra):
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                message = {**message, 'headers': [*message.get('headers', []), *extra]}
+            await send(message)
+        return send_wrapper
+
+    @staticmethod
+    def _store(profiler: cProfile.Profile, name: str, scope, elapsed: float):
+        try:
+            os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+            profiler.dump_stats(profile_path(f"{name}.prof"))
+            summary = io.StringIO()
+            summary.write(f"{scope.get('method')} {scope.get('path')}?{scope.get('query_string', b'').decode()} "
+                          f"{elapsed * 1000:.1f}ms\n\n")
+            pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(50)
+            save_profile(f"{name}.txt", summary.getvalue())
+            logger.info(f"Request profile saved: {name} ({elapsed * 1000:.1f}ms)")
+        except Exception as e:
+            logger.warning(f"Failed to store request profile {name}: {e}")
@@ -0,0 +1,304 @@
+"""
+Tracing
+파이프라인 단계/외부 호출을 부모-자식 관계가 있는 span 으로 기록
+
+- traced() 데코레이터 / span() 컨텍스트 매니저로 span 생성 (현재 span 은 contextvar 로 전달)
+- 루트 span 이 끝나면 trace 전체를 TRACE_FILE 에 한 줄씩 기록 (OTLP/JSON ExportTraceServiceRequest 형식,
+  OpenTelemetry Collector 의 otlpjsonfile receiver 로 그대로 읽을 수 있음)
+- 최근 trace 는 메모리에 보관 -> GET /debug/traces 에서 오래 걸린 실행 순으로 조회
+
+사용:
+    @traced('pipeline.run')
+    async def run_pipeline(...): ...
+
+    with span('pipeline.filter', filings=len(filings)):
+        ...
+"""
+import contextvars
+import functools
+import inspect
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pytz
+from loguru import logger
+
+from ..config.settings import settings
+
+KST = pytz.timezone('Asia/Seoul')
+
+SERVICE_NAME = 'invest-engine'
+
+# OTLP span kind / status code
+SPAN_KINDS = {'internal': 1, 'server': 2, 'client': 3}
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# 루트가 끝나지 않은 trace 최대 보관 수 (백그라운드 태스크가 남긴 span 등)
+MAX_OPEN_TRACES = 1000
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar('current_span', default=None)
+
+
+class Span:
+    """trace 의 한 구간"""
+
+    __slots__ = ('trace_id', 'span_id', 'parent_id', 'name', 'kind', 'start_ns', 'end_ns',
+                 'attributes', 'status', 'status_message')
+
+    def __init__(self, name: str, parent: Optional['Span'] = None, kind: str = 'internal',
+                 attributes: Optional[Dict] = None, start_ns: Optional[int] = None):
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.kind = kind
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = dict(attributes or {})
+        self.status = STATUS_OK
+        self.status_message = ''
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def set_attributes(self, **attributes):
+        self.attributes.update(attributes)
+
+    def set_error(self, message: str = ''):
+        self.status = STATUS_ERROR
+        self.status_message = message[:500]
+
+    def to_otlp(self) -> Dict:
+        """OTLP/JSON span"""
+        data = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': SPAN_KINDS.get(self.kind, 1),
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns or self.start_ns),
+            'attributes': [{'key': key, 'value': _otlp_value(value)} for key, value in self.attributes.items()],
+            'status': {'code': self.status},
+        }
+        if self.parent_id:
+            data['parentSpanId'] = self.parent_id
+        if self.status_message:
+            data['status']['message'] = self.status_message
+        return data
+
+
+def _otlp_value(value) -> Dict:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class _SpanContext:
+    """with 블록 동안 span 을 현재 span 으로 설정"""
+
+    __slots__ = ('tracer', 'span', 'token')
+
+    def __init__(self, tracer: 'Tracer', span: Optional[Span]):
+        self.tracer = tracer
+        self.span = span
+        self.token = None
+
+    def __enter__(self) -> Optional[Span]:
+        if self.span is not None:
+            self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.span is None:
+            return False
+        _current_span.reset(self.token)
+        if exc is not None:
+            self.span.set_error(f"{exc_type.__name__}: {exc}")
+        self.tracer.end_span(self.span)
+        return False
+
+
+class Tracer:
+    """span 생성 + 파일 exporter + 최근 trace 보관"""
+
+    def __init__(self, path: Optional[str] = None, enabled: Optional[bool] = None,
+                 recent_limit: Optional[int] = None):
+        self.path = path or settings.TRACE_FILE
+        self.enabled = settings.TRACING_ENABLED if enabled is None else enabled
+        self.max_bytes = settings.TRACE_FILE_MAX_MB * 1024 * 1024
+        self._lock = threading.Lock()
+        self._open: OrderedDict = OrderedDict()  # trace_id -> 끝난 span 리스트
+        self._recent: deque = deque(maxlen=recent_limit or settings.TRACE_RECENT_LIMIT)
+
+    # ------------------------------------------------------------------
+    # span 생성
+    # ------------------------------------------------------------------
+    def start_span(self, name: str, kind: str = 'internal', start_ns: Optional[int] = None,
+                   **attributes) -> Optional[Span]:
+        """현재 span 의 자식 span 생성 (현재 span 으로 설정하지는 않음)"""
+        if not self.enabled:
+            return None
+        return Span(name, _current_span.get(), kind, attributes, start_ns)
+
+    def span(self, name: str, kind: str = 'internal', **attributes) -> _SpanContext:
+        """with 블록 span"""
+        return _SpanContext(self, self.start_span(name, kind, **attributes))
+
+    def traced(self, name: Optional[str] = None, kind: str = 'internal'):
+        """함수 전체를 span 으로 감싸는 데코레이터 (async/sync 모두)"""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(span_name, kind):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name, kind):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record_span(self, name: str, start_ns: int, end_ns: Optional[int] = None, kind: str = 'internal',
+                    error: Optional[str] = None, **attributes) -> Optional[Span]:
+        """이미 끝난 구간을 현재 span 의 자식으로 기록 (수집기 단계 타이머용)"""
+        span = self.start_span(name, kind, start_ns=start_ns, **attributes)
+        if span is None:
+            return None
+        if error is not None:
+            span.set_error(error)
+        self.end_span(span, end_ns)
+        return span
+
+    def end_span(self, span: Span, end_ns: Optional[int] = None):
+        span.end_ns = end_ns or time.time_ns()
+        with self._lock:
+            spans = self._open.setdefault(span.trace_id, [])
+            spans.append(span)
+            if span.parent_id is not None:
+                while len(self._open) > MAX_OPEN_TRACES:
+                    self._open.popitem(last=False)
+                return
+            # 루트 span 종료 -> trace 완료
+            del self._open[span.trace_id]
+            self._recent.append((span, spans))
+        self._export(spans)
+
+    # ------------------------------------------------------------------
+    # exporter
+    # ------------------------------------------------------------------
+    def _export(self, spans: List[Span]):
+        if not self.path:
+            return
+        line = json.dumps({'resourceSpans': [{
+            'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': SERVICE_NAME}}]},
+            'scopeSpans': [{
+                'scope': {'name': 'invest-engine.tracing'},
+                'spans': [span.to_otlp() for span in spans],
+            }],
+        }]}, ensure_ascii=False)
+        try:
+            with self._lock:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                if self.max_bytes and os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                    os.replace(self.path, f"{self.path}.1")
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+        except OSError as e:
+            logger.warning(f"Trace export failed: {e}")
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def slowest(self, limit: int = 20, name: Optional[str] = None) -> List[Dict]:
+        """
+        최근 trace 중 오래 걸린 순
+
+        Args:
+            limit: 반환할 trace 수
+            name: 루트 span 이름 필터 (부분 일치)
+
+        Returns:
+            trace 요약 + 단계별 span (시작 순, depth 포함)
+        """
+        with self._lock:
+            recent = list(self._recent)
+        if name:
+            recent = [item for item in recent if name in item[0].name]
+        recent.sort(key=lambda item: item[0].duration_ms, reverse=True)
+        return [_trace_summary(root, spans) for root, spans in recent[:limit]]
+
+
+def _trace_summary(root: Span, spans: List[Span]) -> Dict:
+    children: Dict[Optional[str], List[Span]] = {}
+    for item in spans:
+        children.setdefault(item.parent_id, []).append(item)
+
+    ordered = []
+
+    def walk(parent: Span, depth: int):
+        for child in sorted(children.get(parent.span_id, []), key=lambda item: item.start_ns):
+            ordered.append({
+                'name': child.name,
+                'depth': depth,
+                'offset_ms': round((child.start_ns - root.start_ns) / 1e6, 1),
+                'duration_ms': round(child.duration_ms, 1),
+                'status': 'error' if child.status == STATUS_ERROR else 'ok',
+                'attributes': child.attributes,
+            })
+            walk(child, depth + 1)
+
+    walk(root, 1)
+    return {
+        'trace_id': root.trace_id,
+        'name': root.name,
+        'started_at': datetime.fromtimestamp(root.start_ns / 1e9, KST).isoformat(),
+        'duration_ms': round(root.duration_ms, 1),
+        'status': 'error' if root.status == STATUS_ERROR else 'ok',
+        'error': root.status_message or None,
+        'attributes': root.attributes,
+        'span_count': len(spans),
+        'spans': ordered,
+    }
+
+
+# 글로벌 인스턴스
+tracer = Tracer()
+span = tracer.span
+traced = tracer.traced
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def set_span_attributes(**attributes):
+    """현재 span 에 속성 추가 (span 이 없으면 무시)"""
+    active = _current_span.get()
+    if active is not None:
+        active.set_attributes(**attributes)
+
+
+def mark_span_error(message: str = ''):
+    """예외를 직접 처리한 경우 현재 span 을 오류로 표시"""
+    active = _current_span.get()
+    if active is not None:
+        active.set_error(message)
@@ -11,10 +11,14 @@ import pytz
 from .collectors.dart import DartCollector
 from .analyzers.filing_filter import FilingFilter, FilingGrade
 from .analyzers.ai_summarizer import AISummarizer
+from .analyzers.event_study import event_study_engine
 from .alerts.telegram_bot import InvestmentTelegramBot
 from .alerts.telegram_alert import telegram_alert
 from .db.database import get_db_session
-from .db.models import DartFiling
+from .db.models import DartFiling, FilingKey
+from .db.partitions import claim_keys
+from .services.response_cache import invalidate_cache
+from .monitoring.tracing import traced, span, set_span_attributes, mark_span_error
 
 class DartAnalysisPipeline:
     """DART 공시 분석 파이프라인"""
@@ -25,6 +29,7 @@ class DartAnalysisPipeline:
         self.ai_summarizer = AISummarizer()
         self.telegram_bot = InvestmentTelegramBot()
     
+    @traced('pipeline.dart')
     async def run_pipeline(self, days_back: int = 1, send_alerts: bool = True) -> Dict[str, int]:
         """
         전체 파이프라인 실행
@@ -51,9 +56,10 @@ class DartAnalysisPipeline:
         try:
             # 1. DART API로 최근 공시 수집
             logger.info("Step 1: Collecting DART filings...")
-            async with DartCollector() as collector:
-                self.dart_collector = collector
-                filings = await collector.get_recent_filings(days_back)
+            with span('pipeline.collect', days_back=days_back):
+                async with DartCollector() as collector:
+                    self.dart_collector = collector
+                    filings = await collector.get_recent_filings(days_back)
             
             stats['total_filings'] = len(filings)
             logger.info(f"Collected {len(filings)} filings")
@@ -64,19 +70,22 @@ class DartAnalysisPipeline:
             
             # 2. 필터링 (A/B/C 분류)
             logger.info("Step 2: Filtering filings by grade...")
-            distribution = self.filing_filter.analyze_filing_distribution(filings)
-            stats.update({
-                'grade_a': distribution['A'],
-                'grade_b': distribution['B'],
-                'grade_c': distribution['C']
-            })
-            
-            # 모든 공시에 등급 부여
-            from .analyzers.filing_filter import FilingGrade
-            all_graded = self.filing_filter.filter_filings_by_grade(filings, [FilingGrade.A, FilingGrade.B, FilingGrade.C])
-            
-            # A+B등급만 추출 (중요 공시)
-            important_filings = [f for f in all_graded if f.get('grade') in ('A', 'B')]
+            with span('pipeline.filter', filings=len(filings)) as filter_span:
+                distribution = self.filing_filter.analyze_filing_distribution(filings)
+                stats.update({
+                    'grade_a': distribution['A'],
+                    'grade_b': distribution['B'],
+                    'grade_c': distribution['C']
+                })
+                
+                # 모든 공시에 등급 부여
+                from .analyzers.filing_filter import FilingGrade
+                all_graded = self.filing_filter.filter_filings_by_grade(filings, [FilingGrade.A, FilingGrade.B, FilingGrade.C])
+                
+                # A+B등급만 추출 (중요 공시)
+                important_filings = [f for f in all_graded if f.get('grade') in ('A', 'B')]
+                if filter_span is not None:
+                    filter_span.set_attributes(important=len(important_filings))
             logger.info(f"Found {len(important_filings)} important filings (A+B grade)")
             
             # 3. A+B등급만 AI 분석
@@ -121,14 +130,17 @@ class DartAnalysisPipeline:
         except Exception as e:
             logger.error(f"Pipeline error: {e}")
             stats['errors'] = 1
+            mark_span_error(str(e))
             
             # 에러 알림
             if send_alerts:
                 error_msg = f"❌ <b>DART 파이프라인 오류</b>\n\n{str(e)}"
                 await self.telegram_bot.send_message(error_msg)
         
+        set_span_attributes(**stats)
         return stats
     
+    @traced('pipeline.analyze')
     async def _analyze_filings(self, filings: List[Dict]) -> List[Dict]:
         """
         공시 AI 분석 실행
@@ -173,6 +185,7 @@ class DartAnalysisPipeline:
         
         return analyzed_filings
     
+    @traced('pipeline.send_alerts')
     async def _send_alerts(self, analyzed_filings: List[Dict]) -> int:
         """
         분석된 공시들에 대한 텔레그램 알림 발송
@@ -190,6 +203,8 @@ class DartAnalysisPipeline:
             analysis = filing.get('analysis')
             
             try:
+                if filing.get('grade') == 'B':
+                    filing = {**filing, 'event_study': self._lookup_event_study(filing.get('report_nm', ''))}
                 success = await self.telegram_bot.send_dart_alert(filing, analysis)
                 if success:
                     sent_count += 1
@@ -205,6 +220,18 @@ class DartAnalysisPipeline:
         
         return sent_count
     
+    def _lookup_event_study(self, report_nm: str):
+        """B등급 알림용 과거 동일 유형 공시 반응 (캐시 조회만, 없으면 None)"""
+        db = get_db_session()
+        try:
+            return event_study_engine.lookup_for_filing(db, report_nm)
+        except Exception as e:
+            logger.warning(f"Event study lookup failed: {e}")
+            return None
+        finally:
+            db.close()
+    
+    @traced('pipeline.save')
     async def _save_to_database(self, filings: List[Dict]):
         """
         공시 정보를 데이터베이스에 저장
@@ -216,14 +243,13 @@ class DartAnalysisPipeline:
         new_filings = 0
         
         try:
+            # 새 접수번호를 한 번에 등록 (이미 저장됐거나 수집기가 먼저 등록한 공시는 제외)
+            new_rcept_nos = claim_keys(db, FilingKey.rcept_no, [f.get('rcept_no') for f in filings])
+            
             for filing_data in filings:
-                # 이미 저장된 공시인지 확인
-                existing = db.query(DartFiling).filter(
-                    DartFiling.rcept_no == filing_data.get('rcept_no')
-                ).first()
-                
-                if existing:
+                if filing_data.get('rcept_no') not in new_rcept_nos:
                     continue
+                new_rcept_nos.discard(filing_data.get('rcept_no'))
                 
                 # 새 공시 저장
                 filing = DartFiling(
@@ -247,6 +273,8 @@ class DartAnalysisPipeline:
                 new_filings += 1
             
             db.commit()
+            if new_filings:
+                invalidate_cache('filings')
             logger.info(f"Saved {new_filings} new filings to database")
             
         except Exception as e:
@@ -256,6 +284,7 @@ class DartAnalysisPipeline:
         finally:
             db.close()
     
+    @traced('pipeline.summary')
     async def _send_pipeline_summary(self, stats: Dict[str, int]):
         """
         파이프라인 실행 요약 발송
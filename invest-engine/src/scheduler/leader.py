@@ -0,0 +1,199 @@
+"""
+Scheduler leader election
+scheduler_leases 테이블의 임대 행으로 여러 API 프로세스 중 하나만 스케줄러를 실행
+
+- 모든 프로세스가 LEADER_LEASE_SECONDS/3 마다 임대 갱신/획득 시도
+  (자기 임대면 연장, 만료된 임대면 가져감, 행이 없으면 생성 - 조건부 UPDATE/INSERT 라 동시에 한 프로세스만 성공)
+- 리더가 되면 on_elected (orchestrator.start), 갱신에 실패하면 on_demoted (orchestrator.demote - 중지 알림 없음)
+- 정상 종료 시 임대를 바로 반납해 다른 프로세스가 다음 heartbeat 에 이어받음
+- DB 에 닿지 못하는 동안은 마지막으로 받은 임대가 끝날 때까지만 리더 유지
+
+여러 서버에서 쓰려면 서버 시계가 NTP 로 맞춰져 있어야 함 (만료 시각을 각 프로세스 시계로 비교).
+"""
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+from sqlalchemy.exc import IntegrityError
+
+from ..config.settings import settings
+from ..db.database import get_db_session
+from ..db.models import SchedulerLease, KST
+
+
+class LeaderElector:
+    """임대 행 기반 리더 선출"""
+
+    def __init__(self, name: str = 'scheduler', lease_seconds: int = None):
+        """
+        Args:
+            name: 임대 이름 (선출 단위)
+            lease_seconds: 임대 기간 (기본 LEADER_LEASE_SECONDS)
+        """
+        self.name = name
+        self.lease_seconds = lease_seconds or settings.LEADER_LEASE_SECONDS
+        self.holder_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.is_leader = False
+        self.enabled = False  # start() 전에는 선출 없이 스케줄 허용
+        self._expires_at: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._on_elected: Optional[Callable[[], Awaitable]] = None
+        self._on_demoted: Optional[Callable[[], Awaitable]] = None
+
+    def try_acquire(self) -> bool:
+        """
+        임대 갱신 또는 획득 (동기 DB 호출)
+
+        Returns:
+            bool: 이 프로세스가 임대를 가지고 있는지
+        """
+        now = datetime.now(KST)
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        db = get_db_session()
+        try:
+            # 1) 내 임대 연장
+            updated = db.query(SchedulerLease).filter(
+                SchedulerLease.name == self.name,
+                SchedulerLease.holder == self.holder_id
+            ).update({'renewed_at': now, 'expires_at': expires_at}, synchronize_session=False)
+
+            # 2) 만료된 임대 가져가기
+            if not updated:
+                updated = db.query(SchedulerLease).filter(
+                    SchedulerLease.name == self.name,
+                    SchedulerLease.expires_at < now
+                ).update({'holder': self.holder_id, 'acquired_at': now, 'renewed_at': now,
+                          'expires_at': expires_at}, synchronize_session=False)
+
+            # 3) 처음이면 행 생성 (동시에 만들면 PK 충돌로 한 프로세스만 성공)
+            if not updated and db.query(SchedulerLease.name).filter(SchedulerLease.name == self.name).first() is None:
+                db.add(SchedulerLease(name=self.name, holder=self.holder_id, acquired_at=now,
+                                      renewed_at=now, expires_at=expires_at))
+                updated = 1
+
+            db.commit()
+            if updated:
+                self._expires_at = expires_at
+            return bool(updated)
+        except IntegrityError:
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    def release(self):
+        """임대 반납 (정상 종료)"""
+        db = get_db_session()
+        try:
+            db.query(SchedulerLease).filter(
+                SchedulerLease.name == self.name,
+                SchedulerLease.holder == self.holder_id
+            ).update({'expires_at': datetime.now(KST)}, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to release {self.name} lease: {e}")
+        finally:
+            db.close()
+        self._expires_at = None
+
+    def allows_scheduling(self) -> bool:
+        """정기 작업 실행 가능 여부 (선출을 쓰지 않으면 항상 True)
+
+        리더여도 임대가 이미 끝났으면 False - 다음 heartbeat 전에 다른 프로세스가 가져갔을 수 있음
+        """
+        if not self.enabled:
+            return True
+        return self.is_leader and self._expires_at is not None and datetime.now(KST) < self._expires_at
+
+    async def start(self, on_elected: Callable[[], Awaitable], on_demoted: Callable[[], Awaitable]):
+        """
+        선출 시작 (첫 시도는 바로 실행 - 단일 프로세스면 시작 직후 리더)
+
+        Args:
+            on_elected: 리더가 되었을 때 (스케줄러 시작)
+            on_demoted: 리더를 잃었을 때 (스케줄러 중지)
+        """
+        if self._task is not None:
+            return
+        self.enabled = True
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        await self._tick()
+        if not self.is_leader:
+            logger.info(f"Scheduler standby ({self.holder_id}), another process holds the {self.name} lease")
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """선출 중지 + 리더였으면 스케줄러 중지, 임대 반납"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.is_leader:
+            await self._set_leader(False)
+            await asyncio.to_thread(self.release)
+        self.enabled = False
+
+    async def _loop(self):
+        interval = max(self.lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            await self._tick()
+
+    async def _tick(self):
+        try:
+            holding = await asyncio.to_thread(self.try_acquire)
+        except Exception as e:
+            logger.warning(f"Leader lease check failed: {e}")
+            # DB 에 닿지 못하면 마지막 임대가 끝날 때까지만 유지
+            holding = self.is_leader and self._expires_at is not None and datetime.now(KST) < self._expires_at
+        if holding != self.is_leader:
+            await self._set_leader(holding)
+
+    async def _set_leader(self, leader: bool):
+        self.is_leader = leader
+        if leader:
+            logger.info(f"Elected scheduler leader ({self.holder_id})")
+            callback = self._on_elected
+        else:
+            logger.warning(f"Lost scheduler leadership ({self.holder_id})")
+            callback = self._on_demoted
+        if callback is not None:
+            try:
+                await callback()
+            except Exception as e:
+                logger.error(f"Leader {'election' if leader else 'demotion'} callback failed: {e}")
+
+    def get_status(self) -> dict:
+        """선출 상태 (현재 리더는 DB 조회)"""
+        status = {
+            'enabled': self.enabled,
+            'holder_id': self.holder_id,
+            'is_leader': self.is_leader,
+            'leader': None,
+            'expires_at': None,
+        }
+        if not self.enabled:
+            return status
+        db = get_db_session()
+        try:
+            lease = db.query(SchedulerLease).filter(SchedulerLease.name == self.name).first()
+            if lease is not None:
+                status['leader'] = lease.holder
+                status['expires_at'] = lease.expires_at.strftime('%Y-%m-%d %H:%M:%S') if lease.expires_at else None
+        except Exception as e:
+            logger.warning(f"Failed to read {self.name} lease: {e}")
+        finally:
+            db.close()
+        return status
+
+
+# 글로벌 리더 선출 인스턴스
+leader_elector = LeaderElector()
@@ -0,0 +1,811 @@
+"""
+Job orchestrator
+모든 정기 작업을 한 곳에서 실행 - 수집 -> 분류 -> 분석 -> 알림 -> 번역 의존 관계, 자원별 동시 실행 한도
+
+- 작업은 APScheduler 에 한 번만 등록 (여러 시간대 규칙은 OrTrigger 로 합침) -> 같은 수집이 두 번 돌지 않음
+- after: 상위 작업이 성공하고 새 데이터가 있으면 하위 작업을 바로 실행
+- 이미 실행 중인 작업: 정기/수동 실행은 건너뜀 (invest_job_skips_total),
+  상위 작업이 보낸 실행은 한 번으로 합쳐 현재 실행이 끝난 뒤 다시 실행
+- resources: ORCHESTRATOR_BUDGETS 의 자원별 semaphore (DART API, LLM, 텔레그램, 웹 수집),
+  여러 자원은 이름 순서로 잡아 교착 없음
+- jitter: 수집 작업 시작 시각을 0~ORCHESTRATOR_JITTER_SECONDS 초 분산
+- 여러 API 프로세스: 리더 임대(leader.py)를 가진 프로세스만 start() - 나머지는 HTTP 만 처리
+- TASK_QUEUE_ENABLED=True: local 이 아닌 작업은 task_queue 에 넣기만 하고 worker.py 가 실행
+  (중복 방지/자원 한도/하위 작업 전달은 큐와 워커가 같은 규칙으로 처리 - src/tasks)
+
+작업 함수는 처리 건수를 반환하고 실패하면 None 을 반환.
+수집기(httpx/bs4/feedparser), 이벤트 스터디(numpy), 아카이브(pyarrow)는 작업 함수 안에서 import - API 시작 시간에 포함되지 않음.
+"""
+import asyncio
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.combining import OrTrigger
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from loguru import logger
+import pytz
+
+from ..config.settings import settings
+from ..analyzers.filing_filter import FilingFilter
+from ..alerts.briefing import briefing_generator
+from ..alerts.telegram_bot import telegram_bot
+from ..alerts.telegram_alert import telegram_alert
+from ..services.influencer_sync import sync_influencer_signals
+from ..services.leaderboard import fill_influencer_returns
+from ..services.response_cache import invalidate_cache
+from ..db.database import get_db_session
+from ..db.models import DartFiling
+from ..db.partitions import ensure_future_partitions
+from ..monitoring.metrics import track_job, mark_job_failed, metrics, JOB_SKIPS
+from ..tasks.queue import task_queue
+from .leader import leader_elector
+
+
+def parse_budgets(value: str) -> Dict[str, int]:
+    """"dart_api=1,llm=2" -> {'dart_api': 1, 'llm': 2}"""
+    budgets = {}
+    for item in (value or '').split(','):
+        if '=' not in item:
+            continue
+        name, limit = item.split('=', 1)
+        try:
+            budgets[name.strip()] = max(int(limit), 1)
+        except ValueError:
+            logger.warning(f"Invalid orchestrator budget '{item}', ignored")
+    return budgets
+
+
+class OrchestratedJob:
+    """오케스트레이터에 등록된 작업 하나 (정의 + 실행 상태)"""
+
+    def __init__(self, job_id: str, name: str, func: Callable, triggers: Sequence = (),
+                 after: Sequence[str] = (), resources: Sequence[str] = (), jitter: int = 0,
+                 run_at_start: bool = False, local: bool = False):
+        self.id = job_id
+        self.name = name
+        self.func = func
+        self.triggers = list(triggers)
+        self.after = list(after)
+        self.resources = sorted(resources)
+        self.jitter = jitter
+        self.run_at_start = run_at_start
+        self.local = local  # 작업 큐를 쓰더라도 API 프로세스에서 실행
+
+        self.running = False
+        self.pending = False
+        self.runs = 0
+        self.skips = 0
+        self.last_status: Optional[str] = None
+        self.last_result = None
+        self.last_started: Optional[datetime] = None
+        self.last_finished: Optional[datetime] = None
+
+
+class Orchestrator:
+    """투자 엔진 작업 오케스트레이터"""
+
+    def __init__(self):
+        self.scheduler = AsyncIOScheduler(timezone=settings.TIMEZONE)
+        self.is_running = False
+        self.paused = False
+        self.kst = pytz.timezone('Asia/Seoul')
+        self.filing_filter = FilingFilter()
+        self.ai_summarizer = None  # 첫 분석 때 생성 (OpenAI 클라이언트)
+
+        self.budgets = parse_budgets(settings.ORCHESTRATOR_BUDGETS)
+        self._semaphores = {name: asyncio.Semaphore(limit) for name, limit in self.budgets.items()}
+        self._tasks = set()
+        self.use_queue = settings.TASK_QUEUE_ENABLED
+
+        self.jobs: Dict[str, OrchestratedJob] = {}
+        self.downstream: Dict[str, List[str]] = {}
+        self.define_jobs()
+
+    def add(self, job: OrchestratedJob):
+        """작업 정의 등록 (after 에 적은 상위 작업이 먼저 등록되어 있어야 함)"""
+        tracked = getattr(job.func, 'job_name', job.id)
+        if tracked != job.id:
+            # 메트릭/트레이스의 job 라벨이 작업 ID 와 달라지지 않도록
+            raise ValueError(f"Job '{job.id}' is tracked as '{tracked}' - track_job name must match the job id")
+        for upstream in job.after:
+            if upstream not in self.jobs:
+                raise ValueError(f"Job '{job.id}' depends on unknown job '{upstream}'")
+            self.downstream.setdefault(upstream, []).append(job.id)
+        for resource in job.resources:
+            if resource not in self.budgets:
+                logger.warning(f"Job '{job.id}' uses resource '{resource}' without a budget (unlimited)")
+        self.jobs[job.id] = job
+
+    def define_jobs(self):
+        """작업과 의존 관계 정의"""
+        tz = settings.TIMEZONE
+        jitter = settings.ORCHESTRATOR_JITTER_SECONDS
+        morning_time = settings.MORNING_BRIEFING_TIME.split(':')
+        close_time = settings.MARKET_CLOSE_TIME.split(':')
+        returns_minutes = int(close_time[0]) * 60 + int(close_time[1]) + 30
+
+        # --- 수집 ---
+        # 한국 뉴스: 장중(평일 09:00-18:00) 15분, 장외/주말 30분
+        self.add(OrchestratedJob(
+            'korean_news', 'Korean News Collection', self.korean_news_job,
+            triggers=[
+                CronTrigger(minute='*/15', hour='9-17', day_of_week='mon-fri', timezone=tz),
+                CronTrigger(minute='0,30', hour='0-8,18-23', day_of_week='mon-fri', timezone=tz),
+                CronTrigger(minute='0,30', day_of_week='sat-sun', timezone=tz),
+            ],
+            resources=['web'], jitter=jitter))
+
+        # 미국 뉴스: 미장 시간(22:00-06:00 KST) 30분, 그 외 1시간
+        self.add(OrchestratedJob(
+            'us_news', 'US News Collection', self.us_news_job,
+            triggers=[
+                CronTrigger(minute='0,30', hour='22-23', day_of_week='mon-fri', timezone=tz),
+                CronTrigger(minute='0,30', hour='0-5', day_of_week='tue-sat', timezone=tz),
+                CronTrigger(minute=0, hour='6-21', day_of_week='mon-fri', timezone=tz),
+                CronTrigger(minute=0, day_of_week='sat-sun', timezone=tz),
+            ],
+            resources=['web'], jitter=jitter))
+
+        # 코인 뉴스: 24시간 30분
+        self.add(OrchestratedJob(
+            'crypto_news', 'Crypto News Collection', self.crypto_news_job,
+            triggers=[CronTrigger(minute='0,30', timezone=tz)],
+            resources=['web'], jitter=jitter))
+
+        # DART 공시: 장중 20분, 장외 1시간 (평일)
+        self.add(OrchestratedJob(
+            'dart_collection', 'DART Collection', self.dart_collection_job,
+            triggers=[
+                CronTrigger(minute='0,20,40', hour='9-17', day_of_week='mon-fri', timezone=tz),
+                CronTrigger(minute=0, hour='0-8,18-23', day_of_week='mon-fri', timezone=tz),
+            ],
+            resources=['dart_api'], jitter=jitter))
+
+        # --- 공시 분류 -> AI 분석 (수집 뒤 바로, 시작 직후 1회 미분류분 정리) ---
+        self.add(OrchestratedJob(
+            'filing_classify', 'Filing Classification', self.filing_classify_job,
+            after=['dart_collection'], run_at_start=True))
+        self.add(OrchestratedJob(
+            'filing_analysis', 'Filing AI Analysis', self.filing_analysis_job,
+            after=['filing_classify'], resources=['dart_api', 'llm']))
+
+        # --- 알림: 새 뉴스/분석된 공시 뒤 + 평일 15분마다 (전송 실패분 재시도) ---
+        self.add(OrchestratedJob(
+            'high_priority_alerts', 'High Priority Content Alerts', self.high_priority_alert_job,
+            triggers=[CronTrigger(minute='*/15', day_of_week='mon-fri', timezone=tz)],
+            after=['korean_news', 'us_news', 'crypto_news', 'filing_analysis'],
+            resources=['telegram']))
+
+        # --- 번역: 알림이 나간 뒤 미국/코인 뉴스 제목 ---
+        self.add(OrchestratedJob(
+            'news_translate', 'News Translation', self.news_translate_job,
+            after=['high_priority_alerts'], resources=['llm']))
+
+        # --- 브리핑 / 유지보수 (정시 실행, jitter 없음) ---
+        self.add(OrchestratedJob(
+            'morning_briefing', 'Morning Briefing', self.morning_briefing_job,
+            triggers=[CronTrigger(hour=int(morning_time[0]), minute=int(morning_time[1]),
+                                  day_of_week='mon-fri', timezone=tz)],
+            resources=['telegram']))
+        self.add(OrchestratedJob(
+            'market_close_summary', 'Market Close Summary', self.market_close_summary_job,
+            triggers=[CronTrigger(hour=int(close_time[0]), minute=int(close_time[1]),
+                                  day_of_week='mon-fri', timezone=tz)],
+            resources=['telegram']))
+        self.add(OrchestratedJob(
+            'price_monitoring', 'Price Monitoring', self.price_monitoring_job,
+            triggers=[CronTrigger(minute='*/5', hour='9-15', day_of_week='mon-fri', timezone=tz)],
+            local=True))
+        self.add(OrchestratedJob(
+            'system_health_check', 'System Health Check', self.system_health_check_job,
+            triggers=[CronTrigger(hour=0, minute=0, timezone=tz)],
+            resources=['telegram'], local=True))
+        self.add(OrchestratedJob(
+            'influencer_sync', 'Influencer Signal Sync', self.influencer_sync_job,
+            triggers=[IntervalTrigger(minutes=settings.INFLUENCER_SYNC_INTERVAL_MINUTES, timezone=tz)],
+            run_at_start=True))
+        self.add(OrchestratedJob(
+            'influencer_returns', 'Influencer Returns', self.influencer_returns_job,
+            triggers=[CronTrigger(hour=returns_minutes // 60 % 24, minute=returns_minutes % 60,
+                                  day_of_week='mon-fri', timezone=tz)]))
+        self.add(OrchestratedJob(
+            'event_study_refresh', 'Event Study Refresh', self.event_study_job,
+            triggers=[CronTrigger(hour=6, minute=0, day_of_week='sat', timezone=tz)]))
+        self.add(OrchestratedJob(
+            'partition_maintenance', 'Partition Maintenance', self.partition_maintenance_job,
+            triggers=[CronTrigger(hour=0, minute=30, timezone=tz)],
+            run_at_start=True))
+        self.add(OrchestratedJob(
+            'cold_archive', 'Cold Storage Archive', self.archive_job,
+            triggers=[CronTrigger(hour=3, minute=30, timezone=tz)]))
+
+    def setup_jobs(self):
+        """정의된 작업을 APScheduler 에 등록 (작업당 하나)"""
+        for job in self.jobs.values():
+            if not job.triggers and not job.run_at_start:
+                continue  # 상위 작업이 끝날 때만 실행
+            options = {}
+            if not job.triggers:
+                trigger = DateTrigger(timezone=settings.TIMEZONE)  # 시작 직후 1회만
+            else:
+                trigger = OrTrigger(job.triggers, jitter=job.jitter or None)
+                if job.run_at_start:
+                    options['next_run_time'] = datetime.now(settings.TIMEZONE)
+            self.scheduler.add_job(
+                self._dispatch,
+                trigger,
+                args=[job.id, 'schedule'],
+                id=job.id,
+                name=job.name,
+                max_instances=3,  # 중복 실행 판단은 _dispatch 에서 (건너뛴 횟수 기록)
+                coalesce=True,
+                replace_existing=True,  # 리더를 잃었다 다시 얻으면 재등록
+                **options
+            )
+        logger.info(f"Orchestrator configured {len(self.scheduler.get_jobs())} scheduled jobs "
+                     f"({len(self.jobs)} total), budgets={self.budgets}, "
+                     f"mode={'task queue' if self.use_queue else 'in-process'}")
+
+    async def start(self):
+        """스케줄러 시작"""
+        if not self.is_running:
+            self.setup_jobs()
+            self.scheduler.start()
+            self.is_running = True
+            self.paused = False
+            logger.info("Job orchestrator started")
+
+            # 시작 알림 (백그라운드 - 텔레그램 응답을 기다리지 않고 앱 시작 진행)
+            self._background(telegram_bot.send_message(
+                "🤖 <b>Investment Engine Started</b>\n\n"
+                "스케줄러가 시작되었습니다:\n"
+                f"• 아침 브리핑: 평일 {settings.MORNING_BRIEFING_TIME}\n"
+                f"• 마감 요약: 평일 {settings.MARKET_CLOSE_TIME}\n"
+                "• 한국 뉴스: 장중 15분 / 장외 30분\n"
+                "• 미국 뉴스: 미장 30분 / 그 외 1시간\n"
+                "• 코인 뉴스: 30분마다\n"
+                "• DART 수집: 평일 장중 20분 / 장외 1시간 → 분류 → AI 분석 → 알림\n"
+                "• 중요 알림 체크: 새 데이터 수집 직후 + 평일 15분마다\n"
+                f"• 인플루언서 시그널 동기화: {settings.INFLUENCER_SYNC_INTERVAL_MINUTES}분마다"
+            ))
+
+    async def stop(self, notify: bool = True):
+        """
+        스케줄러 중지
+
+        Args:
+            notify: 텔레그램 중지 알림 전송 (엔진 종료 시)
+        """
+        if self.is_running:
+            self.scheduler.shutdown()
+            await asyncio.sleep(0)  # AsyncIOScheduler.shutdown 은 이벤트 루프 다음 차례에 적용 (리더 재선출 시 다시 start)
+            for task in list(self._tasks):
+                task.cancel()
+            self.is_running = False
+            logger.info("Job orchestrator stopped")
+
+            if notify:
+                await telegram_bot.send_message("🛑 Investment Engine Stopped")
+
+    async def demote(self):
+        """리더를 잃었을 때 스케줄러만 중지 (엔진은 계속 실행 중이고 다른 프로세스가 이어받으므로 알림 없음)"""
+        await self.stop(notify=False)
+
+    def toggle(self) -> bool:
+        """
+        정기 실행 일시정지/재개 (실행 중인 작업과 수동 실행은 영향 없음)
+
+        Returns:
+            bool: 토글 후 정기 실행 여부
+        """
+        if not self.is_running:
+            return False
+        if self.paused:
+            self.scheduler.resume()
+        else:
+            self.scheduler.pause()
+        self.paused = not self.paused
+        logger.info(f"Job orchestrator {'paused' if self.paused else 'resumed'}")
+        return not self.paused
+
+    async def run_now(self, job_id: str) -> Dict:
+        """
+        작업 즉시 실행 (수동 트리거) - 이미 실행 중이면 건너뜀
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Dict: {'job', 'status': ok/error/skipped, 'result'}
+        """
+        if job_id not in self.jobs:
+            raise KeyError(f"Unknown job '{job_id}'")
+        return await self._dispatch(job_id, 'manual')
+
+    def _queued(self, job: OrchestratedJob) -> bool:
+        return self.use_queue and not job.local
+
+    def _background(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _spawn(self, job_id: str):
+        self._background(self._dispatch(job_id, 'upstream'))
+
+    def _record_skip(self, job: OrchestratedJob, source: str):
+        job.skips += 1
+        if metrics.enabled:
+            JOB_SKIPS.inc(job=job.id)
+        logger.info(f"Job {job.id} already running, skipped {source} run")
+
+    async def _dispatch(self, job_id: str, source: str) -> Dict:
+        """
+        중복 실행 방지 후 작업 실행 (작업 큐 모드: 큐에 넣기), 성공하면 하위 작업 실행
+
+        Args:
+            job_id: 작업 ID
+            source: schedule / manual / upstream
+        """
+        job = self.jobs[job_id]
+        if source == 'schedule' and not leader_elector.allows_scheduling():
+            # 리더를 잃은 직후 이미 예약돼 있던 실행 (스케줄러 중지 전)
+            logger.info(f"Not scheduler leader, skipped scheduled {job_id}")
+            return {'job': job_id, 'status': 'skipped', 'result': None}
+        if self._queued(job):
+            task_id = await asyncio.to_thread(
+                task_queue.enqueue, job_id, source, resources=job.resources
+            )
+            if task_id is None:
+                if source != 'upstream':
+                    self._record_skip(job, source)
+                return {'job': job_id, 'status': 'skipped', 'result': None}
+            return {'job': job_id, 'status': 'queued', 'result': None, 'task_id': task_id}
+
+        if job.running:
+            if source == 'upstream':
+                job.pending = True  # 여러 번 요청돼도 끝난 뒤 한 번만 다시 실행
+                logger.debug(f"Job {job_id} running, queued one rerun for upstream data")
+            else:
+                self._record_skip(job, source)
+            return {'job': job_id, 'status': 'skipped', 'result': None}
+
+        job.running = True
+        try:
+            while True:
+                result = await self.execute(job_id)
+                await self.trigger_downstream(job_id, result, source)
+                if not job.pending:
+                    break
+                job.pending = False
+                source = 'upstream'
+        finally:
+            job.running = False
+
+        return {'job': job_id, 'status': job.last_status, 'result': result}
+
+    async def trigger_downstream(self, job_id: str, result, source: str):
+        """새 데이터가 있거나 상위 작업에서 이어진 실행이면 하위 작업 실행 (작업 큐 모드: 큐에 넣기)"""
+        if result is None or not (result or source == 'upstream'):
+            return
+        for downstream_id in self.downstream.get(job_id, []):
+            if self._queued(self.jobs[downstream_id]):
+                await self._dispatch(downstream_id, 'upstream')
+            else:
+                self._spawn(downstream_id)
+
+    async def execute(self, job_id: str):
+        """
+        자원 한도를 잡고 작업 함수 실행 (중복 확인 없음 - _dispatch / 작업 큐가 담당)
+
+        Returns:
+            처리 건수, 실패 시 None
+        """
+        job = self.jobs[job_id]
+        async with AsyncExitStack() as stack:
+            for resource in job.resources:
+                semaphore = self._semaphores.get(resource)
+                if semaphore is not None:
+                    await stack.enter_async_context(semaphore)
+
+            job.last_started = datetime.now(self.kst)
+            job.runs += 1
+            try:
+                result = await job.func()
+            except Exception as e:
+                logger.error(f"Job {job.id} raised: {e}")
+                result = None
+            job.last_finished = datetime.now(self.kst)
+            job.last_status = 'error' if result is None else 'ok'
+            job.last_result = result
+            return result
+
+    def get_jobs_status(self) -> dict:
+        """작업 상태 조회"""
+        scheduled = {job.id: job for job in self.scheduler.get_jobs()}
+        jobs_info = []
+        for job in self.jobs.values():
+            scheduled_job = scheduled.get(job.id)
+            next_run = scheduled_job.next_run_time if scheduled_job else None
+            jobs_info.append({
+                'id': job.id,
+                'name': job.name,
+                'next_run': next_run.strftime('%Y-%m-%d %H:%M:%S %Z') if next_run else 'N/A',
+                'after': job.after,
+                'resources': job.resources,
+                'running': job.running,
+                'runs': job.runs,
+                'skips': job.skips,
+                'last_status': job.last_status,
+                'last_result': job.last_result,
+                'last_run': job.last_started.strftime('%Y-%m-%d %H:%M:%S') if job.last_started else None,
+            })
+
+        return {
+            'running': self.is_running and not self.paused,
+            'paused': self.paused,
+            'mode': 'task_queue' if self.use_queue else 'in_process',
+            'budgets': self.budgets,
+            'jobs': jobs_info
+        }
+
+    # Job functions - 처리 건수 반환, 실패 시 None
+    @track_job('korean_news')
+    async def korean_news_job(self) -> Optional[int]:
+        """한국 뉴스 수집 작업 (알림은 high_priority_alerts 작업)"""
+        logger.info("Starting Korean news collection job")
+        try:
+            from ..collectors.naver_news import NaverNewsCollector
+            async with NaverNewsCollector() as collector:
+                new_articles = await collector.collect_and_store_news(collect_stock_news=True, alert=False)
+            logger.info(f"Korean news collection completed: {new_articles} new articles")
+            return new_articles
+        except Exception as e:
+            logger.error(f"Korean news collection job failed: {e}")
+            mark_job_failed()
+
+    @track_job('us_news')
+    async def us_news_job(self) -> Optional[int]:
+        """미국 뉴스 수집 작업 (번역은 news_translate 작업)"""
+        logger.info("Starting US news collection job")
+        try:
+            from ..collectors.us_news import USNewsCollector
+            async with USNewsCollector() as collector:
+                new_articles = await collector.collect_and_store_news(translate=False)
+            logger.info(f"US news collection completed: {new_articles} new articles")
+            return new_articles
+        except Exception as e:
+            logger.error(f"US news collection job failed: {e}")
+            mark_job_failed()
+
+    @track_job('crypto_news')
+    async def crypto_news_job(self) -> Optional[int]:
+        """코인 뉴스 수집 작업 (번역은 news_translate 작업)"""
+        logger.info("Starting crypto news collection job")
+        try:
+            from ..collectors.crypto_news import CryptoNewsCollector
+            async with CryptoNewsCollector() as collector:
+                new_articles = await collector.collect_and_store_news(translate=False)
+            logger.info(f"Crypto news collection completed: {new_articles} new articles")
+            return new_articles
+        except Exception as e:
+            logger.error(f"Crypto news collection job failed: {e}")
+            mark_job_failed()
+
+    @track_job('dart_collection')
+    async def dart_collection_job(self) -> Optional[int]:
+        """DART 공시 수집 작업 (알림은 분류/분석 뒤 high_priority_alerts 작업)"""
+        logger.info("Starting DART collection job")
+        try:
+            from ..collectors.dart import DartCollector
+            async with DartCollector() as collector:
+                new_filings = await collector.collect_and_store_filings(days_back=1)
+            logger.info(f"DART collection completed: {new_filings} new filings")
+            return new_filings
+        except Exception as e:
+            logger.error(f"DART collection job failed: {e}")
+            mark_job_failed()
+
+    @track_job('filing_classify')
+    async def filing_classify_job(self) -> Optional[int]:
+        """등급이 없는 공시 A/B/C 분류 작업"""
+        try:
+            classified = await asyncio.to_thread(self._classify_pending_filings)
+            if classified:
+                logger.info(f"Filing classification completed: {classified} filings graded")
+            return classified
+        except Exception as e:
+            logger.error(f"Filing classification job failed: {e}")
+            mark_job_failed()
+
+    def _classify_pending_filings(self) -> int:
+        db = get_db_session()
+        try:
+            filings = db.query(DartFiling).filter(DartFiling.grade.is_(None)).all()
+            for filing in filings:
+                grade, reason = self.filing_filter.classify_filing(
+                    {'corp_name': filing.corp_name, 'report_nm': filing.report_nm}
+                )
+                filing.grade = grade.value
+                filing.category = reason[:50]
+            db.commit()
+            if filings:
+                invalidate_cache('filings')
+            return len(filings)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @track_job('filing_analysis')
+    async def filing_analysis_job(self) -> Optional[int]:
+        """알림 전 A/B등급 공시 AI 분석 작업 (최근 24시간, 1회 FILING_ANALYSIS_BATCH 건)"""
+        try:
+            # DB 조회/저장은 스레드에서, AI 분석만 이벤트 루프에서
+            filings = await asyncio.to_thread(self._pending_analysis_filings)
+            if not filings:
+                return 0
+
+            if self.ai_summarizer is None:
+                from ..analyzers.ai_summarizer import AISummarizer
+                self.ai_summarizer = AISummarizer()
+
+            results = {}
+            for filing_id, grade, filing_dict in filings:
+                try:
+                    if grade == 'A':
+                        analysis = await self.ai_summarizer.analyze_grade_a_filing(filing_dict)
+                    else:
+                        analysis = await self.ai_summarizer.analyze_grade_b_filing(filing_dict)
+                except Exception as e:
+                    logger.error(f"Failed to analyze {filing_dict['corp_name']}: {e}")
+                    continue  # 다음 실행에서 다시 시도
+                results[filing_id] = analysis
+
+            analyzed = await asyncio.to_thread(self._save_filing_analyses, results)
+            logger.info(f"Filing analysis completed: {analyzed}/{len(filings)} filings")
+            return analyzed
+        except Exception as e:
+            logger.error(f"Filing analysis job failed: {e}")
+            mark_job_failed()
+
+    def _pending_analysis_filings(self) -> List[Tuple[int, str, Dict]]:
+        """분석할 공시 [(id, 등급, 분석 입력 dict)]"""
+        db = get_db_session()
+        try:
+            cutoff_time = datetime.now(self.kst) - timedelta(hours=24)
+            filings = db.query(DartFiling).filter(
+                DartFiling.grade.in_(['A', 'B']),
+                DartFiling.ai_analysis.is_(None),
+                DartFiling.is_alerted == False,
+                DartFiling.created_at >= cutoff_time
+            ).order_by(DartFiling.created_at.desc()).limit(settings.FILING_ANALYSIS_BATCH).all()
+            return [(filing.id, filing.grade, {
+                'corp_name': filing.corp_name,
+                'report_nm': filing.report_nm,
+                'rcept_dt': filing.rcept_dt,
+                'stock_code': filing.stock_code,
+                'rcept_no': filing.rcept_no
+            }) for filing in filings]
+        finally:
+            db.close()
+
+    def _save_filing_analyses(self, results: Dict[int, Any]) -> int:
+        if not results:
+            return 0
+        db = get_db_session()
+        try:
+            filings = db.query(DartFiling).filter(DartFiling.id.in_(list(results))).all()
+            for filing in filings:
+                analysis = results[filing.id]
+                filing.ai_summary = analysis.get('summary') if isinstance(analysis, dict) else None
+                filing.ai_analysis = str(analysis)
+            db.commit()
+            if filings:
+                invalidate_cache('filings')
+            return len(filings)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @track_job('high_priority_alerts')
+    async def high_priority_alert_job(self) -> Optional[int]:
+        """높은 중요도 컨텐츠 알림 체크 작업"""
+        logger.debug("Checking for high priority content to alert")
+        try:
+            # 중요도 높은 뉴스와 공시 체크하여 알림 발송
+            news_alerts = await telegram_alert.process_high_importance_news(min_importance=0.7)
+            filing_alerts = await telegram_alert.process_important_filings(['A', 'B'])
+
+            total_alerts = news_alerts + filing_alerts
+
+            if total_alerts > 0:
+                logger.info(f"High priority alerts sent: {news_alerts} news, {filing_alerts} filings")
+            else:
+                logger.debug("No high priority content found for alerting")
+            return total_alerts
+
+        except Exception as e:
+            logger.error(f"High priority alert job failed: {e}")
+            mark_job_failed()
+
+    @track_job('news_translate')
+    async def news_translate_job(self) -> Optional[int]:
+        """미국/코인 뉴스 제목 번역 작업"""
+        try:
+            from ..services.translator import translate_news_batch
+            translated = await translate_news_batch(limit=50)
+            if translated:
+                logger.info(f"News translation completed: {translated} items")
+            return translated
+        except Exception as e:
+            logger.error(f"News translation job failed: {e}")
+            mark_job_failed()
+
+    @track_job('morning_briefing')
+    async def morning_briefing_job(self) -> Optional[int]:
+        """아침 브리핑 작업"""
+        logger.info("Starting morning briefing job")
+        try:
+            success = await briefing_generator.send_morning_briefing()
+            if success:
+                logger.info("Morning briefing sent successfully")
+                return 1
+            logger.error("Failed to send morning briefing")
+            mark_job_failed()
+        except Exception as e:
+            logger.error(f"Morning briefing job failed: {e}")
+            mark_job_failed()
+
+    @track_job('market_close_summary')
+    async def market_close_summary_job(self) -> Optional[int]:
+        """마감 요약 작업"""
+        logger.info("Starting market close summary job")
+        try:
+            success = await briefing_generator.send_market_close_summary()
+            if success:
+                logger.info("Market close summary sent successfully")
+                return 1
+            logger.error("Failed to send market close summary")
+            mark_job_failed()
+        except Exception as e:
+            logger.error(f"Market close summary job failed: {e}")
+            mark_job_failed()
+
+    @track_job('price_monitoring')
+    async def price_monitoring_job(self) -> Optional[int]:
+        """급등락 감지 작업 (향후 구현)"""
+        logger.debug("Price monitoring job executed")
+        # 향후 주가 API 연동하여 구현
+        # 현재는 로그만 남김
+        return 0
+
+    @track_job('influencer_sync')
+    async def influencer_sync_job(self) -> Optional[int]:
+        """인플루언서 시그널 동기화 작업"""
+        logger.debug("Starting influencer signal sync job")
+        try:
+            stats = await asyncio.to_thread(sync_influencer_signals)
+            if stats['channels']:
+                logger.info(f"Influencer signal sync completed: {stats}")
+            return stats['channels']
+        except Exception as e:
+            logger.error(f"Influencer signal sync job failed: {e}")
+            mark_job_failed()
+
+    @track_job('influencer_returns')
+    async def influencer_returns_job(self) -> Optional[int]:
+        """인플루언서 시그널 수익률 반영 작업"""
+        logger.info("Starting influencer returns job")
+        try:
+            applied = await asyncio.to_thread(fill_influencer_returns)
+            logger.info(f"Influencer returns updated: {applied} price points")
+            return applied
+        except Exception as e:
+            logger.error(f"Influencer returns job failed: {e}")
+            mark_job_failed()
+
+    @track_job('event_study_refresh')
+    async def event_study_job(self) -> Optional[int]:
+        """공시 이벤트 스터디 재계산 작업"""
+        logger.info("Starting event study refresh job")
+        try:
+            from ..analyzers.event_study import event_study_engine
+            count = await asyncio.to_thread(event_study_engine.refresh)
+            logger.info(f"Event study refresh completed: {count} results")
+            return count
+        except Exception as e:
+            logger.error(f"Event study refresh job failed: {e}")
+            mark_job_failed()
+
+    @track_job('partition_maintenance')
+    async def partition_maintenance_job(self) -> Optional[int]:
+        """news/dart_filings 미래 월 파티션 생성 작업"""
+        try:
+            names = await asyncio.to_thread(ensure_future_partitions)
+            if names:
+                logger.info(f"Partition maintenance completed: {len(names)} partitions ensured")
+            return len(names or [])
+        except Exception as e:
+            logger.error(f"Partition maintenance job failed: {e}")
+            mark_job_failed()
+
+    @track_job('cold_archive')
+    async def archive_job(self) -> Optional[int]:
+        """오래된 뉴스/알림 기록 아카이브 작업"""
+        logger.info("Starting cold storage archive job")
+        try:
+            from ..services.archive import archive_old_records
+            result = await asyncio.to_thread(archive_old_records)
+            logger.info(f"Cold storage archive completed: {result}")
+            return 0  # 하위 작업 없음
+        except Exception as e:
+            logger.error(f"Cold storage archive job failed: {e}")
+            mark_job_failed()
+
+    @track_job('system_health_check')
+    async def system_health_check_job(self) -> Optional[int]:
+        """시스템 상태 체크 작업"""
+        logger.info("Starting system health check")
+        try:
+            current_time = datetime.now(self.kst)
+
+            # 기본 상태 메시지
+            status_message = f"💚 <b>시스템 상태 체크</b>\n"
+            status_message += f"시간: {current_time.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+
+            # 스케줄러 상태
+            jobs_status = self.get_jobs_status()
+            failed_jobs = [job['id'] for job in jobs_status['jobs'] if job['last_status'] == 'error']
+            status_message += f"스케줄러 상태: {'🟢 실행중' if jobs_status['running'] else '🔴 중지'}\n"
+            status_message += f"등록된 작업 수: {len(jobs_status['jobs'])}개\n"
+            if failed_jobs:
+                status_message += f"최근 실패 작업: {', '.join(failed_jobs)}\n"
+            if self.use_queue:
+                queue_stats = await asyncio.to_thread(task_queue.stats)
+                totals = {}
+                for counts in queue_stats['counts'].values():
+                    for status, count in counts.items():
+                        totals[status] = totals.get(status, 0) + count
+                status_message += (f"작업 큐: 대기 {totals.get('queued', 0)} / 실행 {totals.get('running', 0)} / "
+                                   f"실패 {totals.get('failed', 0)}\n")
+            status_message += "\n"
+
+            # 데이터베이스 상태 체크
+            db_status = "🟢 정상"
+            try:
+                db = get_db_session()
+                db.execute("SELECT 1")
+                db.close()
+            except Exception as e:
+                db_status = f"🔴 오류: {str(e)[:50]}"
+
+            status_message += f"데이터베이스: {db_status}\n"
+
+            # Telegram Bot 상태
+            bot_status = "🟢 정상" if telegram_bot.bot else "🔴 설정되지 않음"
+            status_message += f"텔레그램 봇: {bot_status}"
+
+            # 상태 메시지 전송
+            await telegram_bot.send_message(status_message)
+
+            logger.info("System health check completed")
+            return 1
+
+        except Exception as e:
+            logger.error(f"System health check failed: {e}")
+            mark_job_failed()
+            await telegram_bot.send_message(
+                f"❌ <b>시스템 상태 체크 실패</b>\n\n오류: {str(e)}"
+            )
+
+
+# 글로벌 오케스트레이터 인스턴스
+orchestrator = Orchestrator()
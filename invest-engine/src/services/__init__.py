@@ -1,6 +1,28 @@
 """
 Services module
+하위 모듈은 처음 접근할 때 import (translator -> openai, archive -> pyarrow 가 무거워 API 시작 시간에 포함되지 않도록)
 """
-from .translator import news_translator, translate_news_batch, translate_title
+import importlib
 
-__all__ = ['news_translator', 'translate_news_batch', 'translate_title']
\ No newline at end of file
+_EXPORTS = {
+    'response_cache': '.response_cache',
+    'cached_response': '.response_cache',
+    'invalidate_cache': '.response_cache',
+    'news_translator': '.translator',
+    'translate_news_batch': '.translator',
+    'translate_title': '.translator',
+    'influencer_sync': '.influencer_sync',
+    'sync_influencer_signals': '.influencer_sync',
+    'influencer_leaderboard': '.leaderboard',
+    'fill_influencer_returns': '.leaderboard',
+    'cold_archive': '.archive',
+    'archive_old_records': '.archive',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,276 @@
+"""
+Cold Storage Archive Service
+오래된 뉴스/알림 기록을 월별 zstd 압축 Parquet 파일로 옮기고, 깊은 페이지 조회 시 아카이브에서 이어서 읽음
+
+- 저장 위치: {ARCHIVE_DIR}/{table}/{YYYY-MM}.parquet
+- 이동 순서: Parquet 기록(임시 파일 -> 교체) 후 DB 행 삭제
+  -> 중간에 실패해도 행이 사라지지 않음 (다시 실행하면 id 기준으로 중복 제거)
+- 읽기: 최신 월 파일부터 역순으로 읽어 offset/limit 만큼 반환 (hot 테이블보다 항상 오래된 행)
+
+실행: python -m src.services.archive [--dry-run]
+"""
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+from loguru import logger
+from sqlalchemy import Boolean, DateTime, Float, Integer, JSON
+
+from ..config.settings import settings
+from ..db.database import get_db_session
+from ..db.models import News, AlertsLog
+from .response_cache import invalidate_cache
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+    logger.warning("pyarrow not installed. News archive disabled.")
+
+KST = pytz.timezone('Asia/Seoul')
+
+# 테이블 -> (모델, 기준 시각 컬럼, 보관 일수 설정 이름)
+ARCHIVE_TABLES = {
+    'news': (News, 'created_at', 'ARCHIVE_NEWS_AFTER_DAYS'),
+    'alerts_log': (AlertsLog, 'sent_at', 'ARCHIVE_ALERTS_AFTER_DAYS'),
+}
+
+
+def _arrow_type(column):
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp('us')
+    return pa.string()  # String/Text, JSON은 문자열로 직렬화
+
+
+def arrow_schema(model):
+    """모델 컬럼 -> Parquet 스키마"""
+    return pa.schema([pa.field(column.name, _arrow_type(column)) for column in model.__table__.columns])
+
+
+def _row_dict(model, row) -> Dict:
+    record = {}
+    for column in model.__table__.columns:
+        value = getattr(row, column.name)
+        if isinstance(column.type, JSON) and value is not None:
+            value = json.dumps(value, ensure_ascii=False)
+        elif isinstance(value, datetime) and value.tzinfo is not None:
+            value = value.astimezone(KST).replace(tzinfo=None)
+        record[column.name] = value
+    return record
+
+
+def _restore(model, record: Dict) -> SimpleNamespace:
+    """Parquet 레코드 -> 모델과 같은 속성을 가진 객체 (archived=True)"""
+    for column in model.__table__.columns:
+        if isinstance(column.type, JSON) and record.get(column.name):
+            record[column.name] = json.loads(record[column.name])
+    return SimpleNamespace(archived=True, **record)
+
+
+class ColdArchive:
+    """월별 Parquet 아카이브 (쓰기 + 읽기)"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or settings.ARCHIVE_DIR
+        self._write_lock = threading.Lock()
+        self._count_cache: Dict[Tuple, int] = {}
+
+    # ------------------------------------------------------------------
+    # 파일
+    # ------------------------------------------------------------------
+    def table_dir(self, table: str) -> str:
+        return os.path.join(self.root, table)
+
+    def month_files(self, table: str) -> List[str]:
+        """최신 월부터 정렬된 Parquet 파일 경로"""
+        directory = self.table_dir(table)
+        if not os.path.isdir(directory):
+            return []
+        names = sorted((name for name in os.listdir(directory) if name.endswith('.parquet')), reverse=True)
+        return [os.path.join(directory, name) for name in names]
+
+    def _write_month(self, model, path: str, records: List[Dict]) -> int:
+        """월 파일에 레코드 추가 (기존 파일과 id 기준 중복 제거 후 임시 파일 -> 교체)"""
+        schema = arrow_schema(model)
+        table = pa.Table.from_pylist(records, schema=schema)
+        if os.path.exists(path):
+            existing = pq.read_table(path, schema=schema)
+            table = table.filter(pc.invert(pc.is_in(table['id'], value_set=existing['id'])))
+            table = pa.concat_tables([existing, table])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        pq.write_table(table, tmp_path, compression='zstd', compression_level=settings.ARCHIVE_ZSTD_LEVEL)
+        os.replace(tmp_path, path)
+        return len(records)
+
+    # ------------------------------------------------------------------
+    # 아카이브 (hot 테이블 -> Parquet)
+    # ------------------------------------------------------------------
+    def archive_table(self, db, table: str, cutoff: datetime, dry_run: bool = False) -> int:
+        """
+        cutoff 이전 행을 월별 Parquet로 이동
+
+        Args:
+            table: ARCHIVE_TABLES 키
+            cutoff: 이 시각 이전 행 이동 (naive KST)
+            dry_run: 대상 건수만 계산
+
+        Returns:
+            이동한 행 수
+        """
+        model, time_column, _ = ARCHIVE_TABLES[table]
+        column = getattr(model, time_column)
+        query = db.query(model).filter(column < cutoff)
+        if dry_run:
+            return query.count()
+
+        moved = 0
+        with self._write_lock:
+            while True:
+                rows = query.order_by(column).limit(settings.ARCHIVE_BATCH_SIZE).all()
+                if not rows:
+                    break
+
+                by_month: Dict[str, List[Dict]] = {}
+                for row in rows:
+                    stamp = getattr(row, time_column) or cutoff
+                    by_month.setdefault(f"{stamp:%Y-%m}", []).append(_row_dict(model, row))
+                for month, records in by_month.items():
+                    self._write_month(model, os.path.join(self.table_dir(table), f"{month}.parquet"), records)
+
+                # 파일이 기록된 뒤에만 삭제
+                db.query(model).filter(model.id.in_([row.id for row in rows])).delete(synchronize_session=False)
+                db.commit()
+                moved += len(rows)
+
+        self._count_cache.clear()
+        if moved:
+            invalidate_cache('alerts' if table == 'alerts_log' else table)
+            logger.info(f"Archived {moved} {table} rows older than {cutoff:%Y-%m-%d}")
+        return moved
+
+    def run(self, now: Optional[datetime] = None, dry_run: bool = False) -> Dict[str, int]:
+        """
+        전체 아카이브 실행 (스케줄러용)
+
+        Returns:
+            {table: 이동한(또는 dry_run 시 대상) 행 수}
+        """
+        if not PARQUET_AVAILABLE:
+            logger.warning("Archive skipped: pyarrow not installed")
+            return {}
+
+        now = (now or datetime.now(KST)).replace(tzinfo=None)
+        db = get_db_session()
+        try:
+            result = {}
+            for table, (_, _, days_setting) in ARCHIVE_TABLES.items():
+                cutoff = now - timedelta(days=getattr(settings, days_setting))
+                result[table] = self.archive_table(db, table, cutoff, dry_run=dry_run)
+            return result
+        except Exception as e:
+            logger.error(f"Archive run failed: {e}")
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 읽기 (깊은 페이지 fall-through)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _news_mask(table, search: Optional[str], market: Optional[str], search_source: bool):
+        mask = None
+        if market:
+            mask = pc.equal(table['market'], market)
+        if search:
+            hit = pc.fill_null(pc.match_substring(table['title'], search), False)
+            if search_source:
+                hit = pc.or_(hit, pc.fill_null(pc.match_substring(table['source'], search), False))
+            mask = hit if mask is None else pc.and_(mask, hit)
+        return mask
+
+    def _filtered_month(self, path: str, search, market, search_source):
+        table = pq.read_table(path, schema=arrow_schema(News))
+        mask = self._news_mask(table, search, market, search_source)
+        return table if mask is None else table.filter(mask)
+
+    def count_news(self, search: Optional[str] = None, market: Optional[str] = None,
+                   search_source: bool = False) -> int:
+        """아카이브 뉴스 건수 (필터 없으면 Parquet 메타데이터, 있으면 파일별 결과 캐시)"""
+        if not PARQUET_AVAILABLE:
+            return 0
+        total = 0
+        for path in self.month_files('news'):
+            key = (path, os.path.getmtime(path), search, market, search_source)
+            if key not in self._count_cache:
+                if len(self._count_cache) > 1000:
+                    self._count_cache.clear()
+                if search or market:
+                    self._count_cache[key] = self._filtered_month(path, search, market, search_source).num_rows
+                else:
+                    self._count_cache[key] = pq.ParquetFile(path).metadata.num_rows
+            total += self._count_cache[key]
+        return total
+
+    def newest_news(self, offset: int = 0, limit: int = 20, search: Optional[str] = None,
+                    market: Optional[str] = None, order_by: str = 'created_at',
+                    search_source: bool = False) -> List[SimpleNamespace]:
+        """
+        아카이브 뉴스 최신순 조회
+
+        Args:
+            offset: 아카이브 안에서의 시작 위치
+            order_by: 'created_at' (피드) 또는 'published_at' (뉴스 목록, 없으면 created_at)
+            search_source: 검색어를 출처에도 적용 (/api/news 와 동일)
+
+        Returns:
+            News와 같은 속성을 가진 객체 리스트
+        """
+        if not PARQUET_AVAILABLE or limit <= 0:
+            return []
+        items: List[SimpleNamespace] = []
+        skip = offset
+        for path in self.month_files('news'):
+            table = self._filtered_month(path, search, market, search_source)
+            if table.num_rows <= skip:
+                skip -= table.num_rows
+                continue
+            if order_by == 'published_at':
+                table = table.sort_by([('published_at', 'descending'), ('created_at', 'descending')])
+            else:
+                table = table.sort_by([('created_at', 'descending'), ('id', 'descending')])
+            for record in table.slice(skip, limit - len(items)).to_pylist():
+                items.append(_restore(News, record))
+            skip = 0
+            if len(items) >= limit:
+                break
+        return items
+
+
+# 글로벌 인스턴스
+cold_archive = ColdArchive()
+
+
+def archive_old_records() -> Dict[str, int]:
+    """스케줄러용: 보관 기간이 지난 뉴스/알림 기록을 Parquet로 이동"""
+    return cold_archive.run()
+
+
+if __name__ == "__main__":
+    import sys
+
+    print(json.dumps(cold_archive.run(dry_run='--dry-run' in sys.argv), ensure_ascii=False, indent=2))
@@ -0,0 +1,387 @@
+"""
+Influencer Signal Sync Service
+SNS 파이프라인(invest-sns/smtr_data)의 시그널 JSON을 InfluencerVideo/InfluencerSignal 테이블로 동기화
+
+- 처음 실행하면 전체 임포트, 이후에는 파일 해시가 바뀐 채널만 다시 읽어 signal_key 기준으로 upsert
+- 파일에서 사라진 시그널은 DB에서도 삭제 (파이프라인 결과 파일이 기준)
+- AI 검증 결과(claude_verification)는 검증 결과 파일에서 같은 시그널을 찾아 verdict로 기록
+
+실행: python -m src.services.influencer_sync [--full]
+"""
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+from loguru import logger
+
+from ..config.settings import settings
+from ..db.database import get_db_session
+from ..db.models import InfluencerVideo, InfluencerSignal, InfluencerSyncState, Stock
+from .leaderboard import influencer_leaderboard
+
+KST = pytz.timezone('Asia/Seoul')
+
+# 파이프라인 신뢰도 등급 -> 0~1
+CONFIDENCE_SCORES = {'HIGH': 0.9, 'MEDIUM': 0.6, 'LOW': 0.3}
+
+# 영상 메타데이터 (업로드 날짜 폴백용)
+VIDEO_LIST_FILES = ('_all_videos.json', '_videos.json')
+VIDEO_DATES_FILE = '_video_dates.json'
+
+TIMESTAMP_PATTERN = re.compile(r'(\d+):(\d{2})(?::(\d{2}))?')
+
+
+def signal_key(signal: Dict) -> str:
+    """시그널 고유 키 (SNS 파이프라인 verify_runner.signal_key와 같은 규칙)"""
+    raw = "|".join(str(signal.get(k, '')) for k in ('video_id', 'asset', 'signal_type', 'content', 'timestamp'))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def parse_timestamp(signal: Dict) -> Optional[int]:
+    """시그널의 영상 내 위치(초) - 정렬된 timestamp_seconds 우선, 없으면 "[M:SS]" 파싱"""
+    seconds = signal.get('timestamp_seconds')
+    if isinstance(seconds, (int, float)):
+        return int(seconds)
+    match = TIMESTAMP_PATTERN.search(str(signal.get('timestamp') or ''))
+    if not match:
+        return None
+    a, b, c = match.groups()
+    if c is not None:
+        return int(a) * 3600 + int(b) * 60 + int(c)
+    return int(a) * 60 + int(b)
+
+
+def parse_confidence(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return CONFIDENCE_SCORES.get(value.upper())
+    return None
+
+
+def parse_date(value) -> Optional[datetime]:
+    """'2026-02-19' / '20260219' -> KST datetime"""
+    if not value:
+        return None
+    value = str(value)[:10]
+    for fmt in ('%Y-%m-%d', '%Y%m%d'):
+        try:
+            return KST.localize(datetime.strptime(value, fmt))
+        except ValueError:
+            continue
+    return None
+
+
+class InfluencerSync:
+    """SNS 파이프라인 JSON -> DB 동기화"""
+
+    def __init__(self, data_dir: Optional[str] = None, signal_files: Optional[List[str]] = None,
+                 verdict_files: Optional[List[str]] = None):
+        self.data_dir = data_dir or settings.INFLUENCER_DATA_DIR
+        self.signal_files = signal_files if signal_files is not None else self._split(settings.INFLUENCER_SIGNAL_FILES)
+        self.verdict_files = verdict_files if verdict_files is not None else self._split(settings.INFLUENCER_VERDICT_FILES)
+
+    @staticmethod
+    def _split(value: str) -> List[str]:
+        return [item.strip() for item in (value or '').split(',') if item.strip()]
+
+    @staticmethod
+    def channel_of(rel_path: str) -> str:
+        """데이터 폴더 아래 첫 디렉토리 이름이 채널 ID (corinpapa1106/...)"""
+        parts = rel_path.replace('\\', '/').split('/')
+        return parts[0] if len(parts) > 1 else 'default'
+
+    def _abs(self, rel_path: str) -> str:
+        return os.path.join(self.data_dir, rel_path)
+
+    def _load_json(self, rel_path: str):
+        with open(self._abs(rel_path), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    # ------------------------------------------------------------------
+    # 변경 감지
+    # ------------------------------------------------------------------
+    def _fingerprint(self, db, rel_path: str) -> Tuple[Optional[Dict], bool]:
+        """
+        파일 지문과 변경 여부
+
+        크기/수정시각이 저장된 값과 같으면 해시 계산을 건너뜀
+
+        Returns:
+            (지문 dict 또는 파일 없으면 None, 변경 여부)
+        """
+        path = self._abs(rel_path)
+        state = db.query(InfluencerSyncState).filter(InfluencerSyncState.source_path == rel_path).first()
+        if not os.path.exists(path):
+            return None, state is not None
+
+        stat = os.stat(path)
+        if state and state.file_size == stat.st_size and state.file_mtime == stat.st_mtime:
+            return {'content_hash': state.content_hash, 'file_size': stat.st_size,
+                    'file_mtime': stat.st_mtime}, False
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        fingerprint = {'content_hash': digest.hexdigest(), 'file_size': stat.st_size, 'file_mtime': stat.st_mtime}
+        return fingerprint, not state or state.content_hash != fingerprint['content_hash']
+
+    def _save_state(self, db, rel_path: str, fingerprint: Optional[Dict], record_count: int = 0):
+        state = db.query(InfluencerSyncState).filter(InfluencerSyncState.source_path == rel_path).first()
+        if fingerprint is None:
+            if state:
+                db.delete(state)
+            return
+        if not state:
+            state = InfluencerSyncState(source_path=rel_path)
+            db.add(state)
+        state.content_hash = fingerprint['content_hash']
+        state.file_size = fingerprint['file_size']
+        state.file_mtime = fingerprint['file_mtime']
+        state.record_count = record_count
+
+    # ------------------------------------------------------------------
+    # 파일 로드
+    # ------------------------------------------------------------------
+    def load_verdicts(self, channel_id: str) -> Tuple[Dict[str, str], Dict[Tuple, str]]:
+        """
+        채널의 검증 결과 파일 -> verdict 조회 테이블
+
+        Returns:
+            (signal_key -> judgment, (video_id, asset, content) -> judgment)
+        """
+        by_key, by_quote = {}, {}
+        for rel_path in self.verdict_files:
+            if self.channel_of(rel_path) != channel_id or not os.path.exists(self._abs(rel_path)):
+                continue
+            try:
+                items = self._load_json(rel_path)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Failed to read verdict file {rel_path}: {e}")
+                continue
+            for item in items if isinstance(items, list) else []:
+                judgment = (item.get('claude_verification') or {}).get('judgment')
+                if not judgment or judgment == 'error':
+                    continue
+                by_key.setdefault(signal_key(item), judgment)
+                by_quote.setdefault((item.get('video_id'), item.get('asset'), item.get('content')), judgment)
+        return by_key, by_quote
+
+    def load_video_meta(self, channel_id: str) -> Dict[str, Dict]:
+        """채널 폴더의 영상 목록/업로드 날짜 파일 -> {video_id: {title, date}}"""
+        meta = {}
+        channel_dir = self._abs(channel_id)
+        for name in VIDEO_LIST_FILES:
+            path = os.path.join(channel_dir, name)
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    videos = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            for video in videos if isinstance(videos, list) else []:
+                video_id = video.get('id') or video.get('video_id')
+                if video_id and video_id not in meta:
+                    meta[video_id] = {'title': video.get('title'), 'date': video.get('date') or video.get('upload_date')}
+
+        dates_path = os.path.join(channel_dir, VIDEO_DATES_FILE)
+        if os.path.exists(dates_path):
+            try:
+                with open(dates_path, 'r', encoding='utf-8') as f:
+                    dates = json.load(f)
+                for video_id, date in dates.items():
+                    meta.setdefault(video_id, {'title': None, 'date': None})
+                    meta[video_id]['date'] = meta[video_id]['date'] or date
+            except (OSError, json.JSONDecodeError, AttributeError):
+                pass
+        return meta
+
+    # ------------------------------------------------------------------
+    # 동기화
+    # ------------------------------------------------------------------
+    def sync_channel(self, db, channel_id: str, signal_files: List[str]) -> Dict[str, int]:
+        """
+        채널 하나의 시그널 파일들을 DB에 반영 (signal_key 기준 upsert, 사라진 시그널 삭제)
+
+        Returns:
+            {'signals': 채널 시그널 수, 'videos': 새 영상 수, 'inserted': ..., 'updated': ..., 'deleted': ...}
+        """
+        signals = []
+        for rel_path in signal_files:
+            if not os.path.exists(self._abs(rel_path)):
+                logger.warning(f"Influencer signal file not found: {self._abs(rel_path)}")
+                continue
+            items = self._load_json(rel_path)
+            signals.extend(items if isinstance(items, list) else [])
+
+        video_meta = self.load_video_meta(channel_id)
+        verdict_by_key, verdict_by_quote = self.load_verdicts(channel_id)
+        stock_codes = {name: code for name, code in db.query(Stock.corp_name, Stock.stock_code).all()}
+
+        # 영상 upsert
+        videos = {v.video_id: v for v in db.query(InfluencerVideo).filter(InfluencerVideo.channel_id == channel_id).all()}
+        new_videos = 0
+        undated = set()
+        for signal in signals:
+            video_id = signal.get('video_id')
+            if not video_id:
+                continue
+            meta = video_meta.get(video_id, {})
+            published_at = parse_date(signal.get('upload_date')) or parse_date(meta.get('date'))
+            video = videos.get(video_id)
+            if video is None:
+                video = db.query(InfluencerVideo).filter(InfluencerVideo.video_id == video_id).first()
+            if video is None:
+                if published_at is None:
+                    # 업로드 날짜를 모르면 mentioned_at 을 정할 수 없음 -> 날짜가 생길 때까지 시그널 건너뜀
+                    undated.add(video_id)
+                    continue
+                video = InfluencerVideo(
+                    channel_id=channel_id,
+                    channel_name=signal.get('channel') or channel_id,
+                    video_id=video_id,
+                    title=(signal.get('title') or meta.get('title') or video_id)[:300],
+                    description=signal.get('video_summary'),
+                    published_at=published_at,
+                )
+                db.add(video)
+                new_videos += 1
+            elif published_at:
+                video.published_at = published_at
+            if signal.get('video_summary') and not video.description:
+                video.description = signal['video_summary']
+            videos[video_id] = video
+        db.flush()
+        if undated:
+            logger.warning(f"Influencer sync {channel_id}: skipped {len(undated)} videos without an upload date")
+
+        # 시그널 upsert
+        existing = {s.signal_key: s for s in db.query(InfluencerSignal).filter(InfluencerSignal.channel_id == channel_id).all()}
+        seen = set()
+        inserted = updated = 0
+        for signal in signals:
+            video = videos.get(signal.get('video_id'))
+            if video is None or not signal.get('asset'):
+                continue
+            key = signal_key(signal)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            offset = parse_timestamp(signal)
+            verdict = ((signal.get('claude_verification') or {}).get('judgment')
+                       or verdict_by_key.get(key)
+                       or verdict_by_quote.get((signal.get('video_id'), signal.get('asset'), signal.get('content'))))
+            row = existing.get(key)
+            values = {
+                'video_id': video.video_id,
+                # 종목 마스터에 없는 자산은 이전에 매핑해 둔 코드 유지
+                'stock_code': stock_codes.get(signal['asset']) or (row.stock_code if row else None),
+                'asset': signal['asset'][:100],
+                'channel_id': channel_id,
+                'channel_name': signal.get('channel') or video.channel_name,
+                'signal_type': (signal.get('signal_type') or '').upper()[:20] or None,
+                'confidence': parse_confidence(signal.get('confidence')),
+                'content': signal.get('content'),
+                'context': signal.get('context'),
+                'timestamp_seconds': offset,
+                'verdict': verdict if verdict != 'error' else None,
+                'mentioned_at': (video.published_at + timedelta(seconds=offset or 0)).replace(tzinfo=None),
+            }
+
+            # 리더보드 집계는 변경분만 반영 (수정 = 이전 값 제거 후 새 값 추가)
+            if row is None:
+                row = InfluencerSignal(signal_key=key, **values)
+                db.add(row)
+                influencer_leaderboard.signal_added(db, row)
+                inserted += 1
+            elif any(getattr(row, field) != value for field, value in values.items()):
+                influencer_leaderboard.signal_removed(db, row)
+                for field, value in values.items():
+                    setattr(row, field, value)
+                influencer_leaderboard.signal_added(db, row)
+                updated += 1
+
+        stale = [row for key, row in existing.items() if key not in seen]
+        for row in stale:
+            influencer_leaderboard.signal_removed(db, row)
+            db.delete(row)
+
+        return {'signals': len(seen), 'videos': new_videos, 'inserted': inserted, 'updated': updated,
+                'deleted': len(stale)}
+
+    def sync_all(self, force: bool = False) -> Dict[str, int]:
+        """
+        설정된 시그널/검증 파일 동기화
+
+        Args:
+            force: True면 파일 해시와 관계없이 전체 다시 임포트
+
+        Returns:
+            전체 통계 (channels: 다시 읽은 채널 수 + sync_channel 통계 합계)
+        """
+        totals = {'channels': 0, 'videos': 0, 'inserted': 0, 'updated': 0, 'deleted': 0}
+        channels: Dict[str, List[str]] = {}
+        for rel_path in self.signal_files:
+            channels.setdefault(self.channel_of(rel_path), []).append(rel_path)
+
+        db = get_db_session()
+        try:
+            if influencer_leaderboard.ensure_initialized(db):
+                db.commit()
+
+            for channel_id, signal_files in channels.items():
+                sources = signal_files + [p for p in self.verdict_files if self.channel_of(p) == channel_id]
+                fingerprints = {}
+                changed = force
+                for rel_path in sources:
+                    fingerprints[rel_path], source_changed = self._fingerprint(db, rel_path)
+                    changed = changed or source_changed
+
+                if not changed:
+                    logger.debug(f"Influencer signals unchanged: {channel_id}")
+                    continue
+
+                stats = self.sync_channel(db, channel_id, signal_files)
+                for rel_path, fingerprint in fingerprints.items():
+                    self._save_state(db, rel_path, fingerprint, stats['signals'])
+                db.commit()
+
+                totals['channels'] += 1
+                for field in ('videos', 'inserted', 'updated', 'deleted'):
+                    totals[field] += stats[field]
+                logger.info(f"Influencer sync {channel_id}: {stats}")
+
+            return totals
+
+        except Exception as e:
+            logger.error(f"Influencer sync failed: {e}")
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# 글로벌 인스턴스
+influencer_sync = InfluencerSync()
+
+
+def sync_influencer_signals(force: bool = False) -> Dict[str, int]:
+    """스케줄러/CLI용 편의 함수"""
+    return influencer_sync.sync_all(force=force)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from ..db.database import create_tables
+
+    create_tables()
+    result = sync_influencer_signals(force='--full' in sys.argv)
+    print(json.dumps(result, ensure_ascii=False))
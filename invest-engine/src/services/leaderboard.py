@@ -0,0 +1,302 @@
+"""
+Influencer Leaderboard Service
+인플루언서별 적중률/평균 수익률/시그널 수를 InfluencerStats에 누적 합계로 유지
+
+- 시그널이 추가/삭제/수정될 때, 시그널의 기간별 가격이 들어올 때 해당 시그널의 기여분만 더하고 뺌
+- 리더보드 조회는 InfluencerStats 행만 읽으므로 시그널 수와 무관
+- rebuild()는 최초 1회 초기화/복구용 전체 재계산
+
+적중 기준: 매수 계열(STRONG_BUY/BUY/POSITIVE)은 수익률 > 0, 매도 계열(STRONG_SELL/SELL/CONCERN)은 수익률 < 0
+평균 수익률은 방향을 반영한 수익률 (매도 계열은 부호 반전) 의 평균
+
+실행: python -m src.services.leaderboard [--rebuild] [--fill]
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+from loguru import logger
+from sqlalchemy import and_, or_
+
+from ..db.database import get_db_session
+from ..db.models import InfluencerSignal, InfluencerStats, InfluencerAssetStats, PriceHistory
+
+KST = pytz.timezone('Asia/Seoul')
+
+# 기간 -> 시그널 후 경과일
+HORIZONS = {'1d': 1, '3d': 3, '1w': 7, '1m': 30}
+
+BULLISH_TYPES = ('STRONG_BUY', 'BUY', 'POSITIVE')
+BEARISH_TYPES = ('STRONG_SELL', 'SELL', 'CONCERN')
+
+
+def signal_direction(signal: InfluencerSignal) -> int:
+    """매수 계열 1, 매도 계열 -1, 그 외(HOLD/NEUTRAL 등) 0"""
+    signal_type = (signal.signal_type or '').upper()
+    if signal_type in BULLISH_TYPES:
+        return 1
+    if signal_type in BEARISH_TYPES:
+        return -1
+    return 0
+
+
+def counts_toward_stats(signal: InfluencerSignal) -> bool:
+    """AI 검증에서 기각된 시그널은 집계 제외"""
+    return signal.verdict != 'rejected'
+
+
+def contribution(signal: InfluencerSignal, horizon: str) -> Tuple[int, int, float]:
+    """
+    시그널 하나가 기간별 집계에 기여하는 값
+
+    Returns:
+        (scored, hit, 방향 반영 수익률)
+    """
+    value = getattr(signal, f'return_{horizon}')
+    direction = signal_direction(signal)
+    if value is None or direction == 0 or not counts_toward_stats(signal):
+        return 0, 0, 0.0
+    directed = value * direction
+    return 1, int(directed > 0), directed
+
+
+class InfluencerLeaderboard:
+    """인플루언서 리더보드 (증분 집계)"""
+
+    # ------------------------------------------------------------------
+    # 집계 행
+    # ------------------------------------------------------------------
+    def _stats(self, db, channel_id: str, channel_name: Optional[str] = None) -> InfluencerStats:
+        stats = db.query(InfluencerStats).filter(InfluencerStats.channel_id == channel_id).first()
+        if stats is None:
+            stats = InfluencerStats(channel_id=channel_id, channel_name=channel_name, signal_count=0,
+                                    main_asset_count=0)
+            for horizon in HORIZONS:
+                setattr(stats, f'scored_{horizon}', 0)
+                setattr(stats, f'hits_{horizon}', 0)
+                setattr(stats, f'return_sum_{horizon}', 0.0)
+            db.add(stats)
+            db.flush()
+        elif channel_name and stats.channel_name != channel_name:
+            stats.channel_name = channel_name
+        return stats
+
+    def _adjust_asset(self, db, stats: InfluencerStats, asset: Optional[str], delta: int):
+        """종목 언급 수 증감 + 대표 종목 갱신"""
+        if not asset:
+            return
+        row = db.query(InfluencerAssetStats).filter(
+            InfluencerAssetStats.channel_id == stats.channel_id,
+            InfluencerAssetStats.asset == asset
+        ).first()
+        if row is None:
+            row = InfluencerAssetStats(channel_id=stats.channel_id, asset=asset, signal_count=0)
+            db.add(row)
+        row.signal_count += delta
+        db.flush()
+
+        if delta > 0 and row.signal_count > (stats.main_asset_count or 0):
+            stats.main_asset, stats.main_asset_count = asset, row.signal_count
+        elif delta < 0 and asset == stats.main_asset:
+            # 대표 종목 수가 줄면 인덱스로 채널의 최다 언급 종목 다시 선택
+            top = db.query(InfluencerAssetStats).filter(
+                InfluencerAssetStats.channel_id == stats.channel_id,
+                InfluencerAssetStats.signal_count > 0
+            ).order_by(InfluencerAssetStats.signal_count.desc()).first()
+            stats.main_asset = top.asset if top else None
+            stats.main_asset_count = top.signal_count if top else 0
+
+    def _apply(self, db, signal: InfluencerSignal, sign: int):
+        if not counts_toward_stats(signal) or not signal.channel_id:
+            return
+        stats = self._stats(db, signal.channel_id, signal.channel_name)
+        stats.signal_count += sign
+        self._adjust_asset(db, stats, signal.asset, sign)
+        for horizon in HORIZONS:
+            scored, hit, value = contribution(signal, horizon)
+            if scored:
+                setattr(stats, f'scored_{horizon}', getattr(stats, f'scored_{horizon}') + sign * scored)
+                setattr(stats, f'hits_{horizon}', getattr(stats, f'hits_{horizon}') + sign * hit)
+                setattr(stats, f'return_sum_{horizon}', getattr(stats, f'return_sum_{horizon}') + sign * value)
+
+    # ------------------------------------------------------------------
+    # 증분 갱신 (호출한 쪽 트랜잭션 안에서 실행, 커밋은 호출한 쪽)
+    # ------------------------------------------------------------------
+    def signal_added(self, db, signal: InfluencerSignal):
+        """새 시그널 반영"""
+        self._apply(db, signal, 1)
+
+    def signal_removed(self, db, signal: InfluencerSignal):
+        """시그널 삭제 반영 (수정 시에는 변경 전 값으로 먼저 호출)"""
+        self._apply(db, signal, -1)
+
+    def apply_price_point(self, db, signal: InfluencerSignal, horizon: str, price: float) -> Optional[float]:
+        """
+        시그널의 기간별 가격 반영 -> return_{horizon} 갱신 + 집계에서 이전 기여분을 빼고 새 기여분을 더함
+
+        Args:
+            horizon: '1d' / '3d' / '1w' / '1m'
+            price: 해당 기간 종가
+
+        Returns:
+            계산된 수익률(%) 또는 시그널 시점 가격이 없으면 None
+        """
+        if horizon not in HORIZONS:
+            raise ValueError(f"Unknown horizon: {horizon}")
+        setattr(signal, f'price_{horizon}', price)
+        if not signal.price_at_signal:
+            return None
+
+        new_return = (price - signal.price_at_signal) / signal.price_at_signal * 100
+        old = contribution(signal, horizon)
+        setattr(signal, f'return_{horizon}', new_return)
+        new = contribution(signal, horizon)
+
+        if old != new and counts_toward_stats(signal) and signal.channel_id:
+            stats = self._stats(db, signal.channel_id, signal.channel_name)
+            setattr(stats, f'scored_{horizon}', getattr(stats, f'scored_{horizon}') + new[0] - old[0])
+            setattr(stats, f'hits_{horizon}', getattr(stats, f'hits_{horizon}') + new[1] - old[1])
+            setattr(stats, f'return_sum_{horizon}', getattr(stats, f'return_sum_{horizon}') + new[2] - old[2])
+        return new_return
+
+    def fill_returns_from_history(self, db, now: Optional[datetime] = None, limit: int = 1000) -> int:
+        """
+        기간이 지났는데 수익률이 비어 있는 시그널에 PriceHistory 종가 반영
+
+        비어 있는 시그널만 조회 (이미 채운 시그널은 다시 읽지 않음)
+
+        Args:
+            limit: 한 번에 읽는 시그널 수 - (mentioned_at, id) 순으로 페이지를 넘기므로
+                가격이 아직 없어 건너뛴 시그널이 뒤의 시그널을 가리지 않음
+
+        Returns:
+            반영한 가격 수
+        """
+        now = now or datetime.now(KST)
+        applied = 0
+        for horizon, days in HORIZONS.items():
+            cutoff = (now - timedelta(days=days)).replace(tzinfo=None)
+            pending = db.query(InfluencerSignal).filter(
+                InfluencerSignal.stock_code.isnot(None),
+                getattr(InfluencerSignal, f'return_{horizon}').is_(None),
+                InfluencerSignal.mentioned_at <= cutoff,
+                or_(InfluencerSignal.verdict.is_(None), InfluencerSignal.verdict != 'rejected')
+            ).order_by(InfluencerSignal.mentioned_at, InfluencerSignal.id)
+
+            after = None
+            while True:
+                query = pending
+                if after is not None:
+                    query = query.filter(or_(
+                        InfluencerSignal.mentioned_at > after[0],
+                        and_(InfluencerSignal.mentioned_at == after[0], InfluencerSignal.id > after[1])
+                    ))
+                page = query.limit(limit).all()
+
+                for signal in page:
+                    mentioned = signal.mentioned_at.strftime('%Y%m%d')
+                    if not signal.price_at_signal:
+                        entry = self._close_on_or_after(db, signal.stock_code, mentioned)
+                        if entry is None:
+                            continue
+                        signal.price_at_signal = entry
+                    target = (signal.mentioned_at + timedelta(days=days)).strftime('%Y%m%d')
+                    price = self._close_on_or_after(db, signal.stock_code, target)
+                    if price is not None and self.apply_price_point(db, signal, horizon, price) is not None:
+                        applied += 1
+
+                if len(page) < limit:
+                    break
+                after = (page[-1].mentioned_at, page[-1].id)
+        return applied
+
+    @staticmethod
+    def _close_on_or_after(db, stock_code: str, date: str) -> Optional[float]:
+        row = db.query(PriceHistory.close_price).filter(
+            PriceHistory.stock_code == stock_code,
+            PriceHistory.date >= date
+        ).order_by(PriceHistory.date).first()
+        return row[0] if row else None
+
+    # ------------------------------------------------------------------
+    # 초기화 / 조회
+    # ------------------------------------------------------------------
+    def rebuild(self, db) -> int:
+        """전체 시그널로 집계 재계산 (최초 1회 또는 복구용)"""
+        db.query(InfluencerAssetStats).delete()
+        db.query(InfluencerStats).delete()
+        db.flush()
+        count = 0
+        for signal in db.query(InfluencerSignal).yield_per(500):
+            self.signal_added(db, signal)
+            count += 1
+        logger.info(f"Influencer leaderboard rebuilt from {count} signals")
+        return count
+
+    def ensure_initialized(self, db) -> bool:
+        """시그널은 있는데 집계가 비어 있으면 (이전 버전 DB) 한 번 재계산"""
+        if db.query(InfluencerStats.id).first() or not db.query(InfluencerSignal.id).first():
+            return False
+        self.rebuild(db)
+        return True
+
+    def leaderboard(self, db, horizon: str = '1m') -> List[Dict]:
+        """
+        리더보드 조회 (집계 행만 읽음)
+
+        Returns:
+            [{channel_id, channel_name, signal_count, scored, accuracy, avg_return, main_stock}]
+        """
+        if horizon not in HORIZONS:
+            raise ValueError(f"Unknown horizon: {horizon}")
+        rows = []
+        for stats in db.query(InfluencerStats).filter(InfluencerStats.signal_count > 0).all():
+            scored = getattr(stats, f'scored_{horizon}') or 0
+            rows.append({
+                'channel_id': stats.channel_id,
+                'channel_name': stats.channel_name,
+                'signal_count': stats.signal_count,
+                'scored': scored,
+                'accuracy': round(getattr(stats, f'hits_{horizon}') / scored * 100, 1) if scored else None,
+                'avg_return': round(getattr(stats, f'return_sum_{horizon}') / scored, 1) if scored else None,
+                'main_stock': stats.main_asset,
+            })
+        return rows
+
+
+# 글로벌 인스턴스
+influencer_leaderboard = InfluencerLeaderboard()
+
+
+def fill_influencer_returns() -> int:
+    """스케줄러용: 새 종가를 시그널 수익률/리더보드에 반영"""
+    db = get_db_session()
+    try:
+        applied = influencer_leaderboard.fill_returns_from_history(db)
+        db.commit()
+        return applied
+    except Exception as e:
+        logger.error(f"Failed to fill influencer returns: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    from ..db.database import create_tables
+
+    create_tables()
+    db = get_db_session()
+    try:
+        if '--rebuild' in sys.argv:
+            influencer_leaderboard.rebuild(db)
+        if '--fill' in sys.argv:
+            influencer_leaderboard.fill_returns_from_history(db)
+        db.commit()
+        print(json.dumps(influencer_leaderboard.leaderboard(db), ensure_ascii=False, indent=2))
+    finally:
+        db.close()
@@ -0,0 +1,283 @@
+"""
+Response Cache Service
+조회 API 응답을 정규화된 쿼리 파라미터 기준으로 캐시 (read-through)
+
+- 엔드포인트별 TTL, 엔드포인트가 읽는 데이터 소스(filings/news/alerts) 등록
+- 수집기/파이프라인이 커밋 후 invalidate(source) 호출 -> 해당 소스를 읽는 엔드포인트 캐시 비움
+- 프로세스 간 무효화: invalidate 는 소스별 세대 번호를 DB(cache_generations)에 올리고, 각 API 프로세스는
+  조회 시 RESPONSE_CACHE_SYNC_INTERVAL 초마다 세대를 읽어 바뀐 소스의 캐시를 비움 (워커 수집 -> API 반영)
+- single-flight: 같은 키의 요청이 동시에 몰리면 첫 요청만 DB 조회, 나머지는 결과 공유
+- 무효화 도중 계산된 결과는 저장하지 않음 (세대 번호 비교)
+- stats(): 엔드포인트별 hit/miss/coalesced/hit_ratio
+
+사용:
+    @app.get("/api/feed")
+    @cached_response("feed", sources=("filings", "news"), ttl=settings.CACHE_TTL_FEED)
+    async def get_feed(..., db=Depends(get_async_db)): ...
+"""
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..config.settings import settings
+from ..db.database import SessionLocal, get_async_db_session
+from ..db.models import CacheGeneration, now_kst
+from ..monitoring.metrics import Counter, Gauge, metrics
+
+# 캐시 키에서 제외할 인자 (DB 세션 등 요청마다 다른 의존성)
+EXCLUDED_PARAMS = ('db', 'request', 'background_tasks')
+
+# 전체 무효화(소스 지정 없음)의 세대 키
+ALL_SOURCES = '*'
+
+
+def normalize_params(params: Dict[str, Any]) -> Tuple:
+    """None 제외, 이름순 정렬, 문자열 앞뒤 공백 제거 -> 해시 가능한 키"""
+    items = []
+    for name, value in sorted(params.items()):
+        if name in EXCLUDED_PARAMS or value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        items.append((name, value if isinstance(value, (int, float, bool, str)) else repr(value)))
+    return tuple(items)
+
+
+class _Namespace:
+    """엔드포인트 하나의 캐시 (LRU + TTL + 통계)"""
+
+    def __init__(self, name: str, ttl: float, sources: Iterable[str], max_entries: int):
+        self.name = name
+        self.ttl = ttl
+        self.sources = tuple(sources)
+        self.max_entries = max_entries
+        self.entries: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self.inflight: Dict[Tuple, asyncio.Future] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.generation += 1
+        self.invalidations += 1
+
+
+class ResponseCache:
+    """엔드포인트 응답 캐시"""
+
+    def __init__(self, enabled: Optional[bool] = None, max_entries: Optional[int] = None,
+                 sync_interval: Optional[float] = None):
+        self.enabled = settings.RESPONSE_CACHE_ENABLED if enabled is None else enabled
+        self.max_entries = max_entries or settings.RESPONSE_CACHE_MAX_ENTRIES
+        self.sync_interval = settings.RESPONSE_CACHE_SYNC_INTERVAL if sync_interval is None else sync_interval
+        self._namespaces: Dict[str, _Namespace] = {}
+        self._generations: Optional[Dict[str, int]] = None  # 마지막으로 읽은 공유 세대 (None: 아직 안 읽음)
+        self._synced_at = float('-inf')
+        self._publishing = set()  # 이벤트 루프에서 호출된 invalidate 의 DB 기록 태스크
+
+    def register(self, name: str, ttl: float, sources: Iterable[str] = ()) -> _Namespace:
+        """엔드포인트 캐시 등록 (이미 있으면 그대로 반환)"""
+        if name not in self._namespaces:
+            self._namespaces[name] = _Namespace(name, ttl, sources, self.max_entries)
+        return self._namespaces[name]
+
+    async def get_or_compute(self, name: str, params: Dict[str, Any],
+                             compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시 조회, 없으면 compute() 실행 후 저장 (동일 키 동시 요청은 한 번만 실행)
+
+        Args:
+            name: register()로 등록한 엔드포인트 이름
+            params: 요청 파라미터 (normalize_params로 키 생성)
+            compute: 실제 조회 코루틴 함수
+        """
+        namespace = self._namespaces[name]
+        if not self.enabled or namespace.ttl <= 0:
+            return await compute()
+
+        await self.sync()
+        key = normalize_params(params)
+        cached = namespace.entries.get(key)
+        if cached is not None:
+            expires_at, value = cached
+            if expires_at > time.monotonic():
+                namespace.entries.move_to_end(key)
+                namespace.hits += 1
+                return value
+            del namespace.entries[key]
+
+        inflight = namespace.inflight.get(key)
+        if inflight is not None:
+            namespace.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        namespace.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        namespace.inflight[key] = future
+        generation = namespace.generation
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없어도 "never retrieved" 경고 방지
+            raise
+        finally:
+            namespace.inflight.pop(key, None)
+
+        future.set_result(value)
+        # 계산 중 무효화되었으면 (새 데이터 커밋) 저장하지 않음
+        if generation == namespace.generation:
+            namespace.entries[key] = (time.monotonic() + namespace.ttl, value)
+            while len(namespace.entries) > namespace.max_entries:
+                namespace.entries.popitem(last=False)
+        return value
+
+    def invalidate(self, *sources: str) -> int:
+        """
+        데이터 소스가 바뀌었을 때 호출 (수집기 커밋 후) - 이 프로세스 캐시를 비우고 공유 세대를 올림
+
+        Args:
+            sources: 'filings', 'news', 'alerts' ... (인자가 없으면 전체)
+
+        Returns:
+            이 프로세스에서 비운 엔드포인트 캐시 수
+        """
+        cleared = self._clear(sources)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._publish(sources)
+        else:
+            # 수집기 코루틴에서 호출 -> DB 기록은 스레드에서 (이벤트 루프 차단 방지)
+            task = loop.create_task(asyncio.to_thread(self._publish, sources))
+            self._publishing.add(task)
+            task.add_done_callback(self._publishing.discard)
+        return cleared
+
+    def _clear(self, sources: Tuple[str, ...]) -> int:
+        cleared = 0
+        for namespace in self._namespaces.values():
+            if not sources or set(sources) & set(namespace.sources):
+                namespace.clear()
+                cleared += 1
+        if cleared:
+            logger.debug(f"Response cache invalidated: {sources or 'all'} ({cleared} endpoints)")
+        return cleared
+
+    def _publish(self, sources: Tuple[str, ...]):
+        """소스별 공유 세대 +1 (없으면 1로 생성)"""
+        table = CacheGeneration.__table__
+        db = SessionLocal()
+        try:
+            insert = postgresql.insert if db.bind.dialect.name == 'postgresql' else sqlite.insert
+            for source in sorted(set(sources)) or [ALL_SOURCES]:
+                db.execute(insert(table).values(source=source, generation=1, updated_at=now_kst())
+                           .on_conflict_do_update(index_elements=[table.c.source],
+                                                  set_={'generation': table.c.generation + 1,
+                                                        'updated_at': now_kst()}))
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning(f"Response cache invalidation not shared with other processes: {e}")
+        finally:
+            db.close()
+
+    async def sync(self) -> int:
+        """
+        다른 프로세스(워커 등)의 무효화 반영 - sync_interval 초마다 한 번만 DB 조회
+
+        Returns:
+            비운 엔드포인트 캐시 수
+        """
+        now = time.monotonic()
+        if now - self._synced_at < self.sync_interval:
+            return 0
+        self._synced_at = now
+        try:
+            async with get_async_db_session() as db:
+                rows = (await db.execute(select(CacheGeneration.source, CacheGeneration.generation))).all()
+        except SQLAlchemyError as e:
+            logger.debug(f"Response cache generations not read: {e}")
+            return 0
+
+        generations, previous = dict(rows), self._generations
+        self._generations = generations
+        if previous is None:
+            return 0  # 첫 조회는 기준값만 기록
+        changed = tuple(source for source, generation in generations.items() if previous.get(source) != generation)
+        if not changed:
+            return 0
+        return self._clear(() if ALL_SOURCES in changed else changed)
+
+    def stats(self) -> Dict[str, Dict]:
+        """엔드포인트별 캐시 통계"""
+        result = {}
+        for name, namespace in self._namespaces.items():
+            lookups = namespace.hits + namespace.misses + namespace.coalesced
+            result[name] = {
+                'ttl': namespace.ttl,
+                'sources': list(namespace.sources),
+                'entries': len(namespace.entries),
+                'hits': namespace.hits,
+                'misses': namespace.misses,
+                'coalesced': namespace.coalesced,
+                'invalidations': namespace.invalidations,
+                # DB 조회 없이 응답한 비율 (coalesced 포함)
+                'hit_ratio': round((namespace.hits + namespace.coalesced) / lookups, 3) if lookups else None,
+            }
+        return result
+
+
+# 글로벌 인스턴스
+response_cache = ResponseCache()
+
+
+def cached_response(name: str, sources: Iterable[str] = (), ttl: Optional[float] = None):
+    """
+    FastAPI 엔드포인트 데코레이터 (@app.get 아래에 적용)
+
+    엔드포인트 키워드 인자(db 등 제외)로 캐시 키 생성. functools.wraps로 원래 시그니처를 유지하므로
+    FastAPI 파라미터/의존성 해석은 그대로 동작.
+    """
+    response_cache.register(name, settings.RESPONSE_CACHE_DEFAULT_TTL if ttl is None else ttl, sources)
+
+    def decorator(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            return await response_cache.get_or_compute(name, kwargs, lambda: endpoint(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def invalidate_cache(*sources: str) -> int:
+    """수집기/파이프라인용: 커밋 후 관련 엔드포인트 캐시 무효화"""
+    return response_cache.invalidate(*sources)
+
+
+def _cache_metrics():
+    """/metrics 용 캐시 통계 (렌더링 시점에 읽음)"""
+    lookups = Counter('invest_response_cache_lookups_total', 'Response cache lookups', ('endpoint', 'result'))
+    entries = Gauge('invest_response_cache_entries', 'Response cache entries', ('endpoint',))
+    for name, stats in response_cache.stats().items():
+        for result in ('hits', 'misses', 'coalesced'):
+            lookups.inc(stats[result], endpoint=name, result=result)
+        entries.set(stats['entries'], endpoint=name)
+    return [lookups, entries]
+
+
+metrics.register_collector(_cache_metrics)
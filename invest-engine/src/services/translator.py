@@ -2,7 +2,6 @@
 News Translation Service
 OpenAI GPT-4o-mini를 사용한 영문 뉴스 제목 번역/요약 서비스
 """
-import openai
 import asyncio
 import json
 from typing import List, Dict, Optional
@@ -14,19 +13,28 @@ from sqlalchemy import and_
 from ..config.settings import settings
 from ..db.database import get_db_session
 from ..db.models import News
+from .response_cache import invalidate_cache
+from ..monitoring.metrics import llm_completion
+from ..monitoring.tracing import traced
 
 
 class NewsTranslator:
     """뉴스 번역/요약 서비스"""
     
     def __init__(self):
-        self.openai_client = None
+        self._openai_client = None
         self.api_key = os.getenv('OPENAI_API_KEY')
         
         if not self.api_key:
             logger.warning("OPENAI_API_KEY not found in environment")
-        else:
-            self.openai_client = openai.AsyncOpenAI(api_key=self.api_key)
+    
+    @property
+    def openai_client(self):
+        """OpenAI 클라이언트 (openai import 가 무거워 첫 사용 때 생성)"""
+        if self._openai_client is None and self.api_key:
+            import openai
+            self._openai_client = openai.AsyncOpenAI(api_key=self.api_key)
+        return self._openai_client
     
     async def translate_batch(self, titles: List[str], batch_size: int = 15) -> List[str]:
         """
@@ -88,7 +96,8 @@ class NewsTranslator:
 - 간결하고 이해하기 쉽게 번역
 - 원본의 의미와 뉘앙스 보존"""
         
-        response = await self.openai_client.chat.completions.create(
+        response = await llm_completion(
+            self.openai_client, 'translate_titles',
             model="gpt-4o-mini",
             messages=[
                 {
@@ -128,6 +137,7 @@ class NewsTranslator:
             logger.error(f"번역 결과 파싱 실패: {e}, content: {content}")
             return titles  # 실패시 원문 반환
     
+    @traced('translator.translate_news')
     async def translate_untranslated_news(self, market: str = None, limit: int = 50) -> int:
         """
         번역되지 않은 뉴스들을 일괄 번역
@@ -182,6 +192,8 @@ class NewsTranslator:
                     logger.debug(f"번역: {news.title} -> {translated_title}")
             
             db.commit()
+            if updated_count:
+                invalidate_cache('news')
             logger.info(f"뉴스 번역 완료: {updated_count}개")
             
             return updated_count
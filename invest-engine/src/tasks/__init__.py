@@ -0,0 +1,6 @@
+"""
+Task queue module (worker 는 src.tasks.worker 에서 직접 import - 오케스트레이터를 불러오므로)
+"""
+from .queue import task_queue, TaskQueue, default_worker_id
+
+__all__ = ['task_queue', 'TaskQueue', 'default_worker_id']
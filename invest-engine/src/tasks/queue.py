@@ -0,0 +1,345 @@
+"""
+Durable task queue
+task_queue 테이블 기반 작업 큐 - API 프로세스(스케줄러)는 넣기만 하고 worker.py 프로세스들이 가져가 실행
+
+- enqueue: 같은 작업이 이미 대기 중이면 넣지 않음 (부분 UNIQUE 인덱스라 여러 프로세스가 동시에 넣어도 1개)
+  schedule/manual 은 실행 중인 것도 있으면 건너뜀, upstream 은 실행 중이어도 1개 대기 (끝난 뒤 다시 실행)
+- claim: 실행할 작업 하나를 임대 (locked_until) 와 함께 가져감
+  PostgreSQL 은 SELECT ... FOR UPDATE SKIP LOCKED, SQLite 는 status 조건부 UPDATE 로 한 워커만 성공
+  자원 한도(ORCHESTRATOR_BUDGETS)는 실행 중인 작업 수를 세어 모든 워커에 걸쳐 적용
+  (PostgreSQL 은 자원별 advisory lock 으로 세기~가져가기를 직렬화, SQLite 는 DB 쓰기 잠금)
+- heartbeat: 실행 중 임대 연장, 워커가 죽으면 임대가 끝난 뒤 다른 워커가 다시 실행
+- fail: attempts < max_attempts 면 backoff 뒤 재시도, 아니면 failed
+"""
+import json
+import os
+import socket
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import func, text
+from sqlalchemy.exc import IntegrityError
+
+from ..config.settings import settings
+from ..db.database import get_db_session
+from ..db.models import QueuedTask, KST
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+# claim 한 번에 살펴볼 대기 작업 수 (자원 한도에 걸린 작업은 건너뛰고 다음 후보)
+CLAIM_CANDIDATES = 20
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _now() -> datetime:
+    return datetime.now(KST)
+
+
+def _resources(task: QueuedTask) -> List[str]:
+    return [r for r in (task.resources or '').split(',') if r]
+
+
+def _task_dict(task: QueuedTask) -> Dict:
+    return {
+        'id': task.id,
+        'name': task.name,
+        'source': task.source,
+        'payload': task.payload or {},
+        'resources': _resources(task),
+        'attempts': task.attempts,
+        'max_attempts': task.max_attempts,
+        'locked_by': task.locked_by,
+    }
+
+
+class TaskQueue:
+    """DB 작업 큐"""
+
+    def __init__(self, lease_seconds: int = None, max_attempts: int = None, backoff_seconds: int = None):
+        self.lease_seconds = lease_seconds or settings.TASK_LEASE_SECONDS
+        self.max_attempts = max_attempts or settings.TASK_MAX_ATTEMPTS
+        self.backoff_seconds = backoff_seconds or settings.TASK_RETRY_BACKOFF_SECONDS
+
+    def enqueue(self, name: str, source: str = 'schedule', payload: Dict = None,
+                resources: Sequence[str] = (), priority: int = 0, dedupe_key: str = None,
+                delay_seconds: float = 0) -> Optional[int]:
+        """
+        작업 넣기
+
+        Args:
+            name: 작업 ID (오케스트레이터 작업)
+            source: schedule / manual / upstream
+            payload: 작업 인자 (JSON)
+            resources: 자원 한도 이름
+            priority: 클수록 먼저 실행
+            dedupe_key: 중복 판단 키 (기본 name)
+            delay_seconds: 지연 실행
+
+        Returns:
+            Optional[int]: 새 작업 ID, 이미 대기/실행 중이라 넣지 않았으면 None
+        """
+        dedupe_key = dedupe_key or name
+        db = get_db_session()
+        try:
+            blocking = ('queued',) if source == 'upstream' else ACTIVE_STATUSES
+            existing = db.query(QueuedTask.id).filter(
+                QueuedTask.dedupe_key == dedupe_key,
+                QueuedTask.status.in_(blocking)
+            ).first()
+            if existing:
+                logger.debug(f"Task {dedupe_key} already {'/'.join(blocking)}, not enqueued ({source})")
+                return None
+
+            now = _now()
+            task = QueuedTask(
+                name=name,
+                dedupe_key=dedupe_key,
+                source=source,
+                payload=payload or {},
+                resources=','.join(sorted(resources)),
+                priority=priority,
+                status='queued',
+                max_attempts=self.max_attempts,
+                run_at=now + timedelta(seconds=delay_seconds),
+                created_at=now
+            )
+            db.add(task)
+            db.commit()
+            logger.debug(f"Enqueued task {task.id} {name} ({source})")
+            return task.id
+        except IntegrityError:
+            db.rollback()  # 다른 프로세스가 먼저 넣음
+            return None
+        finally:
+            db.close()
+
+    def claim(self, worker_id: str, budgets: Dict[str, int] = None,
+              names: Optional[Sequence[str]] = None) -> Optional[Dict]:
+        """
+        실행할 작업 하나 가져오기
+
+        Args:
+            worker_id: 워커 ID
+            budgets: 자원별 전체 동시 실행 한도
+            names: 이 워커가 실행할 작업 ID (None 이면 전부)
+
+        Returns:
+            Optional[Dict]: 작업 (id, name, source, payload, resources, attempts ...), 없으면 None
+        """
+        budgets = budgets or {}
+        db = get_db_session()
+        try:
+            self._release_expired(db)
+
+            now = _now()
+            query = db.query(QueuedTask).filter(
+                QueuedTask.status == 'queued',
+                QueuedTask.run_at <= now
+            )
+            if names:
+                query = query.filter(QueuedTask.name.in_(list(names)))
+            query = query.order_by(QueuedTask.priority.desc(), QueuedTask.id).limit(CLAIM_CANDIDATES)
+            postgres = db.bind.dialect.name == 'postgresql'
+            if postgres:
+                query = query.with_for_update(skip_locked=True)
+            candidates = query.all()
+
+            if postgres:
+                # 한도가 있는 자원마다 트랜잭션 advisory lock -> 같은 자원을 쓰는 claim 은 세기~UPDATE 를 한 번에 하나씩
+                # (정렬된 순서로 한 번에 잡으므로 워커끼리 교착 없음, commit/rollback 때 풀림)
+                locked = sorted({r for task in candidates for r in _resources(task) if r in budgets})
+                for resource in locked:
+                    db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                               {'key': f"task_queue:{resource}"})
+            in_use = self._resources_in_use(db)
+
+            for task in candidates:
+                if any(in_use[r] >= budgets[r] for r in _resources(task) if r in budgets):
+                    continue
+                claimed = db.query(QueuedTask).filter(
+                    QueuedTask.id == task.id,
+                    QueuedTask.status == 'queued'
+                ).update({
+                    'status': 'running',
+                    'attempts': QueuedTask.attempts + 1,
+                    'locked_by': worker_id,
+                    'locked_until': now + timedelta(seconds=self.lease_seconds),
+                    'started_at': now,
+                }, synchronize_session=False)
+                if claimed != 1:
+                    continue  # 다른 워커가 먼저 가져감
+                db.commit()
+                db.refresh(task)
+                return _task_dict(task)
+
+            db.commit()
+            return None
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def _resources_in_use(db) -> Counter:
+        """실행 중 작업의 자원별 개수"""
+        in_use = Counter()
+        for (resources,) in db.query(QueuedTask.resources).filter(QueuedTask.status == 'running'):
+            in_use.update(r for r in (resources or '').split(',') if r)
+        return in_use
+
+    def _release_expired(self, db):
+        """임대가 끝난 실행 중 작업 (워커 종료/정지) -> 재시도 또는 실패"""
+        expired = db.query(QueuedTask).filter(
+            QueuedTask.status == 'running',
+            QueuedTask.locked_until < _now()
+        ).all()
+        for task in expired:
+            logger.warning(f"Task {task.id} {task.name} lease expired (worker {task.locked_by})")
+            self._retry_or_fail_commit(db, task, f"lease expired (worker {task.locked_by})")
+
+    def _retry_or_fail(self, db, task: QueuedTask, error: str):
+        task.last_error = error[:2000]
+        task.locked_by = None
+        task.locked_until = None
+        waiting = db.query(QueuedTask.id).filter(
+            QueuedTask.dedupe_key == task.dedupe_key,
+            QueuedTask.status == 'queued',
+            QueuedTask.id != task.id
+        ).first()
+        if task.attempts < task.max_attempts and not waiting:
+            task.status = 'queued'
+            task.run_at = _now() + timedelta(seconds=self.backoff_seconds * 2 ** max(task.attempts - 1, 0))
+        else:
+            # 재시도 한도 초과, 또는 같은 작업이 이미 대기 중 (그 실행이 대신함)
+            task.status = 'failed'
+            task.finished_at = _now()
+
+    def _retry_or_fail_commit(self, db, task: QueuedTask, error: str) -> str:
+        """
+        _retry_or_fail 후 커밋
+
+        대기 중 확인과 커밋 사이에 같은 작업이 새로 들어오면 (upstream enqueue) 다시 대기로 바꾸는 커밋이
+        ix_task_queue_dedupe 에 걸림 -> 롤백하고 실패로 기록 (새로 들어온 작업이 대신 실행)
+
+        Returns:
+            최종 상태 'queued' / 'failed'
+        """
+        task_id, holder = task.id, task.locked_by
+        self._retry_or_fail(db, task, error)
+        try:
+            db.commit()
+            return task.status
+        except IntegrityError:
+            db.rollback()
+        db.query(QueuedTask).filter(
+            QueuedTask.id == task_id,
+            QueuedTask.status == 'running',
+            QueuedTask.locked_by == holder
+        ).update({
+            'status': 'failed',
+            'last_error': error[:2000],
+            'locked_by': None,
+            'locked_until': None,
+            'finished_at': _now(),
+        }, synchronize_session=False)
+        db.commit()
+        logger.info(f"Task {task_id} not re-queued: the same task was queued meanwhile")
+        return 'failed'
+
+    def heartbeat(self, task_id: int, worker_id: str) -> bool:
+        """임대 연장 (False: 임대를 잃음 - 다른 워커가 가져감)"""
+        db = get_db_session()
+        try:
+            updated = db.query(QueuedTask).filter(
+                QueuedTask.id == task_id,
+                QueuedTask.status == 'running',
+                QueuedTask.locked_by == worker_id
+            ).update({'locked_until': _now() + timedelta(seconds=self.lease_seconds)},
+                     synchronize_session=False)
+            db.commit()
+            return updated == 1
+        finally:
+            db.close()
+
+    def complete(self, task_id: int, worker_id: str, result=None):
+        """작업 완료"""
+        db = get_db_session()
+        try:
+            db.query(QueuedTask).filter(
+                QueuedTask.id == task_id,
+                QueuedTask.locked_by == worker_id
+            ).update({
+                'status': 'done',
+                'result': json.dumps(result, ensure_ascii=False, default=str),
+                'locked_by': None,
+                'locked_until': None,
+                'finished_at': _now(),
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def fail(self, task_id: int, worker_id: str, error: str):
+        """작업 실패 (재시도 가능하면 backoff 뒤 다시 대기)"""
+        db = get_db_session()
+        try:
+            task = db.query(QueuedTask).filter(
+                QueuedTask.id == task_id,
+                QueuedTask.locked_by == worker_id
+            ).first()
+            if task is None:
+                return  # 임대를 잃어 다른 워커가 처리 중
+            if self._retry_or_fail_commit(db, task, error) == 'queued':
+                logger.warning(f"Task {task_id} {task.name} failed (attempt {task.attempts}/{task.max_attempts}), "
+                               f"retry at {task.run_at:%H:%M:%S}: {error}")
+            else:
+                logger.error(f"Task {task_id} {task.name} failed permanently: {error}")
+        finally:
+            db.close()
+
+    def stats(self) -> Dict:
+        """작업별/상태별 개수 + 실행 중 작업"""
+        db = get_db_session()
+        try:
+            counts: Dict[str, Dict[str, int]] = {}
+            for name, status, count in db.query(
+                QueuedTask.name, QueuedTask.status, func.count(QueuedTask.id)
+            ).group_by(QueuedTask.name, QueuedTask.status):
+                counts.setdefault(name, {})[status] = count
+            running: List[Dict] = [
+                {
+                    'id': task.id,
+                    'name': task.name,
+                    'worker': task.locked_by,
+                    'started_at': task.started_at.isoformat() if task.started_at else None,
+                    'attempts': task.attempts,
+                }
+                for task in db.query(QueuedTask).filter(QueuedTask.status == 'running').order_by(QueuedTask.id)
+            ]
+            return {'counts': counts, 'running': running}
+        finally:
+            db.close()
+
+    def purge(self, older_than_days: int = None) -> int:
+        """끝난(done/failed) 작업 기록 삭제"""
+        days = older_than_days if older_than_days is not None else settings.TASK_RETENTION_DAYS
+        db = get_db_session()
+        try:
+            deleted = db.query(QueuedTask).filter(
+                QueuedTask.status.in_(['done', 'failed']),
+                QueuedTask.finished_at < _now() - timedelta(days=days)
+            ).delete(synchronize_session=False)
+            db.commit()
+            return deleted
+        finally:
+            db.close()
+
+
+# 글로벌 큐 인스턴스
+task_queue = TaskQueue()
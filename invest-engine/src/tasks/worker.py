@@ -0,0 +1,143 @@
+"""
+Task worker
+task_queue 에서 작업을 가져와 오케스트레이터 작업 함수로 실행 (실행: python worker.py)
+
+- 프로세스당 WORKER_CONCURRENCY 개까지 동시에 실행, 자원 한도는 큐가 모든 워커에 걸쳐 적용
+- 실행 중에는 임대를 TASK_LEASE_SECONDS/3 마다 연장
+- 성공하면 하위 작업을 큐에 넣음 (API 프로세스의 오케스트레이터와 같은 규칙)
+- SIGTERM/SIGINT: 새 작업은 가져오지 않고 실행 중인 작업이 끝나면 종료
+"""
+import asyncio
+import signal
+import time
+from typing import Dict, Optional, Sequence
+
+from loguru import logger
+
+from ..config.settings import settings
+from ..scheduler.orchestrator import orchestrator
+from .queue import TaskQueue, task_queue, default_worker_id
+
+PURGE_INTERVAL_SECONDS = 3600
+
+
+class TaskWorker:
+    """작업 큐 워커 (프로세스 하나)"""
+
+    def __init__(self, worker_id: str = None, concurrency: int = None,
+                 names: Optional[Sequence[str]] = None, queue: TaskQueue = None):
+        """
+        Args:
+            worker_id: 워커 ID (기본 hostname:pid)
+            concurrency: 동시 실행 작업 수 (기본 WORKER_CONCURRENCY)
+            names: 실행할 작업 ID (None 이면 전부)
+            queue: 작업 큐 (기본 글로벌 task_queue)
+        """
+        self.worker_id = worker_id or default_worker_id()
+        self.concurrency = max(concurrency or settings.WORKER_CONCURRENCY, 1)
+        self.names = list(names) if names else None
+        self.queue = queue or task_queue
+        self.processed = 0
+        self.failed = 0
+        self._stopping = False
+        self._active = set()
+
+        unknown = [name for name in self.names or [] if name not in orchestrator.jobs]
+        if unknown:
+            raise ValueError(f"Unknown jobs: {unknown} (available: {sorted(orchestrator.jobs)})")
+
+    def stop(self):
+        if not self._stopping:
+            logger.info(f"Worker {self.worker_id} stopping after {len(self._active)} running tasks")
+        self._stopping = True
+
+    async def run(self, exit_when_idle: bool = False):
+        """
+        작업 처리 루프
+
+        Args:
+            exit_when_idle: 큐가 비고 실행 중인 작업이 없으면 종료 (테스트 / 일괄 처리)
+        """
+        orchestrator.use_queue = True  # 하위 작업은 항상 큐로
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows / 메인 스레드가 아님
+
+        logger.info(f"Worker {self.worker_id} started (concurrency={self.concurrency}, "
+                    f"jobs={','.join(self.names) if self.names else 'all'}, budgets={orchestrator.budgets})")
+        last_purge = 0.0
+        while not self._stopping:
+            claimed = 0
+            while len(self._active) < self.concurrency and not self._stopping:
+                try:
+                    task = await asyncio.to_thread(self.queue.claim, self.worker_id, orchestrator.budgets, self.names)
+                except Exception as e:
+                    logger.error(f"Task claim failed: {e}")
+                    task = None
+                if task is None:
+                    break
+                claimed += 1
+                runner = asyncio.create_task(self._run_task(task))
+                self._active.add(runner)
+                runner.add_done_callback(self._active.discard)
+
+            if exit_when_idle and not claimed and not self._active:
+                break
+
+            if time.monotonic() - last_purge > PURGE_INTERVAL_SECONDS:
+                last_purge = time.monotonic()
+                try:
+                    purged = await asyncio.to_thread(self.queue.purge)
+                    if purged:
+                        logger.info(f"Purged {purged} finished tasks")
+                except Exception as e:
+                    logger.warning(f"Task purge failed: {e}")
+
+            # 빈 슬롯이 생기거나 폴링 간격이 지나면 다시 가져옴
+            if self._active:
+                await asyncio.wait(self._active, timeout=settings.WORKER_POLL_SECONDS,
+                                   return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await asyncio.sleep(settings.WORKER_POLL_SECONDS)
+
+        if self._active:
+            await asyncio.gather(*self._active, return_exceptions=True)
+        logger.info(f"Worker {self.worker_id} stopped: {self.processed} done, {self.failed} failed")
+
+    async def _heartbeat(self, task_id: int):
+        interval = max(self.queue.lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            if not await asyncio.to_thread(self.queue.heartbeat, task_id, self.worker_id):
+                logger.warning(f"Lost lease on task {task_id}")
+                return
+
+    async def _run_task(self, task: Dict):
+        """작업 하나 실행 -> 완료/실패 기록, 하위 작업 큐에 넣기"""
+        name = task['name']
+        logger.info(f"Running task {task['id']} {name} ({task['source']}, attempt {task['attempts']})")
+        heartbeat = asyncio.create_task(self._heartbeat(task['id']))
+        try:
+            if name not in orchestrator.jobs:
+                result, error = None, f"unknown job '{name}'"
+            else:
+                result = await orchestrator.execute(name)
+                error = None if result is not None else "job reported failure (see worker log)"
+        except Exception as e:
+            result, error = None, str(e)
+        finally:
+            heartbeat.cancel()
+
+        try:
+            if result is None:
+                self.failed += 1
+                await asyncio.to_thread(self.queue.fail, task['id'], self.worker_id, error)
+                return
+            self.processed += 1
+            await asyncio.to_thread(self.queue.complete, task['id'], self.worker_id, result)
+            await orchestrator.trigger_downstream(name, result, task['source'])
+        except Exception as e:
+            logger.error(f"Failed to record task {task['id']} {name}: {e}")
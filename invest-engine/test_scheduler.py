@@ -8,30 +8,32 @@ import os
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.scheduler import auto_scheduler
+from src.scheduler.orchestrator import orchestrator
 
 async def test_scheduler():
     """스케줄러 기능 테스트"""
-    print("🚀 Auto Collection Scheduler Test Starting...")
+    print("🚀 Job Orchestrator Test Starting...")
     
     # 스케줄러 시작
-    await auto_scheduler.start()
+    await orchestrator.start()
     
     # 상태 확인
-    status = auto_scheduler.get_scheduler_status()
+    status = orchestrator.get_jobs_status()
     print(f"\n📊 Scheduler Status:")
     print(f"  - Running: {status['running']}")
-    print(f"  - Total Jobs: {status['total_jobs']}")
+    print(f"  - Total Jobs: {len(status['jobs'])}")
+    print(f"  - Budgets: {status['budgets']}")
     
     print(f"\n📅 Scheduled Jobs:")
     for job in status['jobs']:
-        print(f"  - {job['name']}: {job['next_run']}")
+        after = f" (after {', '.join(job['after'])})" if job['after'] else ""
+        print(f"  - {job['name']}: {job['next_run']}{after}")
     
     print(f"\n⏱️  Waiting 10 seconds...")
     await asyncio.sleep(10)
     
     # 스케줄러 중지
-    await auto_scheduler.stop()
+    await orchestrator.stop()
     print(f"\n✅ Test completed successfully!")
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+"""
+Investment Engine - Task worker entry point
+API 프로세스(TASK_QUEUE_ENABLED=True)가 task_queue 에 넣은 수집/분석/알림 작업 실행
+
+실행:
+  python worker.py                                   # 워커 1개 (WORKER_CONCURRENCY 개 동시 실행)
+  python worker.py --processes 4                     # 코어 수만큼 프로세스
+  python worker.py --only filing_analysis,news_translate   # LLM 작업 전용 워커 (다른 서버에서)
+  python worker.py --drain                           # 대기 작업을 모두 처리하고 종료
+
+여러 서버에서 실행하려면 같은 DATABASE_URL (PostgreSQL) 을 가리키면 됨.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import sys
+
+from loguru import logger
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.config.settings import settings
+
+
+def setup_logging():
+    logger.add(
+        settings.LOG_FILE,
+        level=settings.LOG_LEVEL,
+        rotation="1 day",
+        retention="30 days",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {process} | {name}:{function}:{line} | {message}"
+    )
+
+
+def run_worker(concurrency: int, names, drain: bool):
+    """워커 프로세스 하나 실행"""
+    setup_logging()
+    from src.tasks.worker import TaskWorker
+
+    worker = TaskWorker(concurrency=concurrency, names=names)
+    asyncio.run(worker.run(exit_when_idle=drain))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=1, help="워커 프로세스 수")
+    parser.add_argument('--concurrency', type=int, default=settings.WORKER_CONCURRENCY,
+                        help="프로세스당 동시 실행 작업 수")
+    parser.add_argument('--only', default='', help="실행할 작업 ID (쉼표 구분, 기본 전부)")
+    parser.add_argument('--drain', action='store_true', help="큐가 비면 종료")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.only.split(',') if name.strip()] or None
+
+    from src.db.database import create_tables
+    create_tables()
+
+    if args.processes <= 1:
+        run_worker(args.concurrency, names, args.drain)
+        return
+
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(target=run_worker, args=(args.concurrency, names, args.drain), name=f"worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def forward(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()  # 자식은 SIGTERM 을 받으면 실행 중인 작업을 끝내고 종료
+
+    signal.signal(signal.SIGTERM, forward)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()  # Ctrl+C 는 자식에게도 전달됨
+
+    sys.exit(max((process.exitcode or 0) for process in processes))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,21 @@
 코린이 아빠 194개 시그널 전체 Claude Opus 검증
 - _all_signals_194.json의 모든 시그널을 Claude Opus로 검증
 - 타임스탬프 추출도 함께 수행
+- 같은 영상의 시그널은 한 번에 묶어서 검증 (자막 프롬프트 캐싱)
+- 영상 묶음을 동시에 요청하고 시그널 단위 체크포인트로 중단 시 재개
 """
 import json, os, sys, io, re
 from datetime import datetime
 from anthropic import Anthropic
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'smtr_data', 'corinpapa1106'))
+from grouped_verify import group_signals_by_video, verify_video_signals, verify_single_signal, format_usage
+from verify_runner import CheckpointLog, RateLimitedClient, run_units, signal_key, is_overload_error
+
+CONCURRENCY = 8
+REQUESTS_PER_MINUTE = 50
+CHECKPOINT_FILE = 'C:\\Users\\Mario\\work\\invest-sns\\smtr_data\\corinpapa1106\\_claude_verify_full_checkpoint.jsonl'
+
 # UTF-8 출력 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True)
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', line_buffering=True)
@@ -170,138 +180,138 @@ def create_claude_prompt():
 
 엄격하게 검증하되, 자막 내용만을 기준으로 판단하세요."""
 
-def verify_signal_with_claude(client, signal, subtitle, signal_index):
-    """Claude로 개별 시그널 검증"""
-    
-    prompt = create_claude_prompt()
-    
-    # 자막이 너무 길면 자르기 (토큰 제한)
-    if len(subtitle) > 8000:
-        subtitle = subtitle[:8000] + "\n\n[자막이 너무 길어서 일부만 표시]"
-    
-    user_message = f"""## 원본 자막
-{subtitle}
-
-## AI가 추출한 시그널 #{signal_index}
-**종목**: {signal.get('asset', 'N/A')}
-**시그널**: {signal.get('signal_type', 'N/A')}
-**내용**: {signal.get('content', 'N/A')}
-**신뢰도**: {signal.get('confidence', 'N/A')}
-**맥락**: {signal.get('context', 'N/A')}
-**비디오**: {signal.get('video_id', 'N/A')}
-**제목**: {signal.get('title', 'N/A')}
-
-위 시그널이 자막 내용과 정확히 일치하는지 검증해주세요."""
-
+def verify_signal_with_claude(client, signal, subtitle, signal_index, video_id='', title=''):
+    """Claude로 개별 시그널 검증 (묶음과 같은 캐시 프리픽스 사용)"""
     try:
-        response = client.messages.create(
-            model="claude-3-haiku-20240307",  # 현재 사용 가능한 모델
-            max_tokens=1000,
-            temperature=0.1,
-            messages=[
-                {"role": "user", "content": f"{prompt}\n\n{user_message}"}
-            ]
+        verdict, usage = verify_single_signal(
+            client, signal_index, signal, subtitle, create_claude_prompt(),
+            model="claude-3-haiku-20240307", video_id=video_id, title=title
         )
-        
-        raw = response.content[0].text.strip()
-        
-        # JSON 추출 시도
-        if raw.startswith('{'):
-            return json.loads(raw)
-        
-        # ```json ... ``` 블록 찾기
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', raw, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group(1))
-        
-        # 단순 JSON 블록 찾기
-        json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', raw, re.DOTALL)
-        if json_match:
-            return json.loads(json_match.group())
-        
-        raise json.JSONDecodeError("No JSON found", raw, 0)
-        
-    except json.JSONDecodeError as e:
-        print(f"⚠️ Claude 응답 JSON 파싱 실패: {e}")
-        raw_text = response.content[0].text if 'response' in locals() else "N/A"
-        return {
-            "verdict": "error",
-            "confidence": 0.0,
-            "reason": f"응답 파싱 실패: {str(e)}",
-            "raw_response": raw_text[:500]
-        }
-    
+        print(f"   💰 #{signal_index} 단건: {format_usage(usage)}")
     except Exception as e:
+        # 과부하/속도 제한 재시도를 다 써도 실패하면 영상 단위 실패 -> 다음 실행에서 재시도
+        if is_overload_error(e):
+            raise
         print(f"⚠️ Claude API 호출 실패: {e}")
         return {
             "verdict": "error", 
             "confidence": 0.0,
             "reason": f"API 호출 실패: {str(e)}"
         }
+    
+    if verdict is None:
+        return {
+            "verdict": "error",
+            "confidence": 0.0,
+            "reason": "응답 파싱 실패"
+        }
+    return verdict
+
+def verify_video_with_claude(client, indexed_signals, subtitle, video_id):
+    """Claude로 한 영상의 시그널 묶음 검증 (자막 프리픽스 캐싱)
+
+    묶음 응답에서 빠진 시그널만 단건 검증으로 다시 요청한다.
+    단건 요청도 같은 system 블록(지시문 + 자막)을 쓰므로 캐시된 프리픽스를 읽는다.
+    """
+    title = indexed_signals[0][1].get('title', '')
+
+    try:
+        verdicts, usage = verify_video_signals(
+            client, indexed_signals, subtitle, create_claude_prompt(),
+            model="claude-3-haiku-20240307", video_id=video_id, title=title
+        )
+        print(f"   💰 {format_usage(usage)}")
+    except Exception as e:
+        # 과부하/속도 제한 재시도를 다 써도 실패하면 영상 단위 실패 -> 다음 실행에서 재시도
+        if is_overload_error(e):
+            raise
+        print(f"⚠️ 묶음 검증 실패, 단건 검증으로 전환: {e}")
+        verdicts = {}
+
+    for index, signal in indexed_signals:
+        if index not in verdicts:
+            verdicts[index] = verify_signal_with_claude(client, signal, subtitle, index, video_id, title)
+
+    return verdicts
 
 def run_full_verification(signals, client):
-    """194개 시그널 전체 검증"""
-    print(f"🤖 Claude 전체 검증 시작: {len(signals)}개 시그널")
-    
-    results = []
-    processed_videos = set()
-    
-    for i, signal in enumerate(signals):
-        video_id = signal.get('video_id', '')
-        
-        print(f"\n📝 검증 중 ({i+1}/{len(signals)}): {video_id} - {signal.get('asset', 'N/A')}")
+    """194개 시그널 전체 검증 (영상 단위 묶음 요청, 동시 처리)"""
+    checkpoint = CheckpointLog(CHECKPOINT_FILE)
+    done = checkpoint.load()
+    keys = [signal_key(signal) for signal in signals]
+    
+    # 이미 검증된 시그널은 묶음에서 제외
+    groups = group_signals_by_video(signals)
+    units = []
+    for video_id, indexed_signals in groups.items():
+        pending = [(i, signal) for i, signal in indexed_signals if keys[i] not in done]
+        if pending:
+            units.append((video_id, pending))
+    
+    print(f"🤖 Claude 전체 검증 시작: {len(signals)}개 시그널 / {len(groups)}개 영상 "
+          f"(체크포인트 {len(signals) - sum(len(u[1]) for u in units)}개 재사용)")
+    
+    def verify_unit(indexed_signals):
+        video_id = indexed_signals[0][1].get('video_id', '')
         
         # 자막 로드 (비디오별로 한 번만)
-        subtitle = None
-        if video_id not in processed_videos:
-            subtitle = load_subtitle(video_id)
-            processed_videos.add(video_id)
-        else:
-            # 이미 처리된 비디오면 다시 로드
-            subtitle = load_subtitle(video_id)
+        subtitle = load_subtitle(video_id)
         
         if not subtitle:
+            # 기록하지 않음 -> 자막을 받은 뒤 다음 실행에서 검증
             print(f"❌ 자막 없음, 스킵: {video_id}")
-            results.append({
-                'signal_index': i,
-                'video_id': video_id,
-                'original_signal': signal,
-                'claude_verification': {
-                    'verdict': 'error',
-                    'confidence': 0.0,
-                    'reason': '자막 파일 없음'
-                },
-                'timestamp_seconds': None
-            })
-            continue
+            return {}
         
-        # Claude 검증 수행
-        claude_result = verify_signal_with_claude(client, signal, subtitle, i)
-        
-        # 타임스탬프 추출
-        content_text = signal.get('content', '')
-        timestamp_seconds = extract_timestamp_from_subtitle(subtitle, content_text)
-        
-        result_entry = {
-            'signal_index': i,
-            'video_id': video_id,
-            'original_signal': signal,
-            'claude_verification': claude_result,
-            'timestamp_seconds': timestamp_seconds
-        }
-        
-        results.append(result_entry)
+        # Claude 묶음 검증 수행
+        verdicts = verify_video_with_claude(client, indexed_signals, subtitle, video_id)
         
+        records = {}
+        for i, signal in indexed_signals:
+            claude_result = verdicts[i]
+            # API 오류는 기록하지 않음 -> 다음 실행에서 재시도
+            if claude_result.get('verdict') == 'error':
+                continue
+            
+            # 타임스탬프 추출
+            content_text = signal.get('content', '')
+            records[keys[i]] = {
+                'signal_index': i,
+                'video_id': video_id,
+                'claude_verification': claude_result,
+                'timestamp_seconds': extract_timestamp_from_subtitle(subtitle, content_text)
+            }
+        return records
+    
+    def show(key, record):
         # 결과 미리보기
+        signal = signals[record['signal_index']]
+        claude_result = record['claude_verification']
         verdict = claude_result.get('verdict', 'unknown')
-        confidence = claude_result.get('confidence', 0)
+        confidence = claude_result.get('confidence', 0) or 0
+        timestamp_seconds = record.get('timestamp_seconds')
         timestamp_info = f"@{timestamp_seconds}s" if timestamp_seconds else "no timestamp"
-        print(f"   🎯 Claude: {verdict} (신뢰도: {confidence:.2f}) {timestamp_info}")
-        
-        # API 요청 간격 (Rate limiting 방지)
-        import time
-        time.sleep(1.5)  # 1.5초 대기
+        print(f"   🎯 #{record['signal_index']} {signal.get('asset', 'N/A')}: {verdict} (신뢰도: {float(confidence):.2f}) {timestamp_info}")
     
+    stats = run_units(units, verify_unit, checkpoint, concurrency=CONCURRENCY, on_record=show)
+    print(f"\n⏱️ 영상 {stats['done_units']}/{stats['units']}개 완료, 실패 {stats['failed_units']}개, "
+          f"요청 {client.requests}회, 재시도 {client.retries}회, {stats['elapsed']:.1f}초")
+    
+    # 원래 시그널 순서로 정렬 (analyze_signal_quality.py 호환)
+    done = checkpoint.load()
+    results = []
+    for i, signal in enumerate(signals):
+        record = done.get(keys[i])
+        results.append({
+            'signal_index': i,
+            'video_id': signal.get('video_id', ''),
+            'original_signal': signal,
+            'claude_verification': record['claude_verification'] if record else {
+                'verdict': 'error',
+                'confidence': 0.0,
+                'reason': '미검증 (다음 실행에서 재시도)'
+            },
+            'timestamp_seconds': record.get('timestamp_seconds') if record else None
+        })
     return results
 
 def save_results(results):
@@ -408,6 +418,8 @@ def main():
         client = setup_anthropic_client()
         if not client:
             return
+        # 요청마다 속도 제한 + 과부하 재시도 (SDK 자체 재시도는 끔)
+        client = RateLimitedClient(client.with_options(max_retries=0), requests_per_minute=REQUESTS_PER_MINUTE)
         
         # 2. 194개 시그널 로드
         signals = load_all_signals()
@@ -6,6 +6,10 @@ from urllib.parse import urlparse, parse_qs
 import anthropic
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'smtr_data', 'corinpapa1106'))
+from grouped_verify import verify_video_signals, verify_single_signal, group_signals_by_video, format_signal_block
+from subtitle_excerpt import build_group_excerpt
+
 class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
     daemon_threads = True
 
@@ -74,91 +78,127 @@ def get_subtitle_content(video_id):
             return None
     return None
 
-def opus_analyze_signal(signal):
-    """Opus로 시그널 분석"""
-    if not client:
-        return {"error": "Anthropic client not available"}
-    
-    video_id = signal.get('video_id')
-    if not video_id:
-        return {"error": "video_id not found"}
-    
-    subtitle_content = get_subtitle_content(video_id)
-    if not subtitle_content:
-        return {"error": f"Subtitle file not found for video {video_id}"}
-    
-    try:
-        prompt = f"""다음은 유튜브 영상 자막과 Claude Sonnet이 추출한 시그널입니다.
-
-**영상 자막:**
-{subtitle_content}
-
-**Sonnet이 추출한 시그널:**
-- 종목: {signal.get('asset', 'N/A')}
-- 시그널 타입: {signal.get('signal_type', 'N/A')}
-- 내용: {signal.get('content', 'N/A')}
-- 타임스탬프: {signal.get('timestamp', 'N/A')}
-- 신뢰도: {signal.get('confidence', 'N/A')}
+OPUS_SIGNAL_INSTRUCTIONS = """다음은 유튜브 영상 자막과 Claude Sonnet이 추출한 시그널입니다.
 
 **시그널 타입 정의 (절대 변경 금지):**
 STRONG_BUY / BUY / POSITIVE / HOLD / NEUTRAL / CONCERN / SELL / STRONG_SELL
 
 **분석 요청:**
-자막을 처음부터 끝까지 읽고 다음을 분석해주세요:
+주어진 자막을 꼼꼼히 읽고 다음을 분석해주세요:
 
 1. Sonnet이 추출한 시그널이 자막 내용과 일치하는지 검증
 2. 시그널의 정확성과 타당성 평가
 3. 승인/거부/수정 권고
 
 JSON 형식으로 답변:
-{{
+{
   "verdict": "approve|reject|modify",
   "confidence": "HIGH|MEDIUM|LOW",
   "reasoning": "상세한 분석 내용 (한국어)",
-  "suggested_changes": {{
+  "suggested_changes": {
     "signal_type": "수정된 시그널 타입 (필요시)",
     "asset": "수정된 종목명 (필요시)",
     "content": "수정된 내용 (필요시)",
     "timestamp": "수정된 타임스탬프 (필요시)"
-  }}
-}}
+  }
+}
 """
-        
-        response = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=2000,
-            temperature=0.1,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        # JSON 응답 파싱
-        try:
-            result = json.loads(response.content[0].text)
-            result['analysis_timestamp'] = datetime.now().isoformat()
-            return result
-        except json.JSONDecodeError:
-            return {
-                "error": "Failed to parse JSON response",
-                "raw_response": response.content[0].text
-            }
-            
+
+REJECTED_SIGNAL_INSTRUCTIONS = """다음은 유튜브 영상에서 Claude Sonnet이 추출한 시그널인데, 인간 리뷰어가 거부했습니다.
+시그널마다 인간의 거부 사유가 함께 주어집니다.
+
+**분석 요청:**
+1. 인간의 거부가 타당한지 분석
+2. Sonnet 추출 프롬프트에서 개선할 점 제안
+3. 이런 유형의 오추출을 방지하기 위한 규칙 제안
+
+JSON으로 답변:
+{
+  "verdict": "agree_reject|disagree_reject",
+  "reasoning": "거부 타당성 상세 분석 (한국어)",
+  "extraction_issue": "Sonnet이 왜 이걸 잘못 추출했는지 (한국어)",
+  "prompt_improvement": "프롬프트에 추가할 규칙 제안 (한국어)",
+  "pattern": "이 오류의 패턴 분류 (예: 일반논평을_시그널로, 조건부_무시, 종목_오인식 등)"
+}
+"""
+
+def format_rejected_signal_block(index, signal):
+    """거부된 시그널 블록 (시그널 + 영상 제목 + 인간의 거부 사유)"""
+    return (f"{format_signal_block(index, signal)}\n"
+            f"**영상 제목**: {signal.get('title', 'N/A')}\n"
+            f"**인간의 거부 사유**: {signal.get('rejection_reason') or '(사유 미기재)'}")
+
+def opus_analyze_video_signals(signals, instructions=OPUS_SIGNAL_INSTRUCTIONS,
+                               format_signal=format_signal_block, max_tokens_per_signal=600,
+                               require_subtitle=True):
+    """같은 영상의 시그널들을 한 번의 요청으로 분석
+
+    자막은 시그널별 관련 구간 발췌를 합친 것(짧은 자막은 전체)을 system 블록에 캐싱.
+    require_subtitle=False 면 자막이 없어도 시그널 정보만으로 분석 (거부 사유 분석).
+
+    Returns:
+        list: 입력 순서대로 시그널별 결과 (실패한 시그널은 {"error": ...})
+    """
+    if not client:
+        return [{"error": "Anthropic client not available"} for _ in signals]
+    
+    video_id = signals[0].get('video_id') if signals else None
+    if not video_id:
+        return [{"error": "video_id not found"} for _ in signals]
+    
+    subtitle_content = get_subtitle_content(video_id)
+    if subtitle_content:
+        excerpt = build_group_excerpt(signals, subtitle_content)
+    elif require_subtitle:
+        return [{"error": f"Subtitle file not found for video {video_id}"} for _ in signals]
+    else:
+        excerpt = {'mode': 'none', 'text': '(자막 없음)'}
+    
+    options = dict(model="claude-3-haiku-20240307", max_tokens_per_signal=max_tokens_per_signal,
+                   video_id=video_id, title=signals[0].get('title', ''), format_signal=format_signal)
+    try:
+        verdicts, _ = verify_video_signals(client, list(enumerate(signals)), excerpt['text'], instructions, **options)
     except Exception as e:
-        return {"error": str(e)}
+        print(f"⚠️ 묶음 분석 실패, 단건으로 전환 ({video_id}): {e}")
+        verdicts = {}
+    
+    results = []
+    for i, signal in enumerate(signals):
+        result = verdicts.get(i)
+        if result is None:
+            # 묶음 응답에서 빠진 시그널은 같은 캐시 프리픽스로 단건 재요청
+            try:
+                result, _ = verify_single_signal(client, i, signal, excerpt['text'], instructions, **options)
+            except Exception as e:
+                results.append({"error": str(e)})
+                continue
+        if result is None:
+            results.append({"error": "Signal missing from grouped response"})
+            continue
+        result['analysis_timestamp'] = datetime.now().isoformat()
+        result['subtitle_mode'] = excerpt['mode']
+        results.append(result)
+    return results
+
+def opus_analyze_signal(signal):
+    """Opus로 시그널 분석 (단건 = 시그널 1개짜리 영상 묶음)"""
+    return opus_analyze_video_signals([signal])[0]
 
 def opus_analyze_rejected_signals():
-    """거부된 시그널만 Opus 분석 실행"""
+    """거부된 시그널만 Opus 분석 실행 (영상별로 묶어서 요청)"""
     def analyze_rejected():
         global opus_progress
         signals = load_signals()
         reviews = load_reviews()
         opus_reviews = load_opus_reviews()
         
-        # 거부된 시그널만 필터링
+        # 거부된 시그널만 필터링 (거부 사유를 시그널 블록에 함께 전달)
         rejected_signals = []
-        for i, signal in enumerate(signals):
+        for signal in signals:
             signal_id = f"{signal.get('video_id', '')}_{signal.get('asset', '')}"
             if reviews.get(signal_id, {}).get('status') == 'rejected':
-                rejected_signals.append((i, signal, signal_id, reviews[signal_id].get('reason', '')))
+                rejected_signals.append({**signal, 'signal_id': signal_id,
+                                         'rejection_reason': reviews[signal_id].get('reason', '')})
         
         if not rejected_signals:
             opus_progress = {"current": 0, "total": 0, "status": "completed", "message": "거부된 시그널이 없습니다"}
@@ -166,79 +206,28 @@ def opus_analyze_rejected_signals():
         
         opus_progress = {"current": 0, "total": len(rejected_signals), "status": "running"}
         
-        for idx, (i, signal, signal_id, rejection_reason) in enumerate(rejected_signals):
-            opus_progress["current"] = idx + 1
+        for group in group_signals_by_video(rejected_signals).values():
+            group_signals = [signal for _, signal in group]
+            results = opus_analyze_video_signals(group_signals, REJECTED_SIGNAL_INSTRUCTIONS,
+                                                 format_rejected_signal_block, max_tokens_per_signal=800,
+                                                 require_subtitle=False)
             
-            # 거부 사유를 포함한 Opus 분석
-            result = opus_analyze_rejected_signal(signal, rejection_reason)
-            
-            opus_reviews[signal_id] = {
-                **result,
-                "signal_data": signal,
-                "rejection_reason": rejection_reason,
-                "timestamp": datetime.now().isoformat()
-            }
+            for signal, result in zip(group_signals, results):
+                signal_data = {k: v for k, v in signal.items() if k not in ('signal_id', 'rejection_reason')}
+                opus_reviews[signal['signal_id']] = {
+                    **result,
+                    "signal_data": signal_data,
+                    "rejection_reason": signal['rejection_reason'],
+                    "timestamp": datetime.now().isoformat()
+                }
             save_opus_reviews(opus_reviews)
+            opus_progress["current"] += len(group_signals)
             time.sleep(0.5)
         
         opus_progress["status"] = "completed"
     
     threading.Thread(target=analyze_rejected, daemon=True).start()
 
-def opus_analyze_rejected_signal(signal, rejection_reason):
-    """거부된 시그널을 Opus로 재분석 (거부 사유 포함)"""
-    if not client:
-        return {"error": "Anthropic client not available"}
-    
-    video_id = signal.get('video_id')
-    subtitle_content = get_subtitle_content(video_id) if video_id else None
-    
-    try:
-        prompt = f"""다음은 유튜브 영상에서 Claude Sonnet이 추출한 시그널인데, 인간 리뷰어가 거부했습니다.
-
-**Sonnet이 추출한 시그널:**
-- 종목: {signal.get('asset', 'N/A')}
-- 시그널 타입: {signal.get('signal_type', 'N/A')}
-- 내용: {signal.get('content', 'N/A')}
-- 타임스탬프: {signal.get('timestamp', 'N/A')}
-- 신뢰도: {signal.get('confidence', 'N/A')}
-- 영상 제목: {signal.get('title', 'N/A')}
-
-**인간의 거부 사유:**
-{rejection_reason or '(사유 미기재)'}
-
-{f'**영상 자막:**{chr(10)}{subtitle_content[:5000]}' if subtitle_content else '(자막 없음)'}
-
-**분석 요청:**
-1. 인간의 거부가 타당한지 분석
-2. Sonnet 추출 프롬프트에서 개선할 점 제안
-3. 이런 유형의 오추출을 방지하기 위한 규칙 제안
-
-JSON으로 답변:
-{{
-  "verdict": "agree_reject|disagree_reject",
-  "reasoning": "거부 타당성 상세 분석 (한국어)",
-  "extraction_issue": "Sonnet이 왜 이걸 잘못 추출했는지 (한국어)",
-  "prompt_improvement": "프롬프트에 추가할 규칙 제안 (한국어)",
-  "pattern": "이 오류의 패턴 분류 (예: 일반논평을_시그널로, 조건부_무시, 종목_오인식 등)"
-}}"""
-        
-        response = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=2000,
-            temperature=0.1,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        
-        try:
-            result = json.loads(response.content[0].text)
-            result['analysis_timestamp'] = datetime.now().isoformat()
-            return result
-        except json.JSONDecodeError:
-            return {"error": "JSON parse failed", "raw_response": response.content[0].text}
-    except Exception as e:
-        return {"error": str(e)}
-
 def build_html():
     """HTML 페이지 생성"""
     signals = load_signals()
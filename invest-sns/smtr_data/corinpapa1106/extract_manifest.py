@@ -0,0 +1,155 @@
+"""
+step0 시그널 추출용 매니페스트
+- 자막 내용 해시 + 프롬프트 버전 + 모델을 영상별로 기록
+- 새 영상이나 자막/프롬프트/모델이 바뀐 영상만 다시 추출
+- 추출 결과는 기존 _all_signals_8types.json에 영상 단위로 병합 (전체 재생성 안 함)
+"""
+import hashlib
+import json
+import os
+import glob
+from datetime import datetime
+
+MANIFEST_FILE = "_extract_manifest.json"
+SIGNALS_STORE_FILE = "_all_signals_8types.json"
+MIN_SUBTITLE_CHARS = 50
+
+
+def content_hash(text):
+    """자막 내용 해시 (줄 끝 공백/개행 차이는 무시)"""
+    normalized = "\n".join(line.rstrip() for line in text.strip().splitlines())
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def prompt_version(system_prompt):
+    """시스템 프롬프트 해시 앞 12자리를 프롬프트 버전으로 사용"""
+    return hashlib.sha256(system_prompt.encode('utf-8')).hexdigest()[:12]
+
+
+def _write_json(path, data):
+    """임시 파일에 쓰고 교체 (중간에 죽어도 기존 파일 보존)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(subtitle_dir):
+    path = os.path.join(subtitle_dir, MANIFEST_FILE)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {"entries": {}}
+
+
+def save_manifest(subtitle_dir, manifest):
+    manifest["updated_at"] = datetime.now().isoformat()
+    _write_json(os.path.join(subtitle_dir, MANIFEST_FILE), manifest)
+
+
+def iter_subtitles(subtitle_dir):
+    """(video_id, path, subtitle) - '_'로 시작하는 파일과 너무 짧은 자막은 제외"""
+    for txt_path in sorted(glob.glob(os.path.join(subtitle_dir, "*.txt"))):
+        video_id = os.path.splitext(os.path.basename(txt_path))[0]
+        if video_id.startswith('_'):
+            continue
+        with open(txt_path, 'r', encoding='utf-8') as f:
+            subtitle = f.read()
+        if len(subtitle.strip()) < MIN_SUBTITLE_CHARS:
+            continue
+        yield video_id, txt_path, subtitle
+
+
+def plan_extraction(subtitle_dir, manifest, prompt_ver, model):
+    """추출이 필요한 영상 목록
+
+    Returns:
+        (pending, unchanged)
+        pending: [(video_id, subtitle, hash, reason)] - reason: new|content|prompt|model
+        unchanged: 건너뛴 영상 수
+    """
+    entries = manifest.get("entries", {})
+    pending, unchanged = [], 0
+
+    for video_id, _, subtitle in iter_subtitles(subtitle_dir):
+        digest = content_hash(subtitle)
+        entry = entries.get(video_id)
+
+        if entry is None:
+            reason = "new"
+        elif entry.get("content_hash") != digest:
+            reason = "content"
+        elif entry.get("prompt_version") != prompt_ver:
+            reason = "prompt"
+        elif entry.get("model") != model:
+            reason = "model"
+        else:
+            unchanged += 1
+            continue
+
+        pending.append((video_id, subtitle, digest, reason))
+
+    return pending, unchanged
+
+
+def record_extraction(manifest, video_id, digest, prompt_ver, model, signal_count):
+    manifest.setdefault("entries", {})[video_id] = {
+        "content_hash": digest,
+        "prompt_version": prompt_ver,
+        "model": model,
+        "signal_count": signal_count,
+        "extracted_at": datetime.now().isoformat(),
+    }
+
+
+def load_signal_store(subtitle_dir):
+    path = os.path.join(subtitle_dir, SIGNALS_STORE_FILE)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return []
+
+
+def merge_signals(store, results):
+    """영상 단위 병합 - results에 있는 영상의 기존 시그널만 교체
+
+    Args:
+        store: 기존 시그널 리스트
+        results: {video_id: [signal, ...]}
+
+    Returns:
+        병합된 시그널 리스트 (다른 영상 시그널의 순서는 유지)
+    """
+    merged = [sig for sig in store if sig.get("video_id") not in results]
+    for signals in results.values():
+        merged.extend(signals)
+    return merged
+
+
+def save_signal_store(subtitle_dir, signals):
+    path = os.path.join(subtitle_dir, SIGNALS_STORE_FILE)
+    _write_json(path, signals)
+    return path
+
+
+def adopt_existing(subtitle_dir, prompt_ver, model):
+    """매니페스트 없이 이미 추출된 결과를 현재 자막/프롬프트/모델 기준으로 등록
+
+    기존 _all_signals_8types.json을 그대로 믿고 재추출 없이 매니페스트만 채운다.
+    (처음 매니페스트를 도입할 때 한 번만 사용)
+    """
+    manifest = load_manifest(subtitle_dir)
+    counts = {}
+    for sig in load_signal_store(subtitle_dir):
+        counts[sig.get("video_id")] = counts.get(sig.get("video_id"), 0) + 1
+
+    adopted = 0
+    for video_id, _, subtitle in iter_subtitles(subtitle_dir):
+        if video_id in manifest.get("entries", {}):
+            continue
+        record_extraction(manifest, video_id, content_hash(subtitle), prompt_ver, model,
+                          counts.get(video_id, 0))
+        adopted += 1
+
+    save_manifest(subtitle_dir, manifest)
+    return adopted
@@ -0,0 +1,192 @@
+"""
+영상 단위 묶음 검증 (Grouped verification)
+- 같은 영상에서 나온 시그널들을 한 번의 요청으로 검증
+- 공통 지시문 + 자막을 system 블록에 두고 cache_control로 프롬프트 프리픽스 캐싱
+- 시그널별 판정을 id가 붙은 JSON 배열로 받아 원래 시그널에 다시 매핑
+
+호출하는 쪽(claude_verify_full_194, step3_claude_verify_batch, review-server-v5)은
+자기 판정 형식이 담긴 지시문만 넘기면 되고, 결과 형식은 기존 단건 검증과 동일하게 유지된다.
+"""
+import json
+import re
+from collections import OrderedDict
+
+# 한 요청에 넣을 최대 시그널 수 (넘치면 같은 캐시 프리픽스로 나눠서 요청)
+MAX_SIGNALS_PER_REQUEST = 12
+# 요청당 출력 토큰 한도 / 묶음 응답 여유분 - 시그널당 토큰이 크면 묶음 크기를 줄여 JSON 배열이 잘리지 않게 함
+MAX_OUTPUT_TOKENS = 4096
+RESPONSE_OVERHEAD_TOKENS = 200
+
+GROUPED_RESPONSE_RULE = """## 묶음 응답 형식 (중요)
+아래에 같은 영상에서 추출된 시그널 여러 개가 `#번호`와 함께 주어집니다.
+위에서 설명한 단건 응답 JSON 객체를 시그널마다 하나씩 만들고, 각 객체에 "id": 번호 필드를 추가하세요.
+모든 시그널에 대해 빠짐없이, 다른 설명 없이 JSON 배열만 출력하세요.
+예: [{"id": 0, ...}, {"id": 3, ...}]"""
+
+
+def group_signals_by_video(signals):
+    """시그널을 video_id별로 묶기 (첫 등장 순서 유지)
+
+    Args:
+        signals: 시그널 리스트
+
+    Returns:
+        OrderedDict[video_id, list[(index, signal)]]
+    """
+    groups = OrderedDict()
+    for index, signal in enumerate(signals):
+        video_id = signal.get('video_id', '')
+        groups.setdefault(video_id, []).append((index, signal))
+    return groups
+
+
+def format_signal_block(index, signal):
+    """묶음 요청용 시그널 한 건 텍스트"""
+    return f"""### 시그널 #{index}
+**종목**: {signal.get('asset', 'N/A')}
+**시그널**: {signal.get('signal_type', 'N/A')}
+**내용**: {signal.get('content', 'N/A')}
+**신뢰도**: {signal.get('confidence', 'N/A')}
+**맥락**: {signal.get('context', 'N/A')}
+**타임스탬프**: {signal.get('timestamp', 'N/A')}"""
+
+
+def build_system_blocks(instructions, subtitle, video_id='', title=''):
+    """공통 프리픽스(system 블록) 생성
+
+    지시문과 자막은 같은 영상의 모든 요청에서 바이트 단위로 동일해야 캐시가 적중하므로
+    시그널별 내용은 절대 여기에 넣지 않는다.
+    """
+    header = f"## 원본 자막 (video_id: {video_id})"
+    if title:
+        header += f"\n제목: {title}"
+
+    return [
+        {"type": "text", "text": instructions},
+        {
+            "type": "text",
+            "text": f"{header}\n\n{subtitle}",
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+
+
+def build_user_message(indexed_signals, format_signal=format_signal_block):
+    """시그널 목록 + 묶음 응답 규칙"""
+    blocks = [format_signal(index, signal) for index, signal in indexed_signals]
+    ids = ", ".join(str(index) for index, _ in indexed_signals)
+    return (
+        f"{GROUPED_RESPONSE_RULE}\n\n"
+        + "\n\n".join(blocks)
+        + f"\n\n위 {len(indexed_signals)}개 시그널(id: {ids})을 자막 내용과 비교해 각각 검증해주세요."
+    )
+
+
+def parse_grouped_verdicts(raw_text):
+    """묶음 응답에서 id별 판정 추출
+
+    Returns:
+        dict[int, dict]: id -> 판정 객체 (id 필드 제외)
+    """
+    text = raw_text.strip()
+
+    fence = re.search(r'```(?:json)?\s*(.*?)\s*```', text, re.DOTALL)
+    if fence:
+        text = fence.group(1)
+
+    start = min([p for p in (text.find('['), text.find('{')) if p != -1], default=-1)
+    if start == -1:
+        raise json.JSONDecodeError("No JSON found", raw_text, 0)
+
+    data, _ = json.JSONDecoder().raw_decode(text[start:])
+    if isinstance(data, dict):
+        data = data.get('results') or data.get('verdicts') or [data]
+
+    verdicts = {}
+    for item in data:
+        if not isinstance(item, dict) or 'id' not in item:
+            continue
+        try:
+            index = int(str(item['id']).lstrip('#'))
+        except ValueError:
+            continue
+        verdicts[index] = {k: v for k, v in item.items() if k != 'id'}
+    return verdicts
+
+
+def signals_per_request(max_tokens_per_signal):
+    """출력 토큰 한도 안에 들어가는 묶음 크기"""
+    fit = (MAX_OUTPUT_TOKENS - RESPONSE_OVERHEAD_TOKENS) // max(1, max_tokens_per_signal)
+    return max(1, min(MAX_SIGNALS_PER_REQUEST, fit))
+
+
+def verify_video_signals(client, indexed_signals, subtitle, instructions,
+                         model="claude-3-haiku-20240307", max_tokens_per_signal=350,
+                         temperature=0.1, video_id='', title='', format_signal=format_signal_block):
+    """한 영상의 시그널들을 묶어서 검증
+
+    Args:
+        client: Anthropic 클라이언트
+        indexed_signals: [(index, signal), ...] - 같은 영상의 시그널
+        subtitle: 자막 텍스트 (요청 사이에 변하지 않아야 캐시 적중)
+        instructions: 단건 검증 지시문 (판정 JSON 형식 포함)
+        format_signal: (index, signal) -> 시그널 블록 텍스트 (시그널별 추가 정보가 있을 때)
+
+    Returns:
+        (verdicts, usage)
+        verdicts: dict[index, dict] - 응답에 없던 시그널은 빠져 있음
+        usage: 입력/출력/캐시 토큰 합계
+    """
+    system_blocks = build_system_blocks(instructions, subtitle, video_id, title)
+    verdicts = {}
+    usage = {"requests": 0, "input_tokens": 0, "output_tokens": 0,
+             "cache_creation_input_tokens": 0, "cache_read_input_tokens": 0}
+
+    chunk_size = signals_per_request(max_tokens_per_signal)
+    for start in range(0, len(indexed_signals), chunk_size):
+        chunk = indexed_signals[start:start + chunk_size]
+
+        response = client.messages.create(
+            model=model,
+            max_tokens=min(MAX_OUTPUT_TOKENS, RESPONSE_OVERHEAD_TOKENS + max_tokens_per_signal * len(chunk)),
+            temperature=temperature,
+            system=system_blocks,
+            messages=[{"role": "user", "content": build_user_message(chunk, format_signal)}],
+        )
+
+        usage["requests"] += 1
+        for key in list(usage):
+            if key != "requests":
+                usage[key] += getattr(response.usage, key, 0) or 0
+
+        raw = response.content[0].text
+        try:
+            parsed = parse_grouped_verdicts(raw)
+        except (json.JSONDecodeError, ValueError) as e:
+            print(f"⚠️ 묶음 응답 JSON 파싱 실패 ({video_id}): {e}")
+            continue
+
+        chunk_ids = {index for index, _ in chunk}
+        verdicts.update({i: v for i, v in parsed.items() if i in chunk_ids})
+
+    return verdicts, usage
+
+
+def verify_single_signal(client, index, signal, subtitle, instructions, **kwargs):
+    """시그널 한 건 검증 (묶음 응답에서 빠진 시그널 재요청용)
+
+    묶음 요청과 같은 system 블록(지시문 + 자막)을 그대로 쓰므로 캐시된 프리픽스를 읽고,
+    video_id/title 도 묶음 요청과 같은 값을 넘겨야 캐시가 적중한다.
+
+    Returns:
+        (verdict, usage): verdict는 응답을 해석하지 못하면 None
+    """
+    verdicts, usage = verify_video_signals(client, [(index, signal)], subtitle, instructions, **kwargs)
+    return verdicts.get(index), usage
+
+
+def format_usage(usage):
+    """토큰 사용량 한 줄 요약"""
+    return (f"요청 {usage['requests']}회, 입력 {usage['input_tokens']} "
+            f"(캐시 생성 {usage['cache_creation_input_tokens']}, "
+            f"캐시 적중 {usage['cache_read_input_tokens']}), 출력 {usage['output_tokens']}")
@@ -2,12 +2,20 @@
 """
 8개 시그널 타입으로 유튜브 자막에서 투자 시그널 재추출
 OpenAI Batch API 사용 (GPT-4o-mini)
+- 매니페스트(자막 해시 + 프롬프트 버전 + 모델) 기준으로 새로 추가/변경된 영상만 제출
+- 결과는 _all_signals_8types.json에 영상 단위로 병합
 """
 import json
 import os
-import glob
 from openai import OpenAI
 
+from extract_manifest import (
+    load_manifest, save_manifest, plan_extraction, record_extraction, prompt_version,
+    load_signal_store, merge_signals, save_signal_store, adopt_existing,
+)
+
+MODEL = "gpt-4o-mini"
+
 SIGNAL_TYPES = """
 시그널 타입 (반드시 아래 8개 중 하나만 사용):
 
@@ -52,10 +60,16 @@ SYSTEM_PROMPT = f"""당신은 유튜브 투자 채널의 자막을 분석하여
 5. 시그널이 없으면 빈 배열 반환: {{"signals": []}}
 """
 
-def build_batch_requests(subtitle_dir):
-    """자막 파일들로 배치 요청 생성"""
+def build_batch_requests(subtitle_dir, manifest=None):
+    """새로 추가/변경된 자막만 배치 요청 생성
+
+    Returns:
+        (requests, pending_hashes) - pending_hashes: {video_id: content_hash}, 결과 반영 시 매니페스트에 기록
+    """
     requests = []
-    txt_files = sorted(glob.glob(os.path.join(subtitle_dir, "*.txt")))
+    pending_hashes = {}
+    if manifest is None:
+        manifest = load_manifest(subtitle_dir)
     
     # Load video metadata if available
     videos_meta = {}
@@ -66,20 +80,14 @@ def build_batch_requests(subtitle_dir):
                 vid = v.get('video_id') or v.get('id', '')
                 videos_meta[vid] = v
     
-    for txt_path in txt_files:
-        video_id = os.path.splitext(os.path.basename(txt_path))[0]
-        if video_id.startswith('_'):
-            continue  # Skip non-subtitle files
-            
-        with open(txt_path, 'r', encoding='utf-8') as f:
-            subtitle = f.read()
-        
-        if len(subtitle.strip()) < 50:
-            continue
-            
+    pending, unchanged = plan_extraction(subtitle_dir, manifest, prompt_version(SYSTEM_PROMPT), MODEL)
+    print(f"Unchanged (skipped): {unchanged}, to extract: {len(pending)}")
+    
+    for video_id, subtitle, digest, reason in pending:
         meta = videos_meta.get(video_id, {})
         title = meta.get('title', video_id)
         channel = meta.get('channel', '코린이 아빠')
+        print(f"  + {video_id} ({reason})")
         
         user_msg = f"유튜버: {channel}\n영상 제목: {title}\n영상 ID: {video_id}\n\n=== 자막 ===\n{subtitle}"
         
@@ -88,7 +96,7 @@ def build_batch_requests(subtitle_dir):
             "method": "POST",
             "url": "/v1/chat/completions",
             "body": {
-                "model": "gpt-4o-mini",
+                "model": MODEL,
                 "messages": [
                     {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": user_msg}
@@ -98,10 +106,11 @@ def build_batch_requests(subtitle_dir):
             }
         }
         requests.append(request)
+        pending_hashes[video_id] = digest
     
-    return requests
+    return requests, pending_hashes
 
-def submit_batch(requests, subtitle_dir):
+def submit_batch(requests, subtitle_dir, pending_hashes=None):
     """배치 API 제출"""
     client = OpenAI()
     
@@ -134,7 +143,10 @@ def submit_batch(requests, subtitle_dir):
             "input_file_id": file_obj.id,
             "status": batch.status,
             "created_at": batch.created_at,
-            "request_count": len(requests)
+            "request_count": len(requests),
+            "prompt_version": prompt_version(SYSTEM_PROMPT),
+            "model": MODEL,
+            "pending_hashes": pending_hashes or {}
         }, f, indent=2, ensure_ascii=False)
     
     print(f"Batch submitted: {batch.id}")
@@ -162,7 +174,7 @@ def check_batch(subtitle_dir):
         print(f"Results saved to {result_path}")
         
         # Parse results
-        all_signals = []
+        results = {}
         with open(result_path, 'r', encoding='utf-8') as f:
             for line in f:
                 result = json.loads(line)
@@ -173,17 +185,26 @@ def check_batch(subtitle_dir):
                     signals = parsed.get("signals", [])
                     for sig in signals:
                         sig["video_id"] = video_id
-                    all_signals.extend(signals)
+                    results[video_id] = signals
                     print(f"  {video_id}: {len(signals)} signals")
                 except json.JSONDecodeError as e:
                     print(f"  {video_id}: JSON parse error: {e}")
         
-        # Save all signals
-        output_path = os.path.join(subtitle_dir, "_all_signals_8types.json")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(all_signals, f, ensure_ascii=False, indent=2)
+        # Merge into existing store (only the re-extracted videos are replaced)
+        all_signals = merge_signals(load_signal_store(subtitle_dir), results)
+        output_path = save_signal_store(subtitle_dir, all_signals)
+        
+        # Record in manifest - parse failures stay pending for the next run
+        manifest = load_manifest(subtitle_dir)
+        pending_hashes = info.get("pending_hashes", {})
+        for video_id, signals in results.items():
+            if video_id in pending_hashes:
+                record_extraction(manifest, video_id, pending_hashes[video_id],
+                                  info.get("prompt_version"), info.get("model", MODEL), len(signals))
+        save_manifest(subtitle_dir, manifest)
         
-        print(f"\nTotal signals extracted: {len(all_signals)}")
+        print(f"\nMerged {len(results)} videos into {output_path}")
+        print(f"Total signals in store: {len(all_signals)}")
         from collections import Counter
         types = Counter(s.get('signal_type', '?') for s in all_signals)
         print(f"Signal types: {dict(types)}")
@@ -198,7 +219,12 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1 and sys.argv[1] == "check":
         check_batch(subtitle_dir)
+    elif len(sys.argv) > 1 and sys.argv[1] == "adopt":
+        # 기존 결과를 매니페스트에 등록 (재추출 없이)
+        adopted = adopt_existing(subtitle_dir, prompt_version(SYSTEM_PROMPT), MODEL)
+        print(f"Adopted {adopted} existing videos into manifest")
     else:
-        requests = build_batch_requests(subtitle_dir)
-        print(f"Found {len(requests)} subtitle files to process")
-        submit_batch(requests, subtitle_dir)
+        requests, pending_hashes = build_batch_requests(subtitle_dir)
+        print(f"Found {len(requests)} new/changed subtitle files to process")
+        if requests:
+            submit_batch(requests, subtitle_dir, pending_hashes)
@@ -2,13 +2,27 @@
 """
 8개 시그널 타입으로 유튜브 자막에서 투자 시그널 재추출
 Anthropic Claude API 사용
+- 매니페스트(자막 해시 + 프롬프트 버전 + 모델) 기준으로 새로 추가/변경된 영상만 추출
+- 결과는 _all_signals_8types.json에 영상 단위로 병합
+- 병렬 요청은 verify_runner.RateLimitedClient 로 분당 요청 수 제한 + 429/529 재시도
 """
 import json
 import os
-import glob
-import time
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import anthropic
 
+from extract_manifest import (
+    load_manifest, save_manifest, plan_extraction, record_extraction, prompt_version,
+    load_signal_store, merge_signals, save_signal_store, adopt_existing,
+)
+from verify_runner import RateLimitedClient
+
+MODEL = "claude-sonnet-4-20250514"
+MAX_WORKERS = 4
+REQUESTS_PER_MINUTE = 50
+SAVE_EVERY = 5
+
 SIGNAL_TYPES = """
 시그널 타입 (반드시 아래 8개 중 하나만 사용):
 
@@ -431,7 +445,7 @@ def extract_signals_from_subtitle(client, video_id, subtitle, title, channel):
     user_msg = f"유튜버: {channel}\n영상 제목: {title}\n영상 ID: {video_id}\n\n=== 자막 ===\n{subtitle}"
     
     response = client.messages.create(
-        model="claude-sonnet-4-20250514",
+        model=MODEL,
         max_tokens=4096,
         system=SYSTEM_PROMPT,
         messages=[{"role": "user", "content": user_msg}]
@@ -450,7 +464,17 @@ def extract_signals_from_subtitle(client, video_id, subtitle, title, channel):
 
 def main():
     subtitle_dir = os.path.dirname(os.path.abspath(__file__))
-    client = anthropic.Anthropic()
+    prompt_ver = prompt_version(SYSTEM_PROMPT)
+    
+    if len(sys.argv) > 1 and sys.argv[1] == "adopt":
+        # 기존 결과를 매니페스트에 등록 (재추출 없이)
+        adopted = adopt_existing(subtitle_dir, prompt_ver, MODEL)
+        print(f"Adopted {adopted} existing videos into manifest")
+        return
+    
+    # SDK 자체 재시도는 끄고 RateLimitedClient 가 워커 전체의 요청 속도와 과부하 재시도를 관리
+    client = RateLimitedClient(anthropic.Anthropic().with_options(max_retries=0),
+                               requests_per_minute=REQUESTS_PER_MINUTE)
     
     # Load video metadata
     videos_meta = {}
@@ -461,80 +485,74 @@ def main():
                 vid = v.get('video_id') or v.get('id', '')
                 videos_meta[vid] = v
     
-    # Get subtitle files
-    txt_files = sorted(glob.glob(os.path.join(subtitle_dir, "*.txt")))
-    txt_files = [f for f in txt_files if not os.path.basename(f).startswith('_')]
+    # Only new/changed subtitles (content hash, prompt version, model)
+    manifest = load_manifest(subtitle_dir)
+    pending, unchanged = plan_extraction(subtitle_dir, manifest, prompt_ver, MODEL)
+    print(f"Unchanged (skipped): {unchanged}, to extract: {len(pending)}", flush=True)
     
-    # Load progress if exists
-    progress_path = os.path.join(subtitle_dir, "_extract_8types_progress.json")
-    all_signals = []
-    done_ids = set()
-    if os.path.exists(progress_path):
-        with open(progress_path, 'r', encoding='utf-8') as f:
-            progress = json.load(f)
-            all_signals = progress.get("signals", [])
-            done_ids = set(progress.get("done_ids", []))
-        print(f"Resuming: {len(done_ids)} already done, {len(all_signals)} signals so far", flush=True)
+    all_signals = load_signal_store(subtitle_dir)
+    if not pending:
+        print(f"Nothing to do. {len(all_signals)} signals in store.")
+        return
     
-    print(f"Processing {len(txt_files)} subtitle files...", flush=True)
-    
-    for i, txt_path in enumerate(txt_files):
-        video_id = os.path.splitext(os.path.basename(txt_path))[0]
-        
-        if video_id in done_ids:
-            continue
-        
-        with open(txt_path, 'r', encoding='utf-8') as f:
-            subtitle = f.read()
-        
-        if len(subtitle.strip()) < 50:
-            done_ids.add(video_id)
-            continue
-        
+    def extract(video_id, subtitle):
         meta = videos_meta.get(video_id, {})
         title = meta.get('title', video_id)
         channel = meta.get('channel', '코린이 아빠')
         
-        try:
-            result = extract_signals_from_subtitle(client, video_id, subtitle, title, channel)
-            video_summary = result.get("video_summary", "")
-            signals = result.get("signals", [])
-            for sig in signals:
-                sig["video_id"] = video_id
-                sig["channel"] = channel
-                sig["title"] = title
-                sig["video_summary"] = video_summary
-            all_signals.extend(signals)
-            done_ids.add(video_id)
-            print(f"  [{len(done_ids)}/{len(txt_files)}] {video_id}: {len(signals)} signals ({title[:40]})", flush=True)
-            
-            # Save progress every 5 videos
-            if len(done_ids) % 5 == 0:
-                with open(progress_path, 'w', encoding='utf-8') as f:
-                    json.dump({"signals": all_signals, "done_ids": list(done_ids)}, f, ensure_ascii=False, indent=2)
+        result = extract_signals_from_subtitle(client, video_id, subtitle, title, channel)
+        video_summary = result.get("video_summary", "")
+        signals = result.get("signals", [])
+        for sig in signals:
+            sig["video_id"] = video_id
+            sig["channel"] = channel
+            sig["title"] = title
+            sig["video_summary"] = video_summary
+        return signals, title
+    
+    def flush(results):
+        # Merge finished videos into the store and record them in the manifest together
+        nonlocal all_signals
+        all_signals = merge_signals(all_signals, results)
+        save_signal_store(subtitle_dir, all_signals)
+        save_manifest(subtitle_dir, manifest)
+    
+    done = 0
+    unsaved = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(extract, video_id, subtitle): (video_id, digest, reason)
+            for video_id, subtitle, digest, reason in pending
+        }
+        
+        for future in as_completed(futures):
+            video_id, digest, reason = futures[future]
+            try:
+                signals, title = future.result()
+            except Exception as e:
+                # Not recorded in manifest -> retried on the next run
+                print(f"  ERROR {video_id}: {e}", flush=True)
+                continue
             
-            # Rate limiting
-            time.sleep(0.5)
+            unsaved[video_id] = signals
+            record_extraction(manifest, video_id, digest, prompt_ver, MODEL, len(signals))
+            done += 1
+            print(f"  [{done}/{len(pending)}] {video_id} ({reason}): {len(signals)} signals ({title[:40]})", flush=True)
             
-        except Exception as e:
-            print(f"  ERROR {video_id}: {e}", flush=True)
-            time.sleep(2)
-            continue
-    
-    # Save final results
-    output_path = os.path.join(subtitle_dir, "_all_signals_8types.json")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(all_signals, f, ensure_ascii=False, indent=2)
+            # Save progress every few videos
+            if len(unsaved) >= SAVE_EVERY:
+                flush(unsaved)
+                unsaved = {}
     
-    # Save progress
-    with open(progress_path, 'w', encoding='utf-8') as f:
-        json.dump({"signals": all_signals, "done_ids": list(done_ids)}, f, ensure_ascii=False, indent=2)
+    if unsaved:
+        flush(unsaved)
     
-    print(f"\nTotal signals: {len(all_signals)}")
+    print(f"\nExtracted {done}/{len(pending)} videos, total signals in store: {len(all_signals)}")
+    print(f"API requests: {client.requests}, rate-limit retries: {client.retries}")
     from collections import Counter
     types = Counter(s.get('signal_type', '?') for s in all_signals)
     print(f"Types: {dict(types)}")
-    print(f"Saved to {output_path}")
+    print(f"Saved to {os.path.join(subtitle_dir, '_all_signals_8types.json')}")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@
 Claude Opus 전체 시그널 검증
 - 모든 시그널을 Claude Opus로 독립 검증
 - 자막과 시그널 정보를 함께 제공하여 정확성 판단
+- 자막은 시그널 주변 구간 + 영상 요약만 발췌 (정렬 신뢰도가 낮으면 전체 자막)
 """
 import json
 import os
@@ -14,6 +15,8 @@ from datetime import datetime
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+from subtitle_excerpt import build_subtitle_excerpt, format_excerpt_section
+
 # UTF-8 출력 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True)
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', line_buffering=True)
@@ -58,8 +61,11 @@ def load_subtitle_content(video_id):
 
 def create_verification_prompt(signal, subtitle_content):
     """Claude 검증용 프롬프트 생성"""
+    # 시그널 주변 구간만 토큰 예산 안에서 발췌
+    excerpt = build_subtitle_excerpt(signal, subtitle_content)
+    
     prompt = f"""다음은 한국의 주식/코인 투자 유튜브 영상에서 추출된 투자 시그널입니다. 
-영상의 전체 자막과 함께 이 시그널이 정확한지 검증해주세요.
+영상의 자막과 함께 이 시그널이 정확한지 검증해주세요.
 
 === 추출된 시그널 ===
 종목: {signal.get('asset', 'N/A')}
@@ -68,8 +74,7 @@ def create_verification_prompt(signal, subtitle_content):
 신뢰도: {signal.get('confidence', 'N/A')}
 맥락: {signal.get('context', 'N/A')}
 
-=== 영상 자막 (전체) ===
-{subtitle_content}
+{format_excerpt_section(excerpt)}
 
 === 검증 요청 ===
 위 자막을 바탕으로 추출된 시그널을 검증하고, 다음 중 하나로 분류해주세요:
@@ -201,7 +206,7 @@ def main():
         verified_signals.append(verified_signal)
         
         # 비용 추정 (대략적)
-        input_tokens = len(str(subtitle_content or "") + str(signal)) // 4  # 대략적 토큰 수
+        input_tokens = build_subtitle_excerpt(signal, subtitle_content)['tokens'] + len(str(signal)) // 4  # 대략적 토큰 수
         output_tokens = len(str(verification_result)) // 4
         cost = (input_tokens * 0.00000025) + (output_tokens * 0.00000125)  # Claude 3 Haiku 가격
         total_cost += cost
@@ -1,24 +1,29 @@
 #!/usr/bin/env python3
 """
-Claude 전체 검증 (배치 처리)
-- 20개씩 배치로 처리하여 안정성 확보
-- 진행 상황을 파일로 저장하여 중단 시 재개 가능
+Claude 전체 검증 (동시 처리)
+- 같은 영상의 시그널은 한 번의 요청으로 묶어서 검증 (자막 프롬프트 캐싱)
+- 영상 묶음 여러 개를 동시에 요청 (분당 요청 수 제한, 과부하 시 지수 백오프)
+- 시그널 단위 체크포인트 로그(JSONL)로 중단 시 남은 시그널부터 정확히 재개
 """
 import json
 import os
 import sys
 import io
-import time
+import threading
 from datetime import datetime
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+from grouped_verify import group_signals_by_video, verify_video_signals, verify_single_signal
+from verify_runner import CheckpointLog, RateLimitedClient, run_units, signal_key, is_overload_error
+
 # UTF-8 출력 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True)
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', line_buffering=True)
 
-BATCH_SIZE = 20
-PROGRESS_FILE = "_claude_progress.json"
+CONCURRENCY = 8
+REQUESTS_PER_MINUTE = 50
+CHECKPOINT_FILE = "_claude_verify_checkpoint.jsonl"
 
 def setup_anthropic_client():
     """Anthropic 클라이언트 설정"""
@@ -55,119 +60,110 @@ def load_subtitle_content(video_id):
     
     return None
 
-def create_verification_prompt(signal, subtitle_content):
-    """Claude 검증용 프롬프트 생성"""
-    # 자막 내용 길이 제한 (토큰 절약)
-    if subtitle_content and len(subtitle_content) > 8000:
-        subtitle_content = subtitle_content[:8000] + "...(자막 내용 일부 생략)"
+def verify_signal_with_claude(client, signal, subtitle_content, index=0, video_id='', title=''):
+    """Claude를 사용해 시그널 한 건 검증 (묶음과 같은 캐시 프리픽스 사용)"""
+    if not subtitle_content:
+        return {
+            "judgment": "rejected",
+            "confidence": 0.0,
+            "reason": "자막 파일을 찾을 수 없음",
+            "correction": None
+        }
     
-    prompt = f"""다음은 한국의 주식/코인 투자 유튜브 영상에서 추출된 투자 시그널입니다. 
-영상의 자막과 함께 이 시그널이 정확한지 검증해주세요.
-
-=== 추출된 시그널 ===
-종목: {signal.get('asset', 'N/A')}
-신호: {signal.get('signal_type', 'N/A')}
-인용구: "{signal.get('content', 'N/A')}"
+    try:
+        result, _ = verify_single_signal(
+            client, index, signal, subtitle_content, create_group_instructions(),
+            model="claude-3-haiku-20240307", max_tokens_per_signal=250, temperature=1.0,
+            video_id=video_id, title=title
+        )
+    except Exception as e:
+        # 과부하/속도 제한 재시도를 다 써도 실패하면 영상 단위 실패 -> 다음 실행에서 재시도
+        if is_overload_error(e):
+            raise
+        print(f"Claude API 오류: {e}")
+        return {
+            "judgment": "error",
+            "confidence": 0.0,
+            "reason": f"API 오류: {str(e)[:100]}",
+            "correction": None
+        }
+    
+    if result is None:
+        return {"judgment": "error", "confidence": 0.0, "reason": "응답 파싱 실패", "correction": None}
+    return result
 
-=== 영상 자막 ===
-{subtitle_content or '자막을 찾을 수 없습니다.'}
+def create_group_instructions():
+    """묶음 검증용 공통 지시문 (자막/시그널 제외, 캐시 프리픽스에 들어감)"""
+    return """다음은 한국의 주식/코인 투자 유튜브 영상에서 추출된 투자 시그널들입니다.
+영상의 자막과 함께 각 시그널이 정확한지 검증해주세요.
 
 === 검증 요청 ===
-위 자막을 바탕으로 추출된 시그널을 검증하고, 다음 중 하나로 분류해주세요:
+자막을 바탕으로 추출된 시그널을 검증하고, 다음 중 하나로 분류해주세요:
 
 1. **confirmed**: 시그널이 정확함
 2. **corrected**: 시그널에 오류가 있음 (수정 의견 제시)
 3. **rejected**: 해당 내용이 자막에 없거나 시그널이 아님
 
-응답은 반드시 다음 JSON 형식으로 해주세요:
-{{
+시그널 하나당 응답은 반드시 다음 JSON 형식으로 해주세요:
+{
   "judgment": "confirmed|corrected|rejected",
   "confidence": 0.95,
   "reason": "판단 근거를 간결하게 설명",
   "correction": "corrected인 경우에만 수정 의견"
-}}
+}
 """
-    return prompt
 
-def verify_signal_with_claude(client, signal, subtitle_content):
-    """Claude를 사용해 시그널 검증"""
+def verify_video_signals_with_claude(client, indexed_signals, subtitle_content):
+    """같은 영상의 시그널들을 한 번에 검증
+
+    Returns:
+        (results, usage): results는 index -> 판정 dict, 응답에서 빠진 시그널은 단건 검증으로 채움
+    """
     if not subtitle_content:
-        return {
-            "judgment": "rejected",
-            "confidence": 0.0,
-            "reason": "자막 파일을 찾을 수 없음",
-            "correction": None
-        }
+        return {index: verify_signal_with_claude(client, signal, None) for index, signal in indexed_signals}, None
     
-    prompt = create_verification_prompt(signal, subtitle_content)
+    video_id = indexed_signals[0][1].get('video_id', '')
+    title = indexed_signals[0][1].get('title', '')
+    usage = None
     
     try:
-        response = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=500,  # 토큰 절약
-            messages=[{
-                "role": "user", 
-                "content": prompt
-            }]
+        verdicts, usage = verify_video_signals(
+            client, indexed_signals, subtitle_content, create_group_instructions(),
+            model="claude-3-haiku-20240307", max_tokens_per_signal=250, temperature=1.0,
+            video_id=video_id, title=title
         )
-        
-        response_text = response.content[0].text
-        
-        # JSON 부분만 추출
-        if '```json' in response_text:
-            json_start = response_text.find('```json') + 7
-            json_end = response_text.find('```', json_start)
-            json_text = response_text[json_start:json_end].strip()
-        elif '{' in response_text and '}' in response_text:
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
-            json_text = response_text[json_start:json_end]
-        else:
-            json_text = response_text
-        
-        result = json.loads(json_text)
+    except Exception as e:
+        # 과부하/속도 제한 재시도를 다 써도 실패하면 영상 단위 실패 -> 다음 실행에서 재시도
+        if is_overload_error(e):
+            raise
+        print(f"Claude 묶음 검증 오류, 단건으로 전환: {e}")
+        verdicts = {}
+    
+    results = {}
+    for index, signal in indexed_signals:
+        result = verdicts.get(index)
+        if result is None:
+            result = verify_signal_with_claude(client, signal, subtitle_content, index, video_id, title)
         
         # 필수 필드 검증
-        if 'judgment' not in result:
-            result['judgment'] = 'error'
-        if 'confidence' not in result:
-            result['confidence'] = 0.0
-        if 'reason' not in result:
-            result['reason'] = 'No reason provided'
-        
-        return result
-        
-    except Exception as e:
-        print(f"Claude API 오류: {e}")
-        return {
-            "judgment": "error",
-            "confidence": 0.0,
-            "reason": f"API 오류: {str(e)[:100]}",
-            "correction": None
-        }
-
-def load_progress():
-    """진행 상황 로드"""
-    if os.path.exists(PROGRESS_FILE):
-        with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {"processed": 0, "results": []}
-
-def save_progress(processed_count, results):
-    """진행 상황 저장"""
-    with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-        json.dump({"processed": processed_count, "results": results}, f, ensure_ascii=False, indent=2)
+        result.setdefault('judgment', 'error')
+        result.setdefault('confidence', 0.0)
+        result.setdefault('reason', 'No reason provided')
+        results[index] = result
+    
+    return results, usage
 
 def main():
     input_path = "_signals_with_timestamps.json"
     output_path = "_claude_verify_full.json"
     
-    print("=== Claude 전체 검증 (배치 처리) ===")
+    print("=== Claude 전체 검증 (동시 처리) ===")
     
-    # Claude 클라이언트 설정
+    # Claude 클라이언트 설정 (요청마다 속도 제한 + 과부하 재시도, SDK 자체 재시도는 끔)
     client = setup_anthropic_client()
     if not client:
         return
+    client = RateLimitedClient(client.with_options(max_retries=0), requests_per_minute=REQUESTS_PER_MINUTE)
     
     # 시그널 로드
     with open(input_path, 'r', encoding='utf-8') as f:
@@ -175,67 +171,73 @@ def main():
     
     print(f"총 {len(signals)}개 시그널")
     
-    # 진행 상황 로드
-    progress = load_progress()
-    processed_count = progress["processed"]
-    verified_signals = progress["results"]
+    # 체크포인트 로드 - 이미 검증된 시그널은 제외
+    checkpoint = CheckpointLog(CHECKPOINT_FILE)
+    done = checkpoint.load()
+    keys = [signal_key(signal) for signal in signals]
+    remaining = [(i, signal) for i, signal in enumerate(signals) if keys[i] not in done]
+    
+    print(f"이전 진행: {len(signals) - len(remaining)}/{len(signals)} 처리됨")
     
-    print(f"이전 진행: {processed_count}/{len(signals)} 처리됨")
+    # 영상 단위 작업 (남은 시그널만 묶음)
+    units = []
+    for video_id, indexed_signals in group_signals_by_video([s for _, s in remaining]).items():
+        units.append((video_id, [remaining[j] for j, _ in indexed_signals]))
     
-    # 남은 시그널 처리
     total_cost = 0
+    cost_lock = threading.Lock()  # verify_unit 은 워커 스레드에서 동시에 실행됨
     
-    for i in range(processed_count, len(signals), BATCH_SIZE):
-        batch_end = min(i + BATCH_SIZE, len(signals))
-        batch = signals[i:batch_end]
-        
-        print(f"\n=== 배치 {i//BATCH_SIZE + 1}: {i+1}-{batch_end}/{len(signals)} ===")
+    def verify_unit(group):
+        nonlocal total_cost
+        subtitle_content = load_subtitle_content(group[0][1].get('video_id'))
+        verification_results, usage = verify_video_signals_with_claude(client, group, subtitle_content)
         
-        for j, signal in enumerate(batch):
-            signal_idx = i + j
-            video_id = signal.get('video_id')
-            asset = signal.get('asset')
-            
-            print(f"[{signal_idx+1}/{len(signals)}] 검증: {video_id} - {asset}")
-            
-            # 자막 로드
-            subtitle_content = load_subtitle_content(video_id)
-            
-            # Claude 검증
-            verification_result = verify_signal_with_claude(client, signal, subtitle_content)
-            
-            # 결과 합치기
-            verified_signal = signal.copy()
-            verified_signal['claude_verification'] = verification_result
-            verified_signal['verification_timestamp'] = datetime.now().isoformat()
-            
-            verified_signals.append(verified_signal)
-            
-            # 비용 추정
-            input_tokens = len(str(subtitle_content or "")[:8000] + str(signal)) // 4
-            output_tokens = len(str(verification_result)) // 4
-            cost = (input_tokens * 0.00000025) + (output_tokens * 0.00000125)
-            total_cost += cost
-            
-            judgment = verification_result.get('judgment', 'error')
-            confidence = verification_result.get('confidence', 0)
-            print(f"  -> {judgment} (신뢰도: {confidence})")
-            
-            # API 제한 대기
-            time.sleep(1)
+        # 비용 추정 (캐시 적중분은 입력 단가의 10%, 캐시 생성분은 125%)
+        if usage:
+            cost = ((usage['input_tokens'] + usage['cache_creation_input_tokens'] * 1.25
+                     + usage['cache_read_input_tokens'] * 0.1) * 0.00000025
+                    + usage['output_tokens'] * 0.00000125)
+            with cost_lock:
+                total_cost += cost
         
-        # 배치 완료 후 진행 상황 저장
-        processed_count = batch_end
-        save_progress(processed_count, verified_signals)
-        print(f"배치 완료. 진행상황 저장: {processed_count}/{len(signals)}")
-        
-        # 중간 결과 저장
-        if processed_count % (BATCH_SIZE * 3) == 0 or processed_count == len(signals):
-            with open(f"_claude_partial_{processed_count}.json", 'w', encoding='utf-8') as f:
-                json.dump(verified_signals, f, ensure_ascii=False, indent=2)
-            print(f"중간 결과 저장: _claude_partial_{processed_count}.json")
+        records = {}
+        for signal_idx, signal in group:
+            verification_result = verification_results[signal_idx]
+            # 오류 판정은 기록하지 않음 -> 다음 실행에서 재시도
+            if verification_result.get('judgment') == 'error':
+                continue
+            records[keys[signal_idx]] = {
+                'signal_index': signal_idx,
+                'claude_verification': verification_result,
+                'verification_timestamp': datetime.now().isoformat()
+            }
+        return records
+    
+    def show(key, record):
+        signal = signals[record['signal_index']]
+        verification = record['claude_verification']
+        print(f"[{record['signal_index']+1}/{len(signals)}] {signal.get('video_id')} - {signal.get('asset')}"
+              f" -> {verification.get('judgment')} (신뢰도: {verification.get('confidence')})")
+    
+    stats = run_units(units, verify_unit, checkpoint, concurrency=CONCURRENCY, on_record=show)
+    print(f"\n영상 {stats['done_units']}/{stats['units']}개 완료, 실패 {stats['failed_units']}개, "
+          f"요청 {client.requests}회, 재시도 {client.retries}회, {stats['elapsed']:.1f}초")
+    
+    # 최종 결과 (입력 순서 유지, 체크포인트에 없는 시그널은 오류로 표시)
+    done = checkpoint.load()
+    verified_signals = []
+    for i, signal in enumerate(signals):
+        verified_signal = signal.copy()
+        record = done.get(keys[i])
+        if record:
+            verified_signal['claude_verification'] = record['claude_verification']
+            verified_signal['verification_timestamp'] = record['verification_timestamp']
+        else:
+            verified_signal['claude_verification'] = {
+                "judgment": "error", "confidence": 0.0, "reason": "미검증 (다음 실행에서 재시도)", "correction": None
+            }
+        verified_signals.append(verified_signal)
     
-    # 최종 결과 저장
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(verified_signals, f, ensure_ascii=False, indent=2)
     
@@ -255,7 +257,7 @@ def main():
     
     print(f"\n=== 검증 완료 ===")
     print(f"총 시그널: {len(verified_signals)}")
-    print(f"예상 비용: ${total_cost:.3f}")
+    print(f"이번 실행 예상 비용: ${total_cost:.3f}")
     
     print(f"\n판정 분포:")
     for judgment, count in judgment_counts.items():
@@ -268,10 +270,10 @@ def main():
     
     print(f"\n최종 결과: {output_path}")
     
-    # 진행 상황 파일 삭제
-    if os.path.exists(PROGRESS_FILE):
-        os.remove(PROGRESS_FILE)
-        print("진행 상황 파일 삭제됨")
+    # 모든 시그널이 검증되면 체크포인트 삭제
+    if all(key in done for key in keys) and os.path.exists(CHECKPOINT_FILE):
+        os.remove(CHECKPOINT_FILE)
+        print("체크포인트 파일 삭제됨")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
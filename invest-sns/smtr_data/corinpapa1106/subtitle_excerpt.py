@@ -0,0 +1,357 @@
+"""
+검증 프롬프트용 자막 발췌 (Relevance-windowed excerpt)
+- 시그널의 정렬된 timestamp_seconds + 키워드 적중으로 관련 구간만 토큰 예산 안에서 잘라냄
+- 영상 전체 흐름은 짧은 요약(video_summary 또는 균등 샘플)으로 함께 제공
+- 예산 안에 들어오는 짧은 자막은 전체를 그대로 사용
+- 정렬 신뢰도가 낮으면(앵커 없음) 인용 구간을 놓치지 않도록 전체 자막을 사용
+  (모델 컨텍스트 상한을 넘는 자막만 키워드 적중 구간/앞부분을 그 상한 안에서 사용)
+"""
+import re
+
+# 자막 라인: [M:SS] 또는 [H:MM:SS] 텍스트
+LINE_PATTERN = re.compile(r'\[(\d{1,3}:\d{2}(?::\d{2})?)\]\s*([^\[\n]+)')
+
+DEFAULT_TOKEN_BUDGET = 1500     # 발췌 본문 예산
+CONTEXT_TOKEN_LIMIT = 150000    # 앵커 없는 자막에 쓸 수 있는 상한 (모델 컨텍스트 200K 중 지시문/응답 몫 제외)
+SUMMARY_TOKEN_BUDGET = 250      # 전체 요약 예산
+MIN_ALIGNMENT_SIMILARITY = 0.5  # step2 timestamp_similarity 기준
+MIN_KEYWORD_SCORE = 0.3         # 키워드 적중만으로 앵커를 잡을 때 최소 점수
+ANCHOR_CHECK_SECONDS = 90       # 추출 단계 타임스탬프 주변 키워드 검증 범위
+SECONDARY_HITS = 3              # 본 구간 밖에서 추가로 보여줄 종목 언급 수
+
+STOPWORDS = {'그리고', '그래서', '근데', '이제', '지금', '진짜', '정말', '이거', '그거', '저는',
+             '제가', '우리', '여러분', '있습니다', '합니다', '거든요', '그냥', '이런', '그런'}
+
+
+def estimate_tokens(text):
+    """대략적인 토큰 수 (한글 1자 ≈ 1토큰, 그 외 4자 ≈ 1토큰)"""
+    hangul = len(re.findall(r'[가-힣]', text))
+    return hangul + (len(text) - hangul) // 4 + 1
+
+
+def parse_timestamp(ts_str):
+    """'M:SS' / 'H:MM:SS' / '[M:SS]' -> 초"""
+    try:
+        parts = [int(p) for p in ts_str.strip('[] ').split(':')]
+    except (ValueError, AttributeError):
+        return None
+    if len(parts) == 2:
+        return parts[0] * 60 + parts[1]
+    if len(parts) == 3:
+        return parts[0] * 3600 + parts[1] * 60 + parts[2]
+    return None
+
+
+def format_timestamp(seconds):
+    """초 -> 'M:SS' (자막 파일과 같은 표기)"""
+    seconds = int(seconds or 0)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def parse_subtitle_lines(subtitle_text):
+    """자막 텍스트 -> [{'seconds', 'text', 'raw'}]"""
+    lines = []
+    for ts_str, text in LINE_PATTERN.findall(subtitle_text or ''):
+        seconds = parse_timestamp(ts_str)
+        text = re.sub(r'\s+', ' ', text).strip()
+        if seconds is not None and text:
+            lines.append({'seconds': seconds, 'text': text, 'raw': f"[{ts_str}] {text}"})
+    return lines
+
+
+def signal_keywords(signal):
+    """시그널 인용문/종목명에서 검색 키워드 추출"""
+    text = f"{signal.get('content', '')} {signal.get('matched_subtitle', '')}"
+    keywords = {w for w in re.findall(r'[가-힣]{2,}', text) if w not in STOPWORDS}
+    keywords.update(w.lower() for w in re.findall(r'[a-zA-Z]{2,}', text))
+
+    asset_terms = set()
+    for part in re.split(r'[()/,\s]+', signal.get('asset', '')):
+        if len(part) >= 2:
+            asset_terms.add(part.lower())
+    return keywords, asset_terms
+
+
+def _line_score(line_text, keywords, asset_terms):
+    text = line_text.lower()
+    hits = sum(1 for kw in keywords if kw.lower() in text)
+    asset_hit = any(term in text for term in asset_terms)
+    return hits + (2 if asset_hit else 0)
+
+
+def _window_scores(lines, keywords, asset_terms, width=4):
+    """라인별 점수의 이동 합 (width 라인 묶음 기준, 키워드 수로 정규화)"""
+    scores = [_line_score(l['text'], keywords, asset_terms) for l in lines]
+    norm = max(1, min(len(keywords), 12) + 2)
+    window, running = [], 0
+    for i, s in enumerate(scores):
+        running += s
+        if i >= width:
+            running -= scores[i - width]
+        window.append(running / norm)
+    return scores, window
+
+
+def find_anchor(signal, lines, keywords, asset_terms):
+    """발췌 중심 라인 결정
+
+    Returns:
+        (line_index, confidence, source) - 앵커를 못 찾으면 (None, 0.0, 'none')
+    """
+    if not lines:
+        return None, 0.0, 'none'
+
+    seconds_list = [l['seconds'] for l in lines]
+
+    def nearest(seconds):
+        return min(range(len(lines)), key=lambda i: abs(seconds_list[i] - seconds))
+
+    # 1. step2에서 정렬된 타임스탬프 (신뢰도 = timestamp_similarity)
+    aligned = signal.get('timestamp_seconds')
+    similarity = signal.get('timestamp_similarity') or 0
+    if aligned is not None and similarity >= MIN_ALIGNMENT_SIMILARITY:
+        return nearest(aligned), float(similarity), 'aligned'
+
+    scores, window = _window_scores(lines, keywords, asset_terms)
+
+    # 2. 추출 단계 타임스탬프 - 주변에 키워드가 있을 때만 신뢰
+    extracted = parse_timestamp(signal.get('timestamp', '')) if signal.get('timestamp') else None
+    if extracted is not None:
+        nearby = [i for i, s in enumerate(seconds_list) if abs(s - extracted) <= ANCHOR_CHECK_SECONDS]
+        if nearby:
+            best = max(nearby, key=lambda i: window[i])
+            if window[best] >= MIN_KEYWORD_SCORE:
+                return best, min(1.0, window[best]), 'timestamp+keywords'
+
+    # 3. 키워드 적중이 가장 밀집된 구간
+    best = max(range(len(lines)), key=lambda i: window[i])
+    if window[best] >= MIN_KEYWORD_SCORE * 1.5:
+        # 이동 합은 구간 끝 라인에 기록되므로 구간 안 최고점 라인으로 보정
+        start = max(0, best - 3)
+        best = max(range(start, best + 1), key=lambda i: scores[i])
+        return best, min(1.0, window[best] if window[best] else MIN_KEYWORD_SCORE), 'keywords'
+
+    return None, 0.0, 'none'
+
+
+def build_video_summary(signal, lines, token_budget=SUMMARY_TOKEN_BUDGET):
+    """전체 영상 요약: 추출 단계 video_summary가 있으면 사용, 없으면 균등 샘플"""
+    summary = (signal.get('video_summary') or '').strip()
+    if summary:
+        while estimate_tokens(summary) > token_budget and len(summary) > 50:
+            summary = summary[:int(len(summary) * 0.8)].rstrip() + '…'
+        return summary
+
+    if not lines:
+        return ''
+
+    samples, used = [], 0
+    step = max(1, len(lines) // 12)
+    for line in lines[::step]:
+        cost = estimate_tokens(line['raw'])
+        if used + cost > token_budget:
+            break
+        samples.append(line['raw'])
+        used += cost
+    return '\n'.join(samples)
+
+
+def _fallback_excerpt(signal, lines, keywords, asset_terms, token_budget):
+    """앵커를 못 찾았고 컨텍스트 상한도 넘는 자막: 키워드 점수가 높은 라인 주변(앞뒤 한 줄)을 예산만큼, 적중이 없으면 앞부분"""
+    scores = [_line_score(l['text'], keywords, asset_terms) for l in lines]
+    costs = [estimate_tokens(l['raw']) + 1 for l in lines]
+    picked, used = set(), 0
+    for i in sorted((i for i, score in enumerate(scores) if score > 0), key=lambda i: (-scores[i], i)):
+        window = [j for j in range(max(0, i - 1), min(len(lines), i + 2)) if j not in picked]
+        cost = sum(costs[j] for j in window)
+        if used + cost > token_budget:
+            break
+        picked.update(window)
+        used += cost
+
+    mode = 'keywords' if picked else 'head'
+    if not picked:
+        for i, cost in enumerate(costs):
+            if used + cost > token_budget:
+                break
+            picked.add(i)
+            used += cost
+
+    ordered = sorted(picked)
+    parts = []
+    for prev, i in zip([None] + ordered, ordered):
+        if prev is not None and i != prev + 1:
+            parts.append('…')
+        parts.append(lines[i]['raw'])
+
+    summary = build_video_summary(signal, lines)
+    return {
+        'mode': mode,
+        'text': '\n'.join(parts),
+        'summary': summary,
+        'start': lines[ordered[0]]['seconds'] if ordered else None,
+        'end': lines[ordered[-1]]['seconds'] if ordered else None,
+        'tokens': used + estimate_tokens(summary),
+    }
+
+
+def build_subtitle_excerpt(signal, subtitle_text, token_budget=DEFAULT_TOKEN_BUDGET,
+                           context_limit=CONTEXT_TOKEN_LIMIT):
+    """시그널 검증용 자막 발췌
+
+    Args:
+        signal: 시그널 dict (timestamp_seconds / timestamp_similarity / timestamp / content / asset)
+        subtitle_text: 자막 파일 전체 텍스트
+        token_budget: 발췌 본문 토큰 예산 (앵커를 찾은 경우)
+        context_limit: 앵커를 못 찾았을 때 자막에 쓸 수 있는 토큰 상한
+
+    Returns:
+        dict: {
+            'mode': 'window' | 'full' (짧은 자막 또는 앵커 없음)
+                    | 'keywords' | 'head' (앵커 없음 + 컨텍스트 상한 초과),
+            'text': 프롬프트에 넣을 자막 텍스트,
+            'summary': 영상 요약 (window 모드에서만),
+            'start'/'end': 발췌 구간 초,
+            'confidence', 'anchor_source',
+            'tokens', 'full_tokens'
+        }
+    """
+    subtitle_text = subtitle_text or ''
+    full_tokens = estimate_tokens(subtitle_text)
+    lines = parse_subtitle_lines(subtitle_text)
+
+    result = {'mode': 'full', 'text': subtitle_text, 'summary': '', 'start': None, 'end': None,
+              'confidence': 0.0, 'anchor_source': 'none', 'tokens': full_tokens, 'full_tokens': full_tokens}
+
+    # 이미 예산 안에 들어오는 짧은 자막은 전체 사용
+    if full_tokens <= token_budget + SUMMARY_TOKEN_BUDGET:
+        return result
+
+    # 타임스탬프 라인이 없는 자막 - 발췌 기준이 없으므로 컨텍스트 상한 안에서 전체
+    if not lines:
+        if full_tokens <= context_limit:
+            return result
+        text = subtitle_text
+        while estimate_tokens(text) > context_limit:
+            text = text[:int(len(text) * 0.8)]
+        result.update({'mode': 'head', 'text': text.rstrip() + '\n…', 'tokens': estimate_tokens(text)})
+        return result
+
+    keywords, asset_terms = signal_keywords(signal)
+    anchor, confidence, source = find_anchor(signal, lines, keywords, asset_terms)
+    result['confidence'] = confidence
+    result['anchor_source'] = source
+    if anchor is None:
+        # 정렬 실패 - 발췌가 인용 구간을 빠뜨릴 수 있으므로 상한 안이면 전체 자막
+        if full_tokens <= context_limit:
+            return result
+        result.update(_fallback_excerpt(signal, lines, keywords, asset_terms, context_limit))
+        return result
+
+    # 앵커에서 양쪽으로 번갈아 확장 (발언 이후 맥락이 더 중요하므로 뒤쪽 우선)
+    costs = [estimate_tokens(l['raw']) + 1 for l in lines]
+    primary_budget = int(token_budget * 0.8)
+    lo = hi = anchor
+    used = costs[anchor]
+    while True:
+        grew = False
+        if hi + 1 < len(lines) and used + costs[hi + 1] <= primary_budget:
+            hi += 1
+            used += costs[hi]
+            grew = True
+        if lo - 1 >= 0 and used + costs[lo - 1] <= primary_budget:
+            lo -= 1
+            used += costs[lo]
+            grew = True
+        if not grew:
+            break
+
+    parts = [l['raw'] for l in lines[lo:hi + 1]]
+
+    # 구간 밖 종목 언급 몇 곳 (앞뒤 한 줄씩)
+    extra = []
+    if asset_terms:
+        outside = [i for i, l in enumerate(lines)
+                   if (i < lo or i > hi) and any(t in l['text'].lower() for t in asset_terms)]
+        for i in outside:
+            if len(extra) >= SECONDARY_HITS:
+                break
+            snippet_range = range(max(0, i - 1), min(len(lines), i + 2))
+            cost = sum(costs[j] for j in snippet_range) + 2
+            if used + cost > token_budget:
+                break
+            used += cost
+            extra.append((i, '\n'.join(lines[j]['raw'] for j in snippet_range)))
+
+    text = '\n'.join(parts)
+    if extra:
+        before = [s for i, s in extra if i < lo]
+        after = [s for i, s in extra if i > hi]
+        text = '\n…\n'.join(before + [text] + after)
+
+    summary = build_video_summary(signal, lines)
+    result.update({
+        'mode': 'window',
+        'text': text,
+        'summary': summary,
+        'start': lines[lo]['seconds'],
+        'end': lines[hi]['seconds'],
+        'tokens': used + estimate_tokens(summary),
+    })
+    return result
+
+
+EXCERPT_LABELS = {
+    'window': '관련 자막 구간',
+    'keywords': '키워드 적중 구간 - 정렬 실패, 자막이 컨텍스트 상한 초과',
+    'head': '자막 앞부분 - 정렬 실패, 자막이 컨텍스트 상한 초과',
+}
+
+
+def format_excerpt_section(excerpt):
+    """프롬프트에 넣을 자막 섹션 문자열"""
+    if excerpt['mode'] == 'full':
+        return f"=== 영상 자막 (전체) ===\n{excerpt['text']}"
+
+    span = ''
+    if excerpt['start'] is not None:
+        span = f"{format_timestamp(excerpt['start'])} ~ {format_timestamp(excerpt['end'])}, "
+    return (f"=== 영상 전체 요약 ===\n{excerpt['summary'] or '(요약 없음)'}\n\n"
+            f"=== {EXCERPT_LABELS[excerpt['mode']]} ({span}전체 자막 중 발췌) ===\n{excerpt['text']}")
+
+
+def build_group_excerpt(signals, subtitle_text, token_budget=DEFAULT_TOKEN_BUDGET):
+    """같은 영상 시그널 묶음용 자막 섹션 (묶음 요청의 캐시 프리픽스에 들어감)
+
+    시그널별 발췌 구간을 시작 시각 순으로 합치고(같은 구간은 한 번만) 영상 요약은 한 번만 넣는다.
+    정렬 실패로 전체 자막을 쓰는 시그널이 하나라도 있거나 합친 발췌가 전체 자막보다 길어지면 전체 자막을 사용.
+
+    Returns:
+        dict: {'mode': 'excerpt' | 'full', 'text': 자막 섹션, 'tokens', 'full_tokens'}
+    """
+    subtitle_text = subtitle_text or ''
+    full_tokens = estimate_tokens(subtitle_text)
+    full = {'mode': 'full', 'text': f"=== 영상 자막 (전체) ===\n{subtitle_text}",
+            'tokens': full_tokens, 'full_tokens': full_tokens}
+
+    excerpts = [build_subtitle_excerpt(signal, subtitle_text, token_budget) for signal in signals]
+    if not excerpts or any(e['mode'] == 'full' for e in excerpts):
+        return full
+
+    sections, seen = [], set()
+    for excerpt in sorted(excerpts, key=lambda e: e['start'] if e['start'] is not None else -1):
+        if excerpt['text'] in seen:
+            continue
+        seen.add(excerpt['text'])
+        span = ''
+        if excerpt['start'] is not None:
+            span = f" ({format_timestamp(excerpt['start'])} ~ {format_timestamp(excerpt['end'])})"
+        sections.append(f"--- {EXCERPT_LABELS[excerpt['mode']]}{span} ---\n{excerpt['text']}")
+
+    summary = next((e['summary'] for e in excerpts if e['summary']), '')
+    text = (f"=== 영상 전체 요약 ===\n{summary or '(요약 없음)'}\n\n"
+            f"=== 시그널별 관련 자막 구간 (전체 자막 중 발췌) ===\n" + '\n\n'.join(sections))
+    tokens = estimate_tokens(text)
+    if tokens >= full_tokens:
+        return full
+    return {'mode': 'excerpt', 'text': text, 'tokens': tokens, 'full_tokens': full_tokens}
@@ -0,0 +1,208 @@
+"""
+yt-dlp 자막 수집기
+- 제한된 워커 풀로 여러 영상을 동시에 다운로드
+- 언어별 폴백 (기본: 한국어 -> 영어, 수동/자동 자막 선택 가능)
+- 다운로드한 VTT는 같은 워커에서 바로 [M:SS] 텍스트로 변환
+- 타임아웃/일시 오류는 영구 재시도 큐(JSON)에 넣어 다음 실행에서 다시 시도
+
+yt-dlp 실행 명령은 YT_DLP 환경변수(실행 파일 경로)나 yt_dlp_cmd 인자로 바꿀 수 있다.
+(테스트에서는 가짜 yt-dlp 실행 파일 사용)
+"""
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from vtt_converter import convert_vtt_to_txt
+
+DEFAULT_WORKERS = 6
+DEFAULT_TIMEOUT = 60
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_QUEUE_FILE = "_subtitle_retry_queue.json"
+
+# (언어, 종류) 순서대로 시도 - 종류: manual(업로더 자막) / auto(자동 생성) / any(둘 다 허용)
+DEFAULT_FALLBACK = (('ko', 'any'), ('en', 'any'))
+
+# 일시적인 실패로 보고 재시도 큐에 넣을 yt-dlp 오류 문구
+TRANSIENT_ERRORS = ('HTTP Error 429', 'HTTP Error 5', 'timed out', 'Connection reset',
+                    'Temporary failure', 'Unable to download webpage')
+
+
+def default_yt_dlp_cmd():
+    """YT_DLP 환경변수가 있으면 그 명령, 없으면 현재 파이썬의 yt_dlp 모듈"""
+    env_cmd = os.environ.get('YT_DLP')
+    if env_cmd:
+        return shlex.split(env_cmd)
+    return [sys.executable, '-m', 'yt_dlp']
+
+
+class SubtitleFetcher:
+    """yt-dlp 자막 다운로드 + 변환 워커 풀"""
+
+    def __init__(self, output_dir, max_workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT,
+                 fallback=DEFAULT_FALLBACK, yt_dlp_cmd=None, retry_queue_path=None,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, overwrite=False):
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.fallback = tuple(fallback)
+        self.yt_dlp_cmd = list(yt_dlp_cmd) if yt_dlp_cmd else default_yt_dlp_cmd()
+        self.retry_queue_path = retry_queue_path or os.path.join(output_dir, RETRY_QUEUE_FILE)
+        self.max_attempts = max_attempts
+        self.overwrite = overwrite
+        self._queue_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 재시도 큐
+    # ------------------------------------------------------------------
+    def load_retry_queue(self):
+        if os.path.exists(self.retry_queue_path):
+            with open(self.retry_queue_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _save_retry_queue(self, queue):
+        tmp_path = self.retry_queue_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(queue, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.retry_queue_path)
+
+    def _update_retry_queue(self, result):
+        """결과에 따라 재시도 큐 갱신 (성공/자막 없음 -> 제거, 일시 오류 -> 시도 횟수 증가)"""
+        video_id = result['video_id']
+        with self._queue_lock:
+            queue = self.load_retry_queue()
+            if result['status'] in ('timeout', 'retry'):
+                entry = queue.get(video_id, {'attempts': 0})
+                entry['attempts'] += 1
+                entry['last_status'] = result['status']
+                entry['last_error'] = result.get('error', '')
+                entry['updated_at'] = datetime.now().isoformat()
+                entry['exhausted'] = entry['attempts'] >= self.max_attempts
+                queue[video_id] = entry
+            elif video_id in queue:
+                del queue[video_id]
+            else:
+                return
+            self._save_retry_queue(queue)
+
+    def pending_retries(self):
+        """아직 시도 횟수가 남은 재시도 대상 video_id"""
+        return [vid for vid, entry in self.load_retry_queue().items() if not entry.get('exhausted')]
+
+    # ------------------------------------------------------------------
+    # 단일 영상
+    # ------------------------------------------------------------------
+    def _build_command(self, video_id, lang, kind, out_template):
+        cmd = list(self.yt_dlp_cmd) + ['--skip-download']
+        if kind in ('manual', 'any'):
+            cmd.append('--write-sub')
+        if kind in ('auto', 'any'):
+            cmd.append('--write-auto-sub')
+        cmd += ['--sub-lang', lang, '--sub-format', 'vtt', '--convert-subs', 'vtt',
+                '-o', out_template, f"https://www.youtube.com/watch?v={video_id}"]
+        return cmd
+
+    def fetch_one(self, video_id):
+        """한 영상 자막 다운로드 -> 변환
+
+        Returns:
+            dict: video_id, status(ok|exists|no_subs|timeout|retry|error), lang, kind, path, lines, error
+        """
+        txt_path = os.path.join(self.output_dir, f"{video_id}.txt")
+        if os.path.exists(txt_path) and not self.overwrite:
+            return {'video_id': video_id, 'status': 'exists', 'path': txt_path}
+
+        # 워커마다 별도 임시 폴더 (다른 영상의 vtt와 섞이지 않게)
+        workdir = tempfile.mkdtemp(prefix=f"subs_{video_id}_", dir=self.output_dir)
+        last_error = ''
+        try:
+            for lang, kind in self.fallback:
+                cmd = self._build_command(video_id, lang, kind, os.path.join(workdir, video_id))
+                try:
+                    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout,
+                                          encoding='utf-8', errors='replace')
+                except subprocess.TimeoutExpired:
+                    result = {'video_id': video_id, 'status': 'timeout', 'lang': lang, 'kind': kind,
+                              'error': f"timeout after {self.timeout}s"}
+                    self._update_retry_queue(result)
+                    return result
+
+                vtt_files = sorted(f for f in os.listdir(workdir) if f.endswith('.vtt'))
+                if vtt_files:
+                    vtt_path = os.path.join(workdir, vtt_files[0])
+                    for name in vtt_files:
+                        if f".{lang}." in name:
+                            vtt_path = os.path.join(workdir, name)
+                            break
+
+                    # VTT -> [M:SS] 텍스트 (임시 파일에 쓰고 교체)
+                    tmp_txt = os.path.join(workdir, f"{video_id}.txt")
+                    lines = convert_vtt_to_txt(vtt_path, tmp_txt)
+                    os.replace(tmp_txt, txt_path)
+
+                    result = {'video_id': video_id, 'status': 'ok', 'lang': lang, 'kind': kind,
+                              'path': txt_path, 'lines': lines}
+                    self._update_retry_queue(result)
+                    return result
+
+                stderr = (proc.stderr or '').strip()
+                if proc.returncode != 0 and any(marker in stderr for marker in TRANSIENT_ERRORS):
+                    result = {'video_id': video_id, 'status': 'retry', 'lang': lang, 'kind': kind,
+                              'error': stderr.splitlines()[-1] if stderr else ''}
+                    self._update_retry_queue(result)
+                    return result
+                if stderr:
+                    last_error = stderr.splitlines()[-1]
+
+            result = {'video_id': video_id, 'status': 'no_subs', 'error': last_error}
+            self._update_retry_queue(result)
+            return result
+        except Exception as e:
+            return {'video_id': video_id, 'status': 'error', 'error': str(e)}
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # 여러 영상
+    # ------------------------------------------------------------------
+    def fetch_many(self, video_ids, on_result=None):
+        """여러 영상을 워커 풀로 다운로드
+
+        Returns:
+            dict: status별 개수 + results 리스트
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.fetch_one, vid): vid for vid in video_ids}
+            for i, future in enumerate(as_completed(futures)):
+                result = future.result()
+                results.append(result)
+                if on_result:
+                    on_result(i + 1, len(video_ids), result)
+
+        summary = {'total': len(video_ids), 'results': results}
+        for result in results:
+            summary[result['status']] = summary.get(result['status'], 0) + 1
+        return summary
+
+    def retry_pending(self, on_result=None):
+        """재시도 큐에 남아 있는 영상 다시 시도"""
+        return self.fetch_many(self.pending_retries(), on_result=on_result)
+
+
+def print_progress(done, total, result):
+    """fetch_many 진행 출력용 기본 콜백"""
+    status = result['status']
+    if status == 'ok':
+        detail = f"{result['lang']} {result['lines']} lines"
+    else:
+        detail = result.get('error', '')
+    print(f"  [{done}/{total}] {result['video_id']}: {status} {detail}")
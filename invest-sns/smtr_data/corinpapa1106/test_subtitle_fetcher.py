@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+subtitle_fetcher 테스트 (가짜 yt-dlp 실행 파일 사용, 네트워크 없음)
+
+실행: python -m pytest test_subtitle_fetcher.py -q
+"""
+import json
+import os
+import stat
+import sys
+import textwrap
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from subtitle_fetcher import SubtitleFetcher
+
+SAMPLE_VTT = """WEBVTT
+Kind: captions
+Language: ko
+
+00:00:01.000 --> 00:00:03.000
+오늘은 비트코인 이야기
+
+00:01:05.500 --> 00:01:08.000
+지금은 <c>들고 가세요</c>
+"""
+
+# 스펙 파일(FAKE_YTDLP_SPEC)에 따라 동작하는 가짜 yt-dlp
+FAKE_YT_DLP = textwrap.dedent('''\
+    #!{python}
+    import json, os, sys, time
+    args = sys.argv[1:]
+    spec = json.load(open(os.environ["FAKE_YTDLP_SPEC"], encoding="utf-8"))
+    video_id = args[-1].split("v=")[-1]
+    lang = args[args.index("--sub-lang") + 1]
+    template = args[args.index("-o") + 1]
+    kinds = set()
+    if "--write-sub" in args:
+        kinds.add("manual")
+    if "--write-auto-sub" in args:
+        kinds.add("auto")
+    entry = spec.get(video_id, {{}})
+    with open(os.environ["FAKE_YTDLP_LOG"], "a", encoding="utf-8") as log:
+        log.write(json.dumps({{"video_id": video_id, "lang": lang, "start": time.time()}}) + "\\n")
+    time.sleep(entry.get("sleep", 0))
+    if entry.get("error"):
+        sys.stderr.write("ERROR: " + entry["error"] + "\\n")
+        sys.exit(1)
+    if entry.get("langs", {{}}).get(lang) in kinds:
+        with open(template + "." + lang + ".vtt", "w", encoding="utf-8") as f:
+            f.write(open(os.environ["FAKE_YTDLP_VTT"], encoding="utf-8").read())
+    else:
+        sys.stderr.write("WARNING: There are no subtitles for the requested languages\\n")
+''')
+
+
+def make_fetcher(tmp_path, spec, monkeypatch, **kwargs):
+    fake = tmp_path / "fake-yt-dlp"
+    fake.write_text(FAKE_YT_DLP.format(python=sys.executable), encoding="utf-8")
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(spec), encoding="utf-8")
+    vtt_path = tmp_path / "sample.vtt"
+    vtt_path.write_text(SAMPLE_VTT, encoding="utf-8")
+
+    monkeypatch.setenv("FAKE_YTDLP_SPEC", str(spec_path))
+    monkeypatch.setenv("FAKE_YTDLP_LOG", str(tmp_path / "calls.jsonl"))
+    monkeypatch.setenv("FAKE_YTDLP_VTT", str(vtt_path))
+
+    out_dir = tmp_path / "subs"
+    out_dir.mkdir()
+    return SubtitleFetcher(str(out_dir), yt_dlp_cmd=[str(fake)], **kwargs), out_dir
+
+
+def read_calls(tmp_path):
+    with open(tmp_path / "calls.jsonl", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_downloads_and_converts_korean(tmp_path, monkeypatch):
+    fetcher, out_dir = make_fetcher(tmp_path, {"vid1": {"langs": {"ko": "auto"}}}, monkeypatch)
+
+    result = fetcher.fetch_one("vid1")
+
+    assert result["status"] == "ok"
+    assert result["lang"] == "ko"
+    text = (out_dir / "vid1.txt").read_text(encoding="utf-8")
+    assert text.splitlines() == ["[0:01] 오늘은 비트코인 이야기", "[1:05] 지금은 들고 가세요"]
+    # 임시 작업 폴더와 vtt는 남지 않음
+    assert sorted(os.listdir(out_dir)) == ["vid1.txt"]
+
+
+def test_falls_back_to_next_language(tmp_path, monkeypatch):
+    fetcher, out_dir = make_fetcher(tmp_path, {"vid2": {"langs": {"en": "manual"}}}, monkeypatch)
+
+    result = fetcher.fetch_one("vid2")
+
+    assert result["status"] == "ok"
+    assert result["lang"] == "en"
+    assert [c["lang"] for c in read_calls(tmp_path)] == ["ko", "en"]
+
+
+def test_manual_only_step_skips_auto_captions(tmp_path, monkeypatch):
+    fallback = (("ko", "manual"), ("ko", "auto"))
+    fetcher, _ = make_fetcher(tmp_path, {"vid3": {"langs": {"ko": "auto"}}}, monkeypatch, fallback=fallback)
+
+    result = fetcher.fetch_one("vid3")
+
+    assert result["status"] == "ok"
+    assert result["kind"] == "auto"
+    assert len(read_calls(tmp_path)) == 2
+
+
+def test_no_subtitles_is_not_queued(tmp_path, monkeypatch):
+    fetcher, out_dir = make_fetcher(tmp_path, {"vid4": {"langs": {}}}, monkeypatch)
+
+    result = fetcher.fetch_one("vid4")
+
+    assert result["status"] == "no_subs"
+    assert fetcher.load_retry_queue() == {}
+    assert not (out_dir / "vid4.txt").exists()
+
+
+def test_timeout_goes_to_persistent_retry_queue(tmp_path, monkeypatch):
+    spec = {"slow": {"langs": {"ko": "auto"}, "sleep": 5}}
+    fetcher, out_dir = make_fetcher(tmp_path, spec, monkeypatch, timeout=0.5, max_attempts=2)
+
+    assert fetcher.fetch_one("slow")["status"] == "timeout"
+
+    # 새 인스턴스에서도 큐가 유지됨
+    fresh = SubtitleFetcher(str(out_dir), yt_dlp_cmd=fetcher.yt_dlp_cmd, timeout=0.5, max_attempts=2)
+    assert fresh.pending_retries() == ["slow"]
+
+    fresh.fetch_one("slow")
+    queue = fresh.load_retry_queue()
+    assert queue["slow"]["attempts"] == 2
+    assert queue["slow"]["exhausted"] is True
+    assert fresh.pending_retries() == []
+
+
+def test_retry_succeeds_and_clears_queue(tmp_path, monkeypatch):
+    spec = {"flaky": {"error": "Unable to download webpage: HTTP Error 429"}}
+    fetcher, out_dir = make_fetcher(tmp_path, spec, monkeypatch)
+
+    assert fetcher.fetch_one("flaky")["status"] == "retry"
+    assert fetcher.pending_retries() == ["flaky"]
+
+    (tmp_path / "spec.json").write_text(json.dumps({"flaky": {"langs": {"ko": "auto"}}}), encoding="utf-8")
+    summary = fetcher.retry_pending()
+
+    assert summary["ok"] == 1
+    assert fetcher.load_retry_queue() == {}
+    assert (out_dir / "flaky.txt").exists()
+
+
+def test_fetch_many_runs_in_parallel(tmp_path, monkeypatch):
+    spec = {f"v{i}": {"langs": {"ko": "auto"}, "sleep": 0.5} for i in range(8)}
+    fetcher, out_dir = make_fetcher(tmp_path, spec, monkeypatch, max_workers=4)
+
+    summary = fetcher.fetch_many(list(spec))
+
+    assert summary["ok"] == 8
+    starts = sorted(c["start"] for c in read_calls(tmp_path))
+    # 4개 워커 -> 8개 영상이 두 물결로 시작 (직렬이면 0.5초 간격)
+    assert starts[3] - starts[0] < 0.4
+    assert len([f for f in os.listdir(out_dir) if f.endswith(".txt")]) == 8
+
+
+def test_existing_subtitle_is_skipped(tmp_path, monkeypatch):
+    fetcher, out_dir = make_fetcher(tmp_path, {}, monkeypatch)
+    (out_dir / "done.txt").write_text("[0:01] 이미 있음", encoding="utf-8")
+
+    assert fetcher.fetch_one("done")["status"] == "exists"
+    assert not (tmp_path / "calls.jsonl").exists()
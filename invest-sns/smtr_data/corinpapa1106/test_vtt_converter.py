@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+vtt_converter 테스트 (롤링 자막 중복 제거)
+
+실행: python -m pytest test_vtt_converter.py -q
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from vtt_converter import (
+    convert_vtt_to_txt, collapse_cues, iter_txt_cues, suffix_prefix_overlap, legacy_vtt_lines,
+)
+
+# 유튜브 자동 자막 형식: 큐마다 이전 줄을 다시 보여주고, 10ms짜리 전환 큐가 끼어 있음
+ROLLING_VTT = """WEBVTT
+Kind: captions
+Language: ko
+
+00:00:00.320 --> 00:00:02.990 align:start position:0%
+
+코리아<00:00:00.640><c> 아빠의</c><00:00:01.040><c> 투자기.</c>
+
+00:00:02.990 --> 00:00:03.000 align:start position:0%
+코리아 아빠의 투자기.
+
+
+00:00:03.000 --> 00:00:05.910 align:start position:0%
+코리아 아빠의 투자기.
+오늘은<00:00:03.760><c> XRP</c><00:00:04.200><c> 헤어질</c><00:00:04.640><c> 결심</c>
+
+00:00:05.910 --> 00:00:05.920 align:start position:0%
+오늘은 XRP 헤어질 결심
+
+
+00:00:05.920 --> 00:00:08.000 align:start position:0%
+오늘은 XRP 헤어질 결심
+네 네
+
+01:01:09.000 --> 01:01:10.000
+네 네
+""".replace("position:0%\n\n", "position:0%\n \n")  # 유튜브는 첫 큐에 공백 한 칸짜리 줄을 넣음
+
+
+def test_collapses_rolling_cues(tmp_path):
+    vtt = tmp_path / "a.ko.vtt"
+    vtt.write_text(ROLLING_VTT, encoding="utf-8")
+    txt = tmp_path / "a.txt"
+
+    count = convert_vtt_to_txt(str(vtt), str(txt))
+
+    assert txt.read_text(encoding="utf-8").splitlines() == [
+        "[0:00] 코리아 아빠의 투자기.",
+        "[0:03] 오늘은 XRP 헤어질 결심",
+        "[0:05] 네 네",
+        "[61:09] 네 네",  # 한참 뒤의 같은 말은 실제 발화라 유지, 분은 60을 넘어도 그대로
+    ]
+    assert count == 4
+    assert len(txt.read_bytes()) < len("\n".join(legacy_vtt_lines(ROLLING_VTT)).encode("utf-8"))
+
+
+def test_recollapses_already_converted_txt():
+    lines = [
+        "[0:01] 네. 코리니 아빠의 투자기. 아,",
+        "[0:03] 네. 코리니 아빠의 투자기. 아, 오늘은 더블 헤더 경기로",
+        "[0:06] 오늘은 더블 헤더 경기로",
+        "[0:06] 오늘은 더블 헤더 경기로 영상이 두 개",
+    ]
+
+    assert list(collapse_cues(iter_txt_cues(lines))) == [
+        (1, "네. 코리니 아빠의 투자기. 아,"),
+        (3, "오늘은 더블 헤더 경기로"),
+        (6, "영상이 두 개"),
+    ]
+
+
+def test_single_word_repeat_is_kept():
+    # "네" 한 단어 겹침은 우연일 수 있으므로 전환 큐가 아니면 버리지 않음
+    cues = [(1.0, "좋습니다 네"), (3.0, "네 다음은 이더리움")]
+    assert [t for _, t in collapse_cues(cues)] == ["좋습니다 네", "네 다음은 이더리움"]
+
+
+def test_overlap_matches_brute_force():
+    def brute(history, words):
+        for k in range(min(len(history), len(words)), 0, -1):
+            if history[-k:] == words[:k]:
+                return k
+        return 0
+
+    rng = random.Random(7)
+    for _ in range(5000):
+        history = [rng.choice("ab") for _ in range(rng.randint(0, 10))]
+        words = [rng.choice("ab") for _ in range(rng.randint(0, 10))]
+        assert suffix_prefix_overlap(history, words) == brute(history, words)
@@ -0,0 +1,193 @@
+"""
+비동기 동시 검증 러너
+- N개 작업 단위를 동시에 처리 (asyncio + 스레드)
+- 시그널 단위 append-only 체크포인트 로그 (JSONL) - 중단 후 정확히 남은 시그널부터 재개
+- RateLimitedClient: API 호출 한 번마다 분당 요청 수 제한을 적용하고,
+  과부하/속도 제한 오류(429, 529 등)는 그 호출만 지수 백오프로 재시도 (이미 성공한 청크는 다시 보내지 않음)
+
+작업 단위(unit)는 영상 하나의 시그널 묶음이고, 결과는 시그널 키별로 한 줄씩 기록된다.
+이미 기록된 시그널은 다음 실행에서 묶음에서 빠지므로 재개 단위는 항상 시그널이다.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUESTS_PER_MINUTE = 50
+MAX_RETRIES = 6
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# 재시도 대상 HTTP 상태 (429 rate limit, 529 overloaded, 5xx)
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+RETRYABLE_ERROR_NAMES = {'APIConnectionError', 'APITimeoutError', 'RateLimitError',
+                         'InternalServerError', 'OverloadedError'}
+
+
+def signal_key(signal):
+    """시그널 고유 키 (입력 파일 순서가 바뀌어도 같은 시그널이면 같은 키)"""
+    raw = "|".join(str(signal.get(k, '')) for k in ('video_id', 'asset', 'signal_type', 'content', 'timestamp'))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def is_overload_error(exc):
+    """백오프 후 재시도할 오류인지"""
+    status = getattr(exc, 'status_code', None)
+    if status in RETRYABLE_STATUS:
+        return True
+    return type(exc).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def retry_after_seconds(exc):
+    """서버가 알려준 retry-after 헤더 (없으면 None)"""
+    response = getattr(exc, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """분당 요청 수 제한 (토큰 버킷, 여러 워커 스레드에서 공유)"""
+
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, burst=None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = burst or max(1, min(requests_per_minute, 10))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class RateLimitedClient:
+    """Anthropic 클라이언트 래퍼 - messages.create 호출마다 속도 제한 + 과부하 재시도
+
+    워커 함수는 원래 클라이언트처럼 client.messages.create(...) 를 호출하면 된다.
+    재시도를 모두 실패하면 마지막 오류를 그대로 올림 (작업 단위 실패 -> 다음 실행에서 재시도).
+    """
+
+    def __init__(self, client, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, max_retries=MAX_RETRIES):
+        self.client = client
+        self.limiter = RateLimiter(requests_per_minute)
+        self.max_retries = max_retries
+        self.requests = 0
+        self.retries = 0
+        self.lock = threading.Lock()
+        self.messages = self
+
+    def create(self, **kwargs):
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            with self.lock:
+                self.requests += 1
+            try:
+                return self.client.messages.create(**kwargs)
+            except Exception as e:
+                if not is_overload_error(e) or attempt == self.max_retries:
+                    raise
+                delay = retry_after_seconds(e)
+                if delay is None:
+                    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+                    delay *= 0.5 + random.random()  # 지터
+                with self.lock:
+                    self.retries += 1
+                print(f"  ⏳ {type(e).__name__} - {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+
+
+class CheckpointLog:
+    """시그널 단위 append-only 체크포인트 (JSONL, 한 줄 = 시그널 하나)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def load(self):
+        """{key: record} - 같은 키가 여러 번 있으면 마지막 기록 사용, 잘린 마지막 줄은 무시"""
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                records[record['key']] = record
+        return records
+
+    def append(self, key, record):
+        line = json.dumps({'key': key, **record, 'checkpoint_at': datetime.now().isoformat()},
+                          ensure_ascii=False)
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+async def run_units_async(units, worker, checkpoint, concurrency=DEFAULT_CONCURRENCY, on_record=None):
+    """작업 단위들을 동시에 실행하고 결과를 시그널별로 체크포인트에 기록
+
+    속도 제한/재시도는 API 호출 단위 (워커에 RateLimitedClient 를 넘김).
+
+    Args:
+        units: [(unit_id, payload)] - 이미 끝난 시그널은 호출하는 쪽에서 빼고 넘김
+        worker: payload -> {key: record} (동기 함수면 스레드에서 실행)
+        checkpoint: CheckpointLog
+        on_record: (key, record) 콜백 (진행 출력용)
+
+    Returns:
+        dict: units, done_units, failed_units, records, elapsed
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    stats = {'units': len(units), 'done_units': 0, 'failed_units': 0, 'records': 0}
+    started = time.monotonic()
+
+    async def run_one(unit_id, payload):
+        try:
+            async with semaphore:
+                if asyncio.iscoroutinefunction(worker):
+                    records = await worker(payload)
+                else:
+                    records = await asyncio.to_thread(worker, payload)
+        except Exception as e:
+            # 기록하지 않음 -> 다음 실행에서 다시 시도
+            stats['failed_units'] += 1
+            print(f"  ❌ {unit_id}: {type(e).__name__}: {str(e)[:120]}")
+            return
+        for key, record in records.items():
+            checkpoint.append(key, record)
+            stats['records'] += 1
+            if on_record:
+                on_record(key, record)
+        stats['done_units'] += 1
+
+    await asyncio.gather(*(run_one(unit_id, payload) for unit_id, payload in units))
+    stats['elapsed'] = time.monotonic() - started
+    return stats
+
+
+def run_units(units, worker, checkpoint, **kwargs):
+    """run_units_async 동기 래퍼"""
+    return asyncio.run(run_units_async(units, worker, checkpoint, **kwargs))
@@ -0,0 +1,281 @@
+"""
+VTT 자막 -> [M:SS] 텍스트 변환 (스트리밍, 롤링 자막 중복 제거)
+
+유튜브 자동 자막은 큐마다 이전 줄을 다시 보여주는 롤링 방식이라
+큐 텍스트를 그대로 이어 붙이면 같은 문장이 2~3번씩 반복된다.
+여기서는 지금까지 출력한 단어열의 접미사와 새 큐 단어열의 접두사가 겹치는 최대 길이를
+KMP 실패 함수로 구해 (큐 길이에 비례, 전체 선형 시간) 새로 나온 부분만 출력한다.
+새 부분의 타임스탬프는 큐 안의 단어별 타임스탬프(<00:00:01.500>)가 있으면 그것을, 없으면 큐 시작 시각을 쓴다.
+
+실행: python vtt_converter.py <vtt 파일/폴더 ...>   # 변환 + 코퍼스 용량 감소 리포트
+      python vtt_converter.py --txt <txt 폴더>      # 기존 [M:SS] 자막 파일 재압축 리포트 (쓰기 없음)
+"""
+import glob
+import os
+import re
+import sys
+
+CUE_TIME = re.compile(r'(\d{1,2}):(\d{2}):(\d{2})\.(\d{3})\s*-->')
+CUE_TIME_SHORT = re.compile(r'^(\d{2}):(\d{2})\.(\d{3})\s*-->')
+INLINE_TIME = re.compile(r'<(\d{1,2}):(\d{2}):(\d{2})\.(\d{3})>')
+TAG = re.compile(r'<[^>]+>')
+TXT_LINE = re.compile(r'^\[(\d+):(\d{2})(?::(\d{2}))?\]\s*(.*)$')
+
+# 한 단어짜리 겹침은 우연일 수 있어서 (예: "네" 반복) 짧은 전환 큐일 때만 인정
+MIN_OVERLAP_WORDS = 2
+TRANSITION_SECONDS = 1.0
+# 롤링 자막의 반복은 바로 다음 큐에서 나오므로 이보다 멀리 떨어진 반복은 실제 발화로 취급
+ROLLING_WINDOW_SECONDS = 10.0
+
+
+def _seconds(h, m, s, ms=0):
+    return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000.0
+
+
+def format_timestamp(seconds):
+    """초 -> M:SS (분은 60을 넘어도 그대로)"""
+    seconds = int(seconds)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def iter_cues(lines):
+    """VTT 라인 이터레이터 -> (시작 초, 큐 텍스트 원문) 스트림"""
+    start = None
+    text_lines = []
+    for raw in lines:
+        line = raw.rstrip('\n').rstrip('\r')
+        if not line:
+            # 빈 줄 = 큐 끝 (공백만 있는 줄은 유튜브 자막의 빈 자리라 큐 안에 포함)
+            if start is not None and text_lines:
+                yield start, '\n'.join(text_lines)
+            start, text_lines = None, []
+            continue
+        if not line.strip():
+            continue
+
+        if '-->' in line:
+            if start is not None and text_lines:
+                yield start, '\n'.join(text_lines)
+            text_lines = []
+            match = CUE_TIME.search(line)
+            if match:
+                start = _seconds(*match.groups())
+            else:
+                short = CUE_TIME_SHORT.search(line.strip())
+                start = _seconds(0, *short.groups()) if short else None
+            continue
+
+        if start is not None:
+            text_lines.append(line.strip())
+
+    if start is not None and text_lines:
+        yield start, '\n'.join(text_lines)
+
+
+def cue_words(cue_start, cue_text):
+    """큐 텍스트 -> [(단어, 시각)] (단어별 인라인 타임스탬프 반영)"""
+    words = []
+    current = cue_start
+    pos = 0
+    text = cue_text.replace('\n', ' ')
+    for match in INLINE_TIME.finditer(text):
+        for word in TAG.sub('', text[pos:match.start()]).split():
+            words.append((word, current))
+        current = _seconds(*match.groups())
+        pos = match.end()
+    for word in TAG.sub('', text[pos:]).split():
+        words.append((word, current))
+    return words
+
+
+def suffix_prefix_overlap(history, new_words):
+    """history의 접미사 == new_words의 접두사인 최대 길이 (KMP, O(len(new_words)))
+
+    history는 new_words 길이만큼의 꼬리만 보면 된다.
+    """
+    n = len(new_words)
+    if n == 0 or not history:
+        return 0
+    tail = history[-n:]
+
+    # new_words의 실패 함수
+    fail = [0] * n
+    k = 0
+    for i in range(1, n):
+        while k and new_words[i] != new_words[k]:
+            k = fail[k - 1]
+        if new_words[i] == new_words[k]:
+            k += 1
+        fail[i] = k
+
+    # tail 위에서 new_words 접두사 매칭을 진행 -> 끝났을 때 k가 겹침 길이
+    k = 0
+    last = len(tail) - 1
+    for i, word in enumerate(tail):
+        while k and word != new_words[k]:
+            k = fail[k - 1]
+        if word == new_words[k]:
+            k += 1
+        if k == n and i != last:
+            # 중간에서 전체가 일치하면 더 짧은 접두사로 계속 진행
+            k = fail[k - 1]
+    return k
+
+
+class RollingCaptionCollapser:
+    """큐 스트림을 받아 겹치지 않는 [M:SS] 세그먼트를 내보냄"""
+
+    def __init__(self):
+        self.history = []  # 지금까지 출력한 단어 (겹침 계산용, 큐 길이만큼만 사용)
+        self.history_limit = 256
+        self.last_start = float('-inf')
+
+    def feed(self, cue_start, cue_text):
+        """큐 하나 처리 -> (시각, 텍스트) 또는 None"""
+        words = cue_words(cue_start, cue_text)
+        if not words:
+            return None
+
+        tokens = [w for w, _ in words]
+        overlap = 0
+        if cue_start - self.last_start <= ROLLING_WINDOW_SECONDS:
+            overlap = suffix_prefix_overlap(self.history, tokens)
+        if overlap < MIN_OVERLAP_WORDS and not (
+                overlap == len(tokens) and cue_start - self.last_start < TRANSITION_SECONDS):
+            overlap = 0
+        self.last_start = cue_start
+
+        fresh = words[overlap:]
+        if not fresh:
+            return None
+
+        self.history.extend(w for w, _ in fresh)
+        if len(self.history) > self.history_limit * 2:
+            del self.history[:-self.history_limit]
+
+        return fresh[0][1], ' '.join(w for w, _ in fresh)
+
+
+def collapse_cues(cues):
+    """(시작 초, 텍스트) 스트림 -> 중복 제거된 (시각, 텍스트) 스트림"""
+    collapser = RollingCaptionCollapser()
+    for cue_start, cue_text in cues:
+        segment = collapser.feed(cue_start, cue_text)
+        if segment:
+            yield segment
+
+
+def convert_vtt_to_txt(vtt_path, txt_path):
+    """VTT 자막을 [M:SS] 텍스트 포맷으로 변환 (스트리밍)
+
+    Returns:
+        int: 변환된 라인 수
+    """
+    count = 0
+    with open(vtt_path, 'r', encoding='utf-8') as src, open(txt_path, 'w', encoding='utf-8') as dst:
+        for seconds, text in collapse_cues(iter_cues(src)):
+            if count:
+                dst.write('\n')
+            dst.write(f"[{format_timestamp(seconds)}] {text}")
+            count += 1
+
+    print(f"  Converted: {count} lines -> {txt_path}")
+    return count
+
+
+def legacy_vtt_lines(content):
+    """이전 변환 방식 (줄 전체 seen_texts 중복 제거) - 리포트 비교용"""
+    lines, seen_texts = [], set()
+    for block in content.split('\n\n'):
+        ts_match = re.search(r'(\d{2}):(\d{2}):(\d{2})\.\d{3}\s*-->', block)
+        if not ts_match:
+            continue
+        h, m, s = (int(g) for g in ts_match.groups())
+        text_lines = block.split('-->', 1)[1].split('\n')[1:]
+        text = re.sub(r'\s+', ' ', TAG.sub('', ' '.join(l.strip() for l in text_lines))).strip()
+        if not text or text in seen_texts:
+            continue
+        seen_texts.add(text)
+        lines.append(f"[{m + h * 60}:{s:02d}] {text}")
+    return lines
+
+
+def iter_txt_cues(lines):
+    """기존 [M:SS] 텍스트 자막 -> 큐 스트림 (이미 변환된 파일 재압축용)"""
+    for line in lines:
+        match = TXT_LINE.match(line.strip())
+        if not match:
+            continue
+        a, b, c, text = match.groups()
+        seconds = _seconds(a, b, c) if c else _seconds(0, a, b)
+        yield seconds, text
+
+
+def _size(lines):
+    return len('\n'.join(lines).encode('utf-8'))
+
+
+def report_vtt_corpus(paths, write=True):
+    """VTT 파일들 변환 + 용량 리포트 (원본 VTT / 이전 방식 / 새 방식)"""
+    totals = {'files': 0, 'vtt': 0, 'legacy': 0, 'collapsed': 0}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        legacy = legacy_vtt_lines(content)
+        collapsed = [f"[{format_timestamp(t)}] {x}" for t, x in collapse_cues(iter_cues(content.splitlines()))]
+
+        totals['files'] += 1
+        totals['vtt'] += len(content.encode('utf-8'))
+        totals['legacy'] += _size(legacy)
+        totals['collapsed'] += _size(collapsed)
+
+        if write:
+            txt_path = re.sub(r'(\.[a-zA-Z-]+)?\.vtt$', '.txt', path)
+            with open(txt_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(collapsed))
+    return totals
+
+
+def report_txt_corpus(paths):
+    """이미 변환된 [M:SS] 자막들에 롤링 중복 제거를 적용했을 때의 용량 (파일은 건드리지 않음)"""
+    totals = {'files': 0, 'legacy': 0, 'collapsed': 0}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [l for l in f.read().splitlines() if l.strip()]
+        collapsed = [f"[{format_timestamp(t)}] {x}" for t, x in collapse_cues(iter_txt_cues(lines))]
+        totals['files'] += 1
+        totals['legacy'] += _size(lines)
+        totals['collapsed'] += _size(collapsed)
+    return totals
+
+
+def print_report(totals):
+    def pct(a, b):
+        return (1 - a / b) * 100 if b else 0.0
+
+    print(f"파일: {totals['files']}개")
+    if 'vtt' in totals:
+        print(f"원본 VTT: {totals['vtt']:,} bytes")
+    print(f"이전 방식: {totals['legacy']:,} bytes")
+    print(f"롤링 중복 제거: {totals['collapsed']:,} bytes "
+          f"(이전 대비 -{pct(totals['collapsed'], totals['legacy']):.1f}%)")
+
+
+def _expand(args, ext):
+    paths = []
+    for arg in args:
+        if os.path.isdir(arg):
+            paths.extend(sorted(p for p in glob.glob(os.path.join(arg, f"*{ext}"))
+                                if not os.path.basename(p).startswith('_')))
+        else:
+            paths.append(arg)
+    return paths
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == '--txt':
+        print_report(report_txt_corpus(_expand(sys.argv[2:], '.txt')))
+    elif len(sys.argv) > 1:
+        print_report(report_vtt_corpus(_expand(sys.argv[1:], '.vtt')))
+    else:
+        print(__doc__)
@@ -4,9 +4,16 @@
 """
 import json
 import os
-from youtube_transcript_api import YouTubeTranscriptApi
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
+import re
+import sys
+
+# 자막 수집은 SNS 파이프라인의 yt-dlp 수집기(워커 풀 + 재시도 큐)를 같이 사용
+SUBTITLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'invest-sns', 'smtr_data', 'corinpapa1106')
+sys.path.insert(0, SUBTITLE_DIR)
+from subtitle_fetcher import SubtitleFetcher
+
+# 수동 자막 -> 자동생성 자막 -> 영어 순
+SUBTITLE_FALLBACK = (('ko', 'manual'), ('ko', 'auto'), ('en', 'any'))
 
 def process_raw_data():
     """raw JSON을 정리된 형태로 변환"""
@@ -35,38 +42,27 @@ def process_raw_data():
     print(f"비디오 데이터 정리 완료: {len(videos)}개")
     return videos
 
-def get_subtitles(video_id):
-    """자막 추출 (수동 → 자동생성 순으로 시도)"""
-    try:
-        # 1. 먼저 수동 자막 시도
-        transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['ko', 'ko-KR'])
-        return {'status': 'manual', 'text': ' '.join([t['text'] for t in transcript])}
-    except:
-        try:
-            # 2. 자동생성 자막 시도 (생성된 자막 포함)
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-            
-            # 한국어 자동생성 자막 찾기
-            for transcript in transcript_list:
-                if transcript.language_code in ['ko', 'ko-KR']:
-                    if transcript.is_generated:  # 자동생성 자막
-                        data = transcript.fetch()
-                        return {'status': 'auto', 'text': ' '.join([t['text'] for t in data])}
-            
-            # 그래도 없으면 영어 자막이라도 시도
-            for transcript in transcript_list:
-                if transcript.language_code in ['en', 'en-US', 'en-GB']:
-                    data = transcript.fetch()
-                    return {'status': 'en', 'text': ' '.join([t['text'] for t in data])}
-            
-            return {'status': 'no_subs', 'error': 'No Korean or English subtitles'}
-            
-        except Exception as e:
-            return {'status': 'failed', 'error': str(e)}
+def read_subtitle_text(path):
+    """[M:SS] 자막 파일 -> 타임스탬프 없는 본문"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return ' '.join(re.sub(r'^\[\d+:\d{2}(?::\d{2})?\]\s*', '', line).strip() for line in f if line.strip())
 
-def process_video(video):
-    """개별 비디오 처리"""
-    result = get_subtitles(video['video_id'])
+def subtitle_result(video, fetched):
+    """수집 결과 -> corinpapa_subtitles.json 항목"""
+    status = fetched['status']
+    if status in ('ok', 'exists'):
+        if status == 'exists':
+            result = {'status': 'existing'}
+        elif fetched['lang'] == 'en':
+            result = {'status': 'en'}
+        else:
+            result = {'status': fetched['kind']}
+        result['text'] = read_subtitle_text(fetched['path'])
+    elif status == 'no_subs':
+        result = {'status': 'no_subs', 'error': 'No Korean or English subtitles'}
+    else:
+        result = {'status': 'failed', 'error': fetched.get('error', status)}
+    
     result.update({
         'video_id': video['video_id'],
         'title': video['title'],
@@ -74,8 +70,7 @@ def process_video(video):
         'duration': video['duration'],
         'view_count': video['view_count']
     })
-    
-    return video['title'], result
+    return result
 
 def main():
     print("코린이 아빠 채널 처리 시작...")
@@ -110,38 +105,43 @@ def main():
         print("모든 비디오 처리 완료!")
         return
     
-    # 4. 병렬 자막 추출 (6개씩)
+    # 4. 병렬 자막 추출 (yt-dlp 워커 풀, 타임아웃은 재시도 큐로)
     success_count = 0
     auto_count = 0
     en_count = 0
     
-    with ThreadPoolExecutor(max_workers=6) as executor:
-        future_to_video = {executor.submit(process_video, video): video for video in to_process}
+    fetcher = SubtitleFetcher(SUBTITLE_DIR, fallback=SUBTITLE_FALLBACK)
+    videos_by_id = {video['video_id']: video for video in to_process}
+    
+    def on_result(done, total, fetched):
+        nonlocal success_count, auto_count, en_count
+        video = videos_by_id[fetched['video_id']]
+        title = video['title']
+        result = subtitle_result(video, fetched)
+        subtitles[title] = result
         
-        for i, future in enumerate(as_completed(future_to_video)):
-            title, result = future.result()
-            subtitles[title] = result
-            
-            status = result['status']
-            if status == 'manual':
-                success_count += 1
-                print(f"  [{i+1:3d}/{len(to_process)}] OK {title[:60]}...")
-            elif status == 'auto':
-                success_count += 1
-                auto_count += 1
-                print(f"  [{i+1:3d}/{len(to_process)}] AUTO {title[:60]}...")
-            elif status == 'en':
-                success_count += 1
-                en_count += 1
-                print(f"  [{i+1:3d}/{len(to_process)}] EN {title[:60]}...")
-            else:
-                print(f"  [{i+1:3d}/{len(to_process)}] FAIL {title[:60]}... ({result.get('error', 'failed')})")
-            
-            # 20개마다 저장
-            if (i + 1) % 20 == 0:
-                with open(subtitles_file, 'w', encoding='utf-8') as f:
-                    json.dump(subtitles, f, ensure_ascii=False, indent=2)
-                print(f"    저장 ({i+1}/{len(to_process)})")
+        status = result['status']
+        if status in ('manual', 'existing'):
+            success_count += 1
+            print(f"  [{done:3d}/{total}] OK {title[:60]}...")
+        elif status == 'auto':
+            success_count += 1
+            auto_count += 1
+            print(f"  [{done:3d}/{total}] AUTO {title[:60]}...")
+        elif status == 'en':
+            success_count += 1
+            en_count += 1
+            print(f"  [{done:3d}/{total}] EN {title[:60]}...")
+        else:
+            print(f"  [{done:3d}/{total}] FAIL {title[:60]}... ({result.get('error', 'failed')})")
+        
+        # 20개마다 저장
+        if done % 20 == 0:
+            with open(subtitles_file, 'w', encoding='utf-8') as f:
+                json.dump(subtitles, f, ensure_ascii=False, indent=2)
+            print(f"    저장 ({done}/{total})")
+    
+    fetcher.fetch_many(list(videos_by_id), on_result=on_result)
     
     # 5. 최종 저장
     with open(subtitles_file, 'w', encoding='utf-8') as f: